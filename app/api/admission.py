@@ -0,0 +1,91 @@
+"""
+업로드 수락 제어 미들웨어
+요청 본문을 받기 전에 판정해, 거부할 업로드가 디스크(임시 파일 포함)와 큐를 차지하지 않도록 함
+
+일괄 업로드의 form 파싱은 본문 전체를 임시 파일에 받아 두므로
+라우터가 아닌 ASGI 미들웨어에서 확인합니다.
+"""
+from typing import Iterable
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.services.admission_service import AdmissionRejectedError, admission_service
+
+
+def get_client_id(request: Request) -> str:
+    """
+    요청 수 제한용 클라이언트 식별자
+
+    Args:
+        request: 요청
+
+    Returns:
+        RATE_LIMIT_CLIENT_HEADER 헤더 값 (없으면 클라이언트 IP)
+    """
+    if settings.rate_limit_client_header:
+        client_id = request.headers.get(settings.rate_limit_client_header, "").strip()
+        if client_id:
+            return client_id
+    return request.client.host if request.client else "unknown"
+
+
+def expected_body_bytes(request: Request) -> int:
+    """
+    디스크 확인에 사용할 요청 본문 크기
+
+    Content-Length가 없거나(chunked 전송) 잘못된 값이면 0이 아니라
+    파일 하나의 최대 크기(UPLOAD_MAX_SIZE_MB)로 추정해 디스크 확인을 건너뛰지 않도록 합니다.
+
+    Args:
+        request: 요청
+
+    Returns:
+        본문 크기 (bytes)
+    """
+    try:
+        content_length = int(request.headers["content-length"])
+    except (KeyError, ValueError):
+        content_length = -1
+
+    if content_length < 0:
+        return settings.upload_max_size_mb * 1024 * 1024
+    return content_length
+
+
+class UploadAdmissionMiddleware:
+    """업로드 경로 POST 요청 수락 제어 (거부 시 429/503 + Retry-After)"""
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]):
+        """
+        초기화
+
+        Args:
+            app: 다음 ASGI 앱
+            paths: 수락 제어 대상 경로 (예: /api/v1/upload)
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        incoming_bytes = expected_body_bytes(request)
+
+        try:
+            await admission_service.admit(get_client_id(request), incoming_bytes)
+        except AdmissionRejectedError as e:
+            response = JSONResponse(
+                status_code=e.status_code,
+                content={"detail": str(e), "reason": e.reason, "retry_after": e.retry_after},
+                headers={"Retry-After": str(e.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
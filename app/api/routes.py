@@ -1,102 +1,584 @@
 """
 FastAPI 라우터
 """
+import asyncio
+import json
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import UploadFile as StarletteUploadFile
 from loguru import logger
 
 from app.api.schemas import (
     AudioFileUploadResponse,
+    BacklogResponse,
+    BatchRejectedFile,
+    BatchUploadResponse,
+    BatchStatusResponse,
     TaskStatusResponse,
     TaskResultResponse,
+    TaskRecordResponse,
+    TaskListResponse,
+    SearchHit,
+    SearchResponse,
     PromptUpdateRequest,
     PromptResponse,
     DictionaryUpdateRequest,
     DictionaryResponse,
+    ResummarizeRequest,
+    ResummarizeJobResponse,
     HealthCheckResponse,
     TaskStatus,
 )
+from app.core.celery_client import PROCESS_AUDIO_TASK, celery_client
 from app.core.config import settings
+from app.core.metrics import UPLOAD_BYTES, UPLOAD_FILES
+from app.db.models import TaskRecord
+from app.db.search_index import KIND_SUMMARY, KIND_TRANSCRIPT, search_index_repository
+from app.db.task_index import task_index_repository
+from app.services.admission_service import AdmissionRejectedError, admission_service
+from app.services.decoding_policy import DECODING_TIERS, PASS_PREVIEW, TIER_FULL
+from app.services.device_service import device_router
+from app.services.health_service import health_service
+from app.services.resummarize_service import read_summary_meta, resummarize_service
+from app.services.summary_config_service import summary_config_store
+from app.services.task_event_service import TERMINAL_EVENTS, task_event_service
+from app.utils.http_cache import ResponseBodyCache, build_cached_response, file_version
+from app.utils.upload_utils import (
+    InvalidWavError,
+    MalformedUploadError,
+    UploadTooLargeError,
+    extract_wav_archive,
+    is_archive_filename,
+    receive_wav_upload,
+    save_upload_stream,
+)
 
 router = APIRouter()
 
+# 일괄 업로드는 form을 직접 파싱하므로 요청 본문 스키마를 문서에 명시
+SINGLE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                    },
+                },
+            },
+        },
+    },
+}
+
+BATCH_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["files"],
+                    "properties": {
+                        "files": {"type": "array", "items": {"type": "string", "format": "binary"}},
+                    },
+                },
+            },
+        },
+    },
+}
+
+# 결과 응답/다운로드 본문 캐시 (파일 mtime/size 변경 시 자동 무효화)
+result_cache = ResponseBodyCache(settings.result_cache_max_mb * 1024 * 1024)
+
+
+def _snapshot_event(record: TaskRecord) -> str:
+    """SSE 연결 직후 보내는 작업 상태 이벤트 이름 (미리보기만 끝난 2단계 작업은 종료 이벤트가 아님)"""
+    if record.status == TaskStatus.COMPLETED.value and record.result_pass == PASS_PREVIEW:
+        return "refine_failed" if record.error_message else "preview_completed"
+    return record.status if record.status in TERMINAL_EVENTS else "snapshot"
+
+
+def _record_to_response(record: TaskRecord) -> TaskRecordResponse:
+    """작업 인덱스 레코드를 응답 스키마로 변환"""
+    return TaskRecordResponse(
+        task_id=record.task_id,
+        filename=record.filename,
+        status=TaskStatus(record.status),
+        progress=record.progress,
+        content_hash=record.content_hash,
+        file_size=record.file_size,
+        audio_duration=record.audio_duration,
+        channels=record.channels,
+        stage_timings=record.stage_timings,
+        srt_file_path=record.srt_path,
+        summary_file_path=record.summary_path,
+        trace_file_path=record.trace_path,
+        decoding_tier=record.decoding_tier,
+        result_pass=record.result_pass,
+        error_message=record.error_message,
+        created_at=record.created_at,
+        started_at=record.started_at,
+        completed_at=record.completed_at,
+    )
+
+
+def _upload_task_kwargs(two_pass: Optional[bool], content_hash: str) -> dict:
+    """
+    업로드 파일 처리 작업 인자
+
+    Args:
+        two_pass: 2단계 처리 여부 (요청에 지정이 없으면 TWO_PASS_ENABLED)
+        content_hash: 업로드 시 계산한 SHA-256 (Worker가 정규화 오디오 캐시 키로 사용)
+
+    Returns:
+        process_audio_file kwargs
+    """
+    if two_pass is None:
+        two_pass = settings.two_pass_enabled
+    kwargs = {"content_hash": content_hash}
+    if two_pass:
+        kwargs["result_pass"] = PASS_PREVIEW
+    return kwargs
+
 
 @router.get("/health", response_model=HealthCheckResponse, tags=["시스템"])
-async def health_check():
+async def health_check(response: Response):
     """
     시스템 헬스 체크
-    - Redis 연결 상태
-    - Ollama 가용 상태
-    - GPU 상태
+    - Redis 연결 상태 및 큐 길이
+    - Ollama 가용 상태 및 로드된 모델
+    - GPU 상태 (pynvml)
+
+    값은 백그라운드에서 HEALTH_CHECK_INTERVAL_SEC 주기로 갱신된 캐시이며,
+    Redis에 연결할 수 없으면(작업 등록 불가) 503을 반환합니다.
     """
-    # TODO: 실제 헬스 체크 로직 구현
+    snapshot = health_service.snapshot
+
+    if snapshot.status in ("starting", "down"):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
     return HealthCheckResponse(
-        status="ok",
-        redis_connected=True,
-        ollama_available=True,
-        gpu_available=True,
-        gpu_memory_free_mb=8192,
+        status=snapshot.status,
+        redis_connected=snapshot.redis_connected,
+        ollama_available=snapshot.ollama_available,
+        gpu_available=snapshot.gpu_available,
+        gpu_memory_free_mb=snapshot.gpu_memory_free_mb,
+        queue_depth=snapshot.queue_depth,
+        ollama_loaded_models=snapshot.ollama_loaded_models,
+        gpus=snapshot.gpus,
+        devices=snapshot.devices,
+        checked_at=snapshot.checked_at,
+        check_duration_ms=snapshot.check_duration_ms,
     )
 
 
-@router.post("/upload", response_model=AudioFileUploadResponse, tags=["파일 처리"])
-async def upload_audio_file(file: UploadFile = File(...)):
+@router.get("/backlog", response_model=BacklogResponse, tags=["시스템"])
+async def get_backlog():
     """
-    WAV 파일 업로드
-    - 파일을 input/ 폴더에 저장
-    - Celery 작업 큐에 추가
+    처리 대기량 추정
+    - 큐 길이, 대기/처리 중 오디오 길이, 최근 처리량 기준 예상 대기 시간
+    - 업로드하는 시스템이 accepting/estimated_wait_sec로 전송 속도를 조절하는 용도
     """
-    # 파일 확장자 검증
-    if not file.filename.lower().endswith(".wav"):
+    try:
+        backlog = await admission_service.backlog()
+    except Exception as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="WAV 파일만 업로드 가능합니다.",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"처리 대기량 확인 실패: {str(e)}",
         )
 
+    accepting, retry_after = True, None
+    try:
+        await admission_service.check_capacity()
+    except AdmissionRejectedError as e:
+        accepting, retry_after = False, e.retry_after
+
+    return BacklogResponse(**backlog.to_dict(), accepting=accepting, retry_after_sec=retry_after)
+
+
+@router.post(
+    "/upload",
+    response_model=AudioFileUploadResponse,
+    tags=["파일 처리"],
+    openapi_extra=SINGLE_UPLOAD_OPENAPI,
+)
+async def upload_audio_file(
+    request: Request,
+    two_pass: Optional[bool] = Query(None, description="2단계 처리 (미리보기 후 최종 처리, 기본값: TWO_PASS_ENABLED)"),
+):
+    """
+    WAV 파일 업로드
+    - 큐/대기 오디오/디스크/클라이언트 요청 수 한도 초과 시 본문 수신 전 429/503 + Retry-After
+    - multipart 본문을 스풀링하지 않고 요청 스트림에서 바로 input/ 폴더에 저장 (임시 파일 → 원자적 rename)
+    - WAV 헤더와 최대 크기는 청크가 도착할 때마다 검사 (잘못된 파일은 본문을 다 받기 전에 거부)
+    - Celery 작업 큐에 추가
+    - two_pass: 작은 모델로 미리보기 결과를 먼저 저장한 뒤 낮은 우선순위로 최종 결과로 교체 (긴급 통화용)
+    """
     # 고유 작업 ID 생성
     task_id = str(uuid.uuid4())
 
     # 파일 저장
-    file_path = settings.input_dir / file.filename
-
     try:
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        file_path, file_size, content_hash = await receive_wav_upload(
+            request.stream(),
+            request.headers.get("content-type", ""),
+            settings.input_dir,
+            max_bytes=settings.upload_max_size_mb * 1024 * 1024,
+            chunk_size=settings.upload_chunk_size_kb * 1024,
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+    except InvalidWavError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"유효하지 않은 WAV 파일입니다: {str(e)}",
+        )
+    except MalformedUploadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"파일 저장 실패: {str(e)}",
         )
 
-    # Celery 작업 큐에 추가
-    from app.tasks.audio_task import process_audio_file
-    celery_task = process_audio_file.delay(str(file_path), task_id)
+    UPLOAD_BYTES.inc(file_size)
+    UPLOAD_FILES.labels(endpoint="upload").inc()
+
+    # 작업 인덱스 등록 (실패해도 Worker가 처리 시작 시 레코드를 생성함)
+    try:
+        await task_index_repository.create_task(
+            task_id=task_id,
+            filename=file_path.name,
+            content_hash=content_hash,
+            file_size=file_size,
+        )
+    except Exception as e:
+        logger.error(f"❌ 작업 인덱스 등록 실패 [{task_id}]: {e}")
+
+    # Celery 작업 큐에 추가 (작업 ID를 Celery task ID로 그대로 사용, GPU Worker가 등록되어 있으면 장치 큐 선택)
+    snapshot = health_service.snapshot
+    celery_task = celery_client.send_task(
+        PROCESS_AUDIO_TASK,
+        args=[str(file_path), task_id],
+        kwargs=_upload_task_kwargs(two_pass, content_hash),
+        task_id=task_id,
+        queue=device_router.select_queue(snapshot.devices, snapshot.queue_depth, snapshot.version),
+    )
 
     logger.info(f"📋 작업 추가됨: {task_id} (Celery Task: {celery_task.id})")
 
     return AudioFileUploadResponse(
-        task_id=celery_task.id,  # Celery task ID 사용
-        filename=file.filename,
+        task_id=celery_task.id,
+        filename=file_path.name,
         status=TaskStatus.PENDING,
     )
 
 
+@router.post(
+    "/upload/batch",
+    response_model=BatchUploadResponse,
+    tags=["파일 처리"],
+    openapi_extra=BATCH_UPLOAD_OPENAPI,
+)
+async def upload_audio_batch(
+    request: Request,
+    two_pass: Optional[bool] = Query(None, description="2단계 처리 (기본값: TWO_PASS_ENABLED)"),
+):
+    """
+    WAV 파일 일괄 업로드
+    - 여러 WAV 파일 또는 zip/tar 아카이브(WAV 포함)를 한 번에 업로드 (multipart files 필드, 최대 BATCH_MAX_FILES개)
+    - 파일명은 배치 전체(아카이브 내부 포함)에서 중복될 수 없음
+    - 작업 인덱스에 단일 트랜잭션으로 등록
+    - Celery group으로 한 번에 큐에 추가
+    - 진행 상태는 GET /batches/{batch_id}로 조회
+    """
+    batch_id = str(uuid.uuid4())
+    chunk_size = settings.upload_chunk_size_kb * 1024
+    max_bytes = settings.upload_max_size_mb * 1024 * 1024
+
+    saved: List[tuple] = []  # [(저장 경로, 크기, SHA-256), ...]
+    rejected: List[BatchRejectedFile] = []
+    seen_names: set = set()  # 배치 전체 파일명 (같은 input/ 경로를 두 작업이 가리키지 않도록)
+
+    # Starlette 기본 form 파싱은 파일 1000개로 제한되므로 BATCH_MAX_FILES까지 직접 파싱
+    form = await request.form(max_files=settings.batch_max_files, max_fields=settings.batch_max_files)
+    files = [item for item in form.getlist("files") if isinstance(item, StarletteUploadFile)]
+    if not files:
+        await form.close()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="files 필드에 업로드할 파일이 없습니다.",
+        )
+
+    try:
+        for upload in files:
+            if len(saved) >= settings.batch_max_files:
+                rejected.append(BatchRejectedFile(
+                    filename=upload.filename,
+                    reason=f"배치 최대 파일 수({settings.batch_max_files}) 초과",
+                ))
+                continue
+
+            # 아카이브: 디스크로 스트리밍 후 스레드 풀에서 WAV만 추출
+            if is_archive_filename(upload.filename):
+                archive_path = settings.input_dir / f".batch-{batch_id}-{uuid.uuid4().hex}.archive"
+                try:
+                    await save_upload_stream(
+                        upload,
+                        archive_path,
+                        max_bytes=settings.batch_archive_max_size_mb * 1024 * 1024,
+                        chunk_size=chunk_size,
+                        validate_wav=False,
+                    )
+                    accepted, archive_rejected = await asyncio.to_thread(
+                        extract_wav_archive,
+                        archive_path,
+                        settings.input_dir,
+                        settings.batch_max_files - len(saved),
+                        chunk_size,
+                        max_bytes,
+                        seen_names,
+                    )
+                except (UploadTooLargeError, ValueError) as e:
+                    rejected.append(BatchRejectedFile(filename=upload.filename, reason=str(e)))
+                    continue
+                finally:
+                    archive_path.unlink(missing_ok=True)
+
+                saved.extend(accepted)
+                rejected.extend(
+                    BatchRejectedFile(filename=f"{upload.filename}:{name}", reason=reason)
+                    for name, reason in archive_rejected
+                )
+                continue
+
+            if not upload.filename.lower().endswith(".wav"):
+                rejected.append(BatchRejectedFile(
+                    filename=upload.filename,
+                    reason="WAV 파일 또는 zip/tar 아카이브만 업로드 가능합니다.",
+                ))
+                continue
+
+            filename = Path(upload.filename).name
+            if filename in seen_names:
+                rejected.append(BatchRejectedFile(filename=upload.filename, reason="배치 내 중복 파일명"))
+                continue
+            seen_names.add(filename)
+
+            file_path = settings.input_dir / filename
+            try:
+                file_size, content_hash = await save_upload_stream(
+                    upload, file_path, max_bytes=max_bytes, chunk_size=chunk_size
+                )
+            except (UploadTooLargeError, InvalidWavError) as e:
+                rejected.append(BatchRejectedFile(filename=upload.filename, reason=str(e)))
+                continue
+
+            saved.append((file_path, file_size, content_hash))
+    finally:
+        await form.close()
+
+    if not saved:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "message": "처리 가능한 WAV 파일이 없습니다.",
+                "rejected": [item.model_dump() for item in rejected],
+            },
+        )
+
+    UPLOAD_BYTES.inc(sum(file_size for _, file_size, _ in saved))
+    UPLOAD_FILES.labels(endpoint="batch").inc(len(saved))
+
+    tasks = [
+        {
+            "task_id": str(uuid.uuid4()),
+            "filename": file_path.name,
+            "content_hash": content_hash,
+            "file_size": file_size,
+        }
+        for file_path, file_size, content_hash in saved
+    ]
+
+    # 작업 인덱스 일괄 등록
+    try:
+        await task_index_repository.create_tasks_bulk(batch_id, tasks)
+    except Exception as e:
+        logger.error(f"❌ 배치 작업 인덱스 등록 실패 [{batch_id}]: {e}")
+
+    # Celery group으로 일괄 큐 추가 (단일 producer 연결, group ID = 배치 ID, 파일별로 장치 큐 분산)
+    from celery import group
+
+    snapshot = health_service.snapshot
+    group(
+        celery_client.signature(
+            PROCESS_AUDIO_TASK,
+            args=(str(file_path), task["task_id"]),
+            kwargs=_upload_task_kwargs(two_pass, task["content_hash"]),
+            task_id=task["task_id"],
+            queue=device_router.select_queue(snapshot.devices, snapshot.queue_depth, snapshot.version),
+        )
+        for (file_path, _, _), task in zip(saved, tasks)
+    ).apply_async(task_id=batch_id)
+
+    logger.info(f"📋 배치 작업 추가됨: {batch_id} ({len(tasks)}개, 거부 {len(rejected)}개)")
+
+    return BatchUploadResponse(
+        batch_id=batch_id,
+        total=len(tasks),
+        tasks=[
+            AudioFileUploadResponse(task_id=task["task_id"], filename=task["filename"])
+            for task in tasks
+        ],
+        rejected=rejected,
+    )
+
+
+@router.get("/batches/{batch_id}", response_model=BatchStatusResponse, tags=["작업 관리"])
+async def get_batch_status(batch_id: str):
+    """
+    배치 진행 상태 조회
+    - 작업 인덱스 집계 기준 (Celery 결과 만료와 무관)
+    - 개별 작업 목록은 GET /tasks?batch_id=...
+    """
+    summary = await task_index_repository.get_batch_summary(batch_id)
+
+    if not summary:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="배치를 찾을 수 없습니다.",
+        )
+
+    total = sum(count for count, _ in summary.values())
+    progress_sum = sum(progress for _, progress in summary.values())
+
+    return BatchStatusResponse(
+        batch_id=batch_id,
+        total=total,
+        pending=summary.get(TaskStatus.PENDING.value, (0, 0))[0],
+        in_progress=summary.get(TaskStatus.IN_PROGRESS.value, (0, 0))[0],
+        completed=summary.get(TaskStatus.COMPLETED.value, (0, 0))[0],
+        failed=summary.get(TaskStatus.FAILED.value, (0, 0))[0],
+        progress=progress_sum // total,
+    )
+
+
+@router.get("/tasks", response_model=TaskListResponse, tags=["작업 관리"])
+async def list_tasks(
+    task_status: Optional[TaskStatus] = Query(None, alias="status", description="상태 필터"),
+    filename: Optional[str] = Query(None, description="파일명 접두어"),
+    content_hash: Optional[str] = Query(None, description="파일 SHA-256"),
+    batch_id: Optional[str] = Query(None, description="배치 ID"),
+    created_from: Optional[datetime] = Query(None, description="생성 시각 하한 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="생성 시각 상한 (미포함)"),
+    decoding_tier: Optional[str] = Query(None, description="STT 품질 단계 (full, balanced, fast)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, description="페이지 크기"),
+):
+    """
+    작업 목록 조회 (최신순)
+    - 작업 인덱스 DB 기준이므로 Celery 결과 만료와 무관
+    - decoding_tier로 부하 때문에 낮은 품질 단계로 처리된 작업만 조회 (재처리 대상)
+    - next_cursor로 다음 페이지 조회
+    """
+    try:
+        records, next_cursor = await task_index_repository.list_tasks(
+            status=task_status.value if task_status else None,
+            filename=filename,
+            content_hash=content_hash,
+            batch_id=batch_id,
+            created_from=created_from,
+            created_to=created_to,
+            decoding_tier=decoding_tier,
+            cursor=cursor,
+            limit=min(limit, settings.task_list_max_limit),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return TaskListResponse(
+        items=[_record_to_response(record) for record in records],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/search", response_model=SearchResponse, tags=["작업 관리"])
+async def search_transcripts(
+    q: str = Query(..., description="검색어 (문자/숫자 2자 이상, 공백/문장 부호 무시)"),
+    kind: Optional[str] = Query(None, description="항목 종류 (transcript, summary)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, description="페이지 크기"),
+):
+    """
+    전사/요약 전문 검색
+    - 문자 bigram 역색인(SQLite FTS5)으로 부분 문자열 검색 ("당일콜", 병원명 등)
+    - 세그먼트별 작업 ID, 시각, 화자 반환 (최근 색인 순, 커서 페이지네이션)
+    """
+    if kind is not None and kind not in (KIND_TRANSCRIPT, KIND_SUMMARY):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"kind는 {KIND_TRANSCRIPT} 또는 {KIND_SUMMARY}만 가능합니다.",
+        )
+
+    try:
+        rows, next_cursor = await search_index_repository.search(
+            q,
+            kind=kind,
+            cursor=int(cursor) if cursor else None,
+            limit=min(limit, settings.task_list_max_limit),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return SearchResponse(
+        items=[
+            SearchHit(
+                task_id=row["task_id"],
+                filename=row["filename"],
+                source=row["source"],
+                kind=row["kind"],
+                start=row["start_sec"],
+                end=row["end_sec"],
+                speaker=row["speaker"],
+                text=row["text"],
+            )
+            for row in rows
+        ],
+        next_cursor=str(next_cursor) if next_cursor is not None else None,
+    )
+
+
 @router.get("/tasks/{task_id}", response_model=TaskStatusResponse, tags=["작업 관리"])
 async def get_task_status(task_id: str):
     """
     작업 상태 조회
     """
-    from app.tasks.audio_task import process_audio_file
     from celery.result import AsyncResult
 
     # Celery 작업 결과 조회
-    result = AsyncResult(task_id, app=process_audio_file.app)
+    result = AsyncResult(task_id, app=celery_client)
+    record = await task_index_repository.get_task(task_id)
 
     # 상태 매핑
     status_mapping = {
@@ -109,97 +591,376 @@ async def get_task_status(task_id: str):
 
     task_status = status_mapping.get(result.state, TaskStatus.PENDING)
 
-    # 진행률 계산 (임시)
-    progress = 0
-    if result.state == "STARTED":
-        progress = 50
-    elif result.state == "SUCCESS":
+    # Celery는 알 수 없는(만료된) 작업도 PENDING으로 보고하므로 인덱스 상태 우선
+    if record is not None and result.state == "PENDING":
+        task_status = TaskStatus(record.status)
+
+    # 진행률 계산
+    if task_status == TaskStatus.COMPLETED:
         progress = 100
+    elif record is not None:
+        progress = record.progress
+    elif result.state == "STARTED":
+        progress = 50
+    else:
+        progress = 0
+
+    if record is None:
+        return TaskStatusResponse(
+            task_id=task_id,
+            filename="",
+            status=task_status,
+            progress=progress,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
 
     return TaskStatusResponse(
         task_id=task_id,
-        filename="",  # TODO: 파일명 조회
+        filename=record.filename,
         status=task_status,
         progress=progress,
-        created_at=datetime.now(),  # TODO: 실제 생성 시간
-        updated_at=datetime.now(),
+        created_at=record.created_at,
+        updated_at=record.updated_at,
+        error_message=record.error_message,
+        result_pass=record.result_pass,
+    )
+
+
+@router.post(
+    "/tasks/{task_id}/reprocess",
+    response_model=AudioFileUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["작업 관리"],
+)
+async def reprocess_task(
+    task_id: str,
+    decoding_tier: str = Query(TIER_FULL, description="재처리 품질 단계 (full, balanced, fast)"),
+):
+    """
+    완료된 작업을 지정한 품질 단계로 재처리
+    - 부하가 높을 때 낮은 단계(balanced/fast)로 처리된 결과를 부하가 줄어든 뒤 다시 처리
+    - 처리 완료된 원본(processed/)을 input/으로 옮겨 같은 작업 ID로 큐에 추가 (결과 파일은 덮어씀)
+    - 2단계 처리의 최종 처리가 실패한 작업도 재처리 가능 (원본은 processed/에 있음)
+    """
+    if decoding_tier not in DECODING_TIERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 품질 단계입니다: {decoding_tier} (가능: {', '.join(DECODING_TIERS)})",
+        )
+
+    record = await task_index_repository.get_task(task_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다.",
+        )
+    if record.status != TaskStatus.COMPLETED.value:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"완료된 작업만 재처리할 수 있습니다 (현재 상태: {record.status}).",
+        )
+    # 최종 처리가 실패한 미리보기 결과(error_message 기록됨)는 재처리 가능
+    if record.result_pass == PASS_PREVIEW and not record.error_message:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="2단계 처리의 최종 처리가 아직 끝나지 않았습니다.",
+        )
+
+    processed_path = settings.processed_dir / record.filename
+    file_path = settings.input_dir / record.filename
+    if not processed_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="처리 완료된 원본 오디오 파일을 찾을 수 없습니다.",
+        )
+    if file_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="같은 이름의 파일이 이미 처리 대기 중입니다.",
+        )
+
+    from celery.result import AsyncResult
+
+    await asyncio.to_thread(processed_path.rename, file_path)
+    await task_index_repository.mark_requeued(task_id)
+
+    # 같은 작업 ID를 재사용하므로 이전 SUCCESS 결과를 지워 상태 조회가 대기 중으로 보이도록 함
+    AsyncResult(task_id, app=celery_client).forget()
+
+    snapshot = health_service.snapshot
+    celery_client.send_task(
+        PROCESS_AUDIO_TASK,
+        args=[str(file_path), task_id],
+        kwargs={"decoding_tier": decoding_tier, "content_hash": record.content_hash},
+        task_id=task_id,
+        queue=device_router.select_queue(snapshot.devices, snapshot.queue_depth, snapshot.version),
+    )
+
+    logger.info(f"🔁 재처리 추가됨: {task_id} ({record.filename}, 품질 단계 {decoding_tier})")
+
+    return AudioFileUploadResponse(
+        task_id=task_id,
+        filename=record.filename,
+        status=TaskStatus.PENDING,
+    )
+
+
+@router.get("/events", tags=["작업 관리"])
+async def stream_task_events(
+    task_ids: List[str] = Query(default=[], alias="task_id", description="구독할 작업 ID (여러 개 가능)"),
+    batch_id: Optional[str] = Query(None, description="배치 ID (배치 내 전체 작업 구독)"),
+):
+    """
+    작업 진행 이벤트 스트림 (Server-Sent Events)
+    - 하나의 연결로 여러 작업의 단계 전환/진행률/완료 이벤트 수신
+    - 연결 직후 현재 상태를 snapshot 이벤트로 전송
+    - 모든 작업이 completed/failed가 되면 스트림 종료
+      (2단계 처리는 미리보기 완료(preview_completed) 후 최종 처리의 completed/refine_failed까지 유지)
+    """
+    subscribed = list(dict.fromkeys(task_ids))
+    if batch_id:
+        subscribed.extend(
+            task_id
+            for task_id in await task_index_repository.get_batch_task_ids(batch_id)
+            if task_id not in subscribed
+        )
+
+    if not subscribed:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="task_id 또는 batch_id가 필요합니다.",
+        )
+
+    if len(subscribed) > settings.task_event_max_tasks:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 구독 가능한 작업 수({settings.task_event_max_tasks})를 초과했습니다.",
+        )
+
+    async def snapshot() -> List[dict]:
+        records = await task_index_repository.get_tasks(subscribed)
+        return [
+            {
+                "task_id": record.task_id,
+                "event": _snapshot_event(record),
+                "filename": record.filename,
+                "status": record.status,
+                "progress": record.progress,
+            }
+            for record in records
+        ]
+
+    async def event_stream():
+        async for event in task_event_service.subscribe(
+            subscribed,
+            keepalive_sec=settings.task_event_keepalive_sec,
+            snapshot=snapshot,
+        ):
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+
+            data = json.dumps(event, ensure_ascii=False)
+            yield f"event: {event.get('event', 'message')}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
 @router.get("/results/{task_id}", response_model=TaskResultResponse, tags=["작업 관리"])
-async def get_task_result(task_id: str):
+async def get_task_result(task_id: str, request: Request):
     """
     작업 결과 조회
+    - 결과 본문은 프로세스 내 LRU 캐시에서 제공 (결과 파일 변경 시 무효화)
+    - ETag/Last-Modified 조건부 요청 시 304
+    - Accept-Encoding에 따라 gzip/br 압축
     """
-    from app.tasks.audio_task import process_audio_file
     from celery.result import AsyncResult
 
-    # Celery 작업 결과 조회
-    result = AsyncResult(task_id, app=process_audio_file.app)
+    # Celery 작업 결과 조회 (만료된 경우 작업 인덱스로 대체)
+    result = AsyncResult(task_id, app=celery_client)
+    record = await task_index_repository.get_task(task_id)
 
-    if result.state != "SUCCESS":
+    if result.state == "SUCCESS":
+        filename = result.result.get("filename", "")
+    elif record is not None and record.status == TaskStatus.COMPLETED.value:
+        filename = record.filename
+    else:
+        current_state = record.status if record is not None else result.state
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"작업이 완료되지 않았습니다. 현재 상태: {result.state}",
+            detail=f"작업이 완료되지 않았습니다. 현재 상태: {current_state}",
         )
 
-    # 작업 결과에서 파일명 가져오기
-    task_result = result.result
-    filename = task_result.get("filename", "")
     base_name = Path(filename).stem
 
     # 파일 읽기
-    srt_path = settings.output_dir / f"{base_name}.srt"
-    summary_path = settings.output_dir / f"{base_name}_요약.txt"
+    if record is not None and record.srt_path and record.summary_path:
+        srt_path = Path(record.srt_path)
+        summary_path = Path(record.summary_path)
+    else:
+        srt_path = settings.output_dir / f"{base_name}.srt"
+        summary_path = settings.output_dir / f"{base_name}_요약.txt"
+
+    if record is not None and record.trace_path:
+        trace_path = Path(record.trace_path)
+    else:
+        trace_path = settings.output_dir / f"{base_name}_trace.json"
 
-    if not srt_path.exists() or not summary_path.exists():
+    try:
+        version = file_version(srt_path, summary_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="결과 파일을 찾을 수 없습니다.",
         )
 
-    srt_content = srt_path.read_text(encoding="utf-8")
-    summary = summary_path.read_text(encoding="utf-8")
+    # 트레이스는 선택 항목 (이전 버전 결과에는 없음)
+    try:
+        version += file_version(trace_path)
+    except FileNotFoundError:
+        trace_path = None
+
+    # 최종 결과 파일 교체와 작업 인덱스 갱신 사이에 캐시된 단계 표시가 남지 않도록 단계별로 캐시
+    result_pass = record.result_pass if record is not None else None
+    cache_key = ("result", task_id, result_pass)
+    cached = result_cache.get(cache_key, version)
 
-    return TaskResultResponse(
-        task_id=task_id,
-        filename=filename,
-        srt_content=srt_content,
-        summary=summary,
+    if cached is None:
+        def read_result_files() -> tuple:
+            return (
+                srt_path.read_text(encoding="utf-8"),
+                summary_path.read_text(encoding="utf-8"),
+                json.loads(trace_path.read_text(encoding="utf-8")) if trace_path else None,
+                read_summary_meta(summary_path).get("config_version"),
+            )
+
+        # 결과 파일 읽기는 스레드 풀에서 (이벤트 루프 블로킹 방지)
+        srt_content, summary, trace, summary_config_version = await asyncio.to_thread(read_result_files)
+
+        payload = TaskResultResponse(
+            task_id=task_id,
+            filename=filename,
+            srt_content=srt_content,
+            summary=summary,
+            srt_file_path=str(srt_path),
+            summary_file_path=str(summary_path),
+            trace=trace,
+            trace_file_path=str(trace_path) if trace_path else None,
+            summary_config_version=summary_config_version,
+            result_pass=result_pass,
+        )
+        cached = result_cache.put(cache_key, version, payload.model_dump_json().encode("utf-8"))
+
+    return build_cached_response(
+        request,
+        result_cache,
+        cache_key,
+        cached,
+        media_type="application/json",
+        last_modified=max(mtime_ns for mtime_ns, _ in version) / 1e9,
+        compress_min_bytes=settings.response_compress_min_bytes,
     )
 
 
 @router.get("/download/srt/{filename}", tags=["파일 다운로드"])
-async def download_srt(filename: str):
+async def download_srt(filename: str, request: Request):
     """
     SRT 파일 다운로드
+    - ETag/Last-Modified 조건부 요청 시 304
+    - Range 요청 시 206 (부분 응답)
+    - Accept-Encoding에 따라 gzip/br 압축
     """
+    if Path(filename).name != filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 파일명입니다.",
+        )
+
     file_path = settings.output_dir / filename
 
-    if not file_path.exists():
+    try:
+        cached, mtime = await result_cache.get_file(file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="파일을 찾을 수 없습니다.",
         )
 
-    return FileResponse(
-        path=str(file_path),
-        filename=filename,
-        media_type="text/plain",
+    return build_cached_response(
+        request,
+        result_cache,
+        ("file", str(file_path)),
+        cached,
+        media_type="text/plain; charset=utf-8",
+        last_modified=mtime,
+        compress_min_bytes=settings.response_compress_min_bytes,
+        allow_range=True,
+        headers={
+            "Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}",
+        },
     )
 
 
+@router.post(
+    "/resummarize",
+    response_model=ResummarizeJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["작업 관리"],
+)
+async def start_resummarize(request: ResummarizeRequest):
+    """
+    일괄 재요약 시작
+    - 저장된 SRT에서 대화 전문을 다시 만들어 요약만 새로 생성 (STT 재실행 없음)
+    - 프롬프트/용어 사전/대화 전문이 이전 요약과 같은 파일은 생략 (force=true면 모두 재요약)
+    - 진행 상태는 GET /resummarize/{job_id}
+    """
+    if request.since and request.until and request.since > request.until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="since는 until보다 늦을 수 없습니다.",
+        )
+
+    srt_paths = await resummarize_service.collect_targets(
+        since=request.since,
+        until=request.until,
+        task_ids=request.task_ids,
+        batch_id=request.batch_id,
+    )
+    job = resummarize_service.start(srt_paths, force=request.force, concurrency=request.concurrency)
+
+    logger.info(f"📋 재요약 작업 추가됨: {job.job_id} ({job.total}개)")
+
+    return ResummarizeJobResponse(**job.to_dict())
+
+
+@router.get("/resummarize/{job_id}", response_model=ResummarizeJobResponse, tags=["작업 관리"])
+async def get_resummarize_status(job_id: str):
+    """
+    일괄 재요약 진행 상태 조회
+    """
+    job = resummarize_service.get(job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="재요약 작업을 찾을 수 없습니다.",
+        )
+
+    return ResummarizeJobResponse(**job.to_dict())
+
+
 @router.get("/config/prompt", response_model=PromptResponse, tags=["설정 관리"])
 async def get_prompt():
     """
-    현재 프롬프트 조회
+    현재 프롬프트 조회 (요약 설정 최신 버전)
     """
-    prompt_file = settings.config_dir / "default_prompt.txt"
-
     try:
-        prompt_content = prompt_file.read_text(encoding="utf-8")
-        stat = prompt_file.stat()
-        updated_at = datetime.fromtimestamp(stat.st_mtime)
+        config = await asyncio.to_thread(summary_config_store.get)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -207,8 +968,9 @@ async def get_prompt():
         )
 
     return PromptResponse(
-        prompt_content=prompt_content,
-        updated_at=updated_at,
+        prompt_content=config.prompt_template,
+        version=config.version,
+        updated_at=config.updated_at,
     )
 
 
@@ -216,12 +978,12 @@ async def get_prompt():
 async def update_prompt(request: PromptUpdateRequest):
     """
     프롬프트 수정
+    - 새 요약 설정 버전으로 저장 후 모든 API/Worker 프로세스에 변경 알림
     """
-    prompt_file = settings.config_dir / "default_prompt.txt"
-
     try:
-        prompt_file.write_text(request.prompt_content, encoding="utf-8")
-        updated_at = datetime.now()
+        config = await asyncio.to_thread(
+            summary_config_store.update, prompt_template=request.prompt_content
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -229,22 +991,19 @@ async def update_prompt(request: PromptUpdateRequest):
         )
 
     return PromptResponse(
-        prompt_content=request.prompt_content,
-        updated_at=updated_at,
+        prompt_content=config.prompt_template,
+        version=config.version,
+        updated_at=config.updated_at,
     )
 
 
 @router.get("/config/dictionary", response_model=DictionaryResponse, tags=["설정 관리"])
 async def get_dictionary():
     """
-    용어 사전 조회
+    용어 사전 조회 (요약 설정 최신 버전)
     """
-    dict_file = settings.config_dir / "dictionary.txt"
-
     try:
-        dictionary_content = dict_file.read_text(encoding="utf-8")
-        stat = dict_file.stat()
-        updated_at = datetime.fromtimestamp(stat.st_mtime)
+        config = await asyncio.to_thread(summary_config_store.get)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -252,8 +1011,9 @@ async def get_dictionary():
         )
 
     return DictionaryResponse(
-        dictionary_content=dictionary_content,
-        updated_at=updated_at,
+        dictionary_content=config.dictionary_content,
+        version=config.version,
+        updated_at=config.updated_at,
     )
 
 
@@ -261,12 +1021,12 @@ async def get_dictionary():
 async def update_dictionary(request: DictionaryUpdateRequest):
     """
     용어 사전 수정
+    - 새 요약 설정 버전으로 저장 후 모든 API/Worker 프로세스에 변경 알림
     """
-    dict_file = settings.config_dir / "dictionary.txt"
-
     try:
-        dict_file.write_text(request.dictionary_content, encoding="utf-8")
-        updated_at = datetime.now()
+        config = await asyncio.to_thread(
+            summary_config_store.update, dictionary_content=request.dictionary_content
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -274,6 +1034,7 @@ async def update_dictionary(request: DictionaryUpdateRequest):
         )
 
     return DictionaryResponse(
-        dictionary_content=request.dictionary_content,
-        updated_at=updated_at,
+        dictionary_content=config.dictionary_content,
+        version=config.version,
+        updated_at=config.updated_at,
     )
@@ -1,9 +1,9 @@
 """
 API 요청/응답 스키마 정의
 """
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -23,6 +23,31 @@ class AudioFileUploadResponse(BaseModel):
     message: str = Field(default="파일이 업로드되어 처리 대기 중입니다.")
 
 
+class BatchRejectedFile(BaseModel):
+    """배치 업로드에서 거부된 파일"""
+    filename: str = Field(..., description="파일명 (아카이브 내 경로 포함)")
+    reason: str = Field(..., description="거부 사유")
+
+
+class BatchUploadResponse(BaseModel):
+    """배치 업로드 응답"""
+    batch_id: str = Field(..., description="배치 ID")
+    total: int = Field(..., description="등록된 작업 수")
+    tasks: List[AudioFileUploadResponse] = Field(default_factory=list, description="등록된 작업 목록")
+    rejected: List[BatchRejectedFile] = Field(default_factory=list, description="거부된 파일 목록")
+
+
+class BatchStatusResponse(BaseModel):
+    """배치 진행 상태 응답"""
+    batch_id: str = Field(..., description="배치 ID")
+    total: int = Field(..., description="전체 작업 수")
+    pending: int = Field(default=0, description="대기 중")
+    in_progress: int = Field(default=0, description="처리 중")
+    completed: int = Field(default=0, description="완료")
+    failed: int = Field(default=0, description="실패")
+    progress: int = Field(default=0, ge=0, le=100, description="전체 진행률 (%)")
+
+
 class TaskStatusResponse(BaseModel):
     """작업 상태 조회 응답"""
     task_id: str = Field(..., description="작업 ID")
@@ -32,6 +57,9 @@ class TaskStatusResponse(BaseModel):
     created_at: datetime = Field(..., description="생성 시간")
     updated_at: Optional[datetime] = Field(None, description="업데이트 시간")
     error_message: Optional[str] = Field(None, description="에러 메시지 (실패 시)")
+    result_pass: Optional[str] = Field(
+        None, description="현재 결과 단계 (preview: 2단계 처리 미리보기, 최종 처리 대기 중 / final: 최종 결과)"
+    )
 
 
 class TaskResultResponse(BaseModel):
@@ -42,6 +70,56 @@ class TaskResultResponse(BaseModel):
     summary: Optional[str] = Field(None, description="요약 내용")
     srt_file_path: Optional[str] = Field(None, description="SRT 파일 경로")
     summary_file_path: Optional[str] = Field(None, description="요약 파일 경로")
+    trace: Optional[dict] = Field(None, description="처리 구간별 타이밍 트레이스")
+    trace_file_path: Optional[str] = Field(None, description="트레이스 파일 경로")
+    summary_config_version: Optional[int] = Field(None, description="요약에 사용한 요약 설정 버전")
+    result_pass: Optional[str] = Field(None, description="결과 단계 (preview: 미리보기, final: 최종 결과)")
+
+
+class TaskRecordResponse(BaseModel):
+    """작업 인덱스 레코드"""
+    task_id: str = Field(..., description="작업 ID")
+    filename: str = Field(..., description="파일명")
+    status: TaskStatus = Field(..., description="작업 상태")
+    progress: int = Field(default=0, ge=0, le=100, description="진행률 (%)")
+    content_hash: Optional[str] = Field(None, description="파일 SHA-256")
+    file_size: Optional[int] = Field(None, description="파일 크기 (bytes)")
+    audio_duration: Optional[float] = Field(None, description="오디오 길이 (초)")
+    channels: Optional[int] = Field(None, description="채널 수")
+    stage_timings: Optional[dict] = Field(None, description="단계별 처리 시간 (초)")
+    srt_file_path: Optional[str] = Field(None, description="SRT 파일 경로")
+    summary_file_path: Optional[str] = Field(None, description="요약 파일 경로")
+    trace_file_path: Optional[str] = Field(None, description="트레이스 파일 경로")
+    decoding_tier: Optional[str] = Field(None, description="STT 품질 단계 (full, balanced, fast, preview)")
+    result_pass: Optional[str] = Field(None, description="결과 단계 (preview, final)")
+    error_message: Optional[str] = Field(None, description="에러 메시지 (실패 시)")
+    created_at: datetime = Field(..., description="생성 시간")
+    started_at: Optional[datetime] = Field(None, description="처리 시작 시간")
+    completed_at: Optional[datetime] = Field(None, description="처리 완료 시간")
+
+
+class TaskListResponse(BaseModel):
+    """작업 목록 조회 응답"""
+    items: List[TaskRecordResponse] = Field(default_factory=list, description="작업 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+
+
+class SearchHit(BaseModel):
+    """전문 검색 결과 항목"""
+    task_id: Optional[str] = Field(None, description="작업 ID (작업 인덱스 이전 결과는 없을 수 있음)")
+    filename: Optional[str] = Field(None, description="원본 파일명")
+    source: str = Field(..., description="결과 파일 이름 (확장자 제외, {source}.srt / {source}_요약.txt)")
+    kind: str = Field(..., description="항목 종류 (transcript, summary)")
+    start: Optional[float] = Field(None, description="세그먼트 시작 (초, 요약은 없음)")
+    end: Optional[float] = Field(None, description="세그먼트 종료 (초, 요약은 없음)")
+    speaker: Optional[str] = Field(None, description="화자")
+    text: str = Field(..., description="세그먼트 텍스트 또는 요약")
+
+
+class SearchResponse(BaseModel):
+    """전문 검색 응답"""
+    items: List[SearchHit] = Field(default_factory=list, description="검색 결과 (최근 색인 순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
 
 
 class PromptUpdateRequest(BaseModel):
@@ -52,6 +130,7 @@ class PromptUpdateRequest(BaseModel):
 class PromptResponse(BaseModel):
     """프롬프트 조회/수정 응답"""
     prompt_content: str = Field(..., description="현재 프롬프트 내용")
+    version: int = Field(..., description="요약 설정 버전 (프롬프트/용어 사전 변경 시 증가)")
     updated_at: Optional[datetime] = Field(None, description="마지막 수정 시간")
 
 
@@ -63,13 +142,77 @@ class DictionaryUpdateRequest(BaseModel):
 class DictionaryResponse(BaseModel):
     """용어 사전 조회/수정 응답"""
     dictionary_content: str = Field(..., description="현재 용어 사전 내용")
+    version: int = Field(..., description="요약 설정 버전 (프롬프트/용어 사전 변경 시 증가)")
     updated_at: Optional[datetime] = Field(None, description="마지막 수정 시간")
 
 
+class ResummarizeRequest(BaseModel):
+    """일괄 재요약 요청 (조건이 없으면 output/*.srt 전체)"""
+    since: Optional[date] = Field(None, description="시작 날짜 (SRT 수정 날짜 기준, 포함)")
+    until: Optional[date] = Field(None, description="종료 날짜 (SRT 수정 날짜 기준, 포함)")
+    task_ids: List[str] = Field(default_factory=list, description="대상 작업 ID")
+    batch_id: Optional[str] = Field(None, description="대상 배치 ID")
+    force: bool = Field(default=False, description="입력이 바뀌지 않은 파일도 다시 요약")
+    concurrency: Optional[int] = Field(None, ge=1, le=64, description="동시 LLM 요청 수")
+
+
+class ResummarizeJobResponse(BaseModel):
+    """일괄 재요약 작업 상태"""
+    job_id: str = Field(..., description="재요약 작업 ID")
+    status: str = Field(..., description="상태 (pending, in_progress, completed, failed, cancelled)")
+    total: int = Field(..., description="대상 파일 수")
+    processed: int = Field(default=0, description="처리한 파일 수")
+    updated: int = Field(default=0, description="요약을 새로 생성한 파일 수")
+    skipped: int = Field(default=0, description="입력이 같거나 텍스트가 없어 생략한 파일 수")
+    failed: int = Field(default=0, description="실패한 파일 수")
+    progress: int = Field(default=0, description="진행률 (0-100)")
+    errors: List[str] = Field(default_factory=list, description="파일별 에러 (최대 20개)")
+    config_version: Optional[int] = Field(None, description="사용한 요약 설정 버전")
+    created_at: datetime = Field(..., description="시작 시각")
+    completed_at: Optional[datetime] = Field(None, description="종료 시각")
+
+
+class GpuStatus(BaseModel):
+    """GPU 상태"""
+    index: int = Field(..., description="GPU 번호")
+    name: str = Field(..., description="GPU 이름")
+    memory_free_mb: int = Field(..., description="여유 메모리 (MB)")
+    memory_total_mb: int = Field(..., description="전체 메모리 (MB)")
+
+
+class DeviceWorkerStatus(BaseModel):
+    """GPU Worker 상태 (Worker가 등록한 장치)"""
+    queue: str = Field(..., description="장치 큐 이름 (gpu.{번호})")
+    device_index: int = Field(..., description="물리 GPU 번호")
+    hostname: str = Field(..., description="Worker 호스트")
+    name: Optional[str] = Field(None, description="GPU 이름")
+    memory_free_mb: Optional[int] = Field(None, description="여유 메모리 (MB)")
+    memory_total_mb: Optional[int] = Field(None, description="전체 메모리 (MB)")
+
+
+class BacklogResponse(BaseModel):
+    """처리 대기량 추정 (업로드 측 자체 조절용)"""
+    queue_depth: int = Field(..., description="브로커 큐 대기 작업 수 (모든 큐 합계)")
+    queued_tasks: int = Field(..., description="대기/처리 중 작업 수 (작업 인덱스 기준)")
+    queued_audio_sec: float = Field(..., description="대기/처리 중 오디오 길이 합계 추정 (초)")
+    throughput: float = Field(..., description="최근 처리량 (1초당 처리한 오디오 초)")
+    estimated_wait_sec: Optional[float] = Field(None, description="지금 업로드한 파일의 예상 대기 시간 (초, 최근 완료 작업이 없으면 null)")
+    free_disk_mb: Optional[int] = Field(None, description="input 디렉토리 여유 공간 (MB, 확인 실패 시 null)")
+    accepting: bool = Field(..., description="현재 대기량 기준 업로드 수락 여부 (클라이언트별 요청 수 제한 제외)")
+    retry_after_sec: Optional[int] = Field(None, description="수락하지 않을 때 다시 시도할 때까지 대기 시간 (초)")
+    checked_at: datetime = Field(..., description="집계 시각")
+
+
 class HealthCheckResponse(BaseModel):
     """헬스 체크 응답"""
-    status: str = Field(default="ok")
+    status: str = Field(default="ok", description="전체 상태 (starting, ok, degraded, down)")
     redis_connected: bool = Field(..., description="Redis 연결 상태")
     ollama_available: bool = Field(..., description="Ollama 가용 상태")
     gpu_available: bool = Field(..., description="GPU 가용 상태")
-    gpu_memory_free_mb: Optional[int] = Field(None, description="GPU 여유 메모리 (MB)")
+    gpu_memory_free_mb: Optional[int] = Field(None, description="GPU 여유 메모리 (MB, GPU 중 최대값)")
+    queue_depth: Dict[str, int] = Field(default_factory=dict, description="큐별 대기 작업 수")
+    ollama_loaded_models: List[str] = Field(default_factory=list, description="Ollama에 로드된 모델")
+    gpus: List[GpuStatus] = Field(default_factory=list, description="GPU별 상태")
+    devices: List[DeviceWorkerStatus] = Field(default_factory=list, description="등록된 GPU Worker (장치별 큐)")
+    checked_at: Optional[datetime] = Field(None, description="마지막 확인 시각")
+    check_duration_ms: Optional[float] = Field(None, description="마지막 확인 소요 시간 (ms)")
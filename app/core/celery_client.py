@@ -0,0 +1,55 @@
+"""
+Celery 작업 등록 클라이언트 (API 프로세스용)
+태스크 모듈(app.tasks.*)을 import하지 않고 이름으로 작업을 보내고 결과를 조회
+
+API 프로세스에는 torch/pyannote/faster-whisper가 로드되지 않아야 하므로
+라우터는 app.tasks 대신 이 모듈만 사용합니다 (benchmarks.run_benchmarks --only startup으로 확인).
+"""
+from typing import List
+
+from celery import Celery
+from kombu.transport.redis import PRIORITY_STEPS, Channel
+
+from app.core.config import settings
+
+
+# 태스크 이름 (app.tasks.audio_task에서 등록)
+PROCESS_AUDIO_TASK = "process_audio_file"
+
+# API와 Worker가 공유하는 메시지/결과 설정 (Worker 전용 설정은 celery_app.py)
+MESSAGE_CONFIG = dict(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    timezone="Asia/Seoul",
+    enable_utc=True,
+    result_expires=3600,  # 결과 1시간 후 만료
+)
+
+
+def broker_queue_keys(queue_name: str) -> List[str]:
+    """
+    큐의 Redis 목록 키 (kombu 우선순위 단계별)
+
+    Redis 브로커는 우선순위가 0이 아닌 작업(2단계 처리 최종 작업 등)을 "{큐}\\x06\\x16{단계}" 목록에
+    저장하므로, 큐 길이는 모든 단계 목록의 LLEN 합계입니다 (단계 0은 큐 이름 그대로).
+
+    Args:
+        queue_name: Celery 큐 이름
+
+    Returns:
+        Redis 목록 키 (우선순위 단계 순)
+    """
+    return [
+        f"{queue_name}{Channel.sep}{step}" if step else queue_name
+        for step in PRIORITY_STEPS
+    ]
+
+
+# 전역 인스턴스 (태스크 미등록, send_task/signature/AsyncResult 전용)
+celery_client = Celery(
+    "voicecom_ai",
+    broker=settings.get_celery_broker_url(),
+    backend=settings.get_celery_result_backend(),
+)
+celery_client.conf.update(MESSAGE_CONFIG)
@@ -4,13 +4,43 @@ Pydantic Settings를 사용한 환경 변수 관리
 """
 from pathlib import Path
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, PrivateAttr, field_validator
 
 
 # 프로젝트 루트 경로
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
+def parse_rate_limit_overrides(value: str) -> dict[str, int]:
+    """
+    클라이언트별 분당 요청 한도 파싱 ("클라이언트=한도", 쉼표 구분)
+
+    Args:
+        value: RATE_LIMIT_OVERRIDES 값
+
+    Returns:
+        {클라이언트: 한도}
+
+    Raises:
+        ValueError: 항목 형식이 잘못되었거나 한도가 정수가 아닌 경우
+    """
+    overrides = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+
+        client, separator, limit = item.partition("=")
+        if not separator or not client.strip():
+            raise ValueError(
+                f"RATE_LIMIT_OVERRIDES 항목은 '클라이언트=한도' 형식이어야 합니다: {item.strip()!r}"
+            )
+        try:
+            overrides[client.strip()] = int(limit)
+        except ValueError:
+            raise ValueError(f"RATE_LIMIT_OVERRIDES 한도는 정수여야 합니다: {item.strip()!r}") from None
+    return overrides
+
+
 class Settings(BaseSettings):
     """애플리케이션 설정"""
 
@@ -29,10 +59,35 @@ class Settings(BaseSettings):
     ollama_model: str = Field(default="midm-2.0:base", alias="OLLAMA_MODEL")
     ollama_timeout: int = Field(default=120, alias="OLLAMA_TIMEOUT")
 
+    # 재요약 설정 (저장된 SRT 기반 일괄 재요약 시 동시 LLM 요청 수)
+    resummarize_concurrency: int = Field(default=4, alias="RESUMMARIZE_CONCURRENCY")
+
+    # 요약 설정 (프롬프트/용어 사전) 최신 버전 확인 주기 (초, 변경 알림을 놓쳤을 때 대비)
+    summary_config_check_sec: float = Field(default=60.0, alias="SUMMARY_CONFIG_CHECK_SEC")
+
     # Whisper 설정
     whisper_model: str = Field(default="dropbox-dash/faster-whisper-large-v3-turbo", alias="WHISPER_MODEL")
     whisper_device: str = Field(default="cuda", alias="WHISPER_DEVICE")
     whisper_compute_type: str = Field(default="float16", alias="WHISPER_COMPUTE_TYPE")
+    whisper_fallback_model: str = Field(default="", alias="WHISPER_FALLBACK_MODEL")
+    whisper_batch_size: int = Field(default=8, alias="WHISPER_BATCH_SIZE")
+
+    # 부하 적응형 디코딩 설정 (대기 작업 처리 예상 시간 / SLA가 임계값을 넘으면 balanced, fast 단계 사용)
+    decoding_policy_enabled: bool = Field(default=False, alias="DECODING_POLICY_ENABLED")
+    decoding_sla_sec: float = Field(default=900.0, alias="DECODING_SLA_SEC")
+    decoding_tier_pressure: str = Field(default="0.5,1.0", alias="DECODING_TIER_PRESSURE")
+    mono_like_side_ratio: float = Field(default=0.05, alias="MONO_LIKE_SIDE_RATIO")
+
+    # 2단계 처리 설정 (미리보기 결과를 먼저 저장하고 낮은 우선순위로 최종 처리)
+    two_pass_enabled: bool = Field(default=False, alias="TWO_PASS_ENABLED")
+    preview_whisper_model: str = Field(default="small", alias="PREVIEW_WHISPER_MODEL")
+    preview_compute_type: str = Field(default="int8", alias="PREVIEW_COMPUTE_TYPE")
+    refine_priority: int = Field(default=9, alias="REFINE_PRIORITY")
+
+    # Worker 단계 파이프라인 (threads 풀에서 decode/infer/post 단계를 파일 간에 겹쳐 실행)
+    worker_pipeline_enabled: bool = Field(default=False, alias="WORKER_PIPELINE_ENABLED")
+    # 0이면 queue.Queue가 무제한이 되어 디코딩된 오디오가 메모리에 쌓이므로 1 이상만 허용
+    worker_pipeline_queue_size: int = Field(default=1, ge=1, alias="WORKER_PIPELINE_QUEUE_SIZE")
 
     # Pyannote (화자 분리) 설정
     hf_token: str = Field(default="", alias="HF_TOKEN")
@@ -45,9 +100,87 @@ class Settings(BaseSettings):
     config_dir: Path = Field(default=BASE_DIR / "config", alias="CONFIG_DIR")
     log_dir: Path = Field(default=BASE_DIR / "logs", alias="LOG_DIR")
 
+    # 업로드 설정
+    upload_max_size_mb: int = Field(default=1024, alias="UPLOAD_MAX_SIZE_MB")
+    upload_chunk_size_kb: int = Field(default=1024, alias="UPLOAD_CHUNK_SIZE_KB")
+    batch_max_files: int = Field(default=5000, alias="BATCH_MAX_FILES")
+    batch_archive_max_size_mb: int = Field(default=20480, alias="BATCH_ARCHIVE_MAX_SIZE_MB")
+
+    # 업로드 수락 제어 설정 (한도 0이면 해당 검사 비활성화, 초과 시 503 + Retry-After)
+    admission_max_queue_depth: int = Field(default=0, alias="ADMISSION_MAX_QUEUE_DEPTH")
+    admission_max_queued_audio_sec: float = Field(default=0.0, alias="ADMISSION_MAX_QUEUED_AUDIO_SEC")
+    admission_min_free_disk_mb: int = Field(default=2048, alias="ADMISSION_MIN_FREE_DISK_MB")
+    admission_retry_after_sec: int = Field(default=30, alias="ADMISSION_RETRY_AFTER_SEC")
+    admission_throughput_window_sec: int = Field(default=900, alias="ADMISSION_THROUGHPUT_WINDOW_SEC")
+    admission_bytes_per_audio_sec: int = Field(default=32000, alias="ADMISSION_BYTES_PER_AUDIO_SEC")
+
+    # 클라이언트별 업로드 요청 수 제한 (분당, 0이면 비활성화, 초과 시 429 + Retry-After)
+    rate_limit_per_minute: int = Field(default=0, alias="RATE_LIMIT_PER_MINUTE")
+    rate_limit_client_header: str = Field(default="X-Client-Id", alias="RATE_LIMIT_CLIENT_HEADER")
+    rate_limit_overrides: str = Field(default="", alias="RATE_LIMIT_OVERRIDES")
+    # 파싱 결과 캐시 (원본 문자열, {클라이언트: 한도}) - 업로드 요청마다 다시 파싱하지 않음
+    _rate_limit_overrides: tuple = PrivateAttr(default=("", {}))
+
+    # 결과 응답 캐시 설정
+    result_cache_max_mb: int = Field(default=64, alias="RESULT_CACHE_MAX_MB")
+    response_compress_min_bytes: int = Field(default=1024, alias="RESPONSE_COMPRESS_MIN_BYTES")
+
+    # 작업 진행 이벤트 (SSE) 설정
+    task_event_keepalive_sec: int = Field(default=15, alias="TASK_EVENT_KEEPALIVE_SEC")
+    task_event_max_tasks: int = Field(default=5000, alias="TASK_EVENT_MAX_TASKS")
+
+    # 작업 인덱스 DB 설정 (SQLite)
+    task_db_path: Path = Field(default=BASE_DIR / "data" / "tasks.db", alias="TASK_DB_PATH")
+    task_list_max_limit: int = Field(default=200, alias="TASK_LIST_MAX_LIMIT")
+
+    # 전문 검색 인덱스 설정 (작업 인덱스 DB의 FTS5 테이블, 결과 저장 시 색인)
+    search_index_enabled: bool = Field(default=True, alias="SEARCH_INDEX_ENABLED")
+
     # GPU 설정
     gpu_memory_reserve_mb: int = Field(default=1024, alias="GPU_MEMORY_RESERVE_MB")
 
+    # 멀티 GPU 설정 (worker_launcher가 GPU별 Worker에 WORKER_DEVICE_INDEX 지정, -1이면 장치 미등록)
+    worker_device_index: int = Field(default=-1, alias="WORKER_DEVICE_INDEX")
+    device_routing: str = Field(default="queue", alias="DEVICE_ROUTING")
+    device_task_memory_mb: int = Field(default=1024, ge=0, alias="DEVICE_TASK_MEMORY_MB")
+
+    # Worker 모델 상주 설정 (Worker 프로세스 시작 시 로드 + 워밍업, 빈 값이면 작업마다 로드/언로드)
+    model_preload: str = Field(default="", alias="MODEL_PRELOAD")
+    model_warmup_enabled: bool = Field(default=True, alias="MODEL_WARMUP_ENABLED")
+    worker_proc_alive_timeout_sec: float = Field(default=600.0, alias="WORKER_PROC_ALIVE_TIMEOUT_SEC")
+
+    # Worker 재시작 설정 (모델 상주 시 워밍업 직후 대비 RSS 증가량 기준, 작업 수 기준은 0이면 비활성화)
+    worker_memory_growth_mb: int = Field(default=2048, alias="WORKER_MEMORY_GROWTH_MB")
+    worker_max_tasks_per_child: int = Field(default=50, alias="WORKER_MAX_TASKS_PER_CHILD")
+
+    # 정규화 오디오 캐시 설정 (16kHz float32 .npy, 0이면 저장하지 않음)
+    audio_cache_dir: Path = Field(default=BASE_DIR / "data" / "cache" / "audio", alias="AUDIO_CACHE_DIR")
+    audio_cache_max_mb: int = Field(default=10240, alias="AUDIO_CACHE_MAX_MB")
+
+    # 무음 구간 제거 설정 (모델 로드 전 사전 분석, min_sec보다 긴 비음성 구간만 제거)
+    silence_trim_enabled: bool = Field(default=True, alias="SILENCE_TRIM_ENABLED")
+    silence_min_sec: float = Field(default=3.0, alias="SILENCE_MIN_SEC")
+    silence_pad_sec: float = Field(default=0.5, alias="SILENCE_PAD_SEC")
+    silence_energy_db: float = Field(default=-45.0, alias="SILENCE_ENERGY_DB")
+    silence_flatness: float = Field(default=0.5, alias="SILENCE_FLATNESS")
+
+    # 메트릭 설정 (Prometheus)
+    worker_metrics_port: int = Field(default=9101, alias="WORKER_METRICS_PORT")
+    metrics_multiproc_dir: Path = Field(
+        default=BASE_DIR / "data" / "prometheus", alias="METRICS_MULTIPROC_DIR"
+    )
+
+    # 헬스 체크 설정
+    health_check_interval_sec: float = Field(default=5.0, alias="HEALTH_CHECK_INTERVAL_SEC")
+    health_check_timeout_sec: float = Field(default=2.0, alias="HEALTH_CHECK_TIMEOUT_SEC")
+    monitored_queues: str = Field(default="celery", alias="MONITORED_QUEUES")
+
+    # 프로파일링 설정 (둘 다 비어 있으면 비활성화)
+    profile_every_n_tasks: int = Field(default=0, alias="PROFILE_EVERY_N_TASKS")
+    profile_task_id: str = Field(default="", alias="PROFILE_TASK_ID")
+    profile_interval_ms: float = Field(default=10.0, alias="PROFILE_INTERVAL_MS")
+    profile_alloc_top: int = Field(default=25, alias="PROFILE_ALLOC_TOP")
+
     # 로그 설정
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
@@ -63,6 +196,38 @@ class Settings(BaseSettings):
             return self.celery_result_backend
         return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
 
+    def get_monitored_queues(self) -> list[str]:
+        """큐 길이를 확인할 Celery 큐 이름 목록 (쉼표 구분)"""
+        return [name.strip() for name in self.monitored_queues.split(",") if name.strip()]
+
+    def get_decoding_tier_pressure(self) -> list[float]:
+        """balanced, fast 단계로 내려가는 부하 임계값 (쉼표 구분, 오름차순)"""
+        return sorted(float(value) for value in self.decoding_tier_pressure.split(",") if value.strip())
+
+    def get_preload_models(self) -> list[str]:
+        """Worker 시작 시 미리 로드할 모델 목록 (whisper, diarization, 쉼표 구분)"""
+        return [name.strip() for name in self.model_preload.split(",") if name.strip()]
+
+    @field_validator("rate_limit_overrides")
+    @classmethod
+    def validate_rate_limit_overrides(cls, value: str) -> str:
+        """RATE_LIMIT_OVERRIDES 형식 검증 (잘못된 값은 업로드 요청이 아닌 시작 시 오류)"""
+        parse_rate_limit_overrides(value)
+        return value
+
+    def get_rate_limit_overrides(self) -> dict[str, int]:
+        """클라이언트별 분당 요청 한도 ("클라이언트=한도", 쉼표 구분, 값이 바뀐 경우에만 다시 파싱)"""
+        raw, overrides = self._rate_limit_overrides
+        if raw != self.rate_limit_overrides:
+            overrides = parse_rate_limit_overrides(self.rate_limit_overrides)
+            self._rate_limit_overrides = (self.rate_limit_overrides, overrides)
+        return overrides
+
+    def get_task_db_url(self, async_driver: bool = False) -> str:
+        """작업 인덱스 DB URL (API는 aiosqlite, Worker는 기본 sqlite 드라이버)"""
+        driver = "sqlite+aiosqlite" if async_driver else "sqlite"
+        return f"{driver}:///{self.task_db_path}"
+
     def get_redis_url(self) -> str:
         """Redis URL (환경 변수 우선)"""
         if self.redis_url:
@@ -79,7 +244,7 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
-# 필요한 디렉토리 생성
+# 필요한 디렉토리 생성 (import 시점이 아닌 API lifespan/Worker 시작 시 호출)
 def ensure_directories():
     """필수 디렉토리 생성"""
     directories = [
@@ -89,11 +254,8 @@ def ensure_directories():
         settings.error_dir,
         settings.config_dir,
         settings.log_dir,
+        settings.task_db_path.parent,
     ]
 
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
-
-
-# 초기화 시 디렉토리 생성
-ensure_directories()
@@ -0,0 +1,210 @@
+"""
+Prometheus 메트릭 정의
+API와 Celery Worker가 같은 메트릭을 공유
+
+Celery prefork Worker는 PROMETHEUS_MULTIPROC_DIR(멀티프로세스 모드)를 사용하며,
+이 환경 변수는 prometheus_client import 전에 설정되어야 합니다 (celery_app.py 참고).
+"""
+import os
+from pathlib import Path
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# 단계별 처리 시간 (짧은 probe부터 긴 STT까지)
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+# 실시간 배율 (처리 시간 / 오디오 길이)
+RTF_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5)
+
+# 모델 로드 시간
+MODEL_LOAD_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+
+# Ollama 생성 속도 (tokens/sec)
+TOKENS_PER_SECOND_BUCKETS = (1, 5, 10, 20, 30, 50, 75, 100, 150, 200)
+
+
+STAGE_DURATION = Histogram(
+    "voicecom_stage_duration_seconds",
+    "처리 단계별 소요 시간",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+
+REAL_TIME_FACTOR = Histogram(
+    "voicecom_real_time_factor",
+    "파일별 실시간 배율 (전체 처리 시간 / 오디오 길이)",
+    ["channels"],
+    buckets=RTF_BUCKETS,
+)
+
+TASKS_TOTAL = Counter(
+    "voicecom_tasks_total",
+    "처리 완료/실패 작업 수",
+    ["status"],
+)
+
+MODEL_LOADS = Counter(
+    "voicecom_model_loads_total",
+    "모델 로드 횟수",
+    ["model"],
+)
+
+MODEL_UNLOADS = Counter(
+    "voicecom_model_unloads_total",
+    "모델 언로드 횟수",
+    ["model"],
+)
+
+MODEL_LOAD_DURATION = Histogram(
+    "voicecom_model_load_duration_seconds",
+    "모델 로드 소요 시간",
+    ["model"],
+    buckets=MODEL_LOAD_BUCKETS,
+)
+
+MODEL_WARMUP_DURATION = Histogram(
+    "voicecom_model_warmup_duration_seconds",
+    "Worker 시작 시 합성 오디오 워밍업 추론 시간",
+    ["model"],
+    buckets=MODEL_LOAD_BUCKETS,
+)
+
+WORKER_MEMORY_GROWTH = Gauge(
+    "voicecom_worker_memory_growth_bytes",
+    "Worker 프로세스 RSS 증가량 (모델 로드/워밍업 직후 대비)",
+    multiprocess_mode="livemax",
+)
+
+MODEL_UNLOAD_DURATION = Histogram(
+    "voicecom_model_unload_duration_seconds",
+    "모델 언로드 소요 시간 (GPU 캐시 정리 포함)",
+    ["model"],
+    buckets=STAGE_BUCKETS,
+)
+
+OLLAMA_TOKENS_PER_SECOND = Histogram(
+    "voicecom_ollama_tokens_per_second",
+    "Ollama 생성 속도 (eval_count / eval_duration)",
+    buckets=TOKENS_PER_SECOND_BUCKETS,
+)
+
+QUEUE_DEPTH = Gauge(
+    "voicecom_queue_depth",
+    "브로커 큐 대기 작업 수 (API 헬스 체크 주기로 갱신)",
+    ["queue"],
+    multiprocess_mode="livemax",
+)
+
+BACKLOG_AUDIO_SECONDS = Gauge(
+    "voicecom_backlog_audio_seconds",
+    "대기/처리 중인 작업의 오디오 길이 합계 추정 (초)",
+    multiprocess_mode="livemax",
+)
+
+UPLOAD_REJECTED = Counter(
+    "voicecom_upload_rejected_total",
+    "수락 제어로 거부된 업로드 요청 수",
+    ["reason"],
+)
+
+UPLOAD_BYTES = Counter(
+    "voicecom_upload_bytes_total",
+    "업로드된 바이트 수",
+)
+
+UPLOAD_FILES = Counter(
+    "voicecom_upload_files_total",
+    "업로드된 파일 수",
+    ["endpoint"],
+)
+
+SILENCE_TRIMMED_SECONDS = Counter(
+    "voicecom_silence_trimmed_seconds_total",
+    "모델 처리 전 제거된 비음성 오디오 길이 (초)",
+)
+
+NO_SPEECH_FILES = Counter(
+    "voicecom_no_speech_files_total",
+    "음성이 없어 모델 처리를 생략한 파일 수",
+)
+
+DECODING_TIER_TASKS = Counter(
+    "voicecom_decoding_tier_tasks_total",
+    "디코딩 품질 단계별 처리 작업 수",
+    ["tier"],
+)
+
+DECODING_PRESSURE = Gauge(
+    "voicecom_decoding_pressure",
+    "Worker 부하 추정 (대기 작업 처리 예상 시간 / DECODING_SLA_SEC)",
+    multiprocess_mode="livemax",
+)
+
+PIPELINE_QUEUE_DEPTH = Gauge(
+    "voicecom_pipeline_queue_depth",
+    "Worker 단계 파이프라인의 단계별 대기 파일 수",
+    ["stage"],
+    multiprocess_mode="livemax",
+)
+
+RESUMMARIZED_FILES = Counter(
+    "voicecom_resummarized_files_total",
+    "재요약 작업 처리 파일 수",
+    ["result"],
+)
+
+
+# prometheus_client는 import 시점의 환경 변수로 값 저장 방식을 정하므로 같은 시점에 고정
+MULTIPROCESS_MODE = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def is_multiprocess_mode() -> bool:
+    """멀티프로세스 모드 여부"""
+    return MULTIPROCESS_MODE
+
+
+def prepare_multiprocess_dir(directory: Path):
+    """
+    멀티프로세스 메트릭 디렉토리 초기화 (Worker 메인 프로세스 시작 시)
+
+    이전 실행의 .db 파일이 남아 있으면 카운터가 누적되므로 비웁니다.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale_file in directory.glob("*.db"):
+        stale_file.unlink(missing_ok=True)
+
+
+def build_registry() -> CollectorRegistry:
+    """노출용 레지스트리 (멀티프로세스 모드면 모든 프로세스 값을 합산)"""
+    if not is_multiprocess_mode():
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Prometheus 텍스트 포맷 출력
+
+    Returns:
+        (본문, Content-Type)
+    """
+    return generate_latest(build_registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int):
+    """종료된 Worker 자식 프로세스의 live gauge 정리"""
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(pid)
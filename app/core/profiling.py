@@ -0,0 +1,228 @@
+"""
+Worker 태스크 샘플링 프로파일러
+선택된 process_audio_file 실행(N번째 작업마다 또는 특정 작업 ID)만 프로파일링
+
+- 스택 샘플: 별도 스레드가 sys._current_frames()로 작업 스레드 스택을 주기적으로 수집해
+  collapsed stack 형식(flamegraph.pl, speedscope, inferno 호환)으로 저장
+- 메모리 할당: 디코딩(normalize/trim/decode)과 merge 구간만 tracemalloc으로 측정해 상위 할당 위치 저장
+
+비활성화 상태에서는 profile_task()가 즉시 None을 반환하며 추가 스레드/훅이 없습니다.
+"""
+import itertools
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+# 메모리 할당 통계를 수집하는 구간 이름 (trace_span 이름 기준)
+# normalize: 원본 디코딩/리샘플링 (audio_cache_service.load), trim: 무음 제거, decode: 모델 입력 디코딩
+ALLOCATION_STAGES = {"normalize", "trim", "decode", "merge"}
+
+# 현재 스레드(컨텍스트)의 프로파일 세션
+_current_session: ContextVar[Optional["ProfileSession"]] = ContextVar(
+    "current_profile_session", default=None
+)
+
+# 프로세스별 작업 카운터 (prefork 자식 프로세스마다 따로 셈)
+_task_counter = itertools.count(1)
+
+
+class StackSampler:
+    """대상 스레드의 Python 스택을 주기적으로 샘플링"""
+
+    def __init__(self, thread_id: int, interval_sec: float):
+        """
+        초기화
+
+        Args:
+            thread_id: 샘플링 대상 스레드 ID
+            interval_sec: 샘플링 주기 (초)
+        """
+        self.thread_id = thread_id
+        self.interval_sec = interval_sec
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """샘플링 시작"""
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """샘플링 중지"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """샘플링 루프"""
+        while not self._stop.wait(self.interval_sec):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            self.samples[";".join(reversed(stack))] += 1
+
+    def write_folded(self, path: Path):
+        """
+        collapsed stack 형식으로 저장 ("프레임;프레임;... 샘플수" 한 줄씩)
+
+        Args:
+            path: 저장 경로
+        """
+        lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class ProfileSession:
+    """작업 한 건의 프로파일 세션"""
+
+    def __init__(self, task_id: str, output_dir: Path):
+        """
+        초기화
+
+        Args:
+            task_id: 작업 ID
+            output_dir: 프로파일 저장 디렉토리
+        """
+        self.task_id = task_id
+        self.output_dir = output_dir
+        self.sampler = StackSampler(
+            threading.get_ident(), settings.profile_interval_ms / 1000
+        )
+        self.allocation_reports: List[str] = []
+
+    @contextmanager
+    def track_allocations(self, label: str) -> Iterator[None]:
+        """
+        구간 내 Python 메모리 할당 통계 수집
+
+        Args:
+            label: 구간 경로 (예: transcribe/decode)
+        """
+        was_tracing = tracemalloc.is_tracing()
+        if was_tracing:
+            before = tracemalloc.take_snapshot()
+        else:
+            before = None
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),  # 샘플러 스레드 할당 제외
+                ]
+            )
+            if before is not None:
+                stats = snapshot.compare_to(before, "lineno")
+            else:
+                stats = snapshot.statistics("lineno")
+                tracemalloc.stop()
+
+            lines = [
+                f"== {label} ==",
+                f"traced current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB",
+            ]
+            lines.extend(str(stat) for stat in stats[:settings.profile_alloc_top])
+            self.allocation_reports.append("\n".join(lines))
+
+    def save(self) -> List[Path]:
+        """
+        프로파일 파일 저장
+
+        Returns:
+            저장된 파일 경로 목록
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        folded_path = self.output_dir / f"{self.task_id}.folded"
+        self.sampler.write_folded(folded_path)
+        paths = [folded_path]
+
+        if self.allocation_reports:
+            alloc_path = self.output_dir / f"{self.task_id}_alloc.txt"
+            alloc_path.write_text("\n\n".join(self.allocation_reports) + "\n", encoding="utf-8")
+            paths.append(alloc_path)
+
+        return paths
+
+
+def should_profile(task_id: str) -> bool:
+    """
+    이번 작업의 프로파일링 여부
+
+    Args:
+        task_id: 작업 ID
+
+    Returns:
+        PROFILE_TASK_ID와 일치하거나 N번째 작업이면 True
+    """
+    if settings.profile_task_id and task_id == settings.profile_task_id:
+        return True
+
+    every_n = settings.profile_every_n_tasks
+    return every_n > 0 and next(_task_counter) % every_n == 0
+
+
+@contextmanager
+def profile_task(task_id: str) -> Iterator[Optional[ProfileSession]]:
+    """
+    선택된 작업이면 블록 전체를 프로파일링 (아니면 None)
+
+    Args:
+        task_id: 작업 ID
+    """
+    if not should_profile(task_id):
+        yield None
+        return
+
+    session = ProfileSession(task_id, settings.log_dir / "profiles")
+    token = _current_session.set(session)
+    session.sampler.start()
+    logger.info(f"🔬 프로파일링 시작 [{task_id}]")
+
+    try:
+        yield session
+    finally:
+        session.sampler.stop()
+        _current_session.reset(token)
+
+        try:
+            paths = session.save()
+            logger.info(f"🔬 프로파일 저장: {', '.join(path.name for path in paths)}")
+        except OSError as e:
+            logger.warning(f"⚠️ 프로파일 저장 실패 [{task_id}]: {e}")
+
+
+def follow_current_thread():
+    """현재 컨텍스트의 프로파일 세션이 있으면 스택 샘플링 대상을 현재 스레드로 변경 (단계 파이프라인용)"""
+    session = _current_session.get()
+    if session is not None:
+        session.sampler.thread_id = threading.get_ident()
+
+
+def current_profile_session() -> Optional[ProfileSession]:
+    """현재 컨텍스트의 프로파일 세션 (없으면 None)"""
+    return _current_session.get()
@@ -0,0 +1,234 @@
+"""
+작업별 타이밍 트레이스
+process_audio_file 한 건의 처리 구간을 스팬 트리로 기록 (벽시계/CPU 시간, RSS, GPU 메모리)
+
+서비스 코드는 trace_span()만 호출하며, 활성 트레이스가 없으면 아무것도 하지 않습니다.
+"""
+import json
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: 최대 RSS는 psutil로 대체
+    resource = None
+
+import psutil
+
+from app.core.profiling import ALLOCATION_STAGES, current_profile_session
+
+
+# 현재 스레드(컨텍스트)에서 기록 중인 트레이스
+_current_trace: ContextVar[Optional["TaskTrace"]] = ContextVar("current_trace", default=None)
+
+_MB = 1024 * 1024
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB, 프로세스 시작 이후 최고치)"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 bytes 단위
+        return round(peak / _MB if sys.platform == "darwin" else peak / 1024, 1)
+
+    peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+    return round(peak / _MB, 1) if peak else None
+
+
+def _cuda():
+    """
+    torch.cuda 모듈 (torch가 이미 로드되어 있고 CUDA 사용 가능한 경우만)
+
+    트레이스 때문에 torch를 새로 import하지 않도록 sys.modules만 확인합니다.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None
+    try:
+        return torch.cuda if torch.cuda.is_available() else None
+    except Exception:
+        return None
+
+
+class Span:
+    """트레이스 구간"""
+
+    def __init__(self, name: str, offset_sec: float):
+        """
+        초기화
+
+        Args:
+            name: 구간 이름
+            offset_sec: 트레이스 시작 기준 시작 시점 (초)
+        """
+        self.name = name
+        self.offset_sec = offset_sec
+        self.wall_sec: Optional[float] = None
+        self.cpu_sec: Optional[float] = None
+        self.rss_mb: Optional[float] = None
+        self.peak_rss_mb: Optional[float] = None
+        self.gpu_peak_mb: Optional[float] = None
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+        self._gpu_peak_bytes = 0
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 dict"""
+        data = {
+            "name": self.name,
+            "offset_sec": round(self.offset_sec, 4),
+            "wall_sec": self.wall_sec,
+            "cpu_sec": self.cpu_sec,
+            "rss_mb": self.rss_mb,
+            "peak_rss_mb": self.peak_rss_mb,
+            "gpu_peak_mb": self.gpu_peak_mb,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class TaskTrace:
+    """
+    작업 한 건의 스팬 트리
+
+    - wall_sec: perf_counter 기준 경과 시간
+    - cpu_sec: 프로세스 CPU 시간 (모델 추론의 네이티브 스레드 포함)
+    - peak_rss_mb: 구간 종료 시점의 프로세스 최대 RSS
+    - gpu_peak_mb: 구간 중 torch CUDA 최대 할당량 (CTranslate2 등 torch 외 할당은 제외)
+    """
+
+    def __init__(self, task_id: str, filename: str):
+        """
+        초기화
+
+        Args:
+            task_id: 작업 ID
+            filename: 파일명
+        """
+        self.task_id = task_id
+        self.filename = filename
+        self.started_at = datetime.now()
+        self._origin = time.perf_counter()
+        self._process = psutil.Process()
+        self.root: Optional[Span] = None
+        self._stack: List[Span] = []
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Span]:
+        """
+        하위 구간 기록
+
+        Args:
+            name: 구간 이름
+        """
+        parent = self._stack[-1] if self._stack else None
+        span = Span(name, time.perf_counter() - self._origin)
+        if parent is None:
+            self.root = span
+        else:
+            parent.children.append(span)
+
+        cuda = _cuda()
+        if cuda is not None:
+            # 상위 구간의 최대치를 보존한 뒤 이 구간 기준으로 초기화
+            if parent is not None:
+                parent._gpu_peak_bytes = max(parent._gpu_peak_bytes, cuda.max_memory_allocated())
+            cuda.reset_peak_memory_stats()
+
+        self._stack.append(span)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.wall_sec = round(time.perf_counter() - wall_start, 4)
+            span.cpu_sec = round(time.process_time() - cpu_start, 4)
+            span.rss_mb = round(self._process.memory_info().rss / _MB, 1)
+            span.peak_rss_mb = _peak_rss_mb()
+
+            cuda = _cuda()
+            if cuda is not None:
+                span._gpu_peak_bytes = max(span._gpu_peak_bytes, cuda.max_memory_allocated())
+                span.gpu_peak_mb = round(span._gpu_peak_bytes / _MB, 1)
+                if parent is not None:
+                    parent._gpu_peak_bytes = max(parent._gpu_peak_bytes, span._gpu_peak_bytes)
+
+            self._stack.pop()
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 dict"""
+        return {
+            "task_id": self.task_id,
+            "filename": self.filename,
+            "started_at": self.started_at.isoformat(),
+            "spans": self.root.to_dict() if self.root is not None else None,
+        }
+
+    def save(self, path: Path) -> Path:
+        """
+        트레이스 JSON 저장
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            저장 경로
+        """
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+
+@contextmanager
+def task_trace(task_id: str, filename: str) -> Iterator[TaskTrace]:
+    """
+    작업 트레이스 활성화 (루트 구간 = 블록 전체)
+
+    Args:
+        task_id: 작업 ID
+        filename: 파일명
+    """
+    trace = TaskTrace(task_id, filename)
+    token = _current_trace.set(trace)
+    try:
+        with trace.span("process_audio_file"):
+            yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def trace_span(name: str) -> Iterator[Optional[Span]]:
+    """
+    현재 트레이스에 구간 기록 (활성 트레이스가 없으면 no-op)
+
+    Args:
+        name: 구간 이름
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    session = current_profile_session() if name in ALLOCATION_STAGES else None
+
+    with trace.span(name) as span:
+        if session is None:
+            yield span
+            return
+
+        # 프로파일링 중인 작업이면 디코딩/merge 구간(ALLOCATION_STAGES)의 메모리 할당도 수집
+        label = "/".join(s.name for s in trace._stack[1:])
+        with session.track_allocations(label):
+            yield span
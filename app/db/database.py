@@ -0,0 +1,118 @@
+"""
+작업 인덱스 DB 엔진
+API 프로세스는 aiosqlite 비동기 엔진, Celery Worker는 동기 엔진을 사용
+"""
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.models import SEARCH_FTS_DDL, Base
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    SQLite 연결 설정
+
+    - WAL: API(읽기)와 여러 Worker(쓰기)가 서로를 막지 않도록 함
+    - busy_timeout: 동시 쓰기 시 즉시 실패하지 않고 대기
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker | None = None
+_sync_engine: Engine | None = None
+_sync_session_factory: sessionmaker | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진 (API 프로세스용)"""
+    global _async_engine, _async_session_factory
+
+    if _async_engine is None:
+        _async_engine = create_async_engine(settings.get_task_db_url(async_driver=True))
+        event.listen(_async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """비동기 세션 팩토리"""
+    get_async_engine()
+    return _async_session_factory
+
+
+def get_sync_engine() -> Engine:
+    """동기 엔진 (Celery Worker용)"""
+    global _sync_engine, _sync_session_factory
+
+    if _sync_engine is None:
+        _sync_engine = create_engine(settings.get_task_db_url())
+        event.listen(_sync_engine, "connect", _set_sqlite_pragmas)
+        _sync_session_factory = sessionmaker(_sync_engine, expire_on_commit=False)
+
+    return _sync_engine
+
+
+def get_sync_session_factory() -> sessionmaker:
+    """동기 세션 팩토리"""
+    get_sync_engine()
+    return _sync_session_factory
+
+
+def _create_schema(connection):
+    """
+    테이블/인덱스 생성 및 누락 컬럼 추가 (전문 검색 FTS5 테이블 포함)
+
+    create_all은 기존 테이블에 컬럼을 추가하지 않으므로,
+    모델에 새로 추가된 (nullable) 컬럼은 ALTER TABLE로 보충합니다.
+    """
+    Base.metadata.create_all(connection)
+
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(
+                text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}')
+            )
+
+        # 새 컬럼에 대한 인덱스 생성
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+    # 전문 검색 역색인 (SQLAlchemy 모델로 표현할 수 없는 FTS5 가상 테이블)
+    connection.execute(text(SEARCH_FTS_DDL))
+
+
+async def init_task_db():
+    """테이블 및 인덱스 생성 (API 시작 시)"""
+    engine = get_async_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_schema)
+
+
+async def close_task_db():
+    """비동기 엔진 정리 (API 종료 시)"""
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+
+def init_task_db_sync():
+    """테이블 및 인덱스 생성 (Worker용)"""
+    with get_sync_engine().begin() as conn:
+        _create_schema(conn)
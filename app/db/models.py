@@ -0,0 +1,86 @@
+"""
+작업 인덱스 테이블 정의
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    """SQLAlchemy 선언적 베이스"""
+
+
+class TaskRecord(Base):
+    """
+    작업 메타데이터
+
+    Celery 결과 백엔드(Redis)는 result_expires 이후 사라지므로,
+    상태 조회/목록/이력은 이 테이블을 기준으로 합니다.
+    """
+
+    __tablename__ = "tasks"
+
+    task_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    batch_id: Mapped[Optional[str]] = mapped_column(String(36))
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    file_size: Mapped[Optional[int]] = mapped_column(Integer)
+    audio_duration: Mapped[Optional[float]] = mapped_column(Float)
+    channels: Mapped[Optional[int]] = mapped_column(Integer)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending")
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    stage_timings: Mapped[Optional[dict]] = mapped_column(JSON)
+    srt_path: Mapped[Optional[str]] = mapped_column(Text)
+    summary_path: Mapped[Optional[str]] = mapped_column(Text)
+    trace_path: Mapped[Optional[str]] = mapped_column(Text)
+    decoding_tier: Mapped[Optional[str]] = mapped_column(String(16))
+    result_pass: Mapped[Optional[str]] = mapped_column(String(16))
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # 목록 조회는 (created_at DESC, task_id DESC) 키셋 페이지네이션을 사용
+        Index("ix_tasks_created_at_task_id", "created_at", "task_id"),
+        Index("ix_tasks_status_created_at", "status", "created_at", "task_id"),
+        Index("ix_tasks_status_completed_at", "status", "completed_at"),
+        Index("ix_tasks_filename", "filename"),
+        Index("ix_tasks_content_hash", "content_hash"),
+        Index("ix_tasks_batch_id_status", "batch_id", "status"),
+    )
+
+
+class SearchSegment(Base):
+    """
+    전문 검색 대상 (전사 세그먼트 / 요약)
+
+    검색어 매칭은 FTS5 테이블 transcript_fts(rowid = id)의 문자 bigram 토큰으로 하고,
+    결과 표시용 원문/시각/화자는 이 테이블에서 읽습니다. 같은 결과 파일(source)을 다시 만들면
+    기존 항목을 교체합니다.
+    """
+
+    __tablename__ = "search_segments"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    task_id: Mapped[Optional[str]] = mapped_column(String(36))
+    source: Mapped[str] = mapped_column(String(255), nullable=False)
+    kind: Mapped[str] = mapped_column(String(16), nullable=False)
+    start_sec: Mapped[Optional[float]] = mapped_column(Float)
+    end_sec: Mapped[Optional[float]] = mapped_column(Float)
+    speaker: Mapped[Optional[str]] = mapped_column(String(64))
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("ix_search_segments_source_kind", "source", "kind"),
+    )
+
+
+# 문자 bigram 토큰 역색인 (내용 없는 FTS5: 토큰만 저장, 원문은 search_segments)
+SEARCH_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS transcript_fts USING fts5("
+    "tokens, content='', tokenize='unicode61 remove_diacritics 0')"
+)
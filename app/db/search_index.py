@@ -0,0 +1,288 @@
+"""
+전사/요약 전문 검색 인덱스
+한국어는 형태소 분석 없이 문자 bigram(2글자 단위) 토큰으로 SQLite FTS5에 색인
+
+- "당일콜" → "당일 일콜": 검색어도 같은 방식으로 나눠 연속 토큰(phrase)으로 찾으므로
+  부분 문자열 검색과 같음 (공백/문장 부호 무시)
+- Worker는 결과 저장 시(save_results) 작업 인덱스 기록기 스레드로 항목을 교체하고, API는 비동기로 조회
+- 기존 결과는 python -m app.db.search_index --rebuild로 output/ 디렉토리에서 다시 색인
+"""
+import unicodedata
+from typing import List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import column, delete, insert, select, table, text
+from sqlalchemy.orm import Session
+
+from app.db.database import get_async_session_factory
+from app.db.models import SearchSegment, TaskRecord
+
+
+# 검색 항목 종류
+KIND_TRANSCRIPT = "transcript"
+KIND_SUMMARY = "summary"
+
+# 검색어 최소 길이 (bigram 하나 이상)
+MIN_QUERY_CHARS = 2
+
+# 조회용 FTS5 테이블 표현 (생성은 models.SEARCH_FTS_DDL)
+transcript_fts = table("transcript_fts", column("rowid"), column("tokens"))
+
+
+def ngram_tokens(content: str) -> List[str]:
+    """
+    문자 bigram 토큰 (NFKC 정규화 + 소문자, 문자/숫자만 사용)
+
+    STT 결과의 띄어쓰기가 일정하지 않으므로 공백/문장 부호를 제거한 뒤 나눕니다
+    ("양동 고려의원"과 "양동고려의원"이 같은 토큰). 한 글자뿐이면 그대로 토큰이 됩니다.
+
+    Args:
+        content: 원문
+
+    Returns:
+        토큰 목록 (원문 순서)
+    """
+    normalized = unicodedata.normalize("NFKC", content).lower()
+    chars = "".join(ch for ch in normalized if ch.isalnum())
+
+    if len(chars) == 1:
+        return [chars]
+    return [chars[i:i + 2] for i in range(len(chars) - 1)]
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    검색어 → FTS5 MATCH 식 (bigram 토큰 phrase)
+
+    Args:
+        query: 검색어
+
+    Returns:
+        MATCH 식 (검색 가능한 문자가 MIN_QUERY_CHARS 미만이면 None)
+    """
+    tokens = ngram_tokens(query)
+    if not tokens or len(tokens[0]) < MIN_QUERY_CHARS:
+        return None
+    # 토큰은 문자/숫자만 포함하므로 따옴표 이스케이프 불필요
+    return '"' + " ".join(tokens) + '"'
+
+
+def summary_entry(summary: str) -> dict:
+    """요약 검색 항목"""
+    return {"kind": KIND_SUMMARY, "start_sec": None, "end_sec": None, "speaker": None, "text": summary}
+
+
+def build_entries(segments, summary: Optional[str]) -> List[dict]:
+    """
+    검색 항목 생성 (세그먼트별 전사 + 요약 1건)
+
+    Args:
+        segments: SegmentList
+        summary: 요약 내용 (LLM 요약을 생략했으면 None)
+
+    Returns:
+        [{"kind", "start_sec", "end_sec", "speaker", "text"}, ...]
+    """
+    entries = [
+        {
+            "kind": KIND_TRANSCRIPT,
+            "start_sec": item["start"],
+            "end_sec": item["end"],
+            "speaker": item["speaker"],
+            "text": item["text"],
+        }
+        for item in segments.to_json()
+        if ngram_tokens(item["text"])
+    ]
+    if summary:
+        entries.append(summary_entry(summary))
+    return entries
+
+
+def replace_entries(
+    session: Session,
+    source: str,
+    task_id: Optional[str],
+    entries: List[dict],
+    kind: Optional[str] = None,
+):
+    """
+    결과 파일(source)의 검색 항목 교체 (동기, 커밋은 호출자)
+
+    내용 없는 FTS5 테이블은 원래 토큰을 넘겨 삭제해야 하므로 저장된 원문에서 토큰을 다시 만듭니다.
+
+    Args:
+        session: 동기 세션
+        source: 결과 파일 이름 (원본 오디오 파일명에서 확장자 제외)
+        task_id: 작업 ID
+        entries: build_entries() 결과
+        kind: 이 종류의 항목만 교체 (None이면 전체)
+    """
+    conditions = [SearchSegment.source == source]
+    if kind is not None:
+        conditions.append(SearchSegment.kind == kind)
+
+    old_rows = session.execute(select(SearchSegment.id, SearchSegment.text).where(*conditions)).all()
+    if old_rows:
+        session.execute(
+            text("INSERT INTO transcript_fts(transcript_fts, rowid, tokens) VALUES('delete', :id, :tokens)"),
+            [{"id": row_id, "tokens": " ".join(ngram_tokens(content))} for row_id, content in old_rows],
+        )
+        session.execute(delete(SearchSegment).where(*conditions))
+
+    if not entries:
+        return
+
+    ids = session.scalars(
+        insert(SearchSegment).returning(SearchSegment.id, sort_by_parameter_order=True),
+        [{"source": source, "task_id": task_id, **entry} for entry in entries],
+    ).all()
+    session.execute(
+        text("INSERT INTO transcript_fts(rowid, tokens) VALUES(:id, :tokens)"),
+        [
+            {"id": row_id, "tokens": " ".join(ngram_tokens(entry["text"]))}
+            for row_id, entry in zip(ids, entries)
+        ],
+    )
+
+
+class SearchIndexRepository:
+    """전문 검색 조회 (API 프로세스, 비동기)"""
+
+    async def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50,
+    ) -> Tuple[List[dict], Optional[int]]:
+        """
+        전문 검색 (최근 색인 순, rowid 키셋 페이지네이션)
+
+        Args:
+            query: 검색어 (MIN_QUERY_CHARS자 이상)
+            kind: transcript 또는 summary (None이면 전체)
+            cursor: 이전 페이지의 next_cursor
+            limit: 페이지 크기
+
+        Returns:
+            (검색 결과 목록, 다음 페이지 커서)
+
+        Raises:
+            ValueError: 검색어가 너무 짧은 경우
+        """
+        match = build_match_query(query)
+        if match is None:
+            raise ValueError(f"검색어는 문자/숫자 {MIN_QUERY_CHARS}자 이상이어야 합니다.")
+
+        stmt = (
+            select(
+                SearchSegment.id,
+                SearchSegment.task_id,
+                SearchSegment.source,
+                SearchSegment.kind,
+                SearchSegment.start_sec,
+                SearchSegment.end_sec,
+                SearchSegment.speaker,
+                SearchSegment.text,
+                TaskRecord.filename,
+            )
+            .select_from(transcript_fts)
+            .join(SearchSegment, SearchSegment.id == transcript_fts.c.rowid)
+            .outerjoin(TaskRecord, TaskRecord.task_id == SearchSegment.task_id)
+            .where(transcript_fts.c.tokens.op("MATCH")(match))
+            .order_by(transcript_fts.c.rowid.desc())
+            .limit(limit + 1)
+        )
+        if kind:
+            stmt = stmt.where(SearchSegment.kind == kind)
+        if cursor is not None:
+            stmt = stmt.where(transcript_fts.c.rowid < cursor)
+
+        async with get_async_session_factory()() as session:
+            rows = (await session.execute(stmt)).mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1]["id"]
+
+        return [dict(row) for row in rows], next_cursor
+
+    async def replace_summary(self, source: str, task_id: Optional[str], summary: str):
+        """
+        요약 항목만 교체 (재요약 후)
+
+        Args:
+            source: 결과 파일 이름
+            task_id: 작업 ID (모르면 기존 항목의 작업 ID 유지)
+            summary: 새 요약 내용
+        """
+        async with get_async_session_factory()() as session:
+            if task_id is None:
+                task_id = await session.scalar(
+                    select(SearchSegment.task_id).where(SearchSegment.source == source).limit(1)
+                )
+            await session.run_sync(replace_entries, source, task_id, [summary_entry(summary)], KIND_SUMMARY)
+            await session.commit()
+
+
+def rebuild_from_output() -> int:
+    """
+    output/ 디렉토리의 SRT/요약 파일로 검색 인덱스 재구성 (기존 결과 최초 색인용)
+
+    Returns:
+        색인한 결과 파일 수
+    """
+    from app.core.config import settings
+    from app.db.database import get_sync_session_factory, init_task_db_sync
+    from app.utils.segments import SegmentList
+
+    init_task_db_sync()
+    session_factory = get_sync_session_factory()
+
+    with session_factory() as session:
+        task_ids = dict(
+            session.execute(
+                select(TaskRecord.srt_path, TaskRecord.task_id).where(TaskRecord.srt_path.is_not(None))
+            ).all()
+        )
+
+    count = 0
+    for srt_path in sorted(settings.output_dir.glob("*.srt")):
+        summary_path = srt_path.with_name(f"{srt_path.stem}_요약.txt")
+        try:
+            segments = SegmentList.from_srt(srt_path.read_text(encoding="utf-8"))
+            summary = summary_path.read_text(encoding="utf-8") if summary_path.exists() else None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 색인 생략: {srt_path.name} - {e}")
+            continue
+
+        with session_factory() as session:
+            replace_entries(
+                session, srt_path.stem, task_ids.get(str(srt_path)), build_entries(segments, summary)
+            )
+            session.commit()
+
+        count += 1
+        if count % 1000 == 0:
+            logger.info(f"🔎 검색 인덱스 재구성 진행: {count}개")
+
+    return count
+
+
+# 전역 인스턴스
+search_index_repository = SearchIndexRepository()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="전문 검색 인덱스 관리")
+    parser.add_argument("--rebuild", action="store_true", help="output/ 디렉토리의 결과 파일로 다시 색인")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        logger.info(f"✅ 검색 인덱스 재구성 완료: {rebuild_from_output()}개 결과 파일")
+    else:
+        parser.print_help()
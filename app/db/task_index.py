@@ -0,0 +1,424 @@
+"""
+작업 인덱스 저장소
+- TaskIndexRepository: API용 비동기 조회/등록
+- TaskIndexWriter: Worker용 백그라운드 스레드 기록기 (태스크 처리 흐름을 막지 않음)
+"""
+import base64
+import queue
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.db.database import (
+    get_async_session_factory,
+    get_sync_session_factory,
+    init_task_db_sync,
+)
+from app.db.models import TaskRecord
+
+
+# 기록 완료 대기 요청 표식 (큐 항목의 작업 ID 자리, 작업 ID가 None인 쓰기 요청과 구분)
+_FLUSH = object()
+
+
+def encode_cursor(created_at: datetime, task_id: str) -> str:
+    """키셋 페이지네이션 커서 인코딩"""
+    raw = f"{created_at.isoformat()}|{task_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    키셋 페이지네이션 커서 디코딩
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, task_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), task_id
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+class TaskIndexRepository:
+    """작업 인덱스 조회/등록 (API 프로세스, 비동기)"""
+
+    async def create_task(
+        self,
+        task_id: str,
+        filename: str,
+        content_hash: Optional[str] = None,
+        file_size: Optional[int] = None,
+    ) -> TaskRecord:
+        """
+        업로드된 작업 등록
+
+        Args:
+            task_id: 작업 ID (Celery task ID와 동일)
+            filename: 파일명
+            content_hash: 파일 SHA-256
+            file_size: 파일 크기 (bytes)
+
+        Returns:
+            생성된 레코드
+        """
+        now = datetime.now()
+        record = TaskRecord(
+            task_id=task_id,
+            filename=filename,
+            content_hash=content_hash,
+            file_size=file_size,
+            status="pending",
+            progress=0,
+            created_at=now,
+            updated_at=now,
+        )
+
+        async with get_async_session_factory()() as session:
+            session.add(record)
+            await session.commit()
+
+        return record
+
+    async def create_tasks_bulk(self, batch_id: str, tasks: List[dict]):
+        """
+        배치 작업 일괄 등록 (단일 트랜잭션)
+
+        Args:
+            batch_id: 배치 ID
+            tasks: [{"task_id", "filename", "content_hash", "file_size"}, ...]
+        """
+        now = datetime.now()
+        rows = [
+            {
+                "batch_id": batch_id,
+                "status": "pending",
+                "progress": 0,
+                "created_at": now,
+                "updated_at": now,
+                **task,
+            }
+            for task in tasks
+        ]
+
+        async with get_async_session_factory()() as session:
+            await session.execute(insert(TaskRecord), rows)
+            await session.commit()
+
+    async def get_batch_summary(self, batch_id: str) -> Dict[str, Tuple[int, int]]:
+        """
+        배치 상태별 집계
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            {상태: (작업 수, 진행률 합계)} (배치가 없으면 빈 dict)
+        """
+        stmt = (
+            select(TaskRecord.status, func.count(), func.sum(TaskRecord.progress))
+            .where(TaskRecord.batch_id == batch_id)
+            .group_by(TaskRecord.status)
+        )
+
+        async with get_async_session_factory()() as session:
+            rows = (await session.execute(stmt)).all()
+
+        return {row[0]: (row[1], row[2] or 0) for row in rows}
+
+    async def get_task(self, task_id: str) -> Optional[TaskRecord]:
+        """
+        작업 조회
+
+        Args:
+            task_id: 작업 ID
+
+        Returns:
+            레코드 (없으면 None)
+        """
+        async with get_async_session_factory()() as session:
+            return await session.get(TaskRecord, task_id)
+
+    async def mark_requeued(self, task_id: str):
+        """
+        완료된 작업을 다시 처리 대기 상태로 변경 (재처리 등록 시)
+
+        Args:
+            task_id: 작업 ID
+        """
+        async with get_async_session_factory()() as session:
+            await session.execute(
+                update(TaskRecord)
+                .where(TaskRecord.task_id == task_id)
+                .values(
+                    status="pending",
+                    progress=0,
+                    error_message=None,
+                    completed_at=None,
+                    updated_at=datetime.now(),
+                )
+            )
+            await session.commit()
+
+    async def get_tasks(self, task_ids: List[str]) -> List[TaskRecord]:
+        """
+        여러 작업 조회
+
+        Args:
+            task_ids: 작업 ID 목록
+
+        Returns:
+            존재하는 레코드 목록
+        """
+        async with get_async_session_factory()() as session:
+            stmt = select(TaskRecord).where(TaskRecord.task_id.in_(task_ids))
+            return list((await session.execute(stmt)).scalars().all())
+
+    async def get_batch_task_ids(self, batch_id: str) -> List[str]:
+        """
+        배치에 속한 작업 ID 목록
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            작업 ID 목록
+        """
+        async with get_async_session_factory()() as session:
+            stmt = select(TaskRecord.task_id).where(TaskRecord.batch_id == batch_id)
+            return list((await session.execute(stmt)).scalars().all())
+
+    async def get_backlog(
+        self, completed_since: datetime, bytes_per_audio_sec: int
+    ) -> Tuple[int, float, float]:
+        """
+        처리 대기량 및 최근 처리량 집계
+
+        Worker가 아직 분석하지 않은 작업은 파일 크기로 오디오 길이를 추정합니다.
+
+        Args:
+            completed_since: 처리량 집계 시작 시각
+            bytes_per_audio_sec: 오디오 1초당 WAV 바이트 수 (길이 추정용)
+
+        Returns:
+            (대기/처리 중 작업 수, 대기/처리 중 오디오 길이 합계(초),
+             completed_since 이후 완료된 오디오 길이 합계(초))
+        """
+        queued_duration = func.coalesce(
+            TaskRecord.audio_duration,
+            func.coalesce(TaskRecord.file_size, 0) / float(bytes_per_audio_sec),
+        )
+        queued_stmt = select(
+            func.count(), func.coalesce(func.sum(queued_duration), 0.0)
+        ).where(TaskRecord.status.in_(("pending", "in_progress")))
+        completed_stmt = select(func.coalesce(func.sum(TaskRecord.audio_duration), 0.0)).where(
+            TaskRecord.status == "completed",
+            TaskRecord.completed_at >= completed_since,
+        )
+
+        async with get_async_session_factory()() as session:
+            queued_tasks, queued_audio_sec = (await session.execute(queued_stmt)).one()
+            completed_audio_sec = (await session.execute(completed_stmt)).scalar_one()
+
+        return queued_tasks, float(queued_audio_sec), float(completed_audio_sec)
+
+    async def list_tasks(
+        self,
+        status: Optional[str] = None,
+        filename: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        batch_id: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        decoding_tier: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Tuple[List[TaskRecord], Optional[str]]:
+        """
+        작업 목록 조회 (최신순, 키셋 페이지네이션)
+
+        OFFSET 대신 (created_at, task_id) 커서를 사용하므로
+        행 수가 수백만 건이어도 페이지 위치와 무관하게 인덱스 범위 탐색만 수행합니다.
+
+        Args:
+            status: 상태 필터
+            filename: 파일명 접두어 필터
+            content_hash: 파일 해시 필터
+            batch_id: 배치 ID 필터
+            created_from: 생성 시각 하한 (포함)
+            created_to: 생성 시각 상한 (미포함)
+            decoding_tier: STT 품질 단계 필터 (낮은 단계 결과 재처리 대상 조회)
+            cursor: 이전 페이지의 next_cursor
+            limit: 페이지 크기
+
+        Returns:
+            (레코드 목록, 다음 페이지 커서)
+        """
+        stmt = select(TaskRecord)
+
+        if status:
+            stmt = stmt.where(TaskRecord.status == status)
+        if filename:
+            # LIKE는 SQLite에서 대소문자 무시라 인덱스를 타지 않으므로 범위 조건 사용
+            stmt = stmt.where(
+                TaskRecord.filename >= filename,
+                TaskRecord.filename < filename + "\U0010ffff",
+            )
+        if content_hash:
+            stmt = stmt.where(TaskRecord.content_hash == content_hash)
+        if batch_id:
+            stmt = stmt.where(TaskRecord.batch_id == batch_id)
+        if created_from:
+            stmt = stmt.where(TaskRecord.created_at >= created_from)
+        if created_to:
+            stmt = stmt.where(TaskRecord.created_at < created_to)
+        if decoding_tier:
+            stmt = stmt.where(TaskRecord.decoding_tier == decoding_tier)
+
+        if cursor:
+            cursor_created_at, cursor_task_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    TaskRecord.created_at < cursor_created_at,
+                    and_(
+                        TaskRecord.created_at == cursor_created_at,
+                        TaskRecord.task_id < cursor_task_id,
+                    ),
+                )
+            )
+
+        stmt = stmt.order_by(
+            TaskRecord.created_at.desc(), TaskRecord.task_id.desc()
+        ).limit(limit + 1)
+
+        async with get_async_session_factory()() as session:
+            records = list((await session.execute(stmt)).scalars().all())
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = encode_cursor(last.created_at, last.task_id)
+
+        return records, next_cursor
+
+
+class TaskIndexWriter:
+    """
+    작업 인덱스 기록기 (Celery Worker, 동기)
+
+    태스크는 update()로 큐에 넣기만 하고, 실제 DB 쓰기는
+    프로세스별 백그라운드 스레드가 순서대로 처리합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        """백그라운드 스레드 시작 (prefork 자식 프로세스마다 1회)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._thread = threading.Thread(
+                target=self._run, name="task-index-writer", daemon=True
+            )
+            self._thread.start()
+
+    def update(self, task_id: str, **fields):
+        """
+        작업 레코드 갱신 요청 (비동기)
+
+        Args:
+            task_id: 작업 ID
+            **fields: 갱신할 컬럼 값 (filename이 포함되면 레코드가 없을 때 생성)
+        """
+        fields["updated_at"] = datetime.now()
+        self._ensure_started()
+        self._queue.put((task_id, fields))
+
+    def submit(self, task_id: str, operation: Callable[[Session], None]):
+        """
+        임의의 DB 쓰기 요청 (비동기, 같은 스레드에서 update()와 순서대로 실행)
+
+        Args:
+            task_id: 작업 ID (로그용, None 가능)
+            operation: 동기 세션을 받아 쓰기를 수행하는 함수 (커밋은 기록기가 수행)
+        """
+        self._ensure_started()
+        self._queue.put((task_id, operation))
+
+    def flush(self, timeout: float = 5.0):
+        """
+        대기 중인 기록 완료 대기 (Worker 종료 시)
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait(timeout)
+
+    def _run(self):
+        """큐 처리 루프"""
+        try:
+            init_task_db_sync()
+        except Exception as e:
+            logger.error(f"❌ 작업 인덱스 DB 초기화 실패: {e}")
+
+        session_factory = get_sync_session_factory()
+
+        while True:
+            task_id, fields = self._queue.get()
+
+            if task_id is _FLUSH:
+                fields.set()
+                continue
+
+            try:
+                with session_factory() as session:
+                    if callable(fields):
+                        fields(session)
+                    else:
+                        session.execute(self._build_statement(task_id, fields))
+                    session.commit()
+            except Exception as e:
+                logger.error(f"❌ 작업 인덱스 기록 실패 [{task_id}]: {e}")
+
+    @staticmethod
+    def _build_statement(task_id: str, fields: dict):
+        """UPSERT(파일명 포함 시) 또는 UPDATE 문 생성"""
+        if "filename" not in fields:
+            return (
+                update(TaskRecord)
+                .where(TaskRecord.task_id == task_id)
+                .values(**fields)
+            )
+
+        values = {"created_at": datetime.now(), "status": "pending", "progress": 0, **fields}
+        stmt = insert(TaskRecord).values(task_id=task_id, **values)
+        return stmt.on_conflict_do_update(
+            index_elements=[TaskRecord.task_id],
+            set_=fields,
+        )
+
+
+# 전역 인스턴스
+task_index_repository = TaskIndexRepository()
+task_index_writer = TaskIndexWriter()
@@ -3,12 +3,19 @@ FastAPI 메인 애플리케이션
 """
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
-from app.core.config import settings
+from app.core.config import ensure_directories, settings
+from app.core.metrics import render_metrics
+from app.api.admission import UploadAdmissionMiddleware
 from app.api.routes import router
+from app.db.database import init_task_db, close_task_db
+from app.services.admission_service import admission_service
+from app.services.health_service import health_service
+from app.services.resummarize_service import resummarize_service
+from app.services.task_event_service import task_event_service
 
 
 @asynccontextmanager
@@ -23,9 +30,20 @@ async def lifespan(app: FastAPI):
     logger.info(f"🔧 Whisper 모델: {settings.whisper_model}")
     logger.info(f"🤖 Ollama 모델: {settings.ollama_model}")
 
+    ensure_directories()
+    await init_task_db()
+    logger.info(f"🗄️ 작업 인덱스 DB: {settings.task_db_path}")
+
+    await health_service.start()
+
     yield
 
     # 종료 시
+    await health_service.stop()
+    await resummarize_service.close()
+    await admission_service.close()
+    await task_event_service.close()
+    await close_task_db()
     logger.info("🛑 Voicecom AI 서비스 종료")
 
 
@@ -37,7 +55,13 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS 설정
+# 업로드 수락 제어 (큐/대기 오디오/디스크/클라이언트 요청 수, 본문 수신 전 판정)
+app.add_middleware(
+    UploadAdmissionMiddleware,
+    paths=["/api/v1/upload", "/api/v1/upload/batch"],
+)
+
+# CORS 설정 (나중에 추가한 미들웨어가 바깥쪽이므로 수락 제어의 429/503 응답에도 CORS 헤더가 붙음)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -61,6 +85,13 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (Worker 메트릭은 WORKER_METRICS_PORT에서 별도 노출)"""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,298 @@
+"""
+업로드 수락 제어 서비스
+브로커 큐 길이, 대기 오디오 길이 추정, input 디스크 여유 공간, 클라이언트별 요청 수로
+업로드를 받을지 판정하고, 거부 시 다시 시도할 시점(Retry-After)을 계산
+"""
+import asyncio
+import math
+import shutil
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import settings
+from app.core.metrics import BACKLOG_AUDIO_SECONDS, UPLOAD_REJECTED
+from app.db.task_index import task_index_repository
+from app.services.health_service import health_service
+
+
+# 클라이언트별 요청 수 키 접두어 (키: voicecom:ratelimit:{클라이언트}:{분 단위 구간})
+RATE_LIMIT_KEY_PREFIX = "voicecom:ratelimit:"
+
+# 요청 수 제한 구간 (초)
+RATE_LIMIT_WINDOW_SEC = 60
+
+# Retry-After 상한 (초)
+MAX_RETRY_AFTER_SEC = 3600
+
+
+class AdmissionRejectedError(Exception):
+    """업로드 수락 거부 (429/503 + Retry-After)"""
+
+    def __init__(self, status_code: int, reason: str, message: str, retry_after: int):
+        """
+        초기화
+
+        Args:
+            status_code: HTTP 상태 코드 (429: 클라이언트 요청 수 초과, 503: 시스템 대기량 초과)
+            reason: 거부 사유 코드 (rate_limit, disk, queue_depth, queued_audio)
+            message: 응답 메시지
+            retry_after: 다시 시도할 때까지 대기 시간 (초)
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Backlog:
+    """처리 대기량 추정 스냅샷"""
+
+    def __init__(
+        self,
+        queue_depth: int,
+        queued_tasks: int,
+        queued_audio_sec: float,
+        throughput: float,
+        free_disk_mb: Optional[int],
+    ):
+        """
+        초기화
+
+        Args:
+            queue_depth: 브로커 큐 대기 작업 수 (모든 큐 합계)
+            queued_tasks: 작업 인덱스 기준 대기/처리 중 작업 수
+            queued_audio_sec: 대기/처리 중 오디오 길이 합계 추정 (초)
+            throughput: 최근 처리량 (처리 시간 1초당 오디오 초)
+            free_disk_mb: input 디렉토리 여유 공간 (MB, 확인 실패 시 None)
+        """
+        self.queue_depth = queue_depth
+        self.queued_tasks = queued_tasks
+        self.queued_audio_sec = queued_audio_sec
+        self.throughput = throughput
+        self.free_disk_mb = free_disk_mb
+        self.checked_at = datetime.now()
+
+    def drain_seconds(self, audio_sec: float) -> Optional[float]:
+        """
+        오디오 audio_sec초를 처리하는 데 걸릴 예상 시간 (최근 처리량 기준)
+
+        Returns:
+            예상 시간 (초, 최근 완료 작업이 없으면 None)
+        """
+        if self.throughput <= 0:
+            return None
+        return audio_sec / self.throughput
+
+    @property
+    def estimated_wait_sec(self) -> Optional[float]:
+        """지금 업로드한 파일이 처리되기 시작할 때까지 예상 대기 시간 (초)"""
+        return self.drain_seconds(self.queued_audio_sec)
+
+    def to_dict(self) -> dict:
+        """응답용 dict"""
+        wait = self.estimated_wait_sec
+        return {
+            "queue_depth": self.queue_depth,
+            "queued_tasks": self.queued_tasks,
+            "queued_audio_sec": round(self.queued_audio_sec, 1),
+            "throughput": round(self.throughput, 3),
+            "estimated_wait_sec": round(wait, 1) if wait is not None else None,
+            "free_disk_mb": self.free_disk_mb,
+            "checked_at": self.checked_at,
+        }
+
+
+class AdmissionService:
+    """업로드 수락 제어"""
+
+    def __init__(self):
+        """초기화"""
+        self._client: Optional[aioredis.Redis] = None
+        self._backlog: Optional[Backlog] = None
+        self._backlog_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _get_client(self) -> aioredis.Redis:
+        """비동기 Redis 클라이언트 (요청 수 카운터, API 프로세스 간 공유)"""
+        if self._client is None:
+            self._client = aioredis.Redis.from_url(
+                settings.get_redis_url(), socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        return self._client
+
+    async def close(self):
+        """Redis 연결 종료 (lifespan 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def backlog(self) -> Backlog:
+        """
+        처리 대기량 추정 (헬스 체크 주기 동안 캐시)
+
+        Returns:
+            대기량 스냅샷
+        """
+        async with self._lock:
+            if (
+                self._backlog is None
+                or time.monotonic() - self._backlog_at >= settings.health_check_interval_sec
+            ):
+                self._backlog = await self._measure_backlog()
+                self._backlog_at = time.monotonic()
+                BACKLOG_AUDIO_SECONDS.set(self._backlog.queued_audio_sec)
+            return self._backlog
+
+    async def _measure_backlog(self) -> Backlog:
+        """브로커 큐 길이(헬스 체크 스냅샷) + 작업 인덱스 집계 + 디스크 여유 공간"""
+        window = settings.admission_throughput_window_sec
+        queued_tasks, queued_audio_sec, completed_audio_sec = await task_index_repository.get_backlog(
+            completed_since=datetime.now() - timedelta(seconds=window),
+            bytes_per_audio_sec=settings.admission_bytes_per_audio_sec,
+        )
+        try:
+            disk = await asyncio.to_thread(shutil.disk_usage, settings.input_dir)
+        except OSError as e:
+            logger.warning(f"⚠️ 디스크 여유 공간 확인 실패: {e}")
+            disk = None
+
+        return Backlog(
+            queue_depth=sum(health_service.snapshot.queue_depth.values()),
+            queued_tasks=queued_tasks,
+            queued_audio_sec=queued_audio_sec,
+            throughput=completed_audio_sec / window if window > 0 else 0.0,
+            free_disk_mb=disk.free // (1024 * 1024) if disk is not None else None,
+        )
+
+    async def admit(self, client_id: str, incoming_bytes: int = 0):
+        """
+        업로드 수락 판정 (클라이언트 요청 수 → 디스크 → 큐 길이 → 대기 오디오 길이 순)
+
+        Args:
+            client_id: 클라이언트 식별자 (RATE_LIMIT_CLIENT_HEADER 헤더 값 또는 IP)
+            incoming_bytes: 요청 본문 크기 (Content-Length, 모르면 0)
+
+        Raises:
+            AdmissionRejectedError: 한도 초과 시
+        """
+        try:
+            await self._check_rate_limit(client_id)
+            await self.check_capacity(incoming_bytes)
+        except AdmissionRejectedError as e:
+            UPLOAD_REJECTED.labels(reason=e.reason).inc()
+            logger.warning(f"🚦 업로드 거부 [{client_id}]: {e.reason} (Retry-After {e.retry_after}초)")
+            raise
+
+    async def check_capacity(self, incoming_bytes: int = 0):
+        """
+        시스템 대기량 확인 (디스크 → 큐 길이 → 대기 오디오 길이, 디스크 확인/대기량 집계 실패 시 허용)
+
+        Args:
+            incoming_bytes: 요청 본문 크기 (모르면 0)
+
+        Raises:
+            AdmissionRejectedError: 한도 초과 시 (503)
+        """
+        # 디스크는 짧은 시간에 몰리는 업로드로도 바로 차므로 캐시 없이 매번 확인 (느린 볼륨에서 이벤트 루프를 막지 않도록 스레드에서)
+        try:
+            disk = await asyncio.to_thread(shutil.disk_usage, settings.input_dir)
+        except OSError as e:
+            logger.warning(f"⚠️ 디스크 여유 공간 확인 실패 (허용): {e}")
+            disk = None
+
+        if disk is not None:
+            free_disk_mb = disk.free // (1024 * 1024)
+            if free_disk_mb - incoming_bytes / (1024 * 1024) < settings.admission_min_free_disk_mb:
+                raise AdmissionRejectedError(
+                    503,
+                    "disk",
+                    f"저장 공간이 부족합니다 (여유 {free_disk_mb}MB). 잠시 후 다시 시도하세요.",
+                    settings.admission_retry_after_sec,
+                )
+
+        try:
+            backlog = await self.backlog()
+        except Exception as e:
+            logger.warning(f"⚠️ 처리 대기량 확인 실패 (허용): {e}")
+            return
+
+        max_depth = settings.admission_max_queue_depth
+        if max_depth > 0 and backlog.queue_depth >= max_depth:
+            # 한도 아래로 내려가려면 처리해야 하는 작업 수 × 평균 오디오 길이
+            average_audio_sec = backlog.queued_audio_sec / max(backlog.queued_tasks, 1)
+            excess_sec = (backlog.queue_depth - max_depth + 1) * average_audio_sec
+            raise AdmissionRejectedError(
+                503,
+                "queue_depth",
+                f"처리 대기 작업이 너무 많습니다 ({backlog.queue_depth}건). 잠시 후 다시 시도하세요.",
+                self._retry_after(backlog, excess_sec),
+            )
+
+        max_audio = settings.admission_max_queued_audio_sec
+        if max_audio > 0 and backlog.queued_audio_sec >= max_audio:
+            raise AdmissionRejectedError(
+                503,
+                "queued_audio",
+                f"처리 대기 오디오가 너무 깁니다 ({backlog.queued_audio_sec / 3600:.1f}시간). "
+                "잠시 후 다시 시도하세요.",
+                self._retry_after(backlog, backlog.queued_audio_sec - max_audio),
+            )
+
+    def _retry_after(self, backlog: Backlog, excess_audio_sec: float) -> int:
+        """
+        한도 아래로 내려갈 때까지 예상 시간 (최근 처리량이 없으면 기본값)
+
+        Args:
+            backlog: 대기량 스냅샷
+            excess_audio_sec: 한도를 넘는 오디오 길이 (초)
+
+        Returns:
+            Retry-After (초)
+        """
+        drain = backlog.drain_seconds(max(excess_audio_sec, 0.0))
+        if drain is None:
+            return settings.admission_retry_after_sec
+        return min(max(math.ceil(drain), settings.admission_retry_after_sec), MAX_RETRY_AFTER_SEC)
+
+    async def _check_rate_limit(self, client_id: str):
+        """
+        클라이언트별 분당 요청 수 확인 (Redis 고정 구간 카운터, Redis 장애 시 허용)
+
+        Args:
+            client_id: 클라이언트 식별자
+
+        Raises:
+            AdmissionRejectedError: 요청 수 초과 시 (429)
+        """
+        limit = settings.get_rate_limit_overrides().get(client_id, settings.rate_limit_per_minute)
+        if limit <= 0:
+            return
+
+        now = time.time()
+        window = int(now // RATE_LIMIT_WINDOW_SEC)
+        key = f"{RATE_LIMIT_KEY_PREFIX}{client_id}:{window}"
+
+        try:
+            async with self._get_client().pipeline(transaction=False) as pipe:
+                pipe.incr(key)
+                pipe.expire(key, RATE_LIMIT_WINDOW_SEC * 2)
+                count, _ = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ 요청 수 제한 확인 실패 (허용): {e}")
+            return
+
+        if count > limit:
+            raise AdmissionRejectedError(
+                429,
+                "rate_limit",
+                f"요청 한도(분당 {limit}회)를 초과했습니다.",
+                max(1, math.ceil((window + 1) * RATE_LIMIT_WINDOW_SEC - now)),
+            )
+
+
+# 전역 인스턴스
+admission_service = AdmissionService()
@@ -0,0 +1,201 @@
+"""
+정규화 오디오 캐시 서비스
+원본 파일을 16kHz float32 PCM으로 한 번만 디코딩/리샘플링해 .npy로 저장하고,
+재처리 시에는 메모리 맵으로 열어 디코딩/리샘플링/추가 메모리 복사 없이 사용
+"""
+import hashlib
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+
+from app.core.config import settings
+from app.utils.audio_utils import WHISPER_SAMPLE_RATE, read_audio
+
+
+# 내용 해시 계산 시 읽기 단위
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+class AudioCacheService:
+    """
+    정규화 오디오 캐시 (내용 SHA-256 → {hash}.npy, (프레임, 채널) float32 16kHz)
+
+    같은 내용의 파일은 경로가 달라도(input/ → processed/) 같은 캐시를 사용하며,
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    여러 Worker 프로세스가 같은 디렉토리를 공유하므로 임시 파일에 쓴 뒤 원자적으로 교체합니다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 최대 캐시 크기 (bytes, 0이면 저장하지 않음)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 저장 여부"""
+        return self.max_bytes > 0
+
+    @staticmethod
+    def content_hash(audio_path: Path) -> str:
+        """
+        파일 내용 해시 (업로드 시 작업 인덱스에 기록하는 값과 같은 SHA-256)
+
+        Args:
+            audio_path: 오디오 파일 경로
+
+        Returns:
+            SHA-256 hex
+        """
+        digest = hashlib.sha256()
+        with open(audio_path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load(self, audio_path: Path, content_hash: Optional[str] = None) -> np.ndarray:
+        """
+        정규화 오디오 조회 (없으면 디코딩 후 캐시에 저장)
+
+        Args:
+            audio_path: 오디오 파일 경로
+            content_hash: 파일 SHA-256 (업로드 시 작업 인덱스에 기록한 값, None이면 파일 전체를 읽어 계산)
+
+        Returns:
+            (프레임, 채널) float32 16kHz 배열 (캐시 사용 시 읽기 전용 메모리 맵)
+        """
+        if not self.enabled:
+            return self.normalize(audio_path)
+
+        key = content_hash or self.content_hash(audio_path)
+        cached = self.get(key)
+        if cached is not None:
+            logger.info(f"♻️ 정규화 오디오 캐시 사용: {audio_path.name} ({key[:12]})")
+            return cached
+
+        return self.put(key, self.normalize(audio_path))
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        캐시 조회
+
+        Args:
+            key: 내용 해시
+
+        Returns:
+            읽기 전용 메모리 맵 (없으면 None)
+        """
+        path = self.cache_dir / f"{key}.npy"
+        try:
+            data = np.load(path, mmap_mode="r")
+            # LRU 순서 갱신 (atime은 noatime 마운트에서 갱신되지 않으므로 mtime 사용)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"⚠️ 손상된 오디오 캐시 삭제: {path.name} ({e})")
+            path.unlink(missing_ok=True)
+            return None
+
+        return data
+
+    def put(self, key: str, data: np.ndarray) -> np.ndarray:
+        """
+        캐시 저장 후 메모리 맵으로 다시 열기
+
+        저장 후에는 디코딩한 배열 대신 메모리 맵을 반환하므로 프로세스 메모리에 사본이 남지 않습니다.
+
+        Args:
+            key: 내용 해시
+            data: (프레임, 채널) float32 16kHz 배열
+
+        Returns:
+            읽기 전용 메모리 맵 (최대 크기 초과 또는 저장 실패 시 입력 배열)
+        """
+        if data.nbytes > self.max_bytes:
+            return data
+
+        path = self.cache_dir / f"{key}.npy"
+        temp_path = self.cache_dir / f".{key}.{uuid.uuid4().hex}.tmp"
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                np.save(f, data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ 오디오 캐시 저장 실패: {e}")
+            temp_path.unlink(missing_ok=True)
+            return data
+
+        # 매핑을 먼저 열어 두면 정리 과정에서 삭제되어도 이 작업은 계속 사용 가능
+        mapped = np.load(path, mmap_mode="r")
+        self.evict()
+        return mapped
+
+    def evict(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.npy"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue  # 다른 Worker가 먼저 삭제
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            removed = 0
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                # 이미 메모리 맵으로 열린 파일도 삭제 가능 (POSIX: 매핑이 닫힐 때 해제)
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+            logger.info(f"🧹 오디오 캐시 정리: {removed}개 삭제 (현재 {total / 1024 / 1024:.0f}MB)")
+
+    @staticmethod
+    def normalize(audio_path: Path) -> np.ndarray:
+        """
+        오디오를 16kHz float32 (프레임, 채널) 배열로 디코딩
+
+        Args:
+            audio_path: 오디오 파일 경로
+
+        Returns:
+            (프레임, 채널) float32 16kHz 배열 (C 연속)
+        """
+        data, samplerate = read_audio(audio_path)
+
+        if samplerate != WHISPER_SAMPLE_RATE:
+            # librosa는 리샘플링이 필요할 때만 import (기본 soxr 백엔드)
+            import librosa
+
+            data = librosa.resample(
+                data.T, orig_sr=samplerate, target_sr=WHISPER_SAMPLE_RATE
+            ).T
+
+        return np.ascontiguousarray(data, dtype=np.float32)
+
+
+# 전역 인스턴스
+audio_cache_service = AudioCacheService(
+    settings.audio_cache_dir, settings.audio_cache_max_mb * 1024 * 1024
+)
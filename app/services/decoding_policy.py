@@ -0,0 +1,258 @@
+"""
+부하 적응형 디코딩 정책
+Worker가 소비하는 큐의 대기 작업 수와 처리 시간 목표(SLA)로 STT 품질 단계를 선택
+
+- full: beam 5, 기본 모델 (기본값, 대기 작업이 적을 때)
+- balanced: beam 2, 배치 추론
+- fast: greedy(beam 1), 보조 모델(WHISPER_FALLBACK_MODEL), 배치 추론,
+  두 채널이 거의 같은 Stereo 파일은 화자 분리 생략
+
+부하 = Σ(큐별 대기 작업 수 / 큐를 소비하는 동시 실행 수) × 최근 작업 처리 시간(EWMA) / DECODING_SLA_SEC 로 추정합니다.
+동시 실행 수는 이 Worker의 풀 크기에 같은 큐를 소비하는 다른 GPU Worker(하트비트 등록)의 풀 크기를 더한 값입니다
+(기본 큐는 모든 GPU Worker, 장치 큐는 다른 노드의 같은 번호 GPU).
+결과에는 사용한 단계가 기록되므로 부하가 줄면 낮은 단계 결과만 골라 다시 처리할 수 있습니다.
+
+2단계 처리(two-pass)의 미리보기는 부하와 무관한 별도 단계(PREVIEW_TIER)를 사용합니다.
+"""
+import socket
+import time
+from typing import Dict, List, Optional
+
+import redis
+from loguru import logger
+
+from app.core.celery_client import broker_queue_keys
+from app.core.config import settings
+from app.core.metrics import DECODING_PRESSURE
+from app.services.device_service import DEVICE_QUEUE_PREFIX, device_queue, list_device_workers
+
+
+# 품질 단계 (높은 품질 → 빠른 처리 순)
+TIER_FULL = "full"
+TIER_BALANCED = "balanced"
+TIER_FAST = "fast"
+TIER_ORDER = (TIER_FULL, TIER_BALANCED, TIER_FAST)
+TIER_PREVIEW = "preview"
+
+# Whisper 모델 키 (whisper_service에서 모델 이름/compute type 결정)
+MODEL_MAIN = "main"
+MODEL_FALLBACK = "fallback"
+MODEL_PREVIEW = "preview"
+
+# 2단계 처리 결과 단계 (미리보기 → 최종)
+PASS_PREVIEW = "preview"
+PASS_FINAL = "final"
+
+# 부하가 줄 때는 임계값의 이 배수 아래로 내려가야 품질 단계를 올림 (경계에서 단계가 자주 바뀌지 않도록)
+TIER_HYSTERESIS = 0.8
+
+# 작업 처리 시간 EWMA 가중치
+TASK_SEC_SMOOTHING = 0.2
+
+
+class DecodingTier:
+    """STT 품질 단계"""
+
+    def __init__(
+        self,
+        name: str,
+        beam_size: int,
+        batch_size: int = 0,
+        model: str = MODEL_MAIN,
+        skip_mono_like_diarization: bool = False,
+        skip_diarization: bool = False,
+    ):
+        """
+        초기화
+
+        Args:
+            name: 단계 이름 (결과에 기록)
+            beam_size: Whisper beam 크기 (1이면 greedy)
+            batch_size: 배치 추론 크기 (0이면 순차 추론)
+            model: Whisper 모델 키 (MODEL_FALLBACK은 WHISPER_FALLBACK_MODEL이 비어 있으면 기본 모델)
+            skip_mono_like_diarization: 두 채널이 거의 같은 Stereo 파일의 화자 분리 생략 여부
+            skip_diarization: 모든 Stereo 파일의 화자 분리 생략 여부 (두 채널 평균으로 STT)
+        """
+        self.name = name
+        self.beam_size = beam_size
+        self.batch_size = batch_size
+        self.model = model
+        self.skip_mono_like_diarization = skip_mono_like_diarization
+        self.skip_diarization = skip_diarization
+
+
+def build_tiers() -> Dict[str, DecodingTier]:
+    """설정값으로 품질 단계 생성"""
+    batch_size = settings.whisper_batch_size
+    return {
+        TIER_FULL: DecodingTier(TIER_FULL, beam_size=5),
+        TIER_BALANCED: DecodingTier(TIER_BALANCED, beam_size=2, batch_size=batch_size),
+        TIER_FAST: DecodingTier(
+            TIER_FAST,
+            beam_size=1,
+            batch_size=batch_size,
+            model=MODEL_FALLBACK,
+            skip_mono_like_diarization=True,
+        ),
+    }
+
+
+DECODING_TIERS = build_tiers()
+
+# 2단계 처리 미리보기 (작은 양자화 모델, greedy, 화자 분리 없음)
+PREVIEW_TIER = DecodingTier(TIER_PREVIEW, beam_size=1, model=MODEL_PREVIEW, skip_diarization=True)
+
+
+class DecodingPolicy:
+    """부하 기반 품질 단계 선택 (Worker 프로세스별)"""
+
+    def __init__(self):
+        """초기화"""
+        self._client: Optional[redis.Redis] = None
+        self._level = 0
+        self._task_sec: Optional[float] = None
+        self._depths: Optional[Dict[str, int]] = None
+        self._workers: List[dict] = []
+        self._depth_at = 0.0
+        # 이 Worker의 동시 실행 수 (celeryd_init에서 기록, 파이프라인 사용 시 1)
+        self.pool_size = 1
+
+    def consumed_queues(self) -> List[str]:
+        """이 Worker가 소비하는 큐 (장치 큐 + 기본 큐)"""
+        queues = settings.get_monitored_queues()
+        if settings.worker_device_index >= 0:
+            queues.insert(0, device_queue(settings.worker_device_index))
+        return queues
+
+    def queue_depth(self) -> Optional[Dict[str, int]]:
+        """
+        소비하는 큐별 대기 작업 수 + 등록된 GPU Worker 목록 갱신 (헬스 체크 주기 동안 캐시)
+
+        Returns:
+            {큐 이름: 대기 작업 수} (Redis 장애 시 None)
+        """
+        if self._depths is not None and time.monotonic() - self._depth_at < settings.health_check_interval_sec:
+            return self._depths
+
+        try:
+            if self._client is None:
+                self._client = redis.Redis.from_url(
+                    settings.get_celery_broker_url(), socket_timeout=1.0, socket_connect_timeout=1.0
+                )
+            # 우선순위 하위 목록까지 합산 (2단계 처리 최종 작업도 처리할 작업)
+            queue_keys = {queue_name: broker_queue_keys(queue_name) for queue_name in self.consumed_queues()}
+            with self._client.pipeline(transaction=False) as pipe:
+                for keys in queue_keys.values():
+                    for key in keys:
+                        pipe.llen(key)
+                lengths = iter(pipe.execute())
+            self._depths = {
+                queue_name: sum(next(lengths) for _ in keys) for queue_name, keys in queue_keys.items()
+            }
+            self._workers = list_device_workers(self._client)
+        except Exception as e:
+            logger.warning(f"⚠️ 큐 길이 확인 실패 (현재 품질 단계 유지): {e}")
+            self._depths = None
+
+        self._depth_at = time.monotonic()
+        return self._depths
+
+    def consumers(self, queue_name: str) -> int:
+        """
+        큐를 소비하는 동시 실행 수 (이 Worker + 같은 큐를 소비하는 다른 GPU Worker)
+
+        GPU Worker는 자기 장치 큐와 기본 큐를 소비하므로 장치 큐는 같은 큐 이름으로 등록된 Worker만,
+        기본 큐는 등록된 모든 Worker를 더합니다 (장치를 지정하지 않은 Worker는 등록되지 않아 제외).
+
+        Args:
+            queue_name: 큐 이름
+
+        Returns:
+            동시 실행 수 (1 이상)
+        """
+        own_queue = device_queue(settings.worker_device_index) if settings.worker_device_index >= 0 else None
+        hostname = socket.gethostname()
+        shared = not queue_name.startswith(DEVICE_QUEUE_PREFIX)
+
+        others = sum(
+            int(worker.get("concurrency") or 1)
+            for worker in self._workers
+            if (worker.get("hostname"), worker.get("queue")) != (hostname, own_queue)
+            and (shared or worker.get("queue") == queue_name)
+        )
+        return max(self.pool_size, 1) + others
+
+    def record_task(self, elapsed_sec: float):
+        """
+        작업 처리 시간 기록 (EWMA)
+
+        Args:
+            elapsed_sec: 작업 한 건의 전체 처리 시간 (초)
+        """
+        if self._task_sec is None:
+            self._task_sec = elapsed_sec
+        else:
+            self._task_sec += TASK_SEC_SMOOTHING * (elapsed_sec - self._task_sec)
+
+    def pressure(self, depths: Dict[str, int]) -> float:
+        """
+        부하 (대기 작업을 모두 처리하는 예상 시간 / SLA, 1 이상이면 목표 초과)
+
+        큐마다 대기 작업을 그 큐를 소비하는 동시 실행 수로 나눠 처리 시간을 추정합니다.
+
+        Args:
+            depths: {큐 이름: 대기 작업 수}
+
+        Returns:
+            부하 (처리 이력이 없거나 SLA가 0이면 0)
+        """
+        if self._task_sec is None or settings.decoding_sla_sec <= 0:
+            return 0.0
+        rounds = sum(depth / self.consumers(queue_name) for queue_name, depth in depths.items())
+        return rounds * self._task_sec / settings.decoding_sla_sec
+
+    def select(self, requested: Optional[str] = None) -> DecodingTier:
+        """
+        이번 작업의 품질 단계
+
+        Args:
+            requested: 지정 단계 (재처리 요청 등, None이면 부하로 선택)
+
+        Returns:
+            품질 단계
+
+        Raises:
+            ValueError: 알 수 없는 단계 이름
+        """
+        if requested is not None:
+            if requested not in DECODING_TIERS:
+                raise ValueError(f"알 수 없는 디코딩 단계: {requested}")
+            return DECODING_TIERS[requested]
+
+        if not settings.decoding_policy_enabled:
+            return DECODING_TIERS[TIER_FULL]
+
+        depths = self.queue_depth()
+        if depths is None:
+            return DECODING_TIERS[TIER_ORDER[self._level]]
+
+        pressure = self.pressure(depths)
+        thresholds = settings.get_decoding_tier_pressure()
+        level = sum(pressure >= threshold for threshold in thresholds)
+        if level < self._level:
+            level = max(level, sum(pressure >= threshold * TIER_HYSTERESIS for threshold in thresholds))
+        level = min(level, len(TIER_ORDER) - 1)
+
+        if level != self._level:
+            logger.info(
+                f"🎚️ 디코딩 단계 변경: {TIER_ORDER[self._level]} → {TIER_ORDER[level]} "
+                f"(대기 {sum(depths.values())}건, 부하 {pressure:.2f})"
+            )
+            self._level = level
+
+        DECODING_PRESSURE.set(pressure)
+        return DECODING_TIERS[TIER_ORDER[level]]
+
+
+# 전역 인스턴스 (프로세스별)
+decoding_policy = DecodingPolicy()
@@ -0,0 +1,247 @@
+"""
+GPU 장치 서비스
+GPU 조회(pynvml), GPU별 Worker 등록(Redis 하트비트), 업로드 작업의 장치별 큐 선택
+
+GPU마다 Worker 하나를 고정하고(worker_launcher) 각 Worker는 gpu.{번호} 큐와 기본 큐를 함께 소비합니다.
+API는 등록된 장치 중 대기 작업이 가장 적은(또는 여유 메모리가 가장 큰) 장치의 큐로 작업을 보내며,
+등록된 장치가 없으면(단일 GPU/CPU 노드) 기본 큐를 사용합니다.
+"""
+import json
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+import redis
+from loguru import logger
+
+from app.core.config import settings
+
+
+# 장치별 큐 이름 접두어 (gpu.0, gpu.1, ...)
+DEVICE_QUEUE_PREFIX = "gpu."
+
+# 장치 Worker 등록 키 접두어 (키: voicecom:device:{호스트}:{큐 이름}, 여러 노드의 같은 번호 GPU는 큐를 공유)
+DEVICE_KEY_PREFIX = "voicecom:device:"
+
+# 등록 유지 시간 (하트비트 주기 배수, Worker가 죽으면 이 시간 뒤 라우팅 대상에서 제외)
+DEVICE_TTL_MULTIPLIER = 3
+
+_nvml_lock = threading.Lock()
+_nvml_initialized = False
+
+
+def device_queue(device_index: int) -> str:
+    """장치별 큐 이름"""
+    return f"{DEVICE_QUEUE_PREFIX}{device_index}"
+
+
+def list_gpus() -> List[dict]:
+    """
+    GPU 목록 및 메모리 (pynvml, 블로킹 호출)
+
+    NVML은 CUDA_VISIBLE_DEVICES와 무관하게 물리 GPU 번호를 사용합니다.
+
+    Returns:
+        [{"index", "name", "memory_free_mb", "memory_total_mb"}, ...]
+        (pynvml이 없거나 GPU가 없으면 빈 목록)
+    """
+    global _nvml_initialized
+
+    try:
+        import pynvml
+    except ImportError:
+        return []
+
+    try:
+        with _nvml_lock:
+            if not _nvml_initialized:
+                pynvml.nvmlInit()
+                _nvml_initialized = True
+
+        gpus = []
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            name = pynvml.nvmlDeviceGetName(handle)
+            gpus.append({
+                "index": index,
+                "name": name.decode("utf-8") if isinstance(name, bytes) else name,
+                "memory_free_mb": memory.free // (1024 * 1024),
+                "memory_total_mb": memory.total // (1024 * 1024),
+            })
+        return gpus
+
+    except pynvml.NVMLError:
+        return []
+
+
+def shutdown_nvml():
+    """NVML 종료 (초기화된 경우만)"""
+    global _nvml_initialized
+
+    with _nvml_lock:
+        if _nvml_initialized:
+            import pynvml
+            pynvml.nvmlShutdown()
+            _nvml_initialized = False
+
+
+def list_device_workers(client: redis.Redis) -> List[dict]:
+    """
+    등록된 GPU Worker 목록 (동기, TTL 만료된 Worker는 제외)
+
+    Args:
+        client: 브로커 Redis 클라이언트
+
+    Returns:
+        하트비트 내용 목록 [{"queue", "device_index", "hostname", "concurrency", ...}, ...]
+    """
+    keys = list(client.scan_iter(match=f"{DEVICE_KEY_PREFIX}*"))
+    if not keys:
+        return []
+
+    workers = []
+    for value in client.mget(keys):
+        if value is None:
+            continue  # 조회 사이에 만료
+        try:
+            workers.append(json.loads(value))
+        except ValueError:
+            continue
+    return workers
+
+
+def device_ttl_sec() -> int:
+    """장치 등록 유지 시간 (초)"""
+    return max(int(settings.health_check_interval_sec * DEVICE_TTL_MULTIPLIER), 5)
+
+
+class DeviceHeartbeat:
+    """
+    GPU Worker 등록 (Worker 메인 프로세스)
+
+    헬스 체크 주기마다 장치 상태(여유 메모리 등)를 TTL 키로 갱신하고, 종료 시 삭제합니다.
+    """
+
+    def __init__(self, device_index: int, concurrency: int = 1):
+        """
+        초기화
+
+        Args:
+            device_index: 물리 GPU 번호
+            concurrency: Worker 동시 실행 수 (다른 Worker의 부하 추정에 사용)
+        """
+        self.device_index = device_index
+        self.concurrency = concurrency
+        self.queue = device_queue(device_index)
+        self._hostname = socket.gethostname()
+        self._key = f"{DEVICE_KEY_PREFIX}{self._hostname}:{self.queue}"
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._client = redis.Redis.from_url(
+            settings.get_celery_broker_url(), socket_timeout=1.0, socket_connect_timeout=1.0
+        )
+
+    def start(self):
+        """하트비트 스레드 시작"""
+        self._beat()
+        self._thread = threading.Thread(target=self._run, name="device-heartbeat", daemon=True)
+        self._thread.start()
+        logger.info(f"🎮 GPU Worker 등록: {self.queue} (GPU {self.device_index})")
+
+    def stop(self):
+        """하트비트 중지 및 등록 해제"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        try:
+            self._client.delete(self._key)
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ GPU Worker 등록 해제 실패: {e}")
+
+    def _run(self):
+        """주기적 갱신 루프"""
+        while not self._stop.wait(settings.health_check_interval_sec):
+            self._beat()
+
+    def _beat(self):
+        """장치 상태 갱신 (Redis 오류는 다음 주기에 재시도)"""
+        gpu = next((g for g in list_gpus() if g["index"] == self.device_index), {})
+        payload = {
+            "queue": self.queue,
+            "device_index": self.device_index,
+            "hostname": self._hostname,
+            "concurrency": self.concurrency,
+            "name": gpu.get("name"),
+            "memory_free_mb": gpu.get("memory_free_mb"),
+            "memory_total_mb": gpu.get("memory_total_mb"),
+            "updated_at": time.time(),
+        }
+        try:
+            self._client.set(self._key, json.dumps(payload), ex=device_ttl_sec())
+        except redis.RedisError as e:
+            logger.warning(f"⚠️ GPU Worker 하트비트 실패: {e}")
+
+
+class DeviceRouter:
+    """
+    업로드 작업의 장치별 큐 선택 (API)
+
+    헬스 체크 스냅샷(등록된 장치, 큐 길이)을 기준으로 하며, 스냅샷 갱신 전까지 보낸 작업 수를
+    더해 짧은 시간에 몰린 업로드가 한 장치에 쏠리지 않게 합니다.
+    memory 기준에서는 대기/전송한 작업마다 DEVICE_TASK_MEMORY_MB를 여유 메모리에서 빼서 추정합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._lock = threading.Lock()
+        self._snapshot_version: Optional[int] = None
+        self._dispatched: Dict[str, int] = {}
+
+    def select_queue(
+        self,
+        devices: List[dict],
+        queue_depth: Dict[str, int],
+        snapshot_version: int,
+    ) -> Optional[str]:
+        """
+        작업을 보낼 큐 선택
+
+        Args:
+            devices: 등록된 GPU Worker 목록 (헬스 체크 스냅샷)
+            queue_depth: 큐별 대기 작업 수 (헬스 체크 스냅샷)
+            snapshot_version: 헬스 체크 스냅샷 번호 (바뀌면 전송 수 초기화)
+
+        Returns:
+            장치 큐 이름 (등록된 장치가 없으면 None = 기본 큐)
+        """
+        if not devices:
+            return None
+
+        by_memory = settings.device_routing == "memory"
+        task_memory_mb = settings.device_task_memory_mb
+
+        with self._lock:
+            # 스냅샷이 바뀌면 이전 스냅샷 기준으로 보낸 작업 수 초기화
+            if self._snapshot_version != snapshot_version:
+                self._snapshot_version = snapshot_version
+                self._dispatched = {}
+
+            def load(device: dict) -> tuple:
+                queue = device["queue"]
+                pending = queue_depth.get(queue, 0) + self._dispatched.get(queue, 0)
+                free_mb = device.get("memory_free_mb") or 0
+                if by_memory:
+                    # 스냅샷의 여유 메모리는 갱신 전까지 고정이므로 작업당 예상 사용량을 빼서 분산
+                    return (-(free_mb - pending * task_memory_mb), pending)
+                return (pending, -free_mb)
+
+            queue = min(devices, key=load)["queue"]
+            self._dispatched[queue] = self._dispatched.get(queue, 0) + 1
+
+        return queue
+
+
+# 전역 인스턴스
+device_router = DeviceRouter()
@@ -1,16 +1,29 @@
 """
 화자 분리 서비스 (Speaker Diarization)
 """
+import time
+import warnings
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from pyannote.audio import Pipeline
-from loguru import logger
-import soundfile as sf
-import torch
 import numpy as np
+from loguru import logger
 
 from app.core.config import settings
+from app.core.metrics import (
+    MODEL_LOAD_DURATION,
+    MODEL_LOADS,
+    MODEL_UNLOAD_DURATION,
+    MODEL_UNLOADS,
+    MODEL_WARMUP_DURATION,
+)
+from app.core.tracing import trace_span
+from app.utils.audio_utils import WHISPER_SAMPLE_RATE, read_audio, warmup_waveform
+from app.utils.segments import SegmentList
+
+
+# 워밍업 합성 오디오 길이 (초, 분할 모델 윈도우보다 길게)
+WARMUP_AUDIO_SEC = 12.0
 
 
 class DiarizationService:
@@ -40,43 +53,84 @@ class DiarizationService:
                 ".env 파일에 HF_TOKEN 설정하세요."
             )
 
+        # pyannote/torch는 모델 로드 시점에만 import (병합 로직만 쓰는 경우 불필요)
+        import torch
+        from pyannote.audio import Pipeline
+
         logger.info("🔄 화자 분리 모델 로드 중...")
+        started = time.perf_counter()
 
         try:
-            # pyannote community-1: 최신 오픈소스 모델
-            # 최신 pyannote.audio는 환경 변수 HF_TOKEN을 자동으로 사용
-            self.pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-community-1"
-            )
-
-            # GPU 사용 설정 (Mac MPS 지원)
-            if torch.backends.mps.is_available():
-                self.pipeline.to(torch.device("mps"))
-                logger.info("✅ MPS(Apple Silicon)로 화자 분리 모델 로드 완료")
-            elif torch.cuda.is_available():
-                self.pipeline.to(torch.device("cuda"))
-                logger.info("✅ CUDA GPU로 화자 분리 모델 로드 완료")
-            else:
-                logger.info("✅ CPU로 화자 분리 모델 로드 완료")
+            with trace_span("load"):
+                # pyannote community-1: 최신 오픈소스 모델
+                # 최신 pyannote.audio는 환경 변수 HF_TOKEN을 자동으로 사용
+                self.pipeline = Pipeline.from_pretrained(
+                    "pyannote/speaker-diarization-community-1"
+                )
+
+                # GPU 사용 설정 (Mac MPS 지원, WHISPER_DEVICE=cpu인 Worker는 CPU 유지)
+                # GPU별 Worker는 CUDA_VISIBLE_DEVICES로 장치 하나만 보이므로 "cuda"가 배정된 GPU
+                if settings.whisper_device == "cpu":
+                    logger.info("✅ CPU로 화자 분리 모델 로드 완료")
+                elif torch.backends.mps.is_available():
+                    self.pipeline.to(torch.device("mps"))
+                    logger.info("✅ MPS(Apple Silicon)로 화자 분리 모델 로드 완료")
+                elif torch.cuda.is_available():
+                    self.pipeline.to(torch.device("cuda"))
+                    logger.info("✅ CUDA GPU로 화자 분리 모델 로드 완료")
+                else:
+                    logger.info("✅ CPU로 화자 분리 모델 로드 완료")
 
             self._pipeline_loaded = True
+            MODEL_LOADS.labels(model="diarization").inc()
+            MODEL_LOAD_DURATION.labels(model="diarization").observe(time.perf_counter() - started)
 
         except Exception as e:
             logger.error(f"❌ 화자 분리 모델 로드 실패: {e}")
             raise
 
+    def warmup(self) -> float:
+        """
+        합성 오디오로 한 번 화자 분리 (분할/임베딩 모델 커널 준비)
+
+        Returns:
+            워밍업 소요 시간 (초)
+        """
+        if not self._pipeline_loaded:
+            self.load_pipeline()
+
+        import torch
+
+        started = time.perf_counter()
+        waveform = warmup_waveform(WARMUP_AUDIO_SEC)
+        self.pipeline({
+            "waveform": torch.from_numpy(waveform[np.newaxis, :]),  # (channel, time)
+            "sample_rate": WHISPER_SAMPLE_RATE,
+        })
+
+        elapsed = time.perf_counter() - started
+        MODEL_WARMUP_DURATION.labels(model="diarization").observe(elapsed)
+        logger.info(f"🔥 화자 분리 워밍업 완료 ({elapsed:.1f}초)")
+        return elapsed
+
     def unload_pipeline(self):
         """파이프라인 언로드 (GPU 메모리 해제)"""
         if self.pipeline is not None:
-            del self.pipeline
-            self.pipeline = None
-            self._pipeline_loaded = False
-
-            # GPU 메모리 정리
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-
+            started = time.perf_counter()
+            with trace_span("unload"):
+                del self.pipeline
+                self.pipeline = None
+                self._pipeline_loaded = False
+
+                # GPU 메모리 정리
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+
+            MODEL_UNLOADS.labels(model="diarization").inc()
+            MODEL_UNLOAD_DURATION.labels(model="diarization").observe(
+                time.perf_counter() - started
+            )
             logger.info("✅ 화자 분리 모델 언로드 완료")
 
     def diarize(
@@ -85,6 +139,7 @@ class DiarizationService:
         num_speakers: int = None,
         min_speakers: int = None,
         max_speakers: int = None,
+        audio: Optional[Tuple[np.ndarray, int]] = None,
     ) -> List[Tuple[float, float, str]]:
         """
         화자 분리 수행
@@ -94,6 +149,8 @@ class DiarizationService:
             num_speakers: 정확한 화자 수 (알고 있는 경우)
             min_speakers: 최소 화자 수
             max_speakers: 최대 화자 수
+            audio: 이미 디코딩된 ((프레임, 채널) float32 배열, 샘플레이트).
+                지정하면 파일을 다시 읽지 않습니다 (무음 제거된 오디오 등).
 
         Returns:
             [(시작시간(초), 종료시간(초), 화자ID), ...]
@@ -114,22 +171,24 @@ class DiarizationService:
                 if max_speakers is not None:
                     kwargs["max_speakers"] = max_speakers
 
-            # audio_in_memory 형식으로 전달 (torchcodec 문제 우회)
-            waveform, sample_rate = sf.read(str(audio_path))
-            if waveform.ndim == 1:
-                # Mono: (time,) -> (1, time)
-                waveform = waveform.reshape(1, -1)
-            else:
-                # Stereo: (time, channel) -> (channel, time)
-                waveform = waveform.T
+            import torch
 
-            audio_in_memory = {
-                "waveform": torch.from_numpy(waveform).float(),
-                "sample_rate": sample_rate
-            }
+            # audio_in_memory 형식으로 전달 (torchcodec 문제 우회)
+            with trace_span("decode"):
+                # float32 (time, channel)로 한 번만 읽고 전치 뷰를 그대로 텐서로 공유 (복사 없음)
+                waveform, sample_rate = audio if audio is not None else read_audio(audio_path)
+
+                with warnings.catch_warnings():
+                    # 정규화 오디오 캐시의 읽기 전용 메모리 맵 (pyannote는 입력을 수정하지 않음)
+                    warnings.filterwarnings("ignore", message="The given NumPy array is not writable")
+                    audio_in_memory = {
+                        "waveform": torch.from_numpy(waveform.T),  # (channel, time)
+                        "sample_rate": sample_rate
+                    }
 
             # community-1: 화자 분리 실행
-            output = self.pipeline(audio_in_memory, **kwargs)
+            with trace_span("inference"):
+                output = self.pipeline(audio_in_memory, **kwargs)
 
             # community-1 API: 더 간단한 iteration
             segments = []
@@ -151,77 +210,33 @@ class DiarizationService:
     def merge_with_transcript(
         self,
         diarization_segments: List[Tuple[float, float, str]],
-        whisper_segments: List[Tuple[str, str, str]],
-    ) -> List[Tuple[str, str, str, str]]:
+        whisper_segments: SegmentList,
+    ) -> SegmentList:
         """
         화자 분리 결과와 Whisper STT 결과 병합
 
+        각 STT 세그먼트의 중간 지점이 속한 화자 구간으로 화자를 지정합니다
+        (해당 구간이 없으면 UNKNOWN).
+
         Args:
             diarization_segments: [(시작(초), 종료(초), 화자), ...]
-            whisper_segments: [(시작시각, 종료시각, 텍스트), ...]
+            whisper_segments: STT 세그먼트 목록
 
         Returns:
-            [(시작시각, 종료시각, 화자, 텍스트), ...]
+            화자가 지정된 세그먼트 목록
         """
         logger.info("🔄 화자 정보와 STT 결과 병합 중...")
 
-        merged_segments = []
-
-        for srt_start, srt_end, text in whisper_segments:
-            # SRT 타임스탬프를 초 단위로 변환
-            start_sec = self._timestamp_to_seconds(srt_start)
-            end_sec = self._timestamp_to_seconds(srt_end)
-
-            # 해당 시간대의 화자 찾기 (중간 지점 기준)
-            mid_sec = (start_sec + end_sec) / 2
-            speaker = self._find_speaker_at_time(diarization_segments, mid_sec)
+        turn_starts = [start for start, _, _ in diarization_segments]
+        turn_ends = [end for _, end, _ in diarization_segments]
+        turn_speakers = [speaker for _, _, speaker in diarization_segments]
 
-            # 화자 라벨 추가
-            speaker_label = f"[{speaker}]" if speaker else "[알 수 없음]"
-
-            merged_segments.append((srt_start, srt_end, speaker_label, text))
+        merged_segments = whisper_segments.assign_speakers(turn_starts, turn_ends, turn_speakers)
 
         logger.info(f"✅ 병합 완료: {len(merged_segments)}개 세그먼트")
 
         return merged_segments
 
-    @staticmethod
-    def _timestamp_to_seconds(timestamp: str) -> float:
-        """
-        SRT 타임스탬프를 초 단위로 변환
-
-        Args:
-            timestamp: SRT 타임스탬프 (HH:MM:SS,mmm)
-
-        Returns:
-            초 단위 시간
-        """
-        time_part, ms_part = timestamp.split(",")
-        hours, minutes, seconds = map(int, time_part.split(":"))
-        milliseconds = int(ms_part)
-
-        return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
-
-    @staticmethod
-    def _find_speaker_at_time(
-        diarization_segments: List[Tuple[float, float, str]], time_sec: float
-    ) -> str:
-        """
-        특정 시각의 화자 찾기
-
-        Args:
-            diarization_segments: [(시작, 종료, 화자), ...]
-            time_sec: 찾을 시각 (초)
-
-        Returns:
-            화자 ID
-        """
-        for start, end, speaker in diarization_segments:
-            if start <= time_sec <= end:
-                return speaker
-
-        return "UNKNOWN"
-
 
 # 전역 인스턴스
 diarization_service = DiarizationService()
@@ -0,0 +1,190 @@
+"""
+헬스 체크 서비스
+Redis/브로커 큐/Ollama/GPU 상태를 백그라운드에서 주기적으로 갱신하고,
+/health는 캐시된 스냅샷만 반환
+"""
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.celery_client import broker_queue_keys
+from app.core.config import settings
+from app.core.metrics import QUEUE_DEPTH
+from app.services.device_service import DEVICE_KEY_PREFIX, list_gpus, shutdown_nvml
+from app.services.ollama_service import ollama_service
+
+
+class HealthSnapshot:
+    """헬스 체크 결과 스냅샷"""
+
+    def __init__(self):
+        """초기화 (첫 갱신 전 상태)"""
+        self.redis_connected = False
+        self.queue_depth: Dict[str, int] = {}
+        self.ollama_available = False
+        self.ollama_loaded_models: List[str] = []
+        self.gpu_available = False
+        self.gpus: List[dict] = []
+        self.devices: List[dict] = []
+        self.checked_at: Optional[datetime] = None
+        self.check_duration_ms: Optional[float] = None
+        self.version = 0  # 갱신마다 증가 (장치 라우팅의 스냅샷 구분용)
+
+    @property
+    def gpu_memory_free_mb(self) -> Optional[int]:
+        """GPU 중 가장 큰 여유 메모리 (MB)"""
+        if not self.gpus:
+            return None
+        return max(gpu["memory_free_mb"] for gpu in self.gpus)
+
+    @property
+    def status(self) -> str:
+        """전체 상태 (starting, ok, degraded, down)"""
+        if self.checked_at is None:
+            return "starting"
+        if not self.redis_connected:
+            return "down"
+        if not self.ollama_available:
+            return "degraded"
+        return "ok"
+
+
+class HealthService:
+    """헬스 체크 서비스 (백그라운드 갱신)"""
+
+    def __init__(self):
+        """초기화"""
+        self.snapshot = HealthSnapshot()
+        self._version = 0
+        self._task: Optional[asyncio.Task] = None
+        self._broker: Optional[aioredis.Redis] = None
+
+    async def start(self):
+        """백그라운드 갱신 시작 (lifespan 시작 시)"""
+        if self._task is not None:
+            return
+
+        self._broker = aioredis.Redis.from_url(
+            settings.get_celery_broker_url(),
+            socket_timeout=settings.health_check_timeout_sec,
+            socket_connect_timeout=settings.health_check_timeout_sec,
+        )
+
+        self._task = asyncio.create_task(self._run(), name="health-refresh")
+        logger.info(f"🩺 헬스 체크 갱신 시작 (주기: {settings.health_check_interval_sec}초)")
+
+    async def stop(self):
+        """백그라운드 갱신 중지 (lifespan 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._broker is not None:
+            await self._broker.aclose()
+            self._broker = None
+
+        shutdown_nvml()
+
+    async def _run(self):
+        """주기적 갱신 루프 (첫 갱신 전까지 상태는 starting)"""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"❌ 헬스 체크 갱신 실패: {e}")
+            await asyncio.sleep(settings.health_check_interval_sec)
+
+    async def refresh(self):
+        """모든 항목을 병렬로 확인하고 스냅샷 교체"""
+        started = time.perf_counter()
+        snapshot = HealthSnapshot()
+
+        (
+            (snapshot.redis_connected, snapshot.queue_depth, snapshot.devices),
+            snapshot.ollama_available,
+            snapshot.ollama_loaded_models,
+            snapshot.gpus,
+        ) = await asyncio.gather(
+            self._check_broker(),
+            ollama_service.check_health(),
+            self._check_ollama_models(),
+            asyncio.to_thread(list_gpus),
+        )
+
+        for queue_name, depth in snapshot.queue_depth.items():
+            QUEUE_DEPTH.labels(queue=queue_name).set(depth)
+
+        snapshot.gpu_available = bool(snapshot.gpus)
+        snapshot.checked_at = datetime.now()
+        snapshot.check_duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._version += 1
+        snapshot.version = self._version
+
+        # 참조 교체만 하므로 /health는 잠금 없이 항상 완전한 스냅샷을 읽음
+        self.snapshot = snapshot
+
+    async def _check_broker(self) -> tuple:
+        """
+        Redis 연결, 등록된 GPU Worker 및 큐 길이 확인
+
+        Returns:
+            (연결 여부, {큐 이름: 대기 작업 수}, [등록된 GPU Worker])
+            (장치 큐는 MONITORED_QUEUES에 없어도 포함)
+        """
+        try:
+            await self._broker.ping()
+            devices = await self._list_devices()
+
+            queue_names = settings.get_monitored_queues()
+            queue_names += [d["queue"] for d in devices if d["queue"] not in queue_names]
+            # 우선순위 하위 목록까지 합산 (2단계 처리 최종 작업 등)
+            queue_keys = {queue_name: broker_queue_keys(queue_name) for queue_name in queue_names}
+            async with self._broker.pipeline(transaction=False) as pipe:
+                for keys in queue_keys.values():
+                    for key in keys:
+                        pipe.llen(key)
+                lengths = iter(await pipe.execute())
+            queue_depth = {
+                queue_name: sum(next(lengths) for _ in keys) for queue_name, keys in queue_keys.items()
+            }
+            return True, queue_depth, devices
+
+        except Exception as e:
+            logger.warning(f"⚠️ Redis 헬스 체크 실패: {e}")
+            return False, {}, []
+
+    async def _list_devices(self) -> List[dict]:
+        """Worker가 등록한 GPU 장치 목록 (TTL 만료된 Worker는 제외, 장치 번호 순)"""
+        keys = [key async for key in self._broker.scan_iter(match=f"{DEVICE_KEY_PREFIX}*")]
+        if not keys:
+            return []
+
+        devices = []
+        for value in await self._broker.mget(keys):
+            if value is None:
+                continue  # 조회 사이에 만료
+            try:
+                devices.append(json.loads(value))
+            except ValueError:
+                continue
+        return sorted(devices, key=lambda d: (d["device_index"], d["hostname"]))
+
+    async def _check_ollama_models(self) -> List[str]:
+        """Ollama에 로드된 모델 목록 (실패 시 빈 목록)"""
+        try:
+            return await ollama_service.list_loaded_models()
+        except Exception:
+            return []
+
+
+# 전역 인스턴스
+health_service = HealthService()
@@ -2,13 +2,16 @@
 Ollama LLM 서비스
 Ollama REST API를 사용한 요약 생성
 """
-from pathlib import Path
-from typing import Optional
+import hashlib
+from typing import List, Optional
 
 import httpx
 from loguru import logger
 
 from app.core.config import settings
+from app.core.metrics import OLLAMA_TOKENS_PER_SECOND
+from app.core.tracing import trace_span
+from app.services.summary_config_service import summary_config_store
 
 
 class OllamaService:
@@ -35,6 +38,43 @@ class OllamaService:
             logger.error(f"❌ Ollama 서버 연결 실패: {e}")
             return False
 
+    async def list_loaded_models(self) -> List[str]:
+        """
+        현재 메모리에 로드된 모델 목록 (/api/ps)
+
+        Returns:
+            모델 이름 목록
+
+        Raises:
+            httpx.HTTPError: 요청 실패 시
+        """
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get(f"{self.base_url}/api/ps")
+            response.raise_for_status()
+            return [model.get("name", "") for model in response.json().get("models", [])]
+
+    def summary_fingerprint(
+        self, transcript: str, prompt_template: str, dictionary_content: str
+    ) -> str:
+        """
+        요약 입력 지문 (모델 + 프롬프트 + 용어 사전 + 대화 전문)
+
+        지문이 같으면 요약 결과도 같은 입력으로 만든 것이므로 재요약을 생략할 수 있습니다.
+
+        Args:
+            transcript: 대화 전문
+            prompt_template: 프롬프트 템플릿
+            dictionary_content: 용어 사전 내용
+
+        Returns:
+            16진수 해시 문자열
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model, prompt_template, dictionary_content, transcript):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     async def summarize(
         self,
         transcript: str,
@@ -46,24 +86,19 @@ class OllamaService:
 
         Args:
             transcript: 대화 전문 (SRT 형식 또는 텍스트)
-            prompt_template: 프롬프트 템플릿 (None이면 기본값 사용)
-            dictionary_content: 용어 사전 내용
+            prompt_template: 프롬프트 템플릿 (None이면 현재 요약 설정 사용)
+            dictionary_content: 용어 사전 내용 (None이면 현재 요약 설정 사용)
 
         Returns:
             요약 텍스트
         """
-        # 기본 프롬프트 로드
-        if prompt_template is None:
-            prompt_file = settings.config_dir / "default_prompt.txt"
-            prompt_template = prompt_file.read_text(encoding="utf-8")
-
-        # 용어 사전 로드
-        if dictionary_content is None:
-            dict_file = settings.config_dir / "dictionary.txt"
-            if dict_file.exists():
-                dictionary_content = dict_file.read_text(encoding="utf-8")
-            else:
-                dictionary_content = ""
+        # 현재 프롬프트 / 용어 사전 (프로세스 내 캐시)
+        if prompt_template is None or dictionary_content is None:
+            config = summary_config_store.get()
+            if prompt_template is None:
+                prompt_template = config.prompt_template
+            if dictionary_content is None:
+                dictionary_content = config.dictionary_content
 
         # 용어 사전 섹션 생성
         if dictionary_content.strip():
@@ -82,25 +117,32 @@ class OllamaService:
 
         try:
             async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": full_prompt,
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.3,  # 낮은 온도로 일관된 요약 생성
-                            "top_p": 0.9,
-                            "num_predict": 512,  # 최대 토큰 수
+                with trace_span("llm_request"):
+                    response = await client.post(
+                        f"{self.base_url}/api/generate",
+                        json={
+                            "model": self.model,
+                            "prompt": full_prompt,
+                            "stream": False,
+                            "options": {
+                                "temperature": 0.3,  # 낮은 온도로 일관된 요약 생성
+                                "top_p": 0.9,
+                                "num_predict": 512,  # 최대 토큰 수
+                            },
                         },
-                    },
-                )
+                    )
 
                 response.raise_for_status()
                 result = response.json()
 
                 summary = result.get("response", "").strip()
 
+                # eval_duration은 나노초 단위
+                eval_count = result.get("eval_count") or 0
+                eval_duration = result.get("eval_duration") or 0
+                if eval_count and eval_duration:
+                    OLLAMA_TOKENS_PER_SECOND.observe(eval_count / (eval_duration / 1e9))
+
                 logger.info(f"✅ LLM 요약 완료: {len(summary)} 문자")
                 logger.debug(f"요약 내용: {summary[:100]}...")
 
@@ -0,0 +1,359 @@
+"""
+재요약 서비스
+저장된 SRT(output/*.srt)에서 대화 전문을 다시 만들어 STT 없이 요약만 새로 생성
+
+프롬프트/용어 사전 변경 후 기존 통화 요약을 갱신할 때 사용합니다. 요약 파일 옆의
+메타 파일({원본}_요약.json)에 입력 지문(모델 + 프롬프트 + 용어 사전 + 대화 전문)과 요약 설정 버전을
+기록해, 입력이 바뀌지 않은 파일은 LLM 호출 없이 건너뜁니다.
+"""
+import asyncio
+import json
+import os
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.metrics import RESUMMARIZED_FILES
+from app.db.search_index import search_index_repository
+from app.db.task_index import task_index_repository
+from app.services.ollama_service import ollama_service
+from app.services.summary_config_service import SummaryConfig, summary_config_store
+
+
+# 보관하는 작업 상태 수 (초과 시 오래된 종료 작업부터 삭제)
+MAX_JOBS = 100
+
+# 작업 상태에 남기는 파일별 에러 수
+MAX_JOB_ERRORS = 20
+
+# 진행 로그 간격 (처리 파일 수)
+PROGRESS_LOG_EVERY = 100
+
+
+def summary_path_for(srt_path: Path) -> Path:
+    """SRT 파일에 대응하는 요약 파일 경로 ({원본}_요약.txt)"""
+    return srt_path.with_name(f"{srt_path.stem}_요약.txt")
+
+
+def summary_meta_path(summary_path: Path) -> Path:
+    """요약 메타 파일 경로 ({원본}_요약.json)"""
+    return summary_path.with_suffix(".json")
+
+
+def read_summary_meta(summary_path: Path) -> dict:
+    """
+    요약 메타 파일 내용
+
+    Args:
+        summary_path: 요약 파일 경로
+
+    Returns:
+        {"fingerprint", "config_version", "model", "summarized_at"} (메타 파일이 없거나 읽을 수 없으면 빈 dict)
+    """
+    try:
+        return json.loads(summary_meta_path(summary_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_text_atomic(path: Path, content: str):
+    """
+    임시 파일에 쓴 뒤 교체 (다운로드 중인 파일이 중간 상태로 보이지 않도록)
+
+    Args:
+        path: 대상 파일 경로
+        content: 파일 내용
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        temp_path.write_text(content, encoding="utf-8")
+        os.replace(temp_path, path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_summary_meta(summary_path: Path, fingerprint: str, config_version: Optional[int] = None):
+    """
+    요약 메타 파일 저장
+
+    Args:
+        summary_path: 요약 파일 경로
+        fingerprint: 요약 입력 지문
+        config_version: 요약에 사용한 요약 설정(프롬프트/용어 사전) 버전
+    """
+    meta = {
+        "fingerprint": fingerprint,
+        "config_version": config_version,
+        "model": ollama_service.model,
+        "summarized_at": datetime.now().isoformat(),
+    }
+    write_text_atomic(summary_meta_path(summary_path), json.dumps(meta, ensure_ascii=False))
+
+
+class ResummarizeJob:
+    """재요약 작업 상태"""
+
+    def __init__(self, job_id: str, total: int, force: bool, concurrency: int):
+        """
+        초기화
+
+        Args:
+            job_id: 작업 ID
+            total: 대상 SRT 파일 수
+            force: 입력이 같아도 다시 요약할지 여부
+            concurrency: 동시 LLM 요청 수
+        """
+        self.job_id = job_id
+        self.total = total
+        self.force = force
+        self.concurrency = concurrency
+        self.status = "pending"
+        self.updated = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self.config_version: Optional[int] = None
+        self.created_at = datetime.now()
+        self.completed_at: Optional[datetime] = None
+
+    @property
+    def processed(self) -> int:
+        """처리한 파일 수"""
+        return self.updated + self.skipped + self.failed
+
+    @property
+    def progress(self) -> int:
+        """진행률 (0-100)"""
+        if self.total == 0:
+            return 100
+        return self.processed * 100 // self.total
+
+    @property
+    def is_finished(self) -> bool:
+        """종료 여부"""
+        return self.status in ("completed", "failed", "cancelled")
+
+    def to_dict(self) -> dict:
+        """응답용 dict"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "updated": self.updated,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "progress": self.progress,
+            "errors": list(self.errors),
+            "config_version": self.config_version,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+        }
+
+
+class ResummarizeService:
+    """저장된 SRT 기반 일괄 재요약 (API 프로세스 백그라운드 작업)"""
+
+    def __init__(self):
+        """초기화"""
+        self._jobs: "OrderedDict[str, ResummarizeJob]" = OrderedDict()
+        self._tasks: dict = {}
+
+    async def collect_targets(
+        self,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        task_ids: Optional[List[str]] = None,
+        batch_id: Optional[str] = None,
+    ) -> List[Path]:
+        """
+        재요약 대상 SRT 파일 목록
+
+        작업 ID/배치 ID가 있으면 작업 인덱스의 SRT 경로를, 없으면 output 디렉토리의
+        모든 SRT를 사용하며, 날짜 조건은 SRT 파일 수정 날짜로 거릅니다.
+
+        Args:
+            since: 시작 날짜 (포함)
+            until: 종료 날짜 (포함)
+            task_ids: 작업 ID 목록
+            batch_id: 배치 ID
+
+        Returns:
+            SRT 파일 경로 목록 (이름순)
+        """
+        if task_ids or batch_id:
+            ids = list(task_ids or [])
+            if batch_id:
+                ids.extend(await task_index_repository.get_batch_task_ids(batch_id))
+            records = await task_index_repository.get_tasks(list(dict.fromkeys(ids)))
+            candidates = [Path(record.srt_path) for record in records if record.srt_path]
+        else:
+            candidates = list(settings.output_dir.glob("*.srt"))
+
+        def matches(path: Path) -> bool:
+            try:
+                modified = datetime.fromtimestamp(path.stat().st_mtime).date()
+            except OSError:
+                return False
+            return (since is None or modified >= since) and (until is None or modified <= until)
+
+        targets = await asyncio.to_thread(lambda: [path for path in candidates if matches(path)])
+        return sorted(targets)
+
+    def start(
+        self, srt_paths: List[Path], force: bool = False, concurrency: Optional[int] = None
+    ) -> ResummarizeJob:
+        """
+        재요약 작업 시작 (백그라운드)
+
+        Args:
+            srt_paths: 대상 SRT 파일 목록
+            force: 입력이 같아도 다시 요약할지 여부
+            concurrency: 동시 LLM 요청 수 (None이면 RESUMMARIZE_CONCURRENCY)
+
+        Returns:
+            작업 상태
+        """
+        job = ResummarizeJob(
+            job_id=str(uuid.uuid4()),
+            total=len(srt_paths),
+            force=force,
+            concurrency=max(1, concurrency or settings.resummarize_concurrency),
+        )
+        self._register(job)
+        self._tasks[job.job_id] = asyncio.create_task(
+            self._run(job, srt_paths), name=f"resummarize-{job.job_id}"
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[ResummarizeJob]:
+        """
+        작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 상태 (없으면 None)
+        """
+        return self._jobs.get(job_id)
+
+    async def close(self):
+        """진행 중인 작업 취소 (lifespan 종료 시)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def _register(self, job: ResummarizeJob):
+        """작업 등록 (보관 수 초과 시 오래된 종료 작업 삭제)"""
+        self._jobs[job.job_id] = job
+        for job_id in [job_id for job_id, old in self._jobs.items() if old.is_finished]:
+            if len(self._jobs) <= MAX_JOBS:
+                break
+            del self._jobs[job_id]
+
+    async def _run(self, job: ResummarizeJob, srt_paths: List[Path]):
+        """
+        재요약 실행 (요약 설정은 작업 시작 시점 버전으로 고정)
+
+        Args:
+            job: 작업 상태
+            srt_paths: 대상 SRT 파일 목록
+        """
+        job.status = "in_progress"
+        logger.info(f"🔁 재요약 시작 [{job.job_id}]: {job.total}개 파일 (동시 요청 {job.concurrency})")
+
+        try:
+            config = await asyncio.to_thread(summary_config_store.get)
+            job.config_version = config.version
+            pending = iter(srt_paths)
+
+            # 동시 요청 수만큼의 처리 루프가 대상 목록을 나눠 가짐 (파일 수와 무관하게 코루틴 수 고정)
+            async def consume():
+                for srt_path in pending:
+                    try:
+                        result = await self._resummarize_file(srt_path, config, job.force)
+                    except Exception as e:
+                        result = "failed"
+                        logger.error(f"❌ 재요약 실패: {srt_path.name} - {e}")
+                        if len(job.errors) < MAX_JOB_ERRORS:
+                            job.errors.append(f"{srt_path.name}: {type(e).__name__}: {e}")
+
+                    setattr(job, result, getattr(job, result) + 1)
+                    RESUMMARIZED_FILES.labels(result=result).inc()
+                    if job.processed % PROGRESS_LOG_EVERY == 0:
+                        logger.info(f"🔁 재요약 진행 [{job.job_id}]: {job.processed}/{job.total}")
+
+            await asyncio.gather(*(consume() for _ in range(job.concurrency)))
+            job.status = "completed"
+            logger.info(
+                f"✅ 재요약 완료 [{job.job_id}]: 갱신 {job.updated}, 생략 {job.skipped}, 실패 {job.failed}"
+            )
+
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+
+        except Exception as e:
+            job.status = "failed"
+            job.errors.append(f"{type(e).__name__}: {e}")
+            logger.error(f"❌ 재요약 작업 실패 [{job.job_id}]: {e}")
+
+        finally:
+            job.completed_at = datetime.now()
+            self._tasks.pop(job.job_id, None)
+
+    async def _resummarize_file(self, srt_path: Path, config: SummaryConfig, force: bool) -> str:
+        """
+        파일 하나 재요약
+
+        Args:
+            srt_path: SRT 파일 경로
+            config: 요약 설정 (프롬프트 템플릿 + 용어 사전)
+            force: 입력이 같아도 다시 요약할지 여부
+
+        Returns:
+            처리 결과 (updated, skipped)
+        """
+        from app.utils.segments import extract_text_from_srt
+
+        srt_content = await asyncio.to_thread(srt_path.read_text, encoding="utf-8")
+        transcript = extract_text_from_srt(srt_content)
+
+        # 인식된 텍스트가 없는 파일은 LLM 요약 대상 아님
+        if not transcript:
+            return "skipped"
+
+        summary_path = summary_path_for(srt_path)
+        fingerprint = ollama_service.summary_fingerprint(
+            transcript, config.prompt_template, config.dictionary_content
+        )
+        if (
+            not force
+            and summary_path.exists()
+            and read_summary_meta(summary_path).get("fingerprint") == fingerprint
+        ):
+            return "skipped"
+
+        summary = await ollama_service.summarize(
+            transcript, config.prompt_template, config.dictionary_content
+        )
+
+        await asyncio.to_thread(write_text_atomic, summary_path, summary)
+        await asyncio.to_thread(write_summary_meta, summary_path, fingerprint, config.version)
+
+        if settings.search_index_enabled:
+            await search_index_repository.replace_summary(srt_path.stem, None, summary)
+        return "updated"
+
+
+# 전역 인스턴스
+resummarize_service = ResummarizeService()
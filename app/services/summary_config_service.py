@@ -0,0 +1,369 @@
+"""
+요약 설정 저장소
+프롬프트 템플릿/용어 사전을 버전별 스냅샷으로 저장하고 프로세스마다 메모리에 캐시하며,
+변경 시 Redis pub/sub으로 모든 API/Worker 프로세스에 알려 변경된 경우에만 다시 로드
+
+- 스냅샷: config/versions/{버전}.json (프롬프트 + 용어 사전 한 쌍, 한 번 만들면 바뀌지 않음)
+  임시 파일을 다 쓴 뒤 하드 링크로 만들므로 읽는 쪽은 잠금 없이도 중간 상태를 보지 않음
+- 쓰기(새 버전 생성 + 설정 파일 교체)는 프로세스 간 파일 잠금으로 직렬화
+  (fcntl이 없는 Windows는 같은 버전을 동시에 만들면 한쪽만 성공하고 나머지가 재시도)
+- config/default_prompt.txt, config/dictionary.txt는 최신 내용으로 함께 교체하며,
+  직접 수정해 최신 스냅샷보다 새로워진 파일은 다음 로드 시 새 버전으로 등록
+- 변경 알림을 놓쳐도(Redis 장애) SUMMARY_CONFIG_CHECK_SEC마다 최신 버전 확인
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+import redis
+from loguru import logger
+
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# 변경 알림 채널
+SUMMARY_CONFIG_CHANNEL = "voicecom:summary-config"
+
+# 현재 설정 파일 (사람이 보고 고치는 사본)
+PROMPT_FILENAME = "default_prompt.txt"
+DICTIONARY_FILENAME = "dictionary.txt"
+
+# 버전 스냅샷 디렉토리 (config/ 하위) 및 쓰기 잠금 파일
+VERSIONS_DIRNAME = "versions"
+LOCK_FILENAME = ".lock"
+
+# 버전 충돌 시 재시도 횟수
+MAX_WRITE_ATTEMPTS = 5
+
+# 알림 구독 연결 재시도 간격 (초)
+LISTENER_RETRY_SEC = 5.0
+
+
+class SummaryConfig:
+    """요약 설정 스냅샷 (한 버전의 프롬프트 템플릿 + 용어 사전)"""
+
+    def __init__(
+        self,
+        version: int,
+        prompt_template: str,
+        dictionary_content: str,
+        updated_at: datetime,
+        changed: str,
+    ):
+        """
+        초기화
+
+        Args:
+            version: 설정 버전 (1부터 증가)
+            prompt_template: 프롬프트 템플릿
+            dictionary_content: 용어 사전 내용
+            updated_at: 버전 생성 시간
+            changed: 변경 항목 (prompt, dictionary, file - 설정 파일 직접 수정)
+        """
+        self.version = version
+        self.prompt_template = prompt_template
+        self.dictionary_content = dictionary_content
+        self.updated_at = updated_at
+        self.changed = changed
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SummaryConfig":
+        """스냅샷 파일 내용에서 생성"""
+        return cls(
+            version=int(data["version"]),
+            prompt_template=data["prompt_template"],
+            dictionary_content=data["dictionary_content"],
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            changed=data.get("changed", ""),
+        )
+
+    def to_dict(self) -> dict:
+        """스냅샷 파일 내용"""
+        return {
+            "version": self.version,
+            "prompt_template": self.prompt_template,
+            "dictionary_content": self.dictionary_content,
+            "updated_at": self.updated_at.isoformat(),
+            "changed": self.changed,
+        }
+
+
+class SummaryConfigStore:
+    """버전별 요약 설정 저장소 (프로세스별 캐시 + 변경 알림)"""
+
+    def __init__(self):
+        """초기화"""
+        self._config: Optional[SummaryConfig] = None
+        self._checked_at = 0.0
+        self._stale = threading.Event()
+        self._lock = threading.Lock()
+        self._client: Optional[redis.Redis] = None
+        self._listener_pid: Optional[int] = None
+
+    @property
+    def versions_dir(self) -> Path:
+        """버전 스냅샷 디렉토리"""
+        return settings.config_dir / VERSIONS_DIRNAME
+
+    def get(self) -> SummaryConfig:
+        """
+        현재 요약 설정 (변경 알림을 받았거나 확인 주기가 지났을 때만 다시 로드)
+
+        Returns:
+            최신 설정 스냅샷
+
+        Raises:
+            FileNotFoundError: 스냅샷과 프롬프트 파일이 모두 없는 경우
+        """
+        self._ensure_listener()
+
+        with self._lock:
+            if (
+                self._config is None
+                or self._stale.is_set()
+                or time.monotonic() - self._checked_at >= settings.summary_config_check_sec
+            ):
+                self._stale.clear()
+                config = self._load_latest()
+                if self._config is not None and config.version != self._config.version:
+                    logger.info(f"📝 요약 설정 다시 로드: v{self._config.version} → v{config.version}")
+                self._config = config
+                self._checked_at = time.monotonic()
+            return self._config
+
+    def update(
+        self, prompt_template: Optional[str] = None, dictionary_content: Optional[str] = None
+    ) -> SummaryConfig:
+        """
+        설정 변경 (새 버전 스냅샷 저장 → 설정 파일 교체 → 변경 알림)
+
+        Args:
+            prompt_template: 새 프롬프트 템플릿 (None이면 유지)
+            dictionary_content: 새 용어 사전 내용 (None이면 유지)
+
+        Returns:
+            새 설정 스냅샷
+
+        Raises:
+            RuntimeError: 버전 충돌이 계속되는 경우
+        """
+        changed = "prompt" if prompt_template is not None else "dictionary"
+
+        with self._lock, self._writer_lock():
+            for _ in range(MAX_WRITE_ATTEMPTS):
+                current = self._load_latest_locked()
+                config = SummaryConfig(
+                    version=current.version + 1,
+                    prompt_template=(
+                        current.prompt_template if prompt_template is None else prompt_template
+                    ),
+                    dictionary_content=(
+                        current.dictionary_content if dictionary_content is None else dictionary_content
+                    ),
+                    updated_at=datetime.now(),
+                    changed=changed,
+                )
+                if self._write_snapshot(config):
+                    break
+            else:
+                raise RuntimeError("요약 설정 버전 충돌이 계속되어 저장하지 못했습니다.")
+
+            # 잠금이 없는 환경에서 그사이 더 새 버전이 생겼으면 설정 파일은 그쪽에 맡김
+            if self._latest_snapshot_path() == self._snapshot_path(config.version):
+                self._write_file(settings.config_dir / PROMPT_FILENAME, config.prompt_template)
+                self._write_file(settings.config_dir / DICTIONARY_FILENAME, config.dictionary_content)
+
+            self._config = config
+            self._checked_at = time.monotonic()
+
+        logger.info(f"📝 요약 설정 변경: v{config.version} ({changed})")
+        self._publish(config.version)
+        return config
+
+    def _snapshot_path(self, version: int) -> Path:
+        """버전 스냅샷 경로 (이름순 정렬 = 버전순)"""
+        return self.versions_dir / f"{version:06d}.json"
+
+    def _latest_snapshot_path(self) -> Optional[Path]:
+        """최신 버전 스냅샷 경로 (없으면 None)"""
+        return max(self.versions_dir.glob("[0-9]*.json"), default=None)
+
+    @contextmanager
+    def _writer_lock(self):
+        """프로세스 간 쓰기 잠금 (fcntl이 없으면 잠금 없이 버전 충돌 재시도에 맡김)"""
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.versions_dir / LOCK_FILENAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_latest(self) -> Tuple[Optional[SummaryConfig], Optional[Path]]:
+        """최신 스냅샷과 경로 (없으면 None, None)"""
+        path = self._latest_snapshot_path()
+        if path is None:
+            return None, None
+        return SummaryConfig.from_dict(json.loads(path.read_text(encoding="utf-8"))), path
+
+    def _load_latest(self) -> SummaryConfig:
+        """최신 스냅샷 로드 (스냅샷이 없거나 설정 파일이 직접 수정됐으면 잠금 후 새 버전으로 등록)"""
+        config, path = self._read_latest()
+        if self._read_edited_files(config, path) is None:
+            return config
+
+        # 다른 프로세스가 설정 파일을 교체하는 중일 수 있으므로 잠금을 잡고 다시 확인
+        with self._writer_lock():
+            return self._load_latest_locked()
+
+    def _load_latest_locked(self) -> SummaryConfig:
+        """최신 스냅샷 로드 (쓰기 잠금 상태, 직접 수정된 설정 파일은 새 버전으로 등록)"""
+        for _ in range(MAX_WRITE_ATTEMPTS):
+            config, path = self._read_latest()
+            edited = self._read_edited_files(config, path)
+            if edited is None:
+                return config
+
+            candidate = SummaryConfig(
+                version=(config.version if config is not None else 0) + 1,
+                prompt_template=edited[0],
+                dictionary_content=edited[1],
+                updated_at=datetime.now(),
+                changed="file",
+            )
+            if self._write_snapshot(candidate):
+                logger.info(f"📝 설정 파일 내용을 요약 설정 v{candidate.version}로 등록")
+                return candidate
+
+        raise RuntimeError("요약 설정 버전 충돌이 계속되어 로드하지 못했습니다.")
+
+    def _read_edited_files(
+        self, config: Optional[SummaryConfig], snapshot_path: Optional[Path]
+    ) -> Optional[Tuple[str, str]]:
+        """
+        스냅샷과 다른 설정 파일 내용 (직접 수정 감지)
+
+        Args:
+            config: 최신 스냅샷 (없으면 None)
+            snapshot_path: 최신 스냅샷 경로
+
+        Returns:
+            (프롬프트 템플릿, 용어 사전 내용) - 스냅샷보다 새롭고 내용이 다를 때만, 아니면 None
+
+        Raises:
+            FileNotFoundError: 스냅샷이 없는데 프롬프트 파일도 없는 경우
+        """
+        prompt_file = settings.config_dir / PROMPT_FILENAME
+        dict_file = settings.config_dir / DICTIONARY_FILENAME
+
+        if config is not None:
+            # 설정 파일은 스냅샷 뒤에 쓰이므로 수정 시간이 같거나 이르면 직접 수정 아님
+            snapshot_mtime = snapshot_path.stat().st_mtime_ns
+            file_mtimes = [path.stat().st_mtime_ns for path in (prompt_file, dict_file) if path.exists()]
+            if max(file_mtimes, default=0) <= snapshot_mtime or not prompt_file.exists():
+                return None
+
+        prompt_template = prompt_file.read_text(encoding="utf-8")
+        dictionary_content = dict_file.read_text(encoding="utf-8") if dict_file.exists() else ""
+
+        if config is not None and (prompt_template, dictionary_content) == (
+            config.prompt_template,
+            config.dictionary_content,
+        ):
+            return None
+        return prompt_template, dictionary_content
+
+    def _write_snapshot(self, config: SummaryConfig) -> bool:
+        """
+        버전 스냅샷 생성 (이미 같은 버전이 있으면 실패)
+
+        Returns:
+            생성 여부 (False면 다른 프로세스가 먼저 같은 버전을 만듦)
+        """
+        temp_path = self.versions_dir / f".{uuid.uuid4().hex}.tmp"
+
+        try:
+            temp_path.write_text(json.dumps(config.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+            # 하드 링크는 대상이 있으면 실패하므로 버전 번호 선점과 완성된 내용 공개가 한 번에 이뤄짐
+            os.link(temp_path, self._snapshot_path(config.version))
+        except FileExistsError:
+            return False
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return True
+
+    @staticmethod
+    def _write_file(path: Path, content: str):
+        """설정 파일 교체 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_text(content, encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _publish(self, version: int):
+        """변경 알림 발행 (실패 시 다른 프로세스는 확인 주기에 반영)"""
+        try:
+            if self._client is None:
+                self._client = redis.Redis.from_url(
+                    settings.get_redis_url(), socket_timeout=1.0, socket_connect_timeout=1.0
+                )
+            self._client.publish(SUMMARY_CONFIG_CHANNEL, json.dumps({"version": version}))
+        except Exception as e:
+            logger.warning(f"⚠️ 요약 설정 변경 알림 실패 (v{version}): {e}")
+
+    def _ensure_listener(self):
+        """이 프로세스의 변경 알림 구독 스레드 시작 (fork된 자식 프로세스는 새로 시작)"""
+        if self._listener_pid == os.getpid():
+            return
+
+        self._listener_pid = os.getpid()
+        self._client = None
+        self._stale.set()
+        threading.Thread(target=self._listen, name="summary-config-listener", daemon=True).start()
+
+    def _listen(self):
+        """변경 알림 구독 (연결이 끊기면 재연결 후 놓친 변경이 있을 수 있으므로 다시 로드)"""
+        client = redis.Redis.from_url(
+            settings.get_redis_url(), socket_connect_timeout=1.0, health_check_interval=30
+        )
+        failures = 0
+
+        while True:
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(SUMMARY_CONFIG_CHANNEL)
+                self._stale.set()
+                failures = 0
+
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._stale.set()
+
+            except Exception as e:
+                if failures == 0:
+                    logger.warning(f"⚠️ 요약 설정 변경 알림 구독 실패 (재시도 중): {e}")
+                failures += 1
+
+            time.sleep(LISTENER_RETRY_SEC)
+
+
+# 전역 인스턴스
+summary_config_store = SummaryConfigStore()
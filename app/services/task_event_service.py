@@ -0,0 +1,151 @@
+"""
+작업 진행 이벤트 서비스
+Redis pub/sub으로 Worker의 단계 전환/진행률/완료 이벤트를 API 구독자에게 전달
+"""
+import asyncio
+import json
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Optional
+
+import redis
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import settings
+
+
+# 작업별 채널 접두어 (채널명: voicecom:task-events:{task_id})
+TASK_EVENT_CHANNEL_PREFIX = "voicecom:task-events:"
+
+# 작업 종료 이벤트 (수신 시 해당 작업 구독 종료)
+# 2단계 처리의 미리보기 완료(preview_completed)는 최종 처리가 남아 있으므로 종료 이벤트가 아님
+TERMINAL_EVENTS = {"completed", "failed", "refine_failed"}
+
+
+def task_event_channel(task_id: str) -> str:
+    """작업 이벤트 채널명"""
+    return f"{TASK_EVENT_CHANNEL_PREFIX}{task_id}"
+
+
+class TaskEventService:
+    """작업 진행 이벤트 발행/구독"""
+
+    def __init__(self):
+        """초기화"""
+        self._sync_client: Optional[redis.Redis] = None
+        self._async_client: Optional[aioredis.Redis] = None
+
+    def _get_sync_client(self) -> redis.Redis:
+        """동기 Redis 클라이언트 (Worker용)"""
+        if self._sync_client is None:
+            self._sync_client = redis.Redis.from_url(
+                settings.get_redis_url(), socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        return self._sync_client
+
+    def _get_async_client(self) -> aioredis.Redis:
+        """비동기 Redis 클라이언트 (API용, 연결 풀 공유)"""
+        if self._async_client is None:
+            self._async_client = aioredis.Redis.from_url(settings.get_redis_url())
+        return self._async_client
+
+    def publish(self, task_id: str, event: str, **data):
+        """
+        작업 이벤트 발행 (Worker, 동기)
+
+        이벤트 전달 실패가 작업 처리를 중단시키지 않도록 예외는 로그만 남깁니다.
+
+        Args:
+            task_id: 작업 ID
+            event: 이벤트 종류 (started, stage, preview_completed, completed, failed, refine_failed)
+            **data: 이벤트 데이터 (status, progress, stage 등)
+        """
+        payload = {
+            "task_id": task_id,
+            "event": event,
+            "timestamp": datetime.now().isoformat(),
+            **data,
+        }
+
+        try:
+            self._get_sync_client().publish(
+                task_event_channel(task_id),
+                json.dumps(payload, ensure_ascii=False, default=str),
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 작업 이벤트 발행 실패 [{task_id}]: {e}")
+
+    async def subscribe(
+        self,
+        task_ids: Iterable[str],
+        keepalive_sec: float,
+        snapshot: Optional[Callable[[], Awaitable[List[dict]]]] = None,
+    ) -> AsyncIterator[Optional[dict]]:
+        """
+        여러 작업의 이벤트 구독 (API, 비동기)
+
+        하나의 pub/sub 연결로 모든 작업 채널을 구독하며,
+        모든 작업이 종료 이벤트를 받으면 끝납니다.
+
+        Args:
+            task_ids: 구독할 작업 ID 목록
+            keepalive_sec: 이벤트가 없을 때 None을 내보내는 주기 (초)
+            snapshot: 구독 직후 호출되는 현재 상태 조회 함수
+                      (구독 전에 이미 끝난 작업을 놓치지 않기 위함)
+
+        Yields:
+            이벤트 dict (keepalive 주기마다 None)
+        """
+        remaining = set(task_ids)
+        pubsub = self._get_async_client().pubsub()
+
+        try:
+            await pubsub.subscribe(*(task_event_channel(task_id) for task_id in remaining))
+
+            if snapshot is not None:
+                for event in await snapshot():
+                    yield event
+                    if event.get("event") in TERMINAL_EVENTS:
+                        remaining.discard(event.get("task_id"))
+                        await pubsub.unsubscribe(task_event_channel(event.get("task_id")))
+
+            loop = asyncio.get_running_loop()
+            last_yield = loop.time()
+
+            while remaining:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=keepalive_sec
+                )
+
+                # 구독 확인 메시지도 None으로 반환되므로 keepalive 주기를 직접 관리
+                if message is None:
+                    if loop.time() - last_yield >= keepalive_sec:
+                        last_yield = loop.time()
+                        yield None
+                    continue
+
+                last_yield = loop.time()
+
+                try:
+                    event = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+
+                yield event
+
+                if event.get("event") in TERMINAL_EVENTS:
+                    remaining.discard(event.get("task_id"))
+                    await pubsub.unsubscribe(task_event_channel(event.get("task_id")))
+
+        finally:
+            await pubsub.aclose()
+
+    async def close(self):
+        """비동기 클라이언트 정리 (API 종료 시)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+
+# 전역 인스턴스
+task_event_service = TaskEventService()
@@ -1,15 +1,51 @@
 """
 Whisper STT 서비스
-faster-whisper를 사용한 음성 인식
+faster-whisper를 사용한 음성 인식 (디코딩 정책의 품질 단계에 따라 beam/모델/배치 추론 선택)
 """
+import time
 from pathlib import Path
-from typing import List, Tuple
-from datetime import timedelta
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+import numpy as np
 
-from faster_whisper import WhisperModel
 from loguru import logger
 
 from app.core.config import settings
+from app.core.metrics import (
+    MODEL_LOAD_DURATION,
+    MODEL_LOADS,
+    MODEL_UNLOAD_DURATION,
+    MODEL_UNLOADS,
+    MODEL_WARMUP_DURATION,
+)
+from app.core.tracing import trace_span
+from app.services.decoding_policy import (
+    DECODING_TIERS,
+    MODEL_MAIN,
+    MODEL_PREVIEW,
+    TIER_FULL,
+    DecodingTier,
+)
+from app.utils.audio_utils import warmup_waveform
+from app.utils.segments import SegmentList
+
+
+# 워밍업 합성 오디오 길이 (초)
+WARMUP_AUDIO_SEC = 3.0
+
+# VAD 설정 (순차 추론)
+VAD_PARAMETERS = {
+    "threshold": 0.5,
+    "min_speech_duration_ms": 250,
+    "max_speech_duration_s": float("inf"),
+    "min_silence_duration_ms": 2000,
+    "speech_pad_ms": 400,
+}
+
+# 배치 추론은 발화 구간을 30초 단위로 묶으므로 최대 발화 길이는 파이프라인 기본값 사용
+BATCHED_VAD_PARAMETERS = {
+    key: value for key, value in VAD_PARAMETERS.items() if key != "max_speech_duration_s"
+}
 
 
 class WhisperService:
@@ -19,82 +55,188 @@ class WhisperService:
         """초기화"""
         self.model = None
         self._model_loaded = False
+        self._extra_models: Dict[str, object] = {}
+        self._batched_pipelines: Dict[str, object] = {}
 
     def load_model(self):
         """모델 로드"""
         if self._model_loaded:
             return
 
+        from faster_whisper import WhisperModel
+
         logger.info(f"🔄 Whisper 모델 로드 중: {settings.whisper_model}")
+        started = time.perf_counter()
 
         try:
-            self.model = WhisperModel(
-                settings.whisper_model,
-                device=settings.whisper_device,
-                compute_type=settings.whisper_compute_type,
-            )
+            with trace_span("load"):
+                self.model = WhisperModel(
+                    settings.whisper_model,
+                    device=settings.whisper_device,
+                    compute_type=settings.whisper_compute_type,
+                )
             self._model_loaded = True
-            logger.info("✅ Whisper 모델 로드 완료")
+
+            elapsed = time.perf_counter() - started
+            MODEL_LOADS.labels(model="whisper").inc()
+            MODEL_LOAD_DURATION.labels(model="whisper").observe(elapsed)
+            logger.info(f"✅ Whisper 모델 로드 완료 ({elapsed:.1f}초)")
 
         except Exception as e:
             logger.error(f"❌ Whisper 모델 로드 실패: {e}")
             raise
 
-    def unload_model(self):
-        """모델 언로드 (GPU 메모리 해제)"""
-        if self.model is not None:
-            del self.model
-            self.model = None
-            self._model_loaded = False
+    def _extra_model_config(self, key: str) -> Tuple[str, str]:
+        """보조 모델 키 → (모델 이름, compute type)"""
+        if key == MODEL_PREVIEW:
+            return settings.preview_whisper_model, settings.preview_compute_type
+        return settings.whisper_fallback_model, settings.whisper_compute_type
 
-            # GPU 메모리 정리
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+    def load_extra_model(self, key: str):
+        """
+        보조 모델 로드 (fast 단계 / 2단계 처리 미리보기에서 처음 사용할 때)
 
-            logger.info("✅ Whisper 모델 언로드 완료")
+        Args:
+            key: 모델 키 (MODEL_FALLBACK, MODEL_PREVIEW)
+        """
+        if key in self._extra_models:
+            return
+
+        from faster_whisper import WhisperModel
+
+        model_name, compute_type = self._extra_model_config(key)
+        logger.info(f"🔄 Whisper 보조 모델 로드 중 ({key}): {model_name} ({compute_type})")
+        started = time.perf_counter()
 
-    def transcribe(self, audio_path: Path, language: str = "ko") -> List[Tuple[str, str, str]]:
+        with trace_span("load"):
+            self._extra_models[key] = WhisperModel(
+                model_name,
+                device=settings.whisper_device,
+                compute_type=compute_type,
+            )
+
+        elapsed = time.perf_counter() - started
+        MODEL_LOADS.labels(model=f"whisper_{key}").inc()
+        MODEL_LOAD_DURATION.labels(model=f"whisper_{key}").observe(elapsed)
+        logger.info(f"✅ Whisper 보조 모델 로드 완료 ({key}, {elapsed:.1f}초)")
+
+    def _select_model(self, tier: DecodingTier):
         """
-        음성 파일을 텍스트로 변환
+        품질 단계에 맞는 모델 (필요 시 로드)
 
-        Args:
-            audio_path: 음성 파일 경로
-            language: 언어 코드 (기본값: ko)
+        Returns:
+            (모델 키, WhisperModel)
+        """
+        if tier.model != MODEL_MAIN and self._extra_model_config(tier.model)[0]:
+            self.load_extra_model(tier.model)
+            return tier.model, self._extra_models[tier.model]
+
+        if not self._model_loaded:
+            self.load_model()
+        return MODEL_MAIN, self.model
+
+    def warmup(self) -> float:
+        """
+        합성 오디오로 한 번 추론 (CUDA/CTranslate2 커널 준비, 실제 작업과 같은 beam_size)
 
         Returns:
-            [(시작시간, 종료시간, 텍스트), ...]
+            워밍업 소요 시간 (초)
         """
         if not self._model_loaded:
             self.load_model()
 
-        logger.info(f"🎤 STT 시작: {audio_path.name}")
+        started = time.perf_counter()
+        segments, _ = self.model.transcribe(
+            warmup_waveform(WARMUP_AUDIO_SEC),
+            language="ko",
+            beam_size=5,
+            vad_filter=False,  # 합성 신호가 VAD에서 걸러지지 않도록
+        )
+        for _ in segments:
+            pass
+
+        elapsed = time.perf_counter() - started
+        MODEL_WARMUP_DURATION.labels(model="whisper").observe(elapsed)
+        logger.info(f"🔥 Whisper 워밍업 완료 ({elapsed:.1f}초)")
+        return elapsed
 
-        try:
-            segments, info = self.model.transcribe(
-                str(audio_path),
-                language=language,
-                beam_size=5,
-                vad_filter=True,  # VAD (Voice Activity Detection) 필터
-                vad_parameters={
-                    "threshold": 0.5,
-                    "min_speech_duration_ms": 250,
-                    "max_speech_duration_s": float("inf"),
-                    "min_silence_duration_ms": 2000,
-                    "speech_pad_ms": 400,
-                },
-            )
+    def unload_model(self):
+        """모델 언로드 (GPU 메모리 해제, 보조 모델 포함)"""
+        if self.model is not None or self._extra_models:
+            started = time.perf_counter()
+            with trace_span("unload"):
+                self._batched_pipelines.clear()
+                self.model = None
+                self._extra_models.clear()
+                self._model_loaded = False
+
+                # GPU 메모리 정리
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+
+            MODEL_UNLOADS.labels(model="whisper").inc()
+            MODEL_UNLOAD_DURATION.labels(model="whisper").observe(time.perf_counter() - started)
+            logger.info("✅ Whisper 모델 언로드 완료")
 
-            results = []
-            for segment in segments:
-                start_time = self._format_timestamp(segment.start)
-                end_time = self._format_timestamp(segment.end)
-                text = segment.text.strip()
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str = "ko",
+        audio: Optional[Union[np.ndarray, BinaryIO]] = None,
+        tier: Optional[DecodingTier] = None,
+    ) -> SegmentList:
+        """
+        음성 파일을 텍스트로 변환
+
+        Args:
+            audio_path: 음성 파일 경로
+            language: 언어 코드 (기본값: ko)
+            audio: 이미 디코딩된 16kHz mono float32 샘플 (예: read_stereo_channels()의 채널 뷰)
+                또는 메모리 오디오 파일. 지정하면 audio_path 대신 이 입력을 사용합니다.
+            tier: 디코딩 품질 단계 (None이면 full: beam 5, 기본 모델, 순차 추론)
 
-                results.append((start_time, end_time, text))
+        Returns:
+            세그먼트 목록 (시작/종료 초 + 텍스트, 타임스탬프 문자열 변환은 출력 시점에 수행)
+        """
+        tier = tier or DECODING_TIERS[TIER_FULL]
+        model_key, model = self._select_model(tier)
 
-                logger.debug(f"[{start_time} -> {end_time}] {text}")
+        logger.info(f"🎤 STT 시작: {audio_path.name} ({tier.name}, beam {tier.beam_size})")
 
+        try:
+            # transcribe() 호출 시 디코딩 + VAD가 즉시 수행되고, 추론은 세그먼트 순회 시 진행됨
+            with trace_span("decode"):
+                if tier.batch_size > 1:
+                    segments, info = self._batched_pipeline(model_key, model).transcribe(
+                        str(audio_path) if audio is None else audio,
+                        language=language,
+                        beam_size=tier.beam_size,
+                        batch_size=tier.batch_size,
+                        vad_filter=True,
+                        vad_parameters=BATCHED_VAD_PARAMETERS,
+                    )
+                else:
+                    segments, info = model.transcribe(
+                        str(audio_path) if audio is None else audio,
+                        language=language,
+                        beam_size=tier.beam_size,
+                        vad_filter=True,  # VAD (Voice Activity Detection) 필터
+                        vad_parameters=VAD_PARAMETERS,
+                    )
+
+            starts, ends, texts = [], [], []
+            with trace_span("inference"):
+                for segment in segments:
+                    text = segment.text.strip()
+
+                    starts.append(segment.start)
+                    ends.append(segment.end)
+                    texts.append(text)
+
+                    logger.debug(f"[{segment.start:.2f} -> {segment.end:.2f}] {text}")
+
+            results = SegmentList(starts, ends, texts)
             logger.info(f"✅ STT 완료: {len(results)}개 세그먼트")
             return results
 
@@ -102,6 +244,16 @@ class WhisperService:
             logger.error(f"❌ STT 실패: {e}")
             raise
 
+    def _batched_pipeline(self, model_key: str, model):
+        """모델별 배치 추론 파이프라인 (모델 가중치 공유, 처음 사용할 때 생성)"""
+        pipeline = self._batched_pipelines.get(model_key)
+        if pipeline is None:
+            from faster_whisper import BatchedInferencePipeline
+
+            pipeline = BatchedInferencePipeline(model=model)
+            self._batched_pipelines[model_key] = pipeline
+        return pipeline
+
     def transcribe_to_srt(self, audio_path: Path, language: str = "ko") -> str:
         """
         음성 파일을 SRT 형식으로 변환
@@ -115,32 +267,8 @@ class WhisperService:
         """
         segments = self.transcribe(audio_path, language)
 
-        srt_content = []
-        for idx, (start_time, end_time, text) in enumerate(segments, start=1):
-            srt_content.append(f"{idx}")
-            srt_content.append(f"{start_time} --> {end_time}")
-            srt_content.append(text)
-            srt_content.append("")  # 빈 줄
-
-        return "\n".join(srt_content)
-
-    @staticmethod
-    def _format_timestamp(seconds: float) -> str:
-        """
-        초를 SRT 타임스탬프 형식으로 변환
-
-        Args:
-            seconds: 초 단위 시간
-
-        Returns:
-            SRT 타임스탬프 (HH:MM:SS,mmm)
-        """
-        td = timedelta(seconds=seconds)
-        hours, remainder = divmod(td.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        milliseconds = int(td.microseconds / 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+        with trace_span("srt_build"):
+            return segments.to_srt()
 
 
 # 전역 인스턴스
@@ -2,73 +2,378 @@
 오디오 파일 처리 Celery 태스크
 """
 import shutil
+import time
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import List, Tuple
+from typing import Optional, Tuple
 
+import numpy as np
+from celery.signals import worker_process_shutdown
 from loguru import logger
 
 from app.tasks.celery_app import celery_app
+from app.tasks.task_pipeline import task_pipeline
+from app.tasks.worker_lifecycle import model_residency
 from app.core.config import settings
+from app.core.metrics import (
+    DECODING_TIER_TASKS,
+    NO_SPEECH_FILES,
+    REAL_TIME_FACTOR,
+    SILENCE_TRIMMED_SECONDS,
+    STAGE_DURATION,
+    TASKS_TOTAL,
+)
+from app.core.profiling import profile_task
+from app.core.tracing import TaskTrace, task_trace, trace_span
+from app.db.search_index import build_entries as build_search_entries
+from app.db.search_index import replace_entries as replace_search_entries
+from app.db.task_index import task_index_writer
+from app.services.decoding_policy import (
+    PASS_FINAL,
+    PASS_PREVIEW,
+    PREVIEW_TIER,
+    TIER_FULL,
+    DecodingTier,
+    decoding_policy,
+)
+from app.services.resummarize_service import summary_meta_path, write_summary_meta, write_text_atomic
+from app.services.summary_config_service import summary_config_store
+from app.services.task_event_service import task_event_service
+from app.utils.audio_utils import WHISPER_SAMPLE_RATE, TrimmedAudio, is_mono_like, trim_silence
+from app.utils.segments import SegmentList
+
+
+# 진행 이벤트로 함께 내보내는 작업 인덱스 필드
+EVENT_FIELDS = ("filename", "status", "progress", "audio_duration", "error_message", "result_pass")
+
+# 2단계 처리 최종 작업의 Celery 작업 ID 접미사 (작업 ID는 미리보기와 같음)
+REFINE_TASK_SUFFIX = ":refine"
+
+# 음성이 없는 파일의 요약 내용 (LLM 호출 생략)
+NO_SPEECH_SUMMARY = "음성이 감지되지 않았습니다."
+
+
+@worker_process_shutdown.connect
+def flush_task_index(**kwargs):
+    """Worker 프로세스 종료 전 대기 중인 작업 인덱스 기록 완료"""
+    task_index_writer.flush()
+
+
+def report_task_event(task_id: str, event: str, stage: str = None, keep_status: bool = False, **fields):
+    """
+    작업 상태 보고 (작업 인덱스 갱신 + 진행 이벤트 발행)
+
+    Args:
+        task_id: 작업 ID
+        event: 이벤트 종류 (started, stage, preview_completed, completed, failed, refine_failed)
+        stage: 현재 처리 단계
+        keep_status: 상태/진행률은 바꾸지 않음 (2단계 처리 최종 작업: 미리보기 결과를 계속 제공)
+        **fields: 작업 인덱스 컬럼 값
+    """
+    if keep_status:
+        fields.pop("status", None)
+        fields.pop("progress", None)
+
+    task_index_writer.update(task_id, **fields)
+
+    event_data = {key: fields[key] for key in EVENT_FIELDS if key in fields}
+    if stage is not None:
+        event_data["stage"] = stage
+    task_event_service.publish(task_id, event, **event_data)
+
+
+@contextmanager
+def timed_stage(stage_timings: dict, stage: str):
+    """
+    처리 단계 소요 시간 측정 (작업 인덱스용 dict + 단계별 히스토그램 + 트레이스 구간)
+
+    Args:
+        stage_timings: {단계: 초} 기록 대상
+        stage: 단계 이름
+    """
+    start = time.perf_counter()
+    try:
+        with trace_span(stage):
+            yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stage_timings[stage] = round(elapsed, 3)
+        STAGE_DURATION.labels(stage=stage).observe(elapsed)
 
 
 @celery_app.task(bind=True, name="process_audio_file")
-def process_audio_file(self, file_path: str, task_id: str):
+def process_audio_file(
+    self,
+    file_path: str,
+    task_id: str,
+    decoding_tier: Optional[str] = None,
+    result_pass: Optional[str] = None,
+    content_hash: Optional[str] = None,
+):
     """
     오디오 파일 처리 메인 태스크
 
     Args:
         file_path: 오디오 파일 경로
         task_id: 작업 ID
+        decoding_tier: STT 품질 단계 지정 (재처리 시, None이면 부하에 따라 선택)
+        result_pass: 2단계 처리 단계 (None: 한 번에 처리, preview: 미리보기 후 최종 작업 등록,
+            final: 미리보기 결과를 최종 결과로 교체)
+        content_hash: 파일 SHA-256 (작업 인덱스에 기록된 값, 정규화 오디오 캐시 키로 사용해 다시 계산하지 않음)
 
-    처리 흐름:
+    처리 흐름 (decode → infer → post 단계, WORKER_PIPELINE_ENABLED이면 파일 간에 단계가 겹침):
         1. 파일 타입 감지 (Mono/Stereo)
-        2. STT 처리
-        3. LLM 요약
-        4. 결과 저장
-        5. 원본 파일 이동
+        2. 16kHz 정규화 (정규화 오디오 캐시)
+        3. 무음 구간 제거 (음성이 없으면 모델 처리 생략)
+        4. STT 처리
+        5. LLM 요약
+        6. 결과 저장
+        7. 원본 파일 이동
     """
     # Lazy imports (모델 로딩 지연)
-    from app.utils.audio_utils import is_mono, is_stereo
+    from app.utils.audio_utils import get_audio_info
     from app.services.ollama_service import ollama_service
+    from app.services.audio_cache_service import audio_cache_service
 
     audio_path = Path(file_path)
-    logger.info(f"📥 작업 시작 [{task_id}]: {audio_path.name}")
+    preview = result_pass == PASS_PREVIEW
+    refining = result_pass == PASS_FINAL
+    logger.info(f"📥 작업 시작 [{task_id}]: {audio_path.name}" + (f" ({result_pass})" if result_pass else ""))
+
+    report_task_event(
+        task_id,
+        "started",
+        stage="probe",
+        keep_status=refining,
+        filename=audio_path.name,
+        status="in_progress",
+        progress=10,
+        started_at=datetime.now(),
+    )
+    stage_timings = {}
+    task_start = time.perf_counter()
+    trace = None
 
-    try:
-        # 1. 파일 타입 감지
-        if is_mono(audio_path):
-            logger.info("🎤 Mono 파일 감지")
-            srt_content, transcript_text = process_mono_file(audio_path)
+    # 2단계 처리 최종 작업은 미리보기를 처리한 큐로 등록 (Celery 요청 정보는 작업 스레드에서만 조회 가능)
+    refine_queue = (self.request.delivery_info or {}).get("routing_key") or None
 
-        elif is_stereo(audio_path):
-            logger.info("🎤 Stereo 파일 감지")
-            srt_content, transcript_text = process_stereo_file(audio_path)
+    # 단계 간 공유 값 (파이프라인 사용 시 단계마다 다른 스레드에서 실행)
+    channels = duration = trimmed = tier = segments = None
+    srt_path = summary_path = summary_config_version = None
 
-        else:
+    def decode_stage():
+        """CPU: 파일 타입 감지 + 16kHz 정규화 + 무음 구간 제거 + 품질 단계 선택"""
+        nonlocal channels, duration, trimmed, tier
+
+        # 1. 파일 타입 감지
+        with timed_stage(stage_timings, "probe"):
+            channels, _, duration = get_audio_info(audio_path)
+        report_task_event(
+            task_id,
+            "stage",
+            stage="stt",
+            keep_status=refining,
+            progress=20,
+            channels=channels,
+            audio_duration=duration,
+        )
+
+        if channels not in (1, 2):
             raise ValueError("지원하지 않는 오디오 형식입니다 (Mono 또는 Stereo만 가능).")
 
-        # 2. LLM 요약 생성
-        logger.info("🤖 LLM 요약 생성 중...")
-        summary = ollama_service.summarize_sync(transcript_text)
+        # 2. 16kHz 정규화 (캐시가 있으면 디코딩 없이 메모리 맵)
+        with timed_stage(stage_timings, "normalize"):
+            normalized = audio_cache_service.load(audio_path, content_hash)
+
+        # 3. 무음 구간 제거 (모델 로드 전)
+        with timed_stage(stage_timings, "trim"):
+            trimmed = trim_before_models(normalized)
+
+        # STT 품질 단계 (대기 작업이 많으면 beam/모델/화자 분리를 낮춰 처리 시간 목표 유지)
+        tier = PREVIEW_TIER if preview else decoding_policy.select(decoding_tier)
+        DECODING_TIER_TASKS.labels(tier=tier.name).inc()
 
-        # 3. 결과 저장
-        save_results(audio_path, srt_content, summary)
+    def infer_stage():
+        """GPU: 화자 분리 + STT"""
+        nonlocal trimmed, segments
+
+        if not trimmed.has_speech:
+            logger.info("🔇 음성이 감지되지 않아 STT를 생략합니다")
+            NO_SPEECH_FILES.inc()
+            segments = SegmentList([], [], [])
+
+        elif channels == 1:
+            logger.info("🎤 Mono 파일 감지")
+            segments = process_mono_file(audio_path, stage_timings, trimmed, tier)
 
-        # 4. 원본 파일을 processed/ 폴더로 이동
-        move_to_processed(audio_path)
+        elif tier.skip_diarization:
+            logger.info(f"🎤 Stereo 파일: 화자 분리 생략 ({tier.name})")
+            segments = process_mono_file(audio_path, stage_timings, trimmed, tier)
 
-        logger.info(f"✅ 작업 완료 [{task_id}]: {audio_path.name}")
+        elif tier.skip_mono_like_diarization and is_mono_like(
+            trimmed.data, settings.mono_like_side_ratio
+        ):
+            logger.info(f"🎤 Mono에 가까운 Stereo 파일: 화자 분리 생략 ({tier.name})")
+            segments = process_mono_file(audio_path, stage_timings, trimmed, tier)
+
+        else:
+            logger.info("🎤 Stereo 파일 감지")
+            segments = process_stereo_file(audio_path, stage_timings, trimmed, tier)
+
+        # 오디오 샘플은 여기까지만 사용 (파이프라인에서 요약/저장 대기 중인 파일이 메모리를 잡지 않도록)
+        trimmed = None
+
+    def post_stage():
+        """LLM/I/O: 요약 + 결과 저장 + 원본 이동"""
+        nonlocal srt_path, summary_path, summary_config_version
+
+        report_task_event(
+            task_id,
+            "stage",
+            stage="summarize",
+            keep_status=refining,
+            progress=70,
+            stage_timings=dict(stage_timings),
+        )
+
+        # 4. LLM 요약 생성 (인식된 텍스트가 없으면 생략)
+        with timed_stage(stage_timings, "summarize"):
+            summary_fingerprint = None
+            if len(segments):
+                logger.info("🤖 LLM 요약 생성 중...")
+                transcript = segments.to_text()
+                config = summary_config_store.get()
+                summary = ollama_service.summarize_sync(
+                    transcript, config.prompt_template, config.dictionary_content
+                )
+                summary_fingerprint = ollama_service.summary_fingerprint(
+                    transcript, config.prompt_template, config.dictionary_content
+                )
+                summary_config_version = config.version
+            else:
+                summary = NO_SPEECH_SUMMARY
+        report_task_event(
+            task_id,
+            "stage",
+            stage="save",
+            keep_status=refining,
+            progress=90,
+            stage_timings=dict(stage_timings),
+        )
+
+        # 5. 결과 저장
+        with timed_stage(stage_timings, "save"):
+            srt_path, summary_path = save_results(
+                audio_path,
+                segments,
+                summary,
+                summary_fingerprint,
+                task_id=task_id,
+                summary_config_version=summary_config_version,
+            )
+
+        # 6. 원본 파일을 processed/ 폴더로 이동 (미리보기는 최종 작업이 다시 읽으므로 input/에 유지)
+        if not preview:
+            with timed_stage(stage_timings, "move"):
+                move_to_processed(audio_path)
+
+    try:
+        with profile_task(task_id), task_trace(task_id, audio_path.name) as trace:
+            # WORKER_PIPELINE_ENABLED이면 단계별 스레드에서 다른 파일의 단계와 겹쳐 실행, 아니면 순서대로 실행
+            stage_seconds = task_pipeline.run([decode_stage, infer_stage, post_stage])
+
+        trace_path = save_trace(trace, settings.output_dir, audio_path)
+
+        TASKS_TOTAL.labels(status="completed").inc()
+        if not preview:
+            # 파이프라인에서는 파일 간에 단계가 겹치므로 가장 느린 단계 시간이 작업 처리 간격
+            decoding_policy.record_task(
+                max(stage_seconds) if task_pipeline.enabled else time.perf_counter() - task_start
+            )
+        if duration > 0:
+            REAL_TIME_FACTOR.labels(channels=str(channels)).observe(
+                (time.perf_counter() - task_start) / duration
+            )
+
+        # 미리보기 완료는 종료 이벤트가 아님 (SSE 구독은 최종 처리의 completed/refine_failed까지 유지)
+        completed_at = datetime.now()
+        report_task_event(
+            task_id,
+            "preview_completed" if preview else "completed",
+            status="completed",
+            progress=100,
+            stage_timings=stage_timings,
+            srt_path=str(srt_path),
+            summary_path=str(summary_path),
+            trace_path=str(trace_path) if trace_path else None,
+            decoding_tier=tier.name,
+            result_pass=PASS_PREVIEW if preview else PASS_FINAL,
+            completed_at=completed_at,
+        )
+
+        logger.info(f"✅ 작업 완료 [{task_id}]: {audio_path.name}" + (f" ({result_pass})" if result_pass else ""))
+
+        # 미리보기 완료를 보고한 뒤 최종 작업 등록 (최종 작업의 이벤트가 미리보기 완료보다 먼저 나가지 않도록)
+        if preview:
+            try:
+                enqueue_refine(refine_queue, audio_path, task_id, content_hash)
+            except Exception as e:
+                logger.error(f"❌ 최종 처리 등록 실패 [{task_id}]: {e}")
+                report_task_event(
+                    task_id,
+                    "refine_failed",
+                    keep_status=True,
+                    error_message=f"{type(e).__name__}: {e}",
+                )
+                move_to_processed(audio_path)
 
         return {
             "task_id": task_id,
             "status": "success",
             "filename": audio_path.name,
-            "completed_at": datetime.now().isoformat(),
+            "summary_config_version": summary_config_version,
+            "decoding_tier": tier.name,
+            "result_pass": PASS_PREVIEW if preview else PASS_FINAL,
+            "completed_at": completed_at.isoformat(),
         }
 
     except Exception as e:
         logger.error(f"❌ 작업 실패 [{task_id}]: {e}")
+        TASKS_TOTAL.labels(status="failed").inc()
+
+        trace_path = None
+        if trace is not None:
+            trace_path = save_trace(trace, settings.error_dir, audio_path)
+
+        if refining:
+            # 최종 작업이 실패해도 미리보기 결과는 계속 제공 (상태는 completed 유지, 종료 이벤트 refine_failed 발행)
+            report_task_event(
+                task_id,
+                "refine_failed",
+                keep_status=True,
+                stage_timings=stage_timings,
+                trace_path=str(trace_path) if trace_path else None,
+                error_message=f"{type(e).__name__}: {e}",
+            )
+
+            # 원본은 processed/로 옮겨 재처리 API로 다시 처리할 수 있도록 함
+            write_error_log(audio_path, task_id, e)
+            if audio_path.exists():
+                move_to_processed(audio_path)
+
+            raise
+
+        report_task_event(
+            task_id,
+            "failed",
+            status="failed",
+            stage_timings=stage_timings,
+            trace_path=str(trace_path) if trace_path else None,
+            error_message=f"{type(e).__name__}: {e}",
+            completed_at=datetime.now(),
+        )
 
         # 에러 파일 처리
         handle_error(audio_path, task_id, e)
@@ -76,41 +381,82 @@ def process_audio_file(self, file_path: str, task_id: str):
         raise
 
 
-def process_mono_file(audio_path: Path) -> tuple[str, str]:
+def trim_before_models(normalized: np.ndarray) -> TrimmedAudio:
+    """
+    모델 처리 전 무음 구간 제거
+
+    Args:
+        normalized: 16kHz (프레임, 채널) float32 배열
+
+    Returns:
+        TrimmedAudio (무음 제거 비활성화 시 전체 구간)
+    """
+    if not settings.silence_trim_enabled:
+        return TrimmedAudio.untrimmed(normalized, WHISPER_SAMPLE_RATE)
+
+    trimmed = trim_silence(
+        normalized,
+        WHISPER_SAMPLE_RATE,
+        energy_db=settings.silence_energy_db,
+        max_flatness=settings.silence_flatness,
+        min_silence_sec=settings.silence_min_sec,
+        pad_sec=settings.silence_pad_sec,
+    )
+
+    SILENCE_TRIMMED_SECONDS.inc(trimmed.removed_sec)
+    return trimmed
+
+
+def process_mono_file(
+    audio_path: Path, stage_timings: dict, audio: TrimmedAudio, tier: Optional[DecodingTier] = None
+) -> SegmentList:
     """
-    Mono 파일 처리
+    Mono 파일 처리 (Mono에 가까운 Stereo 파일은 두 채널 평균)
 
     Args:
         audio_path: 오디오 파일 경로
+        stage_timings: 단계별 소요 시간 기록 대상
+        audio: 무음 구간을 제거한 16kHz 오디오
+        tier: STT 품질 단계
 
     Returns:
-        (SRT 내용, 플레인 텍스트)
+        세그먼트 목록
     """
     from app.services.whisper_service import whisper_service
 
     logger.info("🎤 Mono 파일 STT 시작")
 
     # Whisper STT
-    srt_content = whisper_service.transcribe_to_srt(audio_path, language="ko")
+    with timed_stage(stage_timings, "transcribe"):
+        segments = whisper_service.transcribe(
+            audio_path,
+            language="ko",
+            audio=audio.whisper_input(),
+            tier=tier,
+        )
 
-    # GPU 메모리 해제
-    whisper_service.unload_model()
+        # GPU 메모리 해제 (Worker 시작 시 로드한 상주 모델은 다음 작업에 재사용)
+        if not model_residency.is_resident("whisper"):
+            whisper_service.unload_model()
 
-    # SRT에서 텍스트만 추출
-    transcript_text = extract_text_from_srt(srt_content)
+    # 원본 파일 기준 시각으로 복원
+    return audio.restore_segments(segments)
 
-    return srt_content, transcript_text
 
-
-def process_stereo_file(audio_path: Path) -> tuple[str, str]:
+def process_stereo_file(
+    audio_path: Path, stage_timings: dict, audio: TrimmedAudio, tier: Optional[DecodingTier] = None
+) -> SegmentList:
     """
     Stereo 파일 처리 (pyannote 화자 분리 + Whisper STT)
 
     Args:
         audio_path: 오디오 파일 경로
+        stage_timings: 단계별 소요 시간 기록 대상
+        audio: 무음 구간을 제거한 16kHz 오디오
+        tier: STT 품질 단계
 
     Returns:
-        (SRT 내용, 플레인 텍스트)
+        화자가 지정된 세그먼트 목록
     """
     from app.services.whisper_service import whisper_service
     from app.services.diarization_service import diarization_service
@@ -119,100 +465,140 @@ def process_stereo_file(audio_path: Path) -> tuple[str, str]:
 
     # 1. 화자 분리 (pyannote)
     logger.info("🎤 화자 분리 수행 중...")
-    diarization_segments = diarization_service.diarize(
-        audio_path,
-        min_speakers=1,
-        max_speakers=3,  # 최대 3명까지 감지
-    )
-
-    # 화자 분리 모델 언로드 (GPU 메모리 해제)
-    diarization_service.unload_pipeline()
+    with timed_stage(stage_timings, "diarize"):
+        diarization_segments = diarization_service.diarize(
+            audio_path,
+            min_speakers=1,
+            max_speakers=3,  # 최대 3명까지 감지
+            audio=(audio.data, audio.samplerate),
+        )
+
+        # 화자 분리 모델 언로드 (GPU 메모리 해제, 상주 모델은 유지)
+        if not model_residency.is_resident("diarization"):
+            diarization_service.unload_pipeline()
 
     # 2. Whisper STT
     logger.info("🎤 Whisper STT 수행 중...")
-    whisper_segments = whisper_service.transcribe(audio_path, language="ko")
-
-    # Whisper 모델 언로드 (GPU 메모리 해제)
-    whisper_service.unload_model()
-
-    # 3. 화자 정보와 STT 결과 병합
-    merged_segments = diarization_service.merge_with_transcript(
-        diarization_segments, whisper_segments
-    )
-
-    # 4. SRT 형식으로 변환
-    srt_content = convert_merged_to_srt(merged_segments)
-
-    # SRT에서 텍스트만 추출
-    transcript_text = extract_text_from_srt(srt_content)
-
-    return srt_content, transcript_text
-
-
-def convert_merged_to_srt(merged_segments: List[Tuple[str, str, str, str]]) -> str:
+    with timed_stage(stage_timings, "transcribe"):
+        whisper_segments = whisper_service.transcribe(
+            audio_path,
+            language="ko",
+            audio=audio.whisper_input(),
+            tier=tier,
+        )
+
+        # Whisper 모델 언로드 (GPU 메모리 해제, 상주 모델은 유지)
+        if not model_residency.is_resident("whisper"):
+            whisper_service.unload_model()
+
+    # 3. 화자 정보와 STT 결과 병합 (같은 잘라낸 시간축에서 병합 후 원본 시각으로 복원)
+    with timed_stage(stage_timings, "merge"):
+        merged_segments = diarization_service.merge_with_transcript(
+            diarization_segments, whisper_segments
+        )
+        merged_segments = audio.restore_segments(merged_segments)
+
+    return merged_segments
+
+
+def save_results(
+    audio_path: Path,
+    segments: SegmentList,
+    summary: str,
+    summary_fingerprint: Optional[str] = None,
+    task_id: Optional[str] = None,
+    summary_config_version: Optional[int] = None,
+) -> Tuple[Path, Path]:
     """
-    병합된 세그먼트를 SRT 형식으로 변환
+    결과 파일 저장
 
     Args:
-        merged_segments: [(시작시각, 종료시각, 화자, 텍스트), ...]
+        audio_path: 원본 오디오 파일 경로
+        segments: 세그먼트 목록 (SRT로 변환해 저장)
+        summary: 요약 내용
+        summary_fingerprint: 요약 입력 지문 (재요약 시 입력이 같은 파일 생략용, LLM 요약 생략 시 None)
+        task_id: 작업 ID (전문 검색 결과에 표시)
+        summary_config_version: 요약에 사용한 요약 설정(프롬프트/용어 사전) 버전
 
     Returns:
-        SRT 형식 문자열
+        (SRT 파일 경로, 요약 파일 경로)
     """
-    srt_lines = []
+    base_name = audio_path.stem
 
-    for idx, (start, end, speaker, text) in enumerate(merged_segments, start=1):
-        srt_lines.append(f"{idx}")
-        srt_lines.append(f"{start} --> {end}")
-        srt_lines.append(f"{speaker} {text}")
-        srt_lines.append("")  # 빈 줄
+    # SRT 파일 저장
+    with trace_span("srt_build"):
+        srt_content = segments.to_srt()
+    srt_path = settings.output_dir / f"{base_name}.srt"
+    write_text_atomic(srt_path, srt_content)
+    logger.info(f"💾 SRT 저장: {srt_path.name}")
 
-    return "\n".join(srt_lines)
+    # 요약 파일 저장 (2단계 처리 최종 결과가 미리보기를 교체할 때 조회 중인 파일이 중간 상태로 보이지 않도록 원자적 교체)
+    summary_path = settings.output_dir / f"{base_name}_요약.txt"
+    write_text_atomic(summary_path, summary)
+    logger.info(f"💾 요약 저장: {summary_path.name}")
+
+    # 요약 메타 (같은 파일명의 이전 결과 메타가 남지 않도록 지문이 없으면 삭제)
+    if summary_fingerprint is not None:
+        write_summary_meta(summary_path, summary_fingerprint, summary_config_version)
+    else:
+        summary_meta_path(summary_path).unlink(missing_ok=True)
 
+    # 전문 검색 색인 (작업 인덱스 기록기 스레드에서 기존 항목 교체, LLM 요약이 없으면 전사만)
+    if settings.search_index_enabled:
+        entries = build_search_entries(segments, summary if summary_fingerprint else None)
+        task_index_writer.submit(
+            task_id, partial(replace_search_entries, source=base_name, task_id=task_id, entries=entries)
+        )
 
-def extract_text_from_srt(srt_content: str) -> str:
+    return srt_path, summary_path
+
+
+def save_trace(trace: TaskTrace, directory: Path, audio_path: Path) -> Optional[Path]:
     """
-    SRT 형식에서 텍스트만 추출
+    타이밍 트레이스 저장 (결과 파일 옆, 실패 시 error/)
+
+    트레이스 저장 실패가 작업 결과에 영향을 주지 않도록 예외는 로그만 남깁니다.
 
     Args:
-        srt_content: SRT 형식 문자열
+        trace: 작업 트레이스
+        directory: 저장 디렉토리
+        audio_path: 원본 오디오 파일 경로
 
     Returns:
-        플레인 텍스트
+        트레이스 파일 경로 (저장 실패 시 None)
     """
-    lines = srt_content.strip().split("\n")
-    text_lines = []
-
-    for line in lines:
-        line = line.strip()
-
-        # 번호, 타임스탬프, 빈 줄 제외
-        if line and not line.isdigit() and "-->" not in line:
-            text_lines.append(line)
+    try:
+        trace_path = trace.save(directory / f"{audio_path.stem}_trace.json")
+    except OSError as e:
+        logger.warning(f"⚠️ 트레이스 저장 실패: {e}")
+        return None
 
-    return " ".join(text_lines)
+    logger.info(f"💾 트레이스 저장: {trace_path.name}")
+    return trace_path
 
 
-def save_results(audio_path: Path, srt_content: str, summary: str):
+def enqueue_refine(
+    queue: Optional[str], audio_path: Path, task_id: str, content_hash: Optional[str] = None
+):
     """
-    결과 파일 저장
+    2단계 처리 최종 작업 등록 (기본 모델 + 화자 분리, 낮은 우선순위)
+
+    미리보기를 처리한 큐에 REFINE_PRIORITY로 넣으므로 새로 업로드된 파일(미리보기/일반 처리)이 먼저 처리됩니다.
 
     Args:
-        audio_path: 원본 오디오 파일 경로
-        srt_content: SRT 내용
-        summary: 요약 내용
+        queue: 미리보기 작업이 전달된 큐 (None이면 기본 큐)
+        audio_path: 원본 오디오 파일 경로 (input/)
+        task_id: 작업 ID
+        content_hash: 파일 SHA-256 (미리보기에서 저장한 정규화 오디오 캐시 재사용)
     """
-    base_name = audio_path.stem
-
-    # SRT 파일 저장
-    srt_path = settings.output_dir / f"{base_name}.srt"
-    srt_path.write_text(srt_content, encoding="utf-8")
-    logger.info(f"💾 SRT 저장: {srt_path.name}")
-
-    # 요약 파일 저장
-    summary_path = settings.output_dir / f"{base_name}_요약.txt"
-    summary_path.write_text(summary, encoding="utf-8")
-    logger.info(f"💾 요약 저장: {summary_path.name}")
+    process_audio_file.apply_async(
+        args=[str(audio_path), task_id],
+        kwargs={"decoding_tier": TIER_FULL, "result_pass": PASS_FINAL, "content_hash": content_hash},
+        task_id=f"{task_id}{REFINE_TASK_SUFFIX}",
+        queue=queue,
+        priority=settings.refine_priority,
+    )
+    logger.info(f"🔁 최종 처리 등록 [{task_id}]: {audio_path.name} (우선순위 {settings.refine_priority})")
 
 
 def move_to_processed(audio_path: Path):
@@ -237,7 +623,24 @@ def handle_error(audio_path: Path, task_id: str, error: Exception):
         task_id: 작업 ID
         error: 발생한 에러
     """
-    # 에러 로그 파일 생성
+    write_error_log(audio_path, task_id, error)
+
+    # 원본 파일을 error/ 폴더로 이동
+    if audio_path.exists():
+        error_audio_path = settings.error_dir / audio_path.name
+        shutil.move(str(audio_path), str(error_audio_path))
+        logger.info(f"⚠️ 에러 파일 이동: {error_audio_path}")
+
+
+def write_error_log(audio_path: Path, task_id: str, error: Exception):
+    """
+    에러 로그 파일 생성 (error/{파일명}_error.log)
+
+    Args:
+        audio_path: 원본 오디오 파일 경로
+        task_id: 작업 ID
+        error: 발생한 에러
+    """
     error_log_path = settings.error_dir / f"{audio_path.stem}_error.log"
 
     error_log = f"""
@@ -250,9 +653,3 @@ def handle_error(audio_path: Path, task_id: str, error: Exception):
 
     error_log_path.write_text(error_log.strip(), encoding="utf-8")
     logger.info(f"📝 에러 로그 저장: {error_log_path.name}")
-
-    # 원본 파일을 error/ 폴더로 이동
-    if audio_path.exists():
-        error_audio_path = settings.error_dir / audio_path.name
-        shutil.move(str(audio_path), str(error_audio_path))
-        logger.info(f"⚠️ 에러 파일 이동: {error_audio_path}")
@@ -1,8 +1,24 @@
 """
 Celery 애플리케이션 설정
 """
+import os
+
 from celery import Celery
-from app.core.config import settings
+from celery.signals import (
+    celeryd_init,
+    worker_init,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
+from app.core.celery_client import MESSAGE_CONFIG
+from app.core.config import ensure_directories, settings
+
+# Worker 메트릭: prefork 자식 프로세스 값을 합산하려면
+# prometheus_client가 import되기 전에 멀티프로세스 디렉토리를 지정해야 함
+if settings.worker_metrics_port:
+    settings.metrics_multiproc_dir.mkdir(parents=True, exist_ok=True)
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", str(settings.metrics_multiproc_dir))
 
 # Celery 앱 생성
 celery_app = Celery(
@@ -11,26 +27,20 @@ celery_app = Celery(
     backend=settings.get_celery_result_backend(),
 )
 
-# Celery 설정
+# Celery 설정 (직렬화/결과 만료는 API 클라이언트와 공유)
+celery_app.conf.update(MESSAGE_CONFIG)
 celery_app.conf.update(
-    # 작업 설정
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="Asia/Seoul",
-    enable_utc=True,
-
     # Worker 설정
     worker_prefetch_multiplier=1,  # 한 번에 1개 작업만 가져옴 (GPU 메모리 관리)
-    worker_max_tasks_per_child=50,  # Worker 재시작 주기 (메모리 누수 방지)
+    # Worker 재시작은 메모리 증가량 기준 (worker_lifecycle 참고), 작업 수 기준은 선택
+    worker_max_tasks_per_child=settings.worker_max_tasks_per_child or None,
+    # 자식 프로세스 초기화(모델 로드 + 워밍업)가 끝나기 전에 시작 실패로 처리되지 않도록
+    worker_proc_alive_timeout=settings.worker_proc_alive_timeout_sec,
 
     # 작업 타임아웃 설정
     task_soft_time_limit=600,  # 10분 (소프트 타임아웃)
     task_time_limit=900,  # 15분 (하드 타임아웃)
 
-    # 결과 설정
-    result_expires=3600,  # 결과 1시간 후 만료
-
     # 재시도 설정
     task_acks_late=True,  # 작업 완료 후 ACK
     task_reject_on_worker_lost=True,  # Worker 종료 시 작업 거부
@@ -41,5 +51,80 @@ celery_app.autodiscover_tasks(["app.tasks"], force=True)
 
 # Task 명시적 등록
 celery_app.conf.update(
-    imports=["app.tasks.audio_task"],
+    imports=["app.tasks.audio_task", "app.tasks.worker_lifecycle"],
 )
+
+
+@worker_init.connect
+def prepare_worker_directories(**kwargs):
+    """Worker 시작 시 데이터/로그 디렉토리 생성"""
+    ensure_directories()
+
+
+@worker_init.connect
+def start_worker_metrics_server(**kwargs):
+    """Worker 메인 프로세스에서 메트릭 HTTP 서버 시작 (자식 프로세스 값 합산)"""
+    if not settings.worker_metrics_port:
+        return
+
+    from prometheus_client import start_http_server
+    from loguru import logger
+    from app.core.metrics import build_registry, prepare_multiprocess_dir
+
+    prepare_multiprocess_dir(settings.metrics_multiproc_dir)
+    start_http_server(settings.worker_metrics_port, registry=build_registry())
+    logger.info(f"📈 Worker 메트릭 서버 시작: :{settings.worker_metrics_port}/metrics")
+
+
+@worker_process_shutdown.connect
+def cleanup_worker_metrics(pid=None, **kwargs):
+    """종료된 자식 프로세스의 메트릭 정리"""
+    if not settings.worker_metrics_port:
+        return
+
+    from app.core.metrics import mark_process_dead
+    mark_process_dead(pid or os.getpid())
+
+
+@celeryd_init.connect
+def record_pool_size(conf=None, options=None, **kwargs):
+    """
+    Worker 동시 실행 수 기록 (부하 추정용)
+
+    fork 전 메인 프로세스에서 실행되므로 prefork 자식 프로세스도 같은 값을 사용합니다.
+
+    단계 파이프라인은 threads 풀 동시 실행 수와 무관하게 파일을 한 건씩 단계 간격으로 처리하고,
+    작업 처리 시간도 그 간격으로 기록하므로 1로 계산합니다.
+    """
+    from app.services.decoding_policy import decoding_policy
+
+    concurrency = (
+        (options or {}).get("concurrency") or getattr(conf, "worker_concurrency", None) or os.cpu_count()
+    )
+    decoding_policy.pool_size = 1 if settings.worker_pipeline_enabled else max(int(concurrency or 1), 1)
+
+
+# GPU Worker 등록 (worker_launcher가 지정한 WORKER_DEVICE_INDEX, 메인 프로세스에서만 실행)
+_device_heartbeat = None
+
+
+@worker_ready.connect
+def register_device_worker(**kwargs):
+    """장치 큐(gpu.{번호})를 소비하는 Worker를 API 라우팅 대상으로 등록"""
+    global _device_heartbeat
+
+    if settings.worker_device_index < 0:
+        return
+
+    from app.services.decoding_policy import decoding_policy
+    from app.services.device_service import DeviceHeartbeat
+
+    _device_heartbeat = DeviceHeartbeat(settings.worker_device_index, concurrency=decoding_policy.pool_size)
+    _device_heartbeat.start()
+
+
+@worker_shutdown.connect
+def unregister_device_worker(**kwargs):
+    """종료 시 등록 해제 (새 작업이 종료 중인 Worker로 라우팅되지 않도록)"""
+    if _device_heartbeat is not None:
+        _device_heartbeat.stop()
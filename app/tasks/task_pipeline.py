@@ -0,0 +1,190 @@
+"""
+Worker 내 단계 파이프라인
+연속된 파일의 decode(CPU) / infer(GPU) / post(LLM 요약, 결과 저장/이동) 단계를 겹쳐 실행
+
+threads 풀 Worker의 작업 스레드가 파일마다 단계 함수를 제출하면, 단계별 전용 스레드가 크기 제한 큐로
+이어져 파일 N을 추론하는 동안 파일 N+1을 디코딩하고 파일 N-1을 요약/저장합니다.
+단계 스레드가 하나씩이므로 모델은 infer 스레드에서만 사용되고, 파일별 단계 순서는 유지됩니다.
+
+메모리: 디코딩된 오디오는 decode 스레드 1개 + infer 대기 큐(WORKER_PIPELINE_QUEUE_SIZE) + infer 스레드 1개
+분량까지만 존재합니다 (첫 단계 큐가 가득 차면 작업 스레드는 디코딩 전에 대기).
+
+WORKER_PIPELINE_ENABLED=false(기본값)이면 단계 함수를 호출한 스레드에서 순서대로 실행합니다.
+"""
+import contextvars
+import os
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+from celery.signals import worker_ready
+from loguru import logger
+
+from app.core.config import settings
+from app.core.metrics import PIPELINE_QUEUE_DEPTH
+from app.core.profiling import follow_current_thread
+
+
+# 단계 이름 (process_audio_file의 단계 함수 순서)
+STAGES = ("decode", "infer", "post")
+
+
+class PipelineJob:
+    """파이프라인에 제출된 파일 한 건의 단계 함수 묶음"""
+
+    def __init__(self, steps: Sequence[Callable[[], None]]):
+        """
+        초기화
+
+        Args:
+            steps: 단계별 함수 (STAGES 순서)
+        """
+        self.steps = steps
+        # 제출한 작업 스레드의 컨텍스트 (트레이스/프로파일 세션을 단계 스레드에서도 사용)
+        self.context = contextvars.copy_context()
+        self.stage_seconds: List[float] = []
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+
+class StagePipeline:
+    """단계별 전용 스레드 + 크기 제한 큐 (Worker 프로세스별)"""
+
+    def __init__(self, stages: Sequence[str] = STAGES):
+        """
+        초기화 (스레드는 첫 제출 시 시작)
+
+        Args:
+            stages: 단계 이름 목록
+        """
+        self.stages = tuple(stages)
+        self._queues: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        """파이프라인 사용 여부"""
+        return settings.worker_pipeline_enabled
+
+    def capacity(self) -> int:
+        """동시에 파이프라인에 들어갈 수 있는 파일 수 (단계 스레드 + 단계 큐, threads 풀 동시 실행 수 기준)"""
+        return len(self.stages) * (1 + settings.worker_pipeline_queue_size)
+
+    def run(self, steps: Sequence[Callable[[], None]]) -> List[float]:
+        """
+        파일 한 건의 단계 실행 (모든 단계가 끝날 때까지 대기)
+
+        Args:
+            steps: 단계별 함수 (STAGES 순서, 앞 단계 결과는 함수 간 공유 변수로 전달)
+
+        Returns:
+            단계별 소요 시간 (초, 큐 대기 제외)
+
+        Raises:
+            ValueError: 단계 함수 수가 단계 수와 다른 경우
+            Exception: 단계 함수에서 발생한 예외 (이후 단계는 실행하지 않음)
+        """
+        if len(steps) != len(self.stages):
+            raise ValueError(f"단계 함수 {len(steps)}개 (필요: {len(self.stages)}개)")
+
+        if not self.enabled:
+            stage_seconds = []
+            for step in steps:
+                started = time.perf_counter()
+                step()
+                stage_seconds.append(time.perf_counter() - started)
+            return stage_seconds
+
+        self._ensure_started()
+
+        job = PipelineJob(steps)
+        # 첫 단계 큐가 가득 차면 여기서 대기 (디코딩 전이므로 오디오 메모리를 잡지 않음)
+        self._put(0, job)
+        job.done.wait()
+
+        if job.error is not None:
+            raise job.error
+        return job.stage_seconds
+
+    def _ensure_started(self):
+        """단계 스레드 시작 (프로세스별 한 번, fork 후에는 다시 시작)"""
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            self._queues = [
+                queue.Queue(maxsize=settings.worker_pipeline_queue_size) for _ in self.stages
+            ]
+            for index, name in enumerate(self.stages):
+                threading.Thread(
+                    target=self._stage_loop, args=(index,), name=f"pipeline-{name}", daemon=True
+                ).start()
+            self._pid = os.getpid()
+
+        logger.info(
+            f"🏭 단계 파이프라인 시작 (pid {os.getpid()}): {' → '.join(self.stages)}, "
+            f"단계 큐 {settings.worker_pipeline_queue_size}"
+        )
+
+    def _put(self, index: int, job: PipelineJob):
+        """단계 큐에 추가 (가득 차면 대기)"""
+        self._queues[index].put(job)
+        PIPELINE_QUEUE_DEPTH.labels(stage=self.stages[index]).set(self._queues[index].qsize())
+
+    def _stage_loop(self, index: int):
+        """
+        단계 스레드 루프
+
+        Args:
+            index: 단계 번호
+        """
+        name = self.stages[index]
+        inbox = self._queues[index]
+        last = index == len(self.stages) - 1
+
+        while True:
+            job = inbox.get()
+            PIPELINE_QUEUE_DEPTH.labels(stage=name).set(inbox.qsize())
+
+            started = time.perf_counter()
+            try:
+                job.context.run(self._run_step, job.steps[index])
+            except BaseException as e:
+                job.error = e
+            job.stage_seconds.append(time.perf_counter() - started)
+
+            if last or job.error is not None:
+                job.done.set()
+            else:
+                # 다음 단계가 밀려 있으면 여기서 대기 (앞 단계가 더 앞서 나가지 않도록 역압)
+                self._put(index + 1, job)
+
+    @staticmethod
+    def _run_step(step: Callable[[], None]):
+        """작업 컨텍스트에서 단계 함수 실행 (프로파일링 중이면 샘플링 대상을 이 스레드로 변경)"""
+        follow_current_thread()
+        step()
+
+
+# 전역 인스턴스 (프로세스별)
+task_pipeline = StagePipeline()
+
+
+@worker_ready.connect
+def check_pipeline_pool(sender=None, **kwargs):
+    """파이프라인은 한 프로세스에서 여러 작업이 동시에 실행될 때만 단계가 겹침"""
+    if not task_pipeline.enabled:
+        return
+
+    pool = getattr(sender, "pool", None)
+    limit = getattr(pool, "limit", None)
+    if type(pool).__module__ != "celery.concurrency.thread" or (limit or 0) < 2:
+        logger.warning(
+            f"⚠️ WORKER_PIPELINE_ENABLED는 threads 풀(--pool threads --concurrency {task_pipeline.capacity()})에서만 "
+            f"파일 간 단계가 겹칩니다 (현재: {type(pool).__name__}, 동시 실행 {limit})"
+        )
@@ -0,0 +1,196 @@
+"""
+GPU별 Celery Worker 실행기
+GPU를 조회해 장치마다 Worker 프로세스 하나를 띄우고 모델을 해당 GPU에 고정
+
+    python -m app.tasks.worker_launcher                 # 모든 GPU
+    python -m app.tasks.worker_launcher --gpus 0,2      # 지정한 GPU만
+
+각 Worker는 CUDA_VISIBLE_DEVICES로 GPU 하나만 보며(모델의 "cuda" = 배정된 GPU),
+장치 큐 gpu.{번호}와 기본 큐 celery를 함께 소비합니다. GPU가 없으면 CPU Worker 하나로 실행합니다.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+from app.services.device_service import device_queue, list_gpus, shutdown_nvml
+from app.tasks.task_pipeline import task_pipeline
+
+
+# 자식 Worker 종료 대기 시간 (초, 이후 SIGKILL)
+SHUTDOWN_TIMEOUT_SEC = 60
+
+
+def build_worker_env(device_index: Optional[int]) -> Dict[str, str]:
+    """
+    Worker 환경 변수
+
+    Args:
+        device_index: 물리 GPU 번호 (None이면 CPU Worker)
+
+    Returns:
+        자식 프로세스 환경 변수
+    """
+    env = dict(os.environ)
+
+    if device_index is None:
+        env["CUDA_VISIBLE_DEVICES"] = ""
+        env.pop("WORKER_DEVICE_INDEX", None)
+        env["WHISPER_DEVICE"] = "cpu"
+        if settings.whisper_compute_type == "float16":
+            env["WHISPER_COMPUTE_TYPE"] = "int8"  # CPU는 float16 미지원
+        return env
+
+    env["CUDA_VISIBLE_DEVICES"] = str(device_index)
+    env["WORKER_DEVICE_INDEX"] = str(device_index)
+    env["WHISPER_DEVICE"] = "cuda"
+
+    # 메트릭: Worker마다 포트와 멀티프로세스 디렉토리 분리 (시작 시 디렉토리를 비우므로 공유 불가)
+    if settings.worker_metrics_port:
+        env["WORKER_METRICS_PORT"] = str(settings.worker_metrics_port + device_index)
+        env["METRICS_MULTIPROC_DIR"] = str(settings.metrics_multiproc_dir / f"gpu{device_index}")
+        env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    return env
+
+
+def build_worker_command(device_index: Optional[int], concurrency: int, loglevel: str) -> List[str]:
+    """
+    Worker 실행 명령
+
+    WORKER_PIPELINE_ENABLED이면 모델 사본 하나를 쓰는 threads 풀 프로세스로 실행하고,
+    동시 실행 수는 단계 파이프라인에 들어갈 수 있는 파일 수로 지정합니다 (concurrency 무시).
+
+    Args:
+        device_index: 물리 GPU 번호 (None이면 CPU Worker)
+        concurrency: Worker 프로세스 수 (GPU 하나에 올릴 모델 사본 수)
+        loglevel: Celery 로그 레벨
+
+    Returns:
+        celery worker 명령
+    """
+    if device_index is None:
+        queues, node_name = "celery", "cpu@%h"
+    else:
+        queues, node_name = f"{device_queue(device_index)},celery", f"gpu{device_index}@%h"
+
+    if settings.worker_pipeline_enabled:
+        pool_options = ["--pool=threads", f"--concurrency={task_pipeline.capacity()}"]
+    else:
+        pool_options = [f"--concurrency={concurrency}"]
+
+    return [
+        sys.executable, "-m", "celery",
+        "-A", "app.tasks.celery_app", "worker",
+        f"--loglevel={loglevel}",
+        *pool_options,
+        "-Q", queues,
+        "-n", node_name,
+    ]
+
+
+def select_devices(requested: Optional[str]) -> List[int]:
+    """
+    사용할 GPU 번호 목록
+
+    Args:
+        requested: 쉼표 구분 GPU 번호 (None이면 조회된 모든 GPU)
+
+    Returns:
+        GPU 번호 목록 (빈 목록이면 CPU Worker)
+    """
+    available = [gpu["index"] for gpu in list_gpus()]
+    shutdown_nvml()
+
+    if requested is None:
+        return available
+
+    devices = [int(index) for index in requested.split(",") if index.strip()]
+    missing = [index for index in devices if index not in available]
+    if missing:
+        raise SystemExit(f"존재하지 않는 GPU: {missing} (사용 가능: {available})")
+    return devices
+
+
+def run(devices: List[int], concurrency: int, loglevel: str) -> int:
+    """
+    Worker 실행 및 감시 (하나라도 종료되면 나머지도 종료)
+
+    Args:
+        devices: GPU 번호 목록 (빈 목록이면 CPU Worker 하나)
+        concurrency: Worker당 프로세스 수
+        loglevel: Celery 로그 레벨
+
+    Returns:
+        종료 코드 (먼저 종료된 Worker의 코드)
+    """
+    targets: List[Optional[int]] = list(devices) or [None]
+    workers: Dict[Optional[int], subprocess.Popen] = {}
+
+    for device_index in targets:
+        workers[device_index] = subprocess.Popen(
+            build_worker_command(device_index, concurrency, loglevel),
+            env=build_worker_env(device_index),
+        )
+        label = "CPU" if device_index is None else f"GPU {device_index} → {device_queue(device_index)}"
+        logger.info(f"🚀 Worker 시작: {label} (pid {workers[device_index].pid})")
+
+    stopping = False
+
+    def forward(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in workers.values():
+            if process.poll() is None:
+                process.send_signal(signum)
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+
+    exit_code = 0
+    while True:
+        exited = [(index, p) for index, p in workers.items() if p.poll() is not None]
+        if exited:
+            index, process = exited[0]
+            exit_code = process.returncode
+            if not stopping:
+                logger.error(f"❌ Worker 종료: {index if index is not None else 'CPU'} (code {exit_code}), 전체 종료")
+                forward(signal.SIGTERM, None)
+            break
+        time.sleep(1.0)
+
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT_SEC
+    for process in workers.values():
+        try:
+            process.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    logger.info("✅ 모든 Worker 종료")
+    return exit_code
+
+
+def main():
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="GPU별 Celery Worker 실행")
+    parser.add_argument("--gpus", default=None, help="사용할 GPU 번호 (쉼표 구분, 기본값: 모든 GPU)")
+    parser.add_argument("--concurrency-per-gpu", type=int, default=1, help="GPU당 Worker 프로세스 수")
+    parser.add_argument("--loglevel", default="info", help="Celery 로그 레벨")
+    args = parser.parse_args()
+
+    devices = select_devices(args.gpus)
+    if not devices:
+        logger.warning("⚠️ GPU를 찾지 못해 CPU Worker로 실행합니다")
+
+    sys.exit(run(devices, args.concurrency_per_gpu, args.loglevel))
+
+
+if __name__ == "__main__":
+    main()
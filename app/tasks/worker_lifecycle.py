@@ -0,0 +1,189 @@
+"""
+Worker 모델 상주 관리
+Worker 프로세스 시작 시 모델 로드 + 워밍업, 작업 간 모델 재사용, 메모리 증가량 기준 프로세스 교체
+
+prefork Worker는 자식 프로세스마다(worker_process_init), solo/threads Worker는 메인 프로세스에서
+(worker_ready) 한 번 로드합니다. 로드/워밍업이 끝난 시점의 RSS를 기준으로, 작업 후 RSS가
+WORKER_MEMORY_GROWTH_MB 이상 늘어난 자식 프로세스는 결과 전송 후 교체됩니다 (billiard 메모리 한도).
+"""
+import gc
+import os
+import time
+from typing import Dict, Optional
+
+import psutil
+from billiard import process as billiard_process
+from celery.signals import task_postrun, worker_process_init, worker_ready
+from loguru import logger
+
+from app.core.config import settings
+from app.core.metrics import WORKER_MEMORY_GROWTH
+
+
+class ModelResidency:
+    """Worker 프로세스의 상주 모델 및 메모리 기준선"""
+
+    def __init__(self):
+        """초기화 (미리 로드 전에는 상주 모델 없음 = 작업마다 로드/언로드)"""
+        self.resident: set = set()
+        self.baseline_rss: Optional[int] = None
+        self.recycle_pending = False
+
+    def is_resident(self, model: str) -> bool:
+        """
+        모델 상주 여부 (상주 모델은 작업 후 언로드하지 않음)
+
+        Args:
+            model: whisper 또는 diarization
+        """
+        return model in self.resident
+
+    def preload(self) -> Dict[str, float]:
+        """
+        설정된 모델 로드 및 워밍업 (실패한 모델은 기존처럼 작업 시 로드)
+
+        Returns:
+            {"{모델}_load" / "{모델}_warmup": 소요 시간(초)}
+        """
+        from app.services.diarization_service import diarization_service
+        from app.services.whisper_service import whisper_service
+
+        services = {
+            "whisper": (whisper_service.load_model, whisper_service.warmup),
+            "diarization": (diarization_service.load_pipeline, diarization_service.warmup),
+        }
+
+        timings = {}
+        for model in settings.get_preload_models():
+            if model not in services:
+                logger.warning(f"⚠️ 알 수 없는 MODEL_PRELOAD 항목: {model}")
+                continue
+
+            load, warmup = services[model]
+            try:
+                started = time.perf_counter()
+                load()
+                timings[f"{model}_load"] = time.perf_counter() - started
+            except Exception as e:
+                logger.warning(f"⚠️ {model} 모델 미리 로드 실패, 작업 시 로드합니다: {e}")
+                continue
+
+            self.resident.add(model)
+
+            if settings.model_warmup_enabled:
+                try:
+                    timings[f"{model}_warmup"] = warmup()
+                except Exception as e:
+                    logger.warning(f"⚠️ {model} 워밍업 실패 (첫 작업에서 커널 준비): {e}")
+
+        return timings
+
+    def mark_baseline(self) -> int:
+        """
+        현재 RSS를 메모리 증가량 기준선으로 기록
+
+        Returns:
+            기준선 RSS (bytes)
+        """
+        gc.collect()
+        self.baseline_rss = psutil.Process(os.getpid()).memory_info().rss
+        return self.baseline_rss
+
+    def memory_growth(self) -> int:
+        """
+        기준선 대비 RSS 증가량 (bytes, 기준선 전에는 0)
+        """
+        if self.baseline_rss is None:
+            return 0
+        return psutil.Process(os.getpid()).memory_info().rss - self.baseline_rss
+
+
+# 전역 인스턴스 (프로세스별)
+model_residency = ModelResidency()
+
+
+def prepare_worker_process():
+    """모델 로드/워밍업 후 메모리 기준선 기록 및 시작 소요 시간 보고"""
+    started = time.perf_counter()
+    timings = model_residency.preload()
+    baseline = model_residency.mark_baseline()
+    elapsed = time.perf_counter() - started
+
+    if model_residency.resident:
+        detail = ", ".join(f"{name} {seconds:.1f}초" for name, seconds in timings.items())
+        logger.info(
+            f"🚀 모델 준비 완료 (pid {os.getpid()}): {detail} / 합계 {elapsed:.1f}초, "
+            f"RSS {baseline / 1024 / 1024:.0f}MB"
+        )
+
+
+@worker_process_init.connect
+def preload_models_in_child(**kwargs):
+    """prefork 자식 프로세스 시작 시 모델 준비 및 메모리 증가량 기준 교체 한도 설정"""
+    if not settings.get_preload_models():
+        return
+
+    prepare_worker_process()
+
+    if settings.worker_memory_growth_mb <= 0:
+        return
+
+    limit_bytes = model_residency.baseline_rss + settings.worker_memory_growth_mb * 1024 * 1024
+    set_child_memory_limit(limit_bytes // 1024)
+
+
+def set_child_memory_limit(limit_kib: int) -> bool:
+    """
+    현재 prefork 자식 프로세스의 billiard 메모리 한도 지정 (worker_process_init에서 호출)
+
+    billiard 공개 API가 없어 풀 Worker 객체(current_process()._target)의 max_memory_per_child를 직접 바꿉니다.
+    billiard는 작업 결과를 보낸 뒤 RSS(KiB)가 이 한도를 넘으면 자식 프로세스를 정상 교체(EX_RECYCLE)하며,
+    한도는 initializer 실행 후 작업 루프 시작 시 읽습니다. 속성이 없으면(prefork 풀 아님, billiard 내부 변경)
+    로그만 남기고 작업 수 기준 재시작(WORKER_MAX_TASKS_PER_CHILD)에 맡깁니다.
+
+    Args:
+        limit_kib: RSS 한도 (KiB)
+
+    Returns:
+        설정 여부
+    """
+    pool_worker = getattr(billiard_process.current_process(), "_target", None)
+    if pool_worker is None or not hasattr(pool_worker, "max_memory_per_child"):
+        logger.warning(
+            "⚠️ 메모리 증가량 기준 재시작을 설정할 수 없습니다 "
+            f"(billiard 풀 Worker 아님: {type(pool_worker).__name__})"
+        )
+        return False
+
+    pool_worker.max_memory_per_child = limit_kib
+    logger.info(f"♻️ Worker 메모리 한도 설정 (pid {os.getpid()}): RSS {limit_kib / 1024:.0f}MB")
+    return True
+
+
+@worker_ready.connect
+def preload_models_in_main(sender=None, **kwargs):
+    """solo/threads Worker는 메인 프로세스에서 작업을 실행하므로 여기서 한 번 준비"""
+    from celery.concurrency.prefork import TaskPool as PreforkPool
+
+    if not settings.get_preload_models() or isinstance(getattr(sender, "pool", None), PreforkPool):
+        return
+
+    prepare_worker_process()
+
+
+@task_postrun.connect
+def record_memory_growth(**kwargs):
+    """작업 후 RSS 증가량 기록 (한도 초과 시 prefork 자식은 결과 전송 후 교체)"""
+    if model_residency.baseline_rss is None:
+        return
+
+    growth = model_residency.memory_growth()
+    WORKER_MEMORY_GROWTH.set(growth)
+
+    limit = settings.worker_memory_growth_mb * 1024 * 1024
+    if limit > 0 and growth > limit and not model_residency.recycle_pending:
+        model_residency.recycle_pending = True
+        logger.warning(
+            f"♻️ Worker 메모리 증가 {growth / 1024 / 1024:.0f}MB "
+            f"(한도 {settings.worker_memory_growth_mb}MB), 프로세스 교체 예정"
+        )
@@ -1,12 +1,29 @@
 """
 오디오 처리 유틸리티
 """
+import io
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO, Tuple, Union
 
+import numpy as np
 import soundfile as sf
 from loguru import logger
 
+from app.utils.segments import SegmentList
+
+
+# 음성 사전 분석 프레임 길이 (초, 실제 길이는 가까운 2의 거듭제곱 샘플 수)
+SPEECH_FRAME_SEC = 0.032
+
+# 한 번에 FFT할 프레임 수 (긴 파일에서 스펙트럼 배열 메모리 제한)
+SPEECH_ANALYSIS_BLOCK_FRAMES = 4096
+
+# 이보다 짧은 음성 구간은 잡음(클릭 등)으로 간주 (Whisper VAD min_speech_duration_ms와 동일)
+SPEECH_MIN_SEC = 0.25
+
+# Whisper 입력 샘플레이트
+WHISPER_SAMPLE_RATE = 16000
+
 
 def get_audio_info(audio_path: Path) -> Tuple[int, int, float]:
     """
@@ -63,9 +80,88 @@ def is_stereo(audio_path: Path) -> bool:
     return channels == 2
 
 
+def read_audio(audio_path: Path) -> Tuple[np.ndarray, int]:
+    """
+    오디오를 float32 (프레임, 채널) 배열로 읽기
+
+    float64 기본값 대비 메모리가 절반이며, 채널별 처리는 channel_views()로 복사 없이 수행합니다.
+
+    Args:
+        audio_path: 오디오 파일 경로
+
+    Returns:
+        ((프레임 수, 채널 수) float32 배열, 샘플레이트)
+    """
+    data, samplerate = sf.read(str(audio_path), dtype="float32", always_2d=True)
+    return data, samplerate
+
+
+def channel_views(data: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    (프레임, 채널) 배열의 채널별 1차원 뷰 (stride 뷰, 복사 없음)
+
+    Args:
+        data: read_audio() 결과 배열
+
+    Returns:
+        (채널1, 채널2, ...) float32 뷰
+    """
+    return tuple(data[:, channel] for channel in range(data.shape[1]))
+
+
+def is_mono_like(data: np.ndarray, max_side_ratio: float = 0.05, stride: int = 4) -> bool:
+    """
+    두 채널이 거의 같은 Stereo 오디오인지 (Mono 녹음을 두 채널로 저장한 경우 등)
+
+    좌우 차이(side) RMS가 평균(mid) RMS의 max_side_ratio배 이하면 채널 구분이 없다고 봅니다.
+
+    Args:
+        data: (프레임, 채널) 배열
+        max_side_ratio: side/mid RMS 비율 상한
+        stride: 표본 간격 (프레임, 긴 파일도 일부 표본만 계산)
+
+    Returns:
+        Mono에 가까운 Stereo 여부 (채널이 2개가 아니면 False)
+    """
+    if data.ndim != 2 or data.shape[1] != 2 or len(data) == 0:
+        return False
+
+    left = data[::stride, 0]
+    right = data[::stride, 1]
+    mid_rms = np.sqrt(np.mean(np.square(left + right, dtype=np.float32)))
+    side_rms = np.sqrt(np.mean(np.square(left - right, dtype=np.float32)))
+    if mid_rms == 0:
+        return side_rms == 0
+    return bool(side_rms <= max_side_ratio * mid_rms)
+
+
+def read_stereo_channels(audio_path: Path) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    스테레오 파일을 한 번 읽어 좌우 채널 뷰 반환 (임시 파일 없음)
+
+    16kHz 파일이면 각 채널을 WhisperService.transcribe(audio=...)에 바로 전달할 수 있습니다.
+
+    Args:
+        audio_path: 스테레오 오디오 파일 경로
+
+    Returns:
+        (왼쪽 채널 뷰, 오른쪽 채널 뷰, 샘플레이트)
+    """
+    data, samplerate = read_audio(audio_path)
+
+    if data.shape[1] != 2:
+        raise ValueError("스테레오 파일이 아닙니다.")
+
+    left, right = channel_views(data)
+    return left, right, samplerate
+
+
 def split_stereo_channels(audio_path: Path, output_dir: Path) -> Tuple[Path, Path]:
     """
-    스테레오 파일을 좌우 채널로 분리
+    스테레오 파일을 좌우 채널 WAV 파일로 분리
+
+    파일이 꼭 필요한 경우에만 사용하세요. 메모리 처리에는 read_stereo_channels()가 디스크 I/O 없이
+    같은 데이터를 제공합니다.
 
     Args:
         audio_path: 스테레오 WAV 파일 경로
@@ -77,21 +173,16 @@ def split_stereo_channels(audio_path: Path, output_dir: Path) -> Tuple[Path, Pat
     logger.info(f"🔊 스테레오 채널 분리 시작: {audio_path.name}")
 
     try:
-        # 오디오 읽기
-        data, samplerate = sf.read(audio_path)
-
-        # 채널 수 확인
-        if data.ndim != 2 or data.shape[1] != 2:
-            raise ValueError("스테레오 파일이 아닙니다.")
+        left, right, samplerate = read_stereo_channels(audio_path)
 
         # 파일명 생성
         base_name = audio_path.stem
         left_path = output_dir / f"{base_name}_1ch.wav"
         right_path = output_dir / f"{base_name}_2ch.wav"
 
-        # 채널 분리 및 저장
-        sf.write(left_path, data[:, 0], samplerate)  # 왼쪽 채널 (화자1)
-        sf.write(right_path, data[:, 1], samplerate)  # 오른쪽 채널 (화자2)
+        # 채널 뷰를 그대로 저장
+        sf.write(left_path, left, samplerate)  # 왼쪽 채널 (화자1)
+        sf.write(right_path, right, samplerate)  # 오른쪽 채널 (화자2)
 
         logger.info(f"✅ 채널 분리 완료: {left_path.name}, {right_path.name}")
 
@@ -102,61 +193,308 @@ def split_stereo_channels(audio_path: Path, output_dir: Path) -> Tuple[Path, Pat
         raise
 
 
-def merge_transcripts_with_speaker_labels(
-    left_segments: list, right_segments: list
-) -> str:
+def warmup_waveform(duration_sec: float, samplerate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
     """
-    좌우 채널 STT 결과를 시간 순서대로 병합하여 화자 라벨링
+    모델 워밍업용 합성 오디오 (음성 대역 배음 + 약한 잡음, 매번 같은 값)
+
+    무음은 VAD/분할 단계에서 걸러져 추론 커널이 실행되지 않으므로 음성과 비슷한 신호를 사용합니다.
 
     Args:
-        left_segments: 왼쪽 채널 세그먼트 [(start, end, text), ...]
-        right_segments: 오른쪽 채널 세그먼트 [(start, end, text), ...]
+        duration_sec: 길이 (초)
+        samplerate: 샘플레이트
 
     Returns:
-        병합된 SRT 형식 문자열 (화자 라벨 포함)
+        (프레임,) float32 mono 배열
     """
-    logger.info("🔄 채널 병합 및 화자 라벨링 시작")
+    t = np.arange(int(duration_sec * samplerate), dtype=np.float32) / samplerate
+    pitch = 140.0 + 40.0 * np.sin(2 * np.pi * 3.0 * t)  # 음절 단위로 흔들리는 기본 주파수
+    phase = 2 * np.pi * np.cumsum(pitch) / samplerate
+    voiced = sum(np.sin(phase * k) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * t) ** 2
+
+    noise = np.random.default_rng(0).standard_normal(t.size)
+    waveform = 0.2 * envelope * voiced + 0.005 * noise
+    return waveform.astype(np.float32)
+
+
+def speech_frame_length(samplerate: int) -> int:
+    """분석 프레임 길이 (샘플, SPEECH_FRAME_SEC에 가까운 2의 거듭제곱으로 FFT 속도 확보)"""
+    return 1 << max(int(round(np.log2(SPEECH_FRAME_SEC * samplerate))), 0)
+
+
+def detect_speech_frames(
+    data: np.ndarray, samplerate: int, energy_db: float, max_flatness: float
+) -> np.ndarray:
+    """
+    프레임별 음성 여부 판정 (에너지 + 스펙트럼 평탄도)
+
+    프레임마다 에너지가 가장 큰 채널을 기준으로 판단하며 (Stereo 상담 녹취는 채널마다 화자가 다름),
+    에너지 기준을 넘은 프레임만 FFT로 평탄도(기하 평균 / 산술 평균, 잡음일수록 1)를 계산합니다.
 
-    # 모든 세그먼트를 시간 순서로 정렬
-    all_segments = []
+    Args:
+        data: (프레임, 채널) float32 배열 (read_audio() 결과)
+        samplerate: 샘플레이트
+        energy_db: 음성 최소 에너지 (dBFS)
+        max_flatness: 음성 최대 스펙트럼 평탄도
+
+    Returns:
+        프레임별 음성 여부 (길이 speech_frame_length() 기준)
+    """
+    frame = speech_frame_length(samplerate)
+    num_frames = data.shape[0] // frame
+    speech = np.zeros(num_frames, dtype=bool)
+    min_mean_square = 10 ** (energy_db / 10)
+
+    for block_start in range(0, num_frames, SPEECH_ANALYSIS_BLOCK_FRAMES):
+        block_end = min(block_start + SPEECH_ANALYSIS_BLOCK_FRAMES, num_frames)
+        # (프레임, 샘플, 채널) 뷰
+        frames = data[block_start * frame:block_end * frame].reshape(-1, frame, data.shape[1])
+
+        mean_square = np.mean(np.square(frames), axis=1)  # (프레임, 채널)
+        loudest = mean_square.argmax(axis=1)
+        candidates = np.flatnonzero(mean_square.max(axis=1) >= min_mean_square)
+        if len(candidates) == 0:
+            continue
+
+        power = np.abs(np.fft.rfft(frames[candidates, :, loudest[candidates]], axis=-1)) ** 2
+        power += 1e-12
+        flatness = np.exp(np.mean(np.log(power), axis=-1)) / np.mean(power, axis=-1)
+
+        speech[block_start + candidates[flatness < max_flatness]] = True
+
+    return speech
+
+
+def find_speech_regions(
+    data: np.ndarray,
+    samplerate: int,
+    energy_db: float = -45.0,
+    max_flatness: float = 0.5,
+    min_silence_sec: float = 3.0,
+    pad_sec: float = 0.5,
+) -> np.ndarray:
+    """
+    음성 구간 탐지 (NumPy 사전 분석)
+
+    에너지가 energy_db 이상이고 스펙트럼 평탄도가 max_flatness 미만인 프레임을 음성으로 보고,
+    앞뒤로 pad_sec만큼 넓힌 뒤 min_silence_sec보다 짧은 간격은 하나의 구간으로 합칩니다.
+
+    Args:
+        data: (프레임, 채널) float32 배열
+        samplerate: 샘플레이트
+        energy_db: 음성 최소 에너지 (dBFS)
+        max_flatness: 음성 최대 스펙트럼 평탄도
+        min_silence_sec: 제거할 최소 비음성 길이 (초)
+        pad_sec: 음성 구간 앞뒤 여유 (초)
+
+    Returns:
+        (구간 수, 2) 샘플 단위 [시작, 종료) 배열 (음성이 없으면 빈 배열)
+    """
+    speech = detect_speech_frames(data, samplerate, energy_db, max_flatness)
 
-    for start, end, text in left_segments:
-        all_segments.append((start, end, "[화자1] " + text))
+    # 연속 음성 프레임 구간 (프레임 단위)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+    starts, ends = edges[0::2], edges[1::2]
 
-    for start, end, text in right_segments:
-        all_segments.append((start, end, "[화자2] " + text))
+    frame = speech_frame_length(samplerate)
+    keep = (ends - starts) * frame >= SPEECH_MIN_SEC * samplerate
+    starts, ends = starts[keep] * frame, ends[keep] * frame
 
-    # 시작 시간 기준으로 정렬
-    all_segments.sort(key=lambda x: _timestamp_to_seconds(x[0]))
+    if len(starts) == 0:
+        return np.empty((0, 2), dtype=np.int64)
 
-    # SRT 형식으로 변환
-    srt_content = []
-    for idx, (start, end, text) in enumerate(all_segments, start=1):
-        srt_content.append(f"{idx}")
-        srt_content.append(f"{start} --> {end}")
-        srt_content.append(text)
-        srt_content.append("")  # 빈 줄
+    # 여유 구간 추가 후 짧은 간격 병합
+    pad = int(pad_sec * samplerate)
+    starts = np.maximum(starts - pad, 0)
+    ends = np.minimum(ends + pad, data.shape[0])
 
-    logger.info(f"✅ 채널 병합 완료: {len(all_segments)}개 세그먼트")
+    long_gaps = (starts[1:] - ends[:-1]) >= min_silence_sec * samplerate
+    starts = np.concatenate((starts[:1], starts[1:][long_gaps]))
+    ends = np.concatenate((ends[:-1][long_gaps], ends[-1:]))
 
-    return "\n".join(srt_content)
+    return np.stack((starts, ends), axis=1).astype(np.int64)
 
 
-def _timestamp_to_seconds(timestamp: str) -> float:
+class TrimmedAudio:
     """
-    SRT 타임스탬프를 초 단위로 변환
+    무음 구간을 잘라낸 오디오
+
+    잘라낸 오디오 기준 시각을 원본 파일 기준 시각으로 되돌리는 오프셋 정보를 함께 보관합니다.
+    """
+
+    @classmethod
+    def untrimmed(cls, data: np.ndarray, samplerate: int) -> "TrimmedAudio":
+        """
+        자르지 않은 오디오 (무음 제거 비활성화 시)
+
+        Args:
+            data: (프레임, 채널) float32 배열
+            samplerate: 샘플레이트
+
+        Returns:
+            전체를 하나의 구간으로 갖는 TrimmedAudio
+        """
+        return cls(data, samplerate, np.array([[0, len(data)]], dtype=np.int64), len(data))
+
+    def __init__(self, data: np.ndarray, samplerate: int, regions: np.ndarray, total_frames: int):
+        """
+        초기화
+
+        Args:
+            data: 음성 구간만 이어 붙인 (프레임, 채널) float32 배열
+            samplerate: 샘플레이트
+            regions: 원본 기준 음성 구간 (구간 수, 2) 샘플 단위
+            total_frames: 원본 전체 프레임 수
+        """
+        self.data = data
+        self.samplerate = samplerate
+        self.regions = regions
+        self.total_frames = total_frames
+
+        lengths = regions[:, 1] - regions[:, 0]
+        # 잘라낸 오디오에서 각 구간이 시작하는 위치 (샘플)
+        self._trimmed_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+
+    @property
+    def has_speech(self) -> bool:
+        """음성 구간 존재 여부"""
+        return len(self.regions) > 0
+
+    @property
+    def kept_sec(self) -> float:
+        """남은 오디오 길이 (초)"""
+        return len(self.data) / self.samplerate
+
+    @property
+    def removed_sec(self) -> float:
+        """제거된 길이 (초)"""
+        return (self.total_frames - len(self.data)) / self.samplerate
+
+    def to_original(self, seconds: np.ndarray, side: str = "right") -> np.ndarray:
+        """
+        잘라낸 오디오 기준 시각 → 원본 기준 시각
+
+        Args:
+            seconds: 잘라낸 오디오 기준 시각 배열 (초)
+            side: 구간 경계 시각 처리 ("right"=다음 구간 시작, "left"=이전 구간 끝)
+
+        Returns:
+            원본 기준 시각 배열 (초)
+        """
+        seconds = np.asarray(seconds, dtype=np.float64)
+        if not self.has_speech:
+            return seconds
+
+        trimmed_starts = self._trimmed_starts / self.samplerate
+        index = np.searchsorted(trimmed_starts, seconds, side=side) - 1
+        index = np.clip(index, 0, len(self.regions) - 1)
+
+        return self.regions[index, 0] / self.samplerate + (seconds - trimmed_starts[index])
+
+    def restore_segments(self, segments: SegmentList) -> SegmentList:
+        """
+        세그먼트 시각을 원본 기준으로 변환
+
+        Args:
+            segments: 잘라낸 오디오 기준 세그먼트 목록
+
+        Returns:
+            원본 기준 세그먼트 목록
+        """
+        return SegmentList(
+            self.to_original(segments.starts, side="right"),
+            self.to_original(segments.ends, side="left"),
+            segments.texts,
+            segments.speakers,
+            segments.speaker_labels,
+        )
+
+    def whisper_input(self) -> Union[np.ndarray, BinaryIO]:
+        """
+        WhisperService.transcribe(audio=...) 입력
+
+        16kHz면 mono float32 배열을, 아니면 리샘플링을 Whisper 디코더에 맡기도록
+        메모리 WAV 파일을 반환합니다.
+
+        Returns:
+            16kHz mono float32 배열 또는 메모리 WAV 파일
+        """
+        if self.samplerate == WHISPER_SAMPLE_RATE:
+            if self.data.shape[1] == 1:
+                return self.data[:, 0]
+            return self.data.mean(axis=1)
+
+        buffer = io.BytesIO()
+        sf.write(buffer, self.data, self.samplerate, format="WAV", subtype="FLOAT")
+        buffer.seek(0)
+        return buffer
+
+
+def trim_silence(
+    data: np.ndarray,
+    samplerate: int,
+    energy_db: float = -45.0,
+    max_flatness: float = 0.5,
+    min_silence_sec: float = 3.0,
+    pad_sec: float = 0.5,
+) -> TrimmedAudio:
+    """
+    긴 비음성 구간(무음, 잡음)을 잘라낸 오디오 생성
+
+    제거할 구간이 없으면 원본 배열(메모리 맵 포함)을 복사 없이 그대로 사용합니다.
+
+    Args:
+        data: (프레임, 채널) float32 배열 (read_audio() 또는 정규화 오디오 캐시)
+        samplerate: 샘플레이트
+        energy_db: 음성 최소 에너지 (dBFS)
+        max_flatness: 음성 최대 스펙트럼 평탄도
+        min_silence_sec: 제거할 최소 비음성 길이 (초)
+        pad_sec: 음성 구간 앞뒤 여유 (초)
+
+    Returns:
+        TrimmedAudio
+    """
+    regions = find_speech_regions(
+        data, samplerate, energy_db, max_flatness, min_silence_sec, pad_sec
+    )
+
+    if len(regions) == 1 and regions[0, 0] == 0 and regions[0, 1] == len(data):
+        trimmed = data
+    elif len(regions):
+        trimmed = np.concatenate([data[start:end] for start, end in regions])
+    else:
+        trimmed = data[:0]
+
+    result = TrimmedAudio(trimmed, samplerate, regions, len(data))
+    logger.info(
+        f"🔇 무음 분석: 음성 구간 {len(regions)}개, "
+        f"{result.kept_sec:.1f}초 / {len(data) / samplerate:.1f}초 (제거 {result.removed_sec:.1f}초)"
+    )
+
+    return result
+
+
+def merge_transcripts_with_speaker_labels(
+    left_segments: SegmentList, right_segments: SegmentList
+) -> SegmentList:
+    """
+    좌우 채널 STT 결과를 시간 순서대로 병합하여 화자 라벨링
 
     Args:
-        timestamp: SRT 타임스탬프 (HH:MM:SS,mmm)
+        left_segments: 왼쪽 채널 세그먼트 목록
+        right_segments: 오른쪽 채널 세그먼트 목록
 
     Returns:
-        초 단위 시간
+        병합된 세그먼트 목록 (왼쪽 = 화자1, 오른쪽 = 화자2, SRT 변환은 출력 시점에 수행)
     """
-    # HH:MM:SS,mmm 형식 파싱
-    time_part, ms_part = timestamp.split(",")
-    hours, minutes, seconds = map(int, time_part.split(":"))
-    milliseconds = int(ms_part)
+    logger.info("🔄 채널 병합 및 화자 라벨링 시작")
+
+    # 시작 시간 기준으로 정렬 (같은 시각이면 왼쪽 채널 먼저)
+    merged = SegmentList.concat_sorted([
+        left_segments.with_speaker("화자1"),
+        right_segments.with_speaker("화자2"),
+    ])
 
-    total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
+    logger.info(f"✅ 채널 병합 완료: {len(merged)}개 세그먼트")
 
-    return total_seconds
+    return merged
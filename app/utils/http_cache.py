@@ -0,0 +1,413 @@
+"""
+HTTP 응답 캐시 유틸리티
+- 결과 본문 LRU 캐시 (파일 변경 시 자동 무효화)
+- ETag/Last-Modified 조건부 요청 (304), 압축 방식별 ETag
+- gzip/br 압축, 바이트 범위(Range/If-Range) 응답
+"""
+import asyncio
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 사용
+    brotli = None
+
+
+class CachedBody:
+    """캐시된 응답 본문 (인코딩별 압축 결과를 함께 보관)"""
+
+    def __init__(self, body: bytes, version: Hashable):
+        """
+        초기화
+
+        Args:
+            body: 원본 본문
+            version: 본문 버전 (파일 mtime/size 등)
+        """
+        self.body = body
+        self.version = version
+        self.etag = '"' + hashlib.sha1(repr(version).encode("utf-8") + body).hexdigest() + '"'
+        self._encoded: Dict[str, bytes] = {}
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """
+        표현(압축 방식)별 ETag
+
+        압축 본문은 원본과 바이트가 다르므로 강한 ETag를 공유하지 않도록 접미사를 붙입니다.
+
+        Args:
+            encoding: "br", "gzip" 또는 None (원본)
+
+        Returns:
+            ETag (예: "abc...", "abc...-gzip")
+        """
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+    @property
+    def size(self) -> int:
+        """캐시가 차지하는 바이트 수"""
+        return len(self.body) + sum(len(data) for data in self._encoded.values())
+
+    def encoded(self, encoding: str) -> bytes:
+        """
+        압축된 본문 (인코딩별 최초 1회만 압축)
+
+        Args:
+            encoding: "br" 또는 "gzip"
+
+        Returns:
+            압축된 본문
+        """
+        if encoding not in self._encoded:
+            if encoding == "br":
+                self._encoded[encoding] = brotli.compress(self.body, quality=5)
+            else:
+                self._encoded[encoding] = gzip.compress(self.body, compresslevel=6)
+        return self._encoded[encoding]
+
+
+class ResponseBodyCache:
+    """
+    크기 제한 LRU 캐시
+
+    항목은 (key, version)으로 조회하며, version이 달라지면(파일 변경) 미스로 처리됩니다.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        초기화
+
+        Args:
+            max_bytes: 최대 캐시 크기 (bytes)
+        """
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Hashable, CachedBody]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[CachedBody]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+            version: 현재 버전
+
+        Returns:
+            캐시 항목 (없거나 버전이 다르면 None)
+        """
+        with self._lock:
+            cached = self._items.get(key)
+            if cached is None:
+                return None
+            if cached.version != version:
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return cached
+
+    def put(self, key: Hashable, version: Hashable, body: bytes) -> CachedBody:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            version: 본문 버전
+            body: 본문
+
+        Returns:
+            저장된 캐시 항목
+        """
+        cached = CachedBody(body, version)
+
+        with self._lock:
+            self._remove(key)
+            if len(body) <= self.max_bytes:
+                self._items[key] = cached
+                self._size += cached.size
+                self._evict()
+
+        return cached
+
+    def encoded(self, key: Hashable, cached: CachedBody, encoding: str) -> bytes:
+        """
+        압축 본문 조회 (새로 압축한 경우 캐시 크기에 반영)
+
+        Args:
+            key: 캐시 키
+            cached: 캐시 항목
+            encoding: "br" 또는 "gzip"
+
+        Returns:
+            압축된 본문
+        """
+        size_before = cached.size
+        data = cached.encoded(encoding)
+        added = cached.size - size_before
+
+        if added:
+            with self._lock:
+                if self._items.get(key) is cached:
+                    self._size += added
+                    self._evict()
+
+        return data
+
+    async def get_file(self, path: Path) -> Tuple[CachedBody, float]:
+        """
+        파일 본문 조회 (mtime/size 변경 시 다시 읽음, 파일 I/O는 스레드 풀에서 수행)
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            (캐시 항목, 수정 시각 timestamp)
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        stat = await asyncio.to_thread(path.stat)
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = ("file", str(path))
+
+        cached = self.get(key, version)
+        if cached is None:
+            cached = self.put(key, version, await asyncio.to_thread(path.read_bytes))
+
+        return cached, stat.st_mtime
+
+    def _remove(self, key: Hashable):
+        """항목 제거 (락 보유 상태에서 호출)"""
+        cached = self._items.pop(key, None)
+        if cached is not None:
+            self._size -= cached.size
+
+    def _evict(self):
+        """최대 크기 초과 시 오래된 항목부터 제거 (락 보유 상태에서 호출)"""
+        while self._size > self.max_bytes and self._items:
+            _, cached = self._items.popitem(last=False)
+            self._size -= cached.size
+
+
+def file_version(*paths: Path) -> Tuple[Tuple[int, int], ...]:
+    """
+    파일들의 버전 (mtime_ns, size)
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+    """
+    versions = []
+    for path in paths:
+        stat = path.stat()
+        versions.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(versions)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """
+    조건부 요청 판정 (If-None-Match 우선, 없으면 If-Modified-Since)
+
+    Args:
+        request: 요청
+        etag: 현재 ETag
+        last_modified: 현재 수정 시각 (timestamp)
+
+    Returns:
+        304 응답 가능 여부
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= int(since)
+
+    return False
+
+
+def if_range_matches(request: Request, etag: str, last_modified: float) -> bool:
+    """
+    If-Range 판정 (헤더가 없거나 현재 본문과 같으면 Range 적용, 다르면 전체 응답)
+
+    ETag는 강한 비교(약한 ETag는 일치하지 않음), 날짜는 Last-Modified와 정확히 같을 때만 일치합니다.
+
+    Args:
+        request: 요청
+        etag: 원본 본문 ETag
+        last_modified: 현재 수정 시각 (timestamp)
+
+    Returns:
+        Range 적용 여부
+    """
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+
+    if_range = if_range.strip()
+    if if_range.startswith(("W/", '"')):
+        return if_range == etag
+
+    try:
+        since = parsedate_to_datetime(if_range).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified) == int(since)
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding에서 사용할 압축 방식 선택 (br > gzip)
+
+    Args:
+        accept_encoding: Accept-Encoding 헤더 값
+
+    Returns:
+        "br", "gzip" 또는 None
+    """
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        accepted.add(name.strip().lower())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 바이트 범위 파싱
+
+    Args:
+        range_header: Range 헤더 값 (예: "bytes=0-1023", "bytes=-500")
+        size: 전체 크기
+
+    Returns:
+        (시작, 끝) (끝 포함), 만족할 수 없는 범위면 None
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 다중 범위인 경우
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError("지원하지 않는 Range 형식입니다.")
+
+    start_text, _, end_text = spec.strip().partition("-")
+
+    if start_text == "":
+        # 접미 범위: 마지막 N바이트
+        length = int(end_text)
+        if length <= 0 or size == 0:
+            return None
+        return max(size - length, 0), size - 1
+
+    start = int(start_text)
+    end = int(end_text) if end_text else size - 1
+    if start >= size or start > end:
+        return None
+
+    return start, min(end, size - 1)
+
+
+def build_cached_response(
+    request: Request,
+    cache: ResponseBodyCache,
+    cache_key: Hashable,
+    cached: CachedBody,
+    media_type: str,
+    last_modified: float,
+    compress_min_bytes: int,
+    allow_range: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    캐시 본문으로 조건부/압축/범위 응답 생성
+
+    ETag는 압축 방식별로 다르며(CachedBody.etag_for), Range는 If-Range가 일치할 때만 원본 기준으로 적용합니다.
+
+    Args:
+        request: 요청
+        cache: 압축 결과를 보관하는 캐시
+        cache_key: 캐시 키
+        cached: 캐시 항목
+        media_type: Content-Type
+        last_modified: 수정 시각 (timestamp)
+        compress_min_bytes: 압축 최소 크기 (bytes)
+        allow_range: Range 요청 허용 여부
+        headers: 추가 헤더
+
+    Returns:
+        200/206/304/416 응답
+    """
+    body = cached.body
+    byte_range = None
+    range_requested = False
+    range_header = request.headers.get("range") if allow_range else None
+
+    # If-Range가 현재 본문과 다르면 Range를 무시하고 전체 응답 (RFC 9110)
+    if range_header and if_range_matches(request, cached.etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, len(body))
+            range_requested = True
+        except ValueError:
+            # 해석할 수 없는 Range는 무시하고 전체 응답 (RFC 9110)
+            pass
+
+    # 부분 응답은 원본 기준이므로 압축하지 않음
+    encoding = None
+    if not range_requested and len(body) >= compress_min_bytes:
+        encoding = select_encoding(request.headers.get("accept-encoding", ""))
+
+    etag = cached.etag_for(encoding)
+    response_headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+        **(headers or {}),
+    }
+    if allow_range:
+        response_headers["Accept-Ranges"] = "bytes"
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=response_headers)
+
+    if range_requested and byte_range is None:
+        response_headers["Content-Range"] = f"bytes */{len(body)}"
+        return Response(status_code=416, headers=response_headers)
+
+    if byte_range is not None:
+        start, end = byte_range
+        response_headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        return Response(
+            content=body[start:end + 1],
+            status_code=206,
+            media_type=media_type,
+            headers=response_headers,
+        )
+
+    if encoding is not None:
+        body = cache.encoded(cache_key, cached, encoding)
+        response_headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type=media_type, headers=response_headers)
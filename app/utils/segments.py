@@ -0,0 +1,329 @@
+"""
+세그먼트 컨테이너
+STT/화자 분리 결과를 숫자 배열(시작/종료 초, 화자 번호) + 텍스트 목록으로 보관하고,
+SRT/VTT/텍스트/JSON 문자열은 출력 시점에 한 번만 생성
+"""
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# 화자 정보 없음 (Mono STT 결과 등)
+NO_SPEAKER = -1
+
+# SRT/텍스트 출력의 화자 라벨 접두어 ("[화자] 텍스트")
+SPEAKER_PREFIX = re.compile(r"^\[([^\]]+)\] (.*)$", re.DOTALL)
+
+
+def format_timestamps(seconds: np.ndarray, separator: str = ",") -> List[str]:
+    """
+    초 배열 → 타임스탬프 문자열 목록 (HH:MM:SS,mmm)
+
+    밀리초는 버림 처리합니다 (기존 SRT 출력과 동일).
+
+    Args:
+        seconds: 초 단위 배열
+        separator: 초/밀리초 구분자 (SRT ",", VTT ".")
+
+    Returns:
+        타임스탬프 문자열 목록
+    """
+    # 마이크로초 단위 반올림 후 밀리초 버림 (timedelta 변환과 같은 결과)
+    total_ms = np.rint(np.asarray(seconds, dtype=np.float64) * 1e6).astype(np.int64) // 1000
+    hours, rest = np.divmod(total_ms, 3_600_000)
+    minutes, rest = np.divmod(rest, 60_000)
+    secs, millis = np.divmod(rest, 1000)
+
+    return [
+        f"{h:02d}:{m:02d}:{s:02d}{separator}{ms:03d}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    ]
+
+
+def parse_timestamp(timestamp: str) -> float:
+    """
+    SRT/VTT 타임스탬프 → 초 (저장된 SRT를 다시 읽을 때 사용)
+
+    Args:
+        timestamp: HH:MM:SS,mmm 또는 HH:MM:SS.mmm
+
+    Returns:
+        초 단위 시간
+    """
+    time_part, _, ms_part = timestamp.strip().replace(".", ",").partition(",")
+    hours, minutes, seconds = map(int, time_part.split(":"))
+    return hours * 3600 + minutes * 60 + seconds + int(ms_part or 0) / 1000
+
+
+def extract_text_from_srt(srt_content: str) -> str:
+    """
+    SRT 형식에서 텍스트만 추출 (저장된 SRT 파일을 다시 읽을 때 사용, 재요약 작업 입력)
+
+    Args:
+        srt_content: SRT 형식 문자열
+
+    Returns:
+        플레인 텍스트
+    """
+    lines = srt_content.strip().split("\n")
+    text_lines = []
+
+    for line in lines:
+        line = line.strip()
+
+        # 번호, 타임스탬프, 빈 줄 제외
+        if line and not line.isdigit() and "-->" not in line:
+            text_lines.append(line)
+
+    return " ".join(text_lines)
+
+
+class SegmentList:
+    """
+    세그먼트 목록 (열 기반)
+
+    - starts/ends: float64 초 배열
+    - speakers: int32 화자 번호 배열 (NO_SPEAKER = 화자 없음)
+    - speaker_labels: 화자 번호 → 화자 ID (예: SPEAKER_00, 화자1)
+    - texts: 텍스트 목록
+    """
+
+    __slots__ = ("starts", "ends", "speakers", "speaker_labels", "texts")
+
+    def __init__(
+        self,
+        starts: Sequence[float],
+        ends: Sequence[float],
+        texts: List[str],
+        speakers: Optional[Sequence[int]] = None,
+        speaker_labels: Optional[List[str]] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            starts: 시작 시각 (초)
+            ends: 종료 시각 (초)
+            texts: 텍스트
+            speakers: 화자 번호 (None이면 모두 NO_SPEAKER)
+            speaker_labels: 화자 번호별 화자 ID
+        """
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        self.texts = list(texts)
+        if speakers is None:
+            self.speakers = np.full(len(self.texts), NO_SPEAKER, dtype=np.int32)
+        else:
+            self.speakers = np.asarray(speakers, dtype=np.int32)
+        self.speaker_labels = list(speaker_labels or [])
+
+    @classmethod
+    def from_tuples(cls, segments: Iterable[Tuple[float, float, str]]) -> "SegmentList":
+        """
+        [(시작(초), 종료(초), 텍스트), ...]에서 생성
+
+        Args:
+            segments: 세그먼트 튜플
+
+        Returns:
+            SegmentList
+        """
+        starts, ends, texts = [], [], []
+        for start, end, text in segments:
+            starts.append(start)
+            ends.append(end)
+            texts.append(text)
+        return cls(starts, ends, texts)
+
+    @classmethod
+    def from_srt(cls, srt_content: str) -> "SegmentList":
+        """
+        저장된 SRT 문자열에서 생성 ("[화자] 텍스트" 접두어는 화자로 복원)
+
+        Args:
+            srt_content: SRT 형식 문자열
+
+        Returns:
+            SegmentList
+        """
+        starts, ends, texts, speakers, labels = [], [], [], [], []
+        for block in re.split(r"\n\s*\n", srt_content.strip()):
+            lines = block.strip().split("\n")
+            timing = next((i for i, line in enumerate(lines) if "-->" in line), None)
+            if timing is None:
+                continue
+
+            start, _, end = lines[timing].partition("-->")
+            text = " ".join(line.strip() for line in lines[timing + 1:] if line.strip())
+
+            speaker = NO_SPEAKER
+            match = SPEAKER_PREFIX.match(text)
+            if match:
+                speaker = cls._label_index(labels, match.group(1))
+                text = match.group(2)
+
+            starts.append(parse_timestamp(start))
+            ends.append(parse_timestamp(end))
+            texts.append(text)
+            speakers.append(speaker)
+
+        return cls(starts, ends, texts, speakers, labels)
+
+    @classmethod
+    def concat_sorted(cls, parts: Sequence["SegmentList"]) -> "SegmentList":
+        """
+        여러 목록을 합친 뒤 시작 시각 순으로 정렬 (같은 시각이면 입력 순서 유지)
+
+        화자 번호는 합친 화자 ID 목록 기준으로 다시 매깁니다.
+
+        Args:
+            parts: 세그먼트 목록들
+
+        Returns:
+            병합된 SegmentList
+        """
+        labels: List[str] = []
+        speakers = []
+        for part in parts:
+            remap = np.array(
+                [cls._label_index(labels, label) for label in part.speaker_labels] or [0],
+                dtype=np.int32,
+            )
+            speakers.append(np.where(part.speakers >= 0, remap[np.clip(part.speakers, 0, None)], NO_SPEAKER))
+
+        starts = np.concatenate([part.starts for part in parts]) if parts else np.empty(0)
+        order = np.argsort(starts, kind="stable")
+        texts = [text for part in parts for text in part.texts]
+
+        return cls(
+            starts[order],
+            np.concatenate([part.ends for part in parts])[order] if parts else np.empty(0),
+            [texts[i] for i in order.tolist()],
+            np.concatenate(speakers)[order] if parts else None,
+            labels,
+        )
+
+    @staticmethod
+    def _label_index(labels: List[str], label: str) -> int:
+        """화자 ID 번호 (없으면 추가)"""
+        if label not in labels:
+            labels.append(label)
+        return labels.index(label)
+
+    def __len__(self) -> int:
+        """세그먼트 수"""
+        return len(self.texts)
+
+    def with_speaker(self, label: str) -> "SegmentList":
+        """
+        모든 세그먼트에 같은 화자 지정 (채널별 STT 결과 등)
+
+        Args:
+            label: 화자 ID
+
+        Returns:
+            새 SegmentList (배열은 공유)
+        """
+        return SegmentList(
+            self.starts, self.ends, self.texts, np.zeros(len(self), dtype=np.int32), [label]
+        )
+
+    def assign_speakers(
+        self,
+        turn_starts: Sequence[float],
+        turn_ends: Sequence[float],
+        turn_labels: Sequence[str],
+        unknown_label: str = "UNKNOWN",
+    ) -> "SegmentList":
+        """
+        화자 분리 구간으로 세그먼트 화자 지정 (세그먼트 중간 지점 기준)
+
+        중간 지점을 포함하는 구간 중 시작 시각 순으로 첫 구간의 화자를 사용하며,
+        없으면 unknown_label을 지정합니다. 세그먼트마다 전체 구간을 훑지 않도록
+        시작 시각 정렬 + 누적 최대 종료 시각에 대한 이진 탐색으로 O((N+M) log M)에 처리합니다.
+
+        Args:
+            turn_starts: 화자 구간 시작 (초)
+            turn_ends: 화자 구간 종료 (초)
+            turn_labels: 화자 구간 화자 ID
+            unknown_label: 해당 구간이 없을 때 화자 ID
+
+        Returns:
+            화자가 지정된 새 SegmentList
+        """
+        turn_starts = np.asarray(turn_starts, dtype=np.float64)
+        turn_ends = np.asarray(turn_ends, dtype=np.float64)
+        order = np.argsort(turn_starts, kind="stable")
+        turn_starts, turn_ends = turn_starts[order], turn_ends[order]
+
+        labels = sorted(set(turn_labels))
+        label_index = {label: i for i, label in enumerate(labels)}
+        turn_speakers = np.array([label_index[turn_labels[i]] for i in order.tolist()], dtype=np.int32)
+
+        mids = (self.starts + self.ends) / 2
+        unknown = len(labels)
+        speakers = np.full(len(mids), unknown, dtype=np.int32)
+
+        if len(turn_starts):
+            # 시작 <= mid 인 구간 수, 그 중 종료 >= mid 인 첫 구간 (누적 최대 종료 시각은 단조 증가)
+            candidates = np.searchsorted(turn_starts, mids, side="right")
+            first_covering = np.searchsorted(np.maximum.accumulate(turn_ends), mids, side="left")
+            found = first_covering < candidates
+            speakers[found] = turn_speakers[first_covering[found]]
+
+        if (speakers == unknown).any():
+            labels = labels + [unknown_label]
+
+        return SegmentList(self.starts, self.ends, self.texts, speakers, labels)
+
+    def _prefixed_texts(self) -> List[str]:
+        """화자 라벨이 붙은 텍스트 ("[화자] 텍스트", 화자 없으면 텍스트만)"""
+        if not self.speaker_labels:
+            return self.texts
+        prefixes = [f"[{label}] " for label in self.speaker_labels]
+        return [
+            prefixes[speaker] + text if speaker >= 0 else text
+            for speaker, text in zip(self.speakers.tolist(), self.texts)
+        ]
+
+    def to_srt(self) -> str:
+        """SRT 문자열"""
+        starts = format_timestamps(self.starts)
+        ends = format_timestamps(self.ends)
+        blocks = [
+            f"{idx}\n{start} --> {end}\n{text}\n"
+            for idx, (start, end, text) in enumerate(
+                zip(starts, ends, self._prefixed_texts()), start=1
+            )
+        ]
+        return "\n".join(blocks)
+
+    def to_vtt(self) -> str:
+        """WebVTT 문자열"""
+        starts = format_timestamps(self.starts, separator=".")
+        ends = format_timestamps(self.ends, separator=".")
+        blocks = [
+            f"{start} --> {end}\n{text}\n"
+            for start, end, text in zip(starts, ends, self._prefixed_texts())
+        ]
+        return "WEBVTT\n\n" + "\n".join(blocks)
+
+    def to_text(self) -> str:
+        """플레인 텍스트 (LLM 요약 입력, 화자 라벨 포함)"""
+        return " ".join(self._prefixed_texts())
+
+    def to_json(self) -> List[dict]:
+        """JSON 직렬화용 목록 [{"start", "end", "speaker", "text"}, ...]"""
+        labels = self.speaker_labels
+        return [
+            {
+                "start": round(start, 3),
+                "end": round(end, 3),
+                "speaker": labels[speaker] if speaker >= 0 else None,
+                "text": text,
+            }
+            for start, end, speaker, text in zip(
+                self.starts.tolist(), self.ends.tolist(), self.speakers.tolist(), self.texts
+            )
+        ]
@@ -0,0 +1,519 @@
+"""
+업로드 유틸리티
+업로드 파일을 메모리에 모으지 않고 청크 단위로 디스크에 기록
+"""
+import hashlib
+import os
+import struct
+import tarfile
+import uuid
+import zipfile
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, List, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+
+# WAV 헤더 검사 시 fmt 청크를 찾기 위해 읽는 최대 바이트 수
+WAV_HEADER_SCAN_LIMIT = 64 * 1024
+
+# 배치 업로드에서 허용하는 아카이브 확장자
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz")
+
+# 지원하는 WAV 포맷 코드 (PCM, IEEE float, WAVE_FORMAT_EXTENSIBLE)
+SUPPORTED_WAV_FORMATS = {0x0001, 0x0003, 0xFFFE}
+
+
+class UploadTooLargeError(Exception):
+    """업로드 최대 크기 초과"""
+
+
+class InvalidWavError(ValueError):
+    """WAV 형식이 아닌 업로드"""
+
+
+class MalformedUploadError(ValueError):
+    """multipart 본문 형식 오류 또는 업로드 파일 필드 누락"""
+
+
+class WavHeaderValidator:
+    """
+    스트리밍 WAV 헤더 검증기
+
+    청크가 들어올 때마다 feed()로 전달하면, fmt 청크까지 읽히는 즉시
+    형식을 판정합니다. 요청 스트림을 직접 파싱하는 단일 업로드(receive_wav_upload)에서는
+    잘못된 파일을 첫 수 KB만 받고 거부합니다. UploadFile을 읽는 경로(save_upload_stream)는
+    Starlette가 본문 전체를 임시 파일에 받아 둔 뒤에 검증합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._buffer = bytearray()
+        self.validated = False
+        self.channels: Optional[int] = None
+        self.sample_rate: Optional[int] = None
+
+    def feed(self, chunk: bytes):
+        """
+        업로드 청크 전달
+
+        Args:
+            chunk: 업로드 데이터 청크
+
+        Raises:
+            InvalidWavError: WAV 형식이 아닌 경우
+        """
+        if self.validated:
+            return
+
+        self._buffer.extend(chunk)
+        self._try_validate()
+
+        if not self.validated and len(self._buffer) >= WAV_HEADER_SCAN_LIMIT:
+            raise InvalidWavError("WAV fmt 청크를 찾을 수 없습니다.")
+
+    def finish(self):
+        """
+        업로드 종료 시 검증 완료 여부 확인
+
+        Raises:
+            InvalidWavError: 헤더가 완전하지 않은 경우
+        """
+        if not self.validated:
+            raise InvalidWavError("WAV 헤더가 불완전합니다.")
+
+    def _try_validate(self):
+        """버퍼에 쌓인 데이터로 RIFF/fmt 헤더 판정 (데이터가 부족하면 보류)"""
+        buffer = self._buffer
+
+        if len(buffer) < 12:
+            return
+
+        if bytes(buffer[0:4]) not in (b"RIFF", b"RF64") or bytes(buffer[8:12]) != b"WAVE":
+            raise InvalidWavError("RIFF/WAVE 헤더가 아닙니다.")
+
+        # 서브 청크 순회: [id(4) | size(4, LE) | data]
+        offset = 12
+        while offset + 8 <= len(buffer):
+            chunk_id = bytes(buffer[offset:offset + 4])
+            chunk_size = struct.unpack_from("<I", buffer, offset + 4)[0]
+
+            if chunk_id == b"fmt ":
+                if offset + 8 + 16 > len(buffer):
+                    return
+                audio_format, channels, sample_rate = struct.unpack_from(
+                    "<HHI", buffer, offset + 8
+                )
+
+                if audio_format not in SUPPORTED_WAV_FORMATS:
+                    raise InvalidWavError(f"지원하지 않는 WAV 포맷입니다: 0x{audio_format:04X}")
+                if channels not in (1, 2):
+                    raise InvalidWavError(
+                        f"지원하지 않는 채널 수입니다: {channels} (Mono 또는 Stereo만 가능)"
+                    )
+                if sample_rate == 0:
+                    raise InvalidWavError("샘플레이트가 0입니다.")
+
+                self.channels = channels
+                self.sample_rate = sample_rate
+                self.validated = True
+                self._buffer = bytearray()
+                return
+
+            if chunk_id == b"data":
+                raise InvalidWavError("fmt 청크보다 data 청크가 먼저 나타났습니다.")
+
+            # RIFF 청크는 2바이트 정렬
+            offset += 8 + chunk_size + (chunk_size & 1)
+
+
+async def save_upload_stream(
+    upload: UploadFile,
+    destination: Path,
+    max_bytes: int,
+    chunk_size: int = 1024 * 1024,
+    validate_wav: bool = True,
+) -> Tuple[int, str]:
+    """
+    업로드 파일을 청크 단위로 저장 (임시 파일 기록 후 원자적 rename)
+
+    - UploadFile은 Starlette form 파싱이 이미 본문 전체를 임시 파일에 받아 둔 상태이므로
+      WAV 검증은 업로드 완료 후에 이뤄지고 디스크에 두 번 기록됨 (배치 업로드 전용,
+      단일 업로드는 receive_wav_upload 사용)
+    - 메모리 사용량은 chunk_size로 제한
+    - 디스크 쓰기는 aiofiles 스레드 풀에서 수행 (이벤트 루프 블로킹 없음)
+    - 처리 중인 파일이 input/에 .wav로 보이지 않도록 .part 임시 파일 사용
+
+    Args:
+        upload: FastAPI UploadFile
+        destination: 최종 저장 경로
+        max_bytes: 최대 허용 크기 (bytes)
+        chunk_size: 읽기/쓰기 청크 크기 (bytes)
+        validate_wav: WAV 헤더 검증 여부 (아카이브 업로드 시 False)
+
+    Returns:
+        (파일 크기, SHA-256 hex)
+
+    Raises:
+        UploadTooLargeError: 최대 크기 초과
+        InvalidWavError: WAV 형식이 아닌 경우
+    """
+    temp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.part")
+    validator = WavHeaderValidator()
+    digest = hashlib.sha256()
+    total_size = 0
+
+    try:
+        async with aiofiles.open(temp_path, "wb") as f:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+
+                total_size += len(chunk)
+                if total_size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"파일 크기가 최대 허용 크기({max_bytes // (1024 * 1024)}MB)를 초과합니다."
+                    )
+
+                if validate_wav:
+                    validator.feed(chunk)
+                digest.update(chunk)
+                await f.write(chunk)
+
+        if validate_wav:
+            validator.finish()
+        await aiofiles.os.replace(temp_path, destination)
+
+    except BaseException:
+        try:
+            await aiofiles.os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return total_size, digest.hexdigest()
+
+
+class _MultipartEventCollector:
+    """
+    python-multipart 콜백을 (이벤트, 데이터) 목록으로 모으는 수집기
+
+    파서 콜백은 동기 함수이므로 디스크 쓰기는 여기서 하지 않고,
+    청크 하나를 파싱한 뒤 호출자가 이벤트 목록을 비동기로 처리합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self.events: List[Tuple[str, bytes]] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._disposition = b""
+
+    @property
+    def callbacks(self) -> dict:
+        """MultipartParser 콜백 딕셔너리"""
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def _on_part_begin(self):
+        self._disposition = b""
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        if self._header_field.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        self.events.append(("headers", self._disposition))
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        self.events.append(("data", data[start:end]))
+
+    def _on_part_end(self):
+        self.events.append(("end", b""))
+
+
+def _decode_header_value(value: bytes) -> str:
+    """multipart 헤더 값 디코딩 (UTF-8 실패 시 latin-1)"""
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return value.decode("latin-1")
+
+
+async def receive_wav_upload(
+    stream: AsyncIterator[bytes],
+    content_type: str,
+    destination_dir: Path,
+    max_bytes: int,
+    chunk_size: int = 1024 * 1024,
+    field_name: str = "file",
+) -> Tuple[Path, int, str]:
+    """
+    multipart 요청 스트림에서 WAV 파일 하나를 받아 저장 (임시 파일 기록 후 원자적 rename)
+
+    - Starlette form 파싱(본문 전체 스풀링)을 거치지 않고 request.stream()을 직접 파싱
+    - 도착한 청크마다 WAV 헤더/크기를 검사해 잘못된 파일은 첫 수 KB에서 중단
+    - 디스크에는 .part 임시 파일로 한 번만 기록 (chunk_size만큼 모아서 aiofiles로 쓰기)
+    - field_name 외의 필드는 버림
+
+    Args:
+        stream: 요청 본문 청크 스트림 (request.stream())
+        content_type: Content-Type 헤더 값 (boundary 포함)
+        destination_dir: 저장 디렉토리 (input/)
+        max_bytes: 최대 허용 크기 (bytes)
+        chunk_size: 디스크 쓰기 단위 (bytes)
+        field_name: 파일 필드 이름
+
+    Returns:
+        (저장 경로, 파일 크기, SHA-256 hex)
+
+    Raises:
+        MalformedUploadError: multipart 형식 오류, WAV가 아닌 파일명, 파일 필드 누락/중복
+        UploadTooLargeError: 최대 크기 초과
+        InvalidWavError: WAV 형식이 아닌 경우
+    """
+    media_type, params = parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if media_type != b"multipart/form-data" or not boundary:
+        raise MalformedUploadError("multipart/form-data 요청이 아닙니다.")
+
+    collector = _MultipartEventCollector()
+    parser = MultipartParser(boundary, collector.callbacks)
+
+    destination: Optional[Path] = None
+    temp_path: Optional[Path] = None
+    output = None
+    receiving = False
+    validator = WavHeaderValidator()
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    total_size = 0
+
+    async def handle_events():
+        nonlocal destination, temp_path, output, receiving, total_size
+
+        for event, data in collector.events:
+            if event == "headers":
+                _, options = parse_options_header(data)
+                filename = options.get(b"filename")
+                receiving = options.get(b"name") == field_name.encode() and filename is not None
+                if not receiving:
+                    continue
+                if destination is not None:
+                    raise MalformedUploadError(f"{field_name} 필드에는 파일 하나만 업로드할 수 있습니다.")
+
+                name = Path(_decode_header_value(filename)).name
+                if not name.lower().endswith(".wav") or name.startswith("."):
+                    raise MalformedUploadError("WAV 파일만 업로드 가능합니다.")
+
+                destination = destination_dir / name
+                temp_path = destination.with_name(f".{name}.{uuid.uuid4().hex}.part")
+                output = await aiofiles.open(temp_path, "wb")
+
+            elif event == "data" and receiving:
+                total_size += len(data)
+                if total_size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"파일 크기가 최대 허용 크기({max_bytes // (1024 * 1024)}MB)를 초과합니다."
+                    )
+
+                validator.feed(data)
+                digest.update(data)
+                buffer.extend(data)
+                if len(buffer) >= chunk_size:
+                    await output.write(bytes(buffer))
+                    buffer.clear()
+
+            elif event == "end" and receiving:
+                validator.finish()
+                if buffer:
+                    await output.write(bytes(buffer))
+                    buffer.clear()
+                await output.close()
+                output = None
+                receiving = False
+
+        collector.events.clear()
+
+    try:
+        async for chunk in stream:
+            try:
+                parser.write(chunk)
+            except MultipartParseError as e:
+                raise MalformedUploadError(f"multipart 본문을 해석할 수 없습니다: {e}")
+            await handle_events()
+
+        try:
+            parser.finalize()
+        except MultipartParseError as e:
+            raise MalformedUploadError(f"multipart 본문을 해석할 수 없습니다: {e}")
+        await handle_events()
+
+        if destination is None or output is not None:
+            raise MalformedUploadError(f"{field_name} 필드에 업로드할 파일이 없습니다.")
+
+        await aiofiles.os.replace(temp_path, destination)
+
+    except BaseException:
+        if output is not None:
+            await output.close()
+        if temp_path is not None:
+            try:
+                await aiofiles.os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+        raise
+
+    return destination, total_size, digest.hexdigest()
+
+
+def is_archive_filename(filename: str) -> bool:
+    """배치 업로드 아카이브 파일명 여부"""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _copy_wav_member(
+    source: BinaryIO,
+    destination: Path,
+    chunk_size: int,
+    max_bytes: int,
+) -> Tuple[int, str]:
+    """
+    아카이브 멤버를 WAV 검증과 함께 저장 (임시 파일 → 원자적 rename)
+
+    압축 해제 크기는 아카이브 헤더 값을 믿지 않고 실제로 읽은 바이트로 셉니다 (압축 폭탄 방지).
+
+    Returns:
+        (파일 크기, SHA-256 hex)
+
+    Raises:
+        UploadTooLargeError: 압축 해제 크기가 max_bytes 초과
+        InvalidWavError: WAV 형식이 아닌 경우
+    """
+    temp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.part")
+    validator = WavHeaderValidator()
+    digest = hashlib.sha256()
+    total_size = 0
+
+    try:
+        with open(temp_path, "wb") as f:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+
+                total_size += len(chunk)
+                if total_size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"압축 해제 크기가 최대 허용 크기({max_bytes // (1024 * 1024)}MB)를 초과합니다."
+                    )
+
+                if not validator.validated:
+                    validator.feed(chunk)
+                digest.update(chunk)
+                f.write(chunk)
+
+        validator.finish()
+        os.replace(temp_path, destination)
+
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return total_size, digest.hexdigest()
+
+
+def extract_wav_archive(
+    archive_path: Path,
+    destination_dir: Path,
+    max_files: int,
+    chunk_size: int = 1024 * 1024,
+    max_bytes: int = 500 * 1024 * 1024,
+    seen_names: Optional[set] = None,
+) -> Tuple[List[Tuple[Path, int, str]], List[Tuple[str, str]]]:
+    """
+    zip/tar 아카이브에서 WAV 파일만 추출 (블로킹, 스레드 풀에서 호출)
+
+    - 디렉토리 구조는 무시하고 파일명만 사용 (경로 조작 방지)
+    - 멤버는 스트리밍으로 복사되어 전체를 메모리에 올리지 않음
+    - 압축 해제 크기가 max_bytes를 넘는 멤버는 복사 중단 후 거부
+
+    Args:
+        archive_path: 아카이브 파일 경로
+        destination_dir: 추출 디렉토리 (input/)
+        max_files: 최대 파일 수
+        chunk_size: 복사 청크 크기 (bytes)
+        max_bytes: 멤버별 최대 압축 해제 크기 (bytes, UPLOAD_MAX_SIZE_MB)
+        seen_names: 배치에서 이미 사용한 파일명 (추출한 파일명이 추가됨, None이면 이 아카이브 안에서만 검사)
+
+    Returns:
+        ([(저장 경로, 크기, SHA-256), ...], [(파일명, 거부 사유), ...])
+    """
+    accepted: List[Tuple[Path, int, str]] = []
+    rejected: List[Tuple[str, str]] = []
+    if seen_names is None:
+        seen_names = set()
+
+    def handle_member(name: str, open_member):
+        filename = Path(name).name
+
+        if not filename.lower().endswith(".wav") or filename.startswith("."):
+            return
+        if filename in seen_names:
+            rejected.append((name, "배치 내 중복 파일명"))
+            return
+        if len(accepted) >= max_files:
+            rejected.append((name, f"배치 최대 파일 수({max_files}) 초과"))
+            return
+
+        seen_names.add(filename)
+        destination = destination_dir / filename
+
+        try:
+            with open_member() as source:
+                size, content_hash = _copy_wav_member(source, destination, chunk_size, max_bytes)
+            accepted.append((destination, size, content_hash))
+        except InvalidWavError as e:
+            rejected.append((name, f"유효하지 않은 WAV 파일입니다: {str(e)}"))
+        except UploadTooLargeError as e:
+            rejected.append((name, str(e)))
+
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                handle_member(info.filename, lambda info=info: archive.open(info))
+
+    elif tarfile.is_tarfile(archive_path):
+        # 스트림 모드(r|*)로 순차 읽기: 멤버 목록을 미리 메모리에 올리지 않음
+        with tarfile.open(archive_path, mode="r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                handle_member(member.name, lambda member=member: archive.extractfile(member))
+
+    else:
+        raise ValueError("지원하지 않는 아카이브 형식입니다 (zip 또는 tar만 가능).")
+
+    return accepted, rejected
@@ -0,0 +1,4 @@
+"""
+오프라인 성능 벤치마크 / 부하 테스트 도구
+GPU, 실제 모델, Ollama 없이 합성 오디오와 대체 백엔드로 처리 경로를 측정
+"""
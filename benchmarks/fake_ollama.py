@@ -0,0 +1,168 @@
+"""
+Ollama 대체 서버 (부하 테스트용)
+/api/generate를 설정된 지연/생성 속도로 흉내 내며, 스트리밍(NDJSON) 응답도 지원
+
+사용법:
+    python -m benchmarks.fake_ollama --port 11535 --latency 0.5 --tokens-per-second 40
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class FakeOllamaConfig:
+    """대체 서버 동작 설정"""
+
+    def __init__(
+        self,
+        model: str = "midm-2.0:base",
+        latency_sec: float = 0.5,
+        tokens_per_second: float = 40.0,
+        output_tokens: int = 200,
+        error_rate: float = 0.0,
+    ):
+        """
+        초기화
+
+        Args:
+            model: 보고할 모델 이름
+            latency_sec: 첫 토큰까지 지연 (프롬프트 처리 시간)
+            tokens_per_second: 생성 속도
+            output_tokens: 응답 토큰 수
+            error_rate: 500 응답 비율 (0~1)
+        """
+        self.model = model
+        self.latency_sec = latency_sec
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.error_rate = error_rate
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Ollama REST API 일부 (/api/tags, /api/ps, /api/generate)"""
+
+    config = FakeOllamaConfig()
+
+    def log_message(self, format, *args):
+        """요청 로그 생략"""
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        """모델 목록 (헬스 체크용)"""
+        if self.path in ("/api/tags", "/api/ps"):
+            self._send_json(200, {"models": [{"name": self.config.model}]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        """텍스트 생성"""
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        config = self.config
+
+        if config.error_rate and random.random() < config.error_rate:
+            self._send_json(500, {"error": "injected failure"})
+            return
+
+        tokens = config.output_tokens
+        token_interval = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+        prompt_tokens = len(request.get("prompt", "")) // 2
+
+        time.sleep(config.latency_sec)
+        started = time.perf_counter()
+
+        final = {
+            "model": config.model,
+            "done": True,
+            "prompt_eval_count": prompt_tokens,
+            "eval_count": tokens,
+        }
+
+        if request.get("stream", True):
+            # NDJSON 스트리밍: 토큰마다 한 줄, 연결 종료로 응답 끝을 알림
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            for i in range(tokens):
+                time.sleep(token_interval)
+                line = {"model": config.model, "response": f"토큰{i} ", "done": False}
+                self.wfile.write(json.dumps(line, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            final["response"] = ""
+            final["eval_duration"] = int((time.perf_counter() - started) * 1e9)
+            self.wfile.write(json.dumps(final).encode("utf-8") + b"\n")
+            return
+
+        time.sleep(tokens * token_interval)
+        final["response"] = "[요약] 대체 서버 응답 " + "내용 " * min(tokens, 50)
+        final["eval_duration"] = int((time.perf_counter() - started) * 1e9)
+        self._send_json(200, final)
+
+
+def start_fake_ollama(
+    host: str, port: int, config: FakeOllamaConfig
+) -> ThreadingHTTPServer:
+    """
+    대체 서버를 백그라운드 스레드로 시작
+
+    Returns:
+        서버 (종료 시 shutdown() 호출)
+    """
+    handler = type("ConfiguredFakeOllamaHandler", (FakeOllamaHandler,), {"config": config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-ollama", daemon=True).start()
+    return server
+
+
+def add_arguments(parser: argparse.ArgumentParser, prefix: Optional[str] = None):
+    """대체 서버 설정 CLI 인자 추가 (load_test에서 재사용)"""
+    p = f"--{prefix}-" if prefix else "--"
+    parser.add_argument(f"{p}latency", type=float, default=0.5, help="첫 토큰까지 지연 (초)")
+    parser.add_argument(f"{p}tokens-per-second", type=float, default=40.0, help="생성 속도")
+    parser.add_argument(f"{p}output-tokens", type=int, default=200, help="응답 토큰 수")
+    parser.add_argument(f"{p}error-rate", type=float, default=0.0, help="500 응답 비율")
+
+
+def main():
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Ollama 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11535)
+    parser.add_argument("--model", default="midm-2.0:base")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    config = FakeOllamaConfig(
+        model=args.model,
+        latency_sec=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        output_tokens=args.output_tokens,
+        error_rate=args.error_rate,
+    )
+    server = start_fake_ollama(args.host, args.port, config)
+    print(f"🤖 Ollama 대체 서버 시작: http://{args.host}:{args.port}")
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+모델/LLM 대체 백엔드
+실제 서비스 클래스를 상속해 모델 로드/추론만 결정적 계산 + 설정된 비용(sleep)으로 대체합니다.
+SRT 변환, 병합, 언로드 흐름 등 나머지 로직은 실제 코드를 그대로 사용합니다.
+"""
+import time
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+import numpy as np
+import soundfile as sf
+
+from app.services import diarization_service, whisper_service
+from app.services.diarization_service import DiarizationService
+from app.services.whisper_service import WhisperService
+from app.utils.audio_utils import WHISPER_SAMPLE_RATE, get_audio_info, read_audio, warmup_waveform
+from app.utils.segments import SegmentList
+from benchmarks.synthetic_audio import SAMPLE_PHRASES
+
+
+# 화자 분리 프레임 길이 (초)
+DIARIZATION_FRAME_SEC = 0.1
+
+# 발화로 판정하는 프레임 RMS 하한
+SPEECH_RMS_THRESHOLD = 0.02
+
+
+class FakeWhisperService(WhisperService):
+    """Whisper 대체: 오디오 길이에 비례한 비용 후 고정 간격 세그먼트 생성"""
+
+    def __init__(
+        self,
+        seconds_per_audio_second: float = 0.0,
+        load_seconds: float = 0.0,
+        segment_sec: float = 2.5,
+    ):
+        """
+        초기화
+
+        Args:
+            seconds_per_audio_second: 오디오 1초당 처리 시간 (실시간 배율)
+            load_seconds: 모델 로드 시간
+            segment_sec: 세그먼트 길이 (초)
+        """
+        super().__init__()
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self.load_seconds = load_seconds
+        self.segment_sec = segment_sec
+
+    def load_model(self):
+        """모델 로드 대체"""
+        if self._model_loaded:
+            return
+        time.sleep(self.load_seconds)
+        self._model_loaded = True
+
+    def unload_model(self):
+        """언로드 대체 (실제 흐름처럼 다음 작업에서 다시 로드)"""
+        self._model_loaded = False
+
+    def warmup(self) -> float:
+        """워밍업 대체 (합성 오디오 1회 처리 비용)"""
+        started = time.perf_counter()
+        self.transcribe(
+            Path("warmup.wav"), audio=warmup_waveform(whisper_service.WARMUP_AUDIO_SEC)
+        )
+        return time.perf_counter() - started
+
+    def transcribe(
+        self,
+        audio_path: Path,
+        language: str = "ko",
+        audio: Optional[Union[np.ndarray, BinaryIO]] = None,
+        tier=None,
+    ) -> SegmentList:
+        """
+        STT 대체 (품질 단계는 무시)
+
+        Returns:
+            세그먼트 목록
+        """
+        if not self._model_loaded:
+            self.load_model()
+
+        if audio is None:
+            _, _, duration = get_audio_info(audio_path)
+        elif isinstance(audio, np.ndarray):
+            duration = len(audio) / WHISPER_SAMPLE_RATE
+        else:
+            duration = sf.info(audio).duration
+            audio.seek(0)
+        time.sleep(duration * self.seconds_per_audio_second)
+
+        starts = np.arange(0.0, duration, self.segment_sec)
+        return SegmentList(
+            starts,
+            np.minimum(starts + self.segment_sec - 0.1, duration),
+            [SAMPLE_PHRASES[i % len(SAMPLE_PHRASES)] for i in range(len(starts))],
+        )
+
+
+class FakeDiarizationService(DiarizationService):
+    """화자 분리 대체: 실제 디코딩 후 채널별 프레임 에너지로 화자 턴 결정"""
+
+    def __init__(self, seconds_per_audio_second: float = 0.0, load_seconds: float = 0.0):
+        """
+        초기화
+
+        Args:
+            seconds_per_audio_second: 오디오 1초당 처리 시간 (실시간 배율)
+            load_seconds: 모델 로드 시간
+        """
+        super().__init__(hf_token="fake")
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self.load_seconds = load_seconds
+
+    def load_pipeline(self):
+        """모델 로드 대체"""
+        if self._pipeline_loaded:
+            return
+        time.sleep(self.load_seconds)
+        self._pipeline_loaded = True
+
+    def unload_pipeline(self):
+        """언로드 대체"""
+        self._pipeline_loaded = False
+
+    def warmup(self) -> float:
+        """워밍업 대체 (합성 오디오 1회 처리 비용)"""
+        started = time.perf_counter()
+        waveform = warmup_waveform(diarization_service.WARMUP_AUDIO_SEC)
+        self.diarize(Path("warmup.wav"), audio=(waveform[:, np.newaxis], WHISPER_SAMPLE_RATE))
+        return time.perf_counter() - started
+
+    def diarize(
+        self,
+        audio_path: Path,
+        num_speakers: Optional[int] = None,
+        min_speakers: Optional[int] = None,
+        max_speakers: Optional[int] = None,
+        audio: Optional[Tuple[np.ndarray, int]] = None,
+    ) -> List[Tuple[float, float, str]]:
+        """
+        화자 분리 대체
+
+        Stereo는 에너지가 큰 채널을 화자로, Mono는 발화 구간마다 화자를 교대로 지정합니다.
+
+        Returns:
+            [(시작시간(초), 종료시간(초), 화자ID), ...]
+        """
+        if not self._pipeline_loaded:
+            self.load_pipeline()
+
+        waveform, sample_rate = audio if audio is not None else read_audio(audio_path)
+        duration = len(waveform) / sample_rate
+        time.sleep(duration * self.seconds_per_audio_second)
+
+        frame = int(DIARIZATION_FRAME_SEC * sample_rate)
+        num_frames = len(waveform) // frame
+        frames = waveform[:num_frames * frame].reshape(num_frames, frame, -1)
+        rms = np.sqrt(np.mean(frames ** 2, axis=1))  # (프레임, 채널)
+
+        active = rms.max(axis=1) > SPEECH_RMS_THRESHOLD
+        if waveform.shape[1] > 1:
+            labels = np.where(active, rms.argmax(axis=1), -1)
+        else:
+            # 발화 구간(연속 active 프레임)마다 화자 교대
+            run_starts = active & ~np.concatenate(([False], active[:-1]))
+            labels = np.where(active, (np.cumsum(run_starts) - 1) % 2, -1)
+
+        # 같은 라벨이 이어지는 구간을 하나의 턴으로 묶음
+        boundaries = np.flatnonzero(np.diff(labels)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [num_frames]))
+
+        segments = [
+            (
+                round(float(start * DIARIZATION_FRAME_SEC), 3),
+                round(float(end * DIARIZATION_FRAME_SEC), 3),
+                f"SPEAKER_{int(labels[start]):02d}",
+            )
+            for start, end in zip(starts, ends)
+            if num_frames and labels[start] >= 0
+        ]
+
+        return segments
+
+
+def make_fake_summarize(latency_sec: float = 0.0):
+    """
+    OllamaService.summarize_sync 대체 함수 생성
+
+    Args:
+        latency_sec: 응답 지연 (초)
+
+    Returns:
+        summarize_sync와 같은 시그니처의 함수
+    """
+    def summarize_sync(transcript: str, prompt_template=None, dictionary_content=None) -> str:
+        time.sleep(latency_sec)
+        return f"[요약] {transcript[:200]}"
+
+    return summarize_sync
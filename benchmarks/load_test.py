@@ -0,0 +1,408 @@
+"""
+API + Redis + Celery 종단 부하 테스트
+동시 업로드와 상태 폴링으로 처리량, 소요 시간 분위수, 큐 대기 시간, 에러율을 측정
+
+--start-stack을 지정하면 Ollama 대체 서버, API(uvicorn), 대체 모델 Worker를 임시 디렉토리로
+격리해 직접 띄웁니다 (Redis는 로컬에서 실행 중이어야 하며 --redis-url로 지정).
+
+사용법:
+    python -m benchmarks.load_test --start-stack --uploads 200 --concurrency 50 --workers 2
+    python -m benchmarks.load_test --api-url http://localhost:8000 --uploads 500 --concurrency 500
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks import fake_ollama
+from benchmarks.synthetic_audio import write_synthetic_wav
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# 종료 상태
+TERMINAL_STATUSES = {"completed", "failed"}
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """백분위수 (선형 보간, 값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latencies(values: List[float]) -> dict:
+    """지연 시간 요약 (초)"""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": round(statistics.fmean(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(max(values), 3),
+    }
+
+
+class LocalStack:
+    """부하 테스트용 로컬 서비스 (Ollama 대체 서버 + API + Worker)"""
+
+    def __init__(self, args: argparse.Namespace, work_dir: Path):
+        """
+        초기화
+
+        Args:
+            args: CLI 인자
+            work_dir: 데이터/로그 임시 디렉토리
+        """
+        self.args = args
+        self.work_dir = work_dir
+        self.processes: List[subprocess.Popen] = []
+        self.ollama_server = None
+
+    def environment(self) -> Dict[str, str]:
+        """API/Worker 공통 환경 변수 (경로 격리 + 대체 백엔드 설정)"""
+        args = self.args
+        data_dir = self.work_dir / "data"
+        env = dict(os.environ)
+        env.update({
+            "PYTHONPATH": str(REPO_ROOT),
+            "INPUT_DIR": str(data_dir / "input"),
+            "OUTPUT_DIR": str(data_dir / "output"),
+            "PROCESSED_DIR": str(data_dir / "processed"),
+            "ERROR_DIR": str(data_dir / "error"),
+            "LOG_DIR": str(self.work_dir / "logs"),
+            "CONFIG_DIR": str(self.work_dir / "config"),
+            "TASK_DB_PATH": str(data_dir / "tasks.db"),
+            "AUDIO_CACHE_DIR": str(data_dir / "cache" / "audio"),
+            "REDIS_URL": args.redis_url,
+            "CELERY_BROKER_URL": args.redis_url,
+            "CELERY_RESULT_BACKEND": args.redis_url,
+            "OLLAMA_BASE_URL": f"http://127.0.0.1:{args.ollama_port}",
+            "HF_TOKEN": "fake",
+            "WORKER_METRICS_PORT": "0",
+            "HEALTH_CHECK_INTERVAL_SEC": "1",
+            "FAKE_WHISPER_RTF": str(args.whisper_rtf),
+            "FAKE_DIARIZATION_RTF": str(args.diarization_rtf),
+            "FAKE_WHISPER_LOAD_SEC": str(args.whisper_load_sec),
+            "FAKE_DIARIZATION_LOAD_SEC": str(args.diarization_load_sec),
+        })
+        return env
+
+    def start(self):
+        """서비스 시작 후 API 헬스 체크 통과까지 대기"""
+        args = self.args
+        config = fake_ollama.FakeOllamaConfig(
+            latency_sec=args.ollama_latency,
+            tokens_per_second=args.ollama_tokens_per_second,
+            output_tokens=args.ollama_output_tokens,
+            error_rate=args.ollama_error_rate,
+        )
+        self.ollama_server = fake_ollama.start_fake_ollama("127.0.0.1", args.ollama_port, config)
+        print(f"🤖 Ollama 대체 서버: http://127.0.0.1:{args.ollama_port}")
+
+        # 요약 설정 저장소가 버전 스냅샷을 만들므로 설정 디렉토리 복사본 사용
+        shutil.copytree(REPO_ROOT / "config", self.work_dir / "config", dirs_exist_ok=True)
+
+        env = self.environment()
+        log_dir = self.work_dir / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        port = args.api_url.rsplit(":", 1)[-1].rstrip("/")
+
+        self._spawn(
+            [sys.executable, "-m", "uvicorn", "app.main:app",
+             "--host", "127.0.0.1", "--port", port, "--log-level", "warning"],
+            env, log_dir / "api.log",
+        )
+        self._spawn(
+            [sys.executable, "-m", "benchmarks.load_worker",
+             "--concurrency", str(args.workers)],
+            env, log_dir / "worker.log",
+        )
+        print(f"🚀 API/Worker 시작 (로그: {log_dir})")
+
+        self._wait_for_api(timeout_sec=60)
+
+    def _spawn(self, command: List[str], env: Dict[str, str], log_path: Path):
+        log_file = open(log_path, "wb")
+        self.processes.append(
+            subprocess.Popen(command, env=env, cwd=REPO_ROOT, stdout=log_file, stderr=log_file)
+        )
+
+    def _wait_for_api(self, timeout_sec: float):
+        deadline = time.monotonic() + timeout_sec
+        while time.monotonic() < deadline:
+            for process in self.processes:
+                if process.poll() is not None:
+                    raise RuntimeError(f"서비스가 종료되었습니다: {process.args}")
+            try:
+                response = httpx.get(f"{self.args.api_url}/api/v1/health", timeout=2.0)
+                if response.status_code == 200:
+                    print("✅ API 헬스 체크 통과")
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.5)
+        raise TimeoutError("API가 제한 시간 내에 준비되지 않았습니다.")
+
+    def stop(self):
+        """서비스 종료"""
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self.ollama_server is not None:
+            self.ollama_server.shutdown()
+
+
+def build_fixtures(fixture_dir: Path, audio_seconds: List[int]) -> List[tuple]:
+    """
+    업로드용 합성 WAV 생성 (길이별 Mono/Stereo)
+
+    Returns:
+        [(WAV bytes, 오디오 길이(초), 채널 수), ...]
+    """
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    fixtures = []
+    for seconds in audio_seconds:
+        for channels in (1, 2):
+            path = fixture_dir / f"load_{channels}ch_{seconds}s.wav"
+            write_synthetic_wav(path, seconds, channels=channels, seed=seconds)
+            fixtures.append((path.read_bytes(), seconds, channels))
+    return fixtures
+
+
+async def upload_and_wait(
+    client: httpx.AsyncClient,
+    index: int,
+    fixture: tuple,
+    run_id: str,
+    args: argparse.Namespace,
+    semaphore: asyncio.Semaphore,
+) -> dict:
+    """
+    업로드 1건 + 종료까지 상태 폴링
+
+    Returns:
+        {"task_id", "audio_seconds", "upload_sec", "turnaround_sec", "status", "error"}
+    """
+    data, audio_seconds, channels = fixture
+    record = {
+        "task_id": None,
+        "audio_seconds": audio_seconds,
+        "channels": channels,
+        "upload_sec": None,
+        "turnaround_sec": None,
+        "status": None,
+        "error": None,
+    }
+
+    async with semaphore:
+        started = time.perf_counter()
+        filename = f"load-{run_id}-{index:05d}.wav"
+
+        try:
+            response = await client.post(
+                "/api/v1/upload", files={"file": (filename, data, "audio/wav")}
+            )
+        except httpx.HTTPError as e:
+            record["status"], record["error"] = "upload_error", type(e).__name__
+            return record
+
+        record["upload_sec"] = time.perf_counter() - started
+        if response.status_code != 200:
+            record["status"], record["error"] = "upload_error", f"HTTP {response.status_code}"
+            return record
+
+        record["task_id"] = response.json()["task_id"]
+        deadline = started + args.task_timeout
+
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(args.poll_interval)
+            try:
+                response = await client.get(f"/api/v1/tasks/{record['task_id']}")
+            except httpx.HTTPError:
+                continue  # 폴링 실패는 재시도
+
+            if response.status_code == 200:
+                status = response.json()["status"]
+                if status in TERMINAL_STATUSES:
+                    record["status"] = status
+                    record["turnaround_sec"] = time.perf_counter() - started
+                    if status == "failed":
+                        record["error"] = response.json().get("error_message")
+                    return record
+
+        record["status"], record["error"] = "timeout", f"{args.task_timeout}초 초과"
+        return record
+
+
+async def fetch_queue_waits(
+    client: httpx.AsyncClient, created_from: datetime, task_ids: set
+) -> List[float]:
+    """작업 인덱스에서 큐 대기 시간 (started_at - created_at) 수집"""
+    waits = []
+    cursor = None
+
+    while True:
+        params = {"created_from": created_from.isoformat(), "limit": 200}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/tasks", params=params)
+        response.raise_for_status()
+        page = response.json()
+
+        for item in page["items"]:
+            if item["task_id"] in task_ids and item.get("started_at"):
+                created = datetime.fromisoformat(item["created_at"])
+                started = datetime.fromisoformat(item["started_at"])
+                waits.append((started - created).total_seconds())
+
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return waits
+
+
+async def run_load(args: argparse.Namespace, fixtures: List[tuple]) -> dict:
+    """부하 생성 및 결과 집계"""
+    run_id = datetime.now().strftime("%H%M%S")
+    created_from = datetime.now()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=args.api_url, timeout=60.0, limits=limits) as client:
+        started = time.perf_counter()
+        records = await asyncio.gather(*(
+            upload_and_wait(client, i, fixtures[i % len(fixtures)], run_id, args, semaphore)
+            for i in range(args.uploads)
+        ))
+        elapsed = time.perf_counter() - started
+
+        completed_ids = {r["task_id"] for r in records if r["status"] == "completed"}
+        try:
+            queue_waits = await fetch_queue_waits(client, created_from, completed_ids)
+        except httpx.HTTPError:
+            queue_waits = []
+
+    completed = [r for r in records if r["status"] == "completed"]
+    errors: Dict[str, int] = {}
+    for r in records:
+        if r["status"] != "completed":
+            key = f"{r['status']}: {r['error']}"
+            errors[key] = errors.get(key, 0) + 1
+
+    return {
+        "config": {
+            "uploads": args.uploads,
+            "concurrency": args.concurrency,
+            "audio_seconds": args.audio_seconds,
+            "workers": args.workers if args.start_stack else None,
+        },
+        "elapsed_sec": round(elapsed, 3),
+        "throughput": {
+            "files_per_sec": round(len(completed) / elapsed, 3),
+            "audio_sec_per_sec": round(sum(r["audio_seconds"] for r in completed) / elapsed, 3),
+        },
+        "upload_latency_sec": summarize_latencies([r["upload_sec"] for r in records if r["upload_sec"]]),
+        "turnaround_sec": summarize_latencies([r["turnaround_sec"] for r in completed]),
+        "queue_wait_sec": summarize_latencies(queue_waits),
+        "completed": len(completed),
+        "error_rate": round(1 - len(completed) / args.uploads, 4),
+        "errors": errors,
+    }
+
+
+def print_report(report: dict):
+    """결과 출력"""
+    print("\n📊 부하 테스트 결과")
+    print(f"  업로드 {report['config']['uploads']}건, 동시성 {report['config']['concurrency']}, "
+          f"소요 {report['elapsed_sec']:.1f}초")
+    print(f"  처리량: {report['throughput']['files_per_sec']:.2f} 파일/초, "
+          f"{report['throughput']['audio_sec_per_sec']:.1f} 오디오초/초")
+
+    for key, label in (
+        ("upload_latency_sec", "업로드 응답"),
+        ("turnaround_sec", "전체 소요"),
+        ("queue_wait_sec", "큐 대기"),
+    ):
+        stats = report[key]
+        if stats["count"]:
+            print(f"  {label:<8} p50 {stats['p50']:>8.2f}s  p95 {stats['p95']:>8.2f}s  "
+                  f"p99 {stats['p99']:>8.2f}s  max {stats['max']:>8.2f}s")
+
+    print(f"  완료 {report['completed']}건, 에러율 {report['error_rate'] * 100:.2f}%")
+    for error, count in report["errors"].items():
+        print(f"    - {error}: {count}건")
+
+
+def main() -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Voicecom AI 종단 부하 테스트")
+    parser.add_argument("--api-url", default="http://127.0.0.1:8765", help="API 주소")
+    parser.add_argument("--uploads", type=int, default=100, help="총 업로드 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 클라이언트 수")
+    parser.add_argument("--audio-seconds", default="30,60,120", help="합성 오디오 길이 목록 (초)")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="상태 폴링 주기 (초)")
+    parser.add_argument("--task-timeout", type=float, default=1800.0, help="작업별 제한 시간 (초)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+
+    stack = parser.add_argument_group("로컬 스택 (--start-stack)")
+    stack.add_argument("--start-stack", action="store_true", help="API/Worker/Ollama 대체 서버 직접 실행")
+    stack.add_argument("--redis-url", default="redis://localhost:6379/15", help="브로커/결과 Redis")
+    stack.add_argument("--workers", type=int, default=2, help="Worker 프로세스 수")
+    stack.add_argument("--ollama-port", type=int, default=11535)
+    stack.add_argument("--whisper-rtf", type=float, default=0.05, help="오디오 1초당 STT 시간")
+    stack.add_argument("--diarization-rtf", type=float, default=0.03, help="오디오 1초당 화자 분리 시간")
+    stack.add_argument("--whisper-load-sec", type=float, default=2.0)
+    stack.add_argument("--diarization-load-sec", type=float, default=1.5)
+    fake_ollama.add_arguments(stack, prefix="ollama")
+
+    args = parser.parse_args()
+    args.api_url = args.api_url.rstrip("/")
+    audio_seconds = [int(item) for item in args.audio_seconds.split(",") if item.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="voicecom-load-") as temp_dir, ExitStack() as cleanup:
+        work_dir = Path(temp_dir)
+
+        if args.start_stack:
+            stack_services = LocalStack(args, work_dir)
+            cleanup.callback(stack_services.stop)
+            stack_services.start()
+
+        print(f"🎵 합성 오디오 생성: {audio_seconds}초 × Mono/Stereo")
+        fixtures = build_fixtures(work_dir / "fixtures", audio_seconds)
+
+        print(f"🏁 부하 시작: {args.uploads}건, 동시성 {args.concurrency}")
+        report = asyncio.run(run_load(args, fixtures))
+
+    print_report(report)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n💾 결과 저장: {args.output}")
+
+    return 0 if report["completed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
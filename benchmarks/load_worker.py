@@ -0,0 +1,63 @@
+"""
+부하 테스트용 Celery Worker
+Whisper/화자 분리 서비스를 대체 백엔드로 바꾼 뒤 일반 Worker와 같은 방식으로 실행
+(LLM은 OLLAMA_BASE_URL을 Ollama 대체 서버로 지정해 실제 HTTP 경로를 사용)
+
+사용법:
+    FAKE_WHISPER_RTF=0.05 FAKE_DIARIZATION_RTF=0.03 \\
+        python -m benchmarks.load_worker --concurrency 2
+
+환경 변수:
+    FAKE_WHISPER_RTF: 오디오 1초당 STT 처리 시간 (기본 0.05)
+    FAKE_DIARIZATION_RTF: 오디오 1초당 화자 분리 처리 시간 (기본 0.03)
+    FAKE_WHISPER_LOAD_SEC: Whisper 모델 로드 시간 (기본 2.0)
+    FAKE_DIARIZATION_LOAD_SEC: 화자 분리 모델 로드 시간 (기본 1.5)
+"""
+import argparse
+import os
+
+
+def install_fake_backends():
+    """
+    모델 서비스 전역 인스턴스를 대체 백엔드로 교체
+
+    prefork 자식 프로세스는 fork 시점의 모듈 상태를 물려받으므로 Worker 시작 전에 호출합니다.
+    """
+    import app.services.diarization_service as diarization_module
+    import app.services.whisper_service as whisper_module
+    from benchmarks.fakes import FakeDiarizationService, FakeWhisperService
+
+    whisper_module.whisper_service = FakeWhisperService(
+        seconds_per_audio_second=float(os.environ.get("FAKE_WHISPER_RTF", "0.05")),
+        load_seconds=float(os.environ.get("FAKE_WHISPER_LOAD_SEC", "2.0")),
+    )
+    diarization_module.diarization_service = FakeDiarizationService(
+        seconds_per_audio_second=float(os.environ.get("FAKE_DIARIZATION_RTF", "0.03")),
+        load_seconds=float(os.environ.get("FAKE_DIARIZATION_LOAD_SEC", "1.5")),
+    )
+
+
+def main():
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="부하 테스트용 Celery Worker")
+    parser.add_argument("--concurrency", type=int, default=1, help="Worker 프로세스 수")
+    parser.add_argument("--loglevel", default="WARNING")
+    args = parser.parse_args()
+
+    from app.tasks.celery_app import celery_app
+    import app.tasks.audio_task  # noqa: F401  (태스크 등록)
+
+    install_fake_backends()
+
+    celery_app.worker_main([
+        "worker",
+        f"--loglevel={args.loglevel}",
+        f"--concurrency={args.concurrency}",
+        "--pool=prefork",
+        "--without-gossip",
+        "--without-mingle",
+    ])
+
+
+if __name__ == "__main__":
+    main()
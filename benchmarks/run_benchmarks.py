@@ -0,0 +1,622 @@
+"""
+처리 파이프라인 오프라인 벤치마크
+합성 오디오와 대체 모델/LLM 백엔드로 GPU 없이 측정하고 JSON 기준값과 비교
+
+사용법:
+    python -m benchmarks.run_benchmarks                                    # 측정 결과 출력
+    python -m benchmarks.run_benchmarks --save benchmarks/baselines/baseline.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/baselines/baseline.json
+    python -m benchmarks.run_benchmarks --segments 100,1000,10000,50000 --audio-seconds 60,600,3600
+    python -m benchmarks.run_benchmarks --only startup                     # API import 검사
+    python -m benchmarks.run_benchmarks --only search --search-calls 1000,10000
+
+--compare는 기준값보다 tolerance배 이상 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+startup 그룹은 API import 시 모델/ML 모듈이 로드되거나 디렉토리가 생성되면 항상 종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "baseline.json"
+
+# 비교 시 이보다 작은 차이(초)는 측정 잡음으로 간주
+NOISE_FLOOR_SEC = 0.005
+
+# API 프로세스에 로드되면 안 되는 모듈 (모델/ML 라이브러리, Worker 태스크 모듈)
+API_FORBIDDEN_MODULES = (
+    "torch",
+    "torchaudio",
+    "pyannote",
+    "faster_whisper",
+    "ctranslate2",
+    "librosa",
+    "scipy",
+    "numba",
+    "transformers",
+    "app.tasks",
+)
+
+# 새 인터프리터에서 API 앱을 import하고 로드된 모듈 목록을 출력
+API_IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"import_sec": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def parse_int_list(value: str) -> List[int]:
+    """쉼표 구분 정수 목록 파싱"""
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def prepare_environment(work_dir: Path):
+    """
+    app 모듈 import 전에 환경 변수로 경로/부가 기능을 격리
+
+    설정은 import 시점에 한 번 읽히므로 반드시 app import보다 먼저 호출해야 합니다.
+    """
+    data_dir = work_dir / "data"
+
+    # 요약 설정 저장소가 버전 스냅샷을 만들므로 설정 디렉토리도 복사본 사용
+    config_dir = work_dir / "config"
+    shutil.copytree(Path(__file__).resolve().parent.parent / "config", config_dir)
+
+    os.environ.update({
+        "INPUT_DIR": str(data_dir / "input"),
+        "OUTPUT_DIR": str(data_dir / "output"),
+        "PROCESSED_DIR": str(data_dir / "processed"),
+        "ERROR_DIR": str(data_dir / "error"),
+        "LOG_DIR": str(work_dir / "logs"),
+        "CONFIG_DIR": str(config_dir),
+        "TASK_DB_PATH": str(data_dir / "tasks.db"),
+        "AUDIO_CACHE_DIR": str(data_dir / "cache" / "audio"),
+        "WORKER_METRICS_PORT": "0",
+        "PROFILE_EVERY_N_TASKS": "0",
+        "PROFILE_TASK_ID": "",
+    })
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+
+def measure(
+    func: Callable[[], object],
+    repeat: int,
+    budget_sec: float,
+    setup: Optional[Callable[[], None]] = None,
+) -> dict:
+    """
+    반복 측정 (최소 1회, repeat회 또는 시간 예산 소진 시까지)
+
+    Args:
+        func: 측정 대상
+        repeat: 최대 반복 횟수
+        budget_sec: 시간 예산 (초)
+        setup: 매 실행 전 호출 (측정 시간에서 제외)
+
+    Returns:
+        {"median_sec", "min_sec", "runs"}
+    """
+    timings = []
+    spent = 0.0
+
+    while len(timings) < repeat and (not timings or spent < budget_sec):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        timings.append(elapsed)
+        spent += elapsed
+
+    return {
+        "median_sec": round(statistics.median(timings), 6),
+        "min_sec": round(min(timings), 6),
+        "runs": len(timings),
+    }
+
+
+class BenchmarkRunner:
+    """벤치마크 실행기"""
+
+    def __init__(self, work_dir: Path, repeat: int, budget_sec: float):
+        """
+        초기화
+
+        Args:
+            work_dir: 임시 작업 디렉토리
+            repeat: 항목별 최대 반복 횟수
+            budget_sec: 항목별 시간 예산 (초)
+        """
+        self.work_dir = work_dir
+        self.fixture_dir = work_dir / "fixtures"
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        self.repeat = repeat
+        self.budget_sec = budget_sec
+        self.results: Dict[str, dict] = {}
+        self.failures: List[str] = []
+
+    def run(self, name: str, func: Callable[[], object], setup=None, **params):
+        """단일 항목 측정 및 출력"""
+        result = measure(func, self.repeat, self.budget_sec, setup)
+        self.record(name, result, **params)
+
+    def record(self, name: str, result: dict, **params):
+        """측정 결과 저장 및 출력"""
+        result["params"] = params
+        self.results[name] = result
+        print(
+            f"  {name:<52} median {result['median_sec'] * 1000:>10.2f} ms"
+            f"  min {result['min_sec'] * 1000:>10.2f} ms  ({result['runs']}회)"
+        )
+
+    def fixture_wav(self, seconds: int, channels: int) -> Path:
+        """합성 WAV 픽스처 (없으면 생성)"""
+        from benchmarks.synthetic_audio import write_synthetic_wav
+
+        path = self.fixture_dir / f"synthetic_{channels}ch_{seconds}s.wav"
+        if not path.exists():
+            write_synthetic_wav(path, seconds, channels=channels)
+        return path
+
+    def bench_api_startup(self):
+        """API 프로세스 import (새 인터프리터, 무거운 모듈/디렉토리 생성 검사)"""
+        print("\n🚀 API 시작")
+        probes = []
+
+        def import_api():
+            completed = subprocess.run(
+                [sys.executable, "-c", API_IMPORT_PROBE],
+                cwd=Path(__file__).resolve().parent.parent,
+                env=os.environ,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            probes.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+        # 인터프리터 시작 포함 / app.main import만
+        self.run("api_import", import_api)
+        import_timings = [probe["import_sec"] for probe in probes]
+        self.record("api_import[in_process]", {
+            "median_sec": round(statistics.median(import_timings), 6),
+            "min_sec": round(min(import_timings), 6),
+            "runs": len(import_timings),
+        })
+
+        modules = probes[-1]["modules"]
+        heavy = sorted(
+            name for name in modules
+            if any(name == forbidden or name.startswith(f"{forbidden}.") for forbidden in API_FORBIDDEN_MODULES)
+        )
+        if heavy:
+            self.failures.append(f"API import 시 로드된 모듈: {', '.join(heavy[:10])}")
+
+        created = [
+            name for name in ("INPUT_DIR", "OUTPUT_DIR", "TASK_DB_PATH")
+            if Path(os.environ[name]).exists()
+        ]
+        if created:
+            self.failures.append(f"API import 시 생성된 경로: {', '.join(created)}")
+
+    def bench_audio_utils(self, audio_seconds: List[int]):
+        """오디오 유틸리티 (파일 I/O)"""
+        from app.services.audio_cache_service import AudioCacheService
+        from app.utils.audio_utils import (
+            get_audio_info,
+            read_audio,
+            read_stereo_channels,
+            split_stereo_channels,
+            trim_silence,
+        )
+
+        print("\n🔊 오디오 유틸리티")
+        split_dir = self.work_dir / "split"
+        split_dir.mkdir(exist_ok=True)
+
+        for seconds in audio_seconds:
+            for channels in (1, 2):
+                path = self.fixture_wav(seconds, channels)
+                self.run(
+                    f"get_audio_info[{channels}ch,{seconds}s]",
+                    lambda: get_audio_info(path),
+                    channels=channels, audio_seconds=seconds,
+                )
+                data, samplerate = read_audio(path)
+                self.run(
+                    f"trim_silence[{channels}ch,{seconds}s]",
+                    lambda: trim_silence(data, samplerate),
+                    channels=channels, audio_seconds=seconds,
+                )
+
+            # 정규화 오디오: 디코딩(캐시 미사용) vs 캐시 메모리 맵 (Worker처럼 업로드 시 계산한 해시 사용)
+            cold_cache = AudioCacheService(self.work_dir / "audio_cache_cold", max_bytes=0)
+            warm_cache = AudioCacheService(self.work_dir / "audio_cache", max_bytes=1 << 40)
+            for channels in (1, 2):
+                path = self.fixture_wav(seconds, channels)
+                key = AudioCacheService.content_hash(path)
+                warm_cache.load(path, key)
+                self.run(
+                    f"normalize_audio[{channels}ch,{seconds}s]",
+                    lambda: cold_cache.load(path),
+                    channels=channels, audio_seconds=seconds,
+                )
+                self.run(
+                    f"audio_cache_load[{channels}ch,{seconds}s]",
+                    lambda: warm_cache.load(path, key),
+                    channels=channels, audio_seconds=seconds,
+                )
+
+            stereo_path = self.fixture_wav(seconds, 2)
+            self.run(
+                f"split_stereo_channels[{seconds}s]",
+                lambda: split_stereo_channels(stereo_path, split_dir),
+                audio_seconds=seconds,
+            )
+            self.run(
+                f"read_stereo_channels[{seconds}s]",
+                lambda: read_stereo_channels(stereo_path),
+                audio_seconds=seconds,
+            )
+
+    def bench_segments(self, segment_counts: List[int]):
+        """세그먼트 병합/변환 (CPU)"""
+        from app.services.diarization_service import DiarizationService
+        from app.utils.audio_utils import merge_transcripts_with_speaker_labels
+        from app.utils.segments import extract_text_from_srt
+        from benchmarks.synthetic_audio import (
+            synthetic_diarization_segments,
+            synthetic_whisper_segments,
+        )
+
+        print("\n🧩 세그먼트 처리")
+        diarization = DiarizationService(hf_token="unused")
+        segment_sec = 2.5
+
+        for count in segment_counts:
+            whisper_segments = synthetic_whisper_segments(count, segment_sec)
+            diarization_segments = synthetic_diarization_segments(count * segment_sec)
+            merged = diarization.merge_with_transcript(diarization_segments, whisper_segments)
+            srt_content = merged.to_srt()
+
+            half = count // 2
+            left = synthetic_whisper_segments(half, segment_sec * 2)
+            right = synthetic_whisper_segments(count - half, segment_sec * 2, offset_sec=segment_sec)
+
+            self.run(
+                f"merge_with_transcript[n={count}]",
+                lambda: diarization.merge_with_transcript(diarization_segments, whisper_segments),
+                segments=count, diarization_turns=len(diarization_segments),
+            )
+            self.run(
+                f"merge_transcripts_with_speaker_labels[n={count}]",
+                lambda: merge_transcripts_with_speaker_labels(left, right),
+                segments=count,
+            )
+            self.run(
+                f"segments_to_srt[n={count}]",
+                lambda: merged.to_srt(),
+                segments=count,
+            )
+            self.run(
+                f"segments_to_text[n={count}]",
+                lambda: merged.to_text(),
+                segments=count,
+            )
+            self.run(
+                f"extract_text_from_srt[n={count}]",
+                lambda: extract_text_from_srt(srt_content),
+                segments=count,
+            )
+
+    def bench_pipeline(self, audio_seconds: List[int]):
+        """process_audio_file 전체 경로 (대체 모델/LLM 백엔드)"""
+        import app.services.diarization_service as diarization_module
+        import app.services.whisper_service as whisper_module
+        from app.core.config import ensure_directories, settings
+        from app.db.task_index import task_index_writer
+        from app.services.ollama_service import ollama_service
+        from app.services.task_event_service import task_event_service
+        from app.tasks.audio_task import process_audio_file
+        from benchmarks.fakes import (
+            FakeDiarizationService,
+            FakeWhisperService,
+            make_fake_summarize,
+        )
+
+        print("\n⚙️ 전체 파이프라인 (대체 백엔드)")
+        ensure_directories()
+
+        # 모델/LLM/Redis 이벤트 발행만 대체하고 나머지는 실제 코드 경로 사용
+        whisper_module.whisper_service = FakeWhisperService()
+        diarization_module.diarization_service = FakeDiarizationService()
+        ollama_service.summarize_sync = make_fake_summarize()
+        task_event_service.publish = lambda *args, **kwargs: None
+
+        for seconds in audio_seconds:
+            for channels in (1, 2):
+                fixture = self.fixture_wav(seconds, channels)
+                input_path = settings.input_dir / f"bench_{channels}ch_{seconds}s.wav"
+
+                def stage_input():
+                    shutil.copyfile(fixture, input_path)
+
+                def run_task():
+                    task_id = str(uuid.uuid4())
+                    process_audio_file.apply(
+                        args=[str(input_path), task_id], task_id=task_id, throw=True
+                    )
+
+                self.run(
+                    f"process_audio_file[{channels}ch,{seconds}s]",
+                    run_task,
+                    setup=stage_input,
+                    channels=channels, audio_seconds=seconds,
+                )
+
+        self.bench_pipeline_overlap()
+        task_index_writer.flush()
+
+    def bench_pipeline_overlap(self, files: int = 6, seconds: int = 60):
+        """
+        연속 파일 처리량: 단계 순차 실행 vs Worker 단계 파이프라인 (threads 풀과 같은 동시 제출)
+
+        모델/LLM 비용을 sleep으로 주어 decode(CPU) / infer(모델) / post(LLM, I/O) 단계가 겹치는 효과를 측정합니다.
+        """
+        import threading
+
+        import app.services.diarization_service as diarization_module
+        import app.services.whisper_service as whisper_module
+        from app.core.config import settings
+        from app.services.ollama_service import ollama_service
+        from app.tasks.audio_task import process_audio_file
+        from app.tasks.task_pipeline import task_pipeline
+        from benchmarks.fakes import FakeDiarizationService, FakeWhisperService, make_fake_summarize
+
+        fixture = self.fixture_wav(seconds, 2)
+        input_paths = [settings.input_dir / f"bench_overlap_{index}.wav" for index in range(files)]
+
+        def stage_inputs():
+            for input_path in input_paths:
+                shutil.copyfile(fixture, input_path)
+
+        def run_one(input_path: Path):
+            task_id = str(uuid.uuid4())
+            process_audio_file.apply(args=[str(input_path), task_id], task_id=task_id, throw=True)
+
+        def run_sequential():
+            for input_path in input_paths:
+                run_one(input_path)
+
+        def run_pipelined():
+            errors = []
+
+            def run_collecting(input_path: Path):
+                try:
+                    run_one(input_path)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=run_collecting, args=(input_path,)) for input_path in input_paths]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise errors[0]
+
+        saved = (whisper_module.whisper_service, diarization_module.diarization_service, ollama_service.summarize_sync)
+        whisper_module.whisper_service = FakeWhisperService(seconds_per_audio_second=0.004)
+        diarization_module.diarization_service = FakeDiarizationService(seconds_per_audio_second=0.002)
+        ollama_service.summarize_sync = make_fake_summarize(latency_sec=0.3)
+
+        try:
+            self.run(
+                f"process_audio_file_batch[{files}x2ch,{seconds}s,sequential]",
+                run_sequential,
+                setup=stage_inputs,
+                files=files, audio_seconds=seconds,
+            )
+            settings.worker_pipeline_enabled = True
+            self.run(
+                f"process_audio_file_batch[{files}x2ch,{seconds}s,pipelined]",
+                run_pipelined,
+                setup=stage_inputs,
+                files=files, audio_seconds=seconds, capacity=task_pipeline.capacity(),
+            )
+        finally:
+            settings.worker_pipeline_enabled = False
+            whisper_module.whisper_service, diarization_module.diarization_service, ollama_service.summarize_sync = saved
+
+    def bench_search(self, call_counts: List[int], segments_per_call: int = 120):
+        """전문 검색 색인/조회 (통화 call_count건 × segments_per_call 세그먼트)"""
+        import asyncio
+
+        from app.core.config import ensure_directories
+        from app.db.database import get_sync_session_factory, init_task_db_sync
+        from app.db.search_index import (
+            build_entries,
+            ngram_tokens,
+            replace_entries,
+            search_index_repository,
+        )
+        from benchmarks.synthetic_audio import synthetic_whisper_segments
+
+        print("\n🔎 전문 검색")
+        ensure_directories()
+        init_task_db_sync()
+        session_factory = get_sync_session_factory()
+        loop = asyncio.new_event_loop()
+
+        segments = synthetic_whisper_segments(segments_per_call)
+        summary = "고객이 내일 오전 병원 예약 변경을 요청함"
+        srt_text = segments.to_text()
+        indexed = 0
+
+        def call_entries(index: int) -> List[dict]:
+            # 통화마다 한 번만 나오는 드문 검색어 (고객번호)
+            return build_entries(segments, f"{summary} 고객번호 {index:07d}")
+
+        try:
+            for count in call_counts:
+                with session_factory() as session:
+                    while indexed < count:
+                        replace_entries(session, f"bench_call_{indexed}", None, call_entries(indexed))
+                        indexed += 1
+                        if indexed % 500 == 0:
+                            session.commit()
+                    session.commit()
+
+                def index_call():
+                    with session_factory() as session:
+                        replace_entries(session, "bench_call_0", None, call_entries(0))
+                        session.commit()
+
+                self.run(
+                    f"search_index_replace[calls={count}]",
+                    index_call,
+                    calls=count, segments=segments_per_call,
+                )
+                for label, query in (("common", "예약 변경"), ("rare", f"고객번호 {count // 2:07d}")):
+                    self.run(
+                        f"search_query[{label},calls={count}]",
+                        lambda: loop.run_until_complete(search_index_repository.search(query, limit=50)),
+                        calls=count, segments=segments_per_call,
+                    )
+        finally:
+            loop.close()
+
+        self.run(
+            f"ngram_tokens[n={segments_per_call}]",
+            lambda: ngram_tokens(srt_text),
+            segments=segments_per_call,
+        )
+
+
+def compare(results: Dict[str, dict], baseline_path: Path, tolerance: float) -> int:
+    """
+    기준값과 비교
+
+    Args:
+        results: 측정 결과
+        baseline_path: 기준값 JSON 경로
+        tolerance: 허용 배율 (median 기준)
+
+    Returns:
+        회귀 항목 수
+    """
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    regressions = 0
+
+    print(f"\n📊 기준값 비교: {baseline_path} (허용 {tolerance:.2f}배)")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"  {name:<52} (기준값 없음)")
+            continue
+
+        current_sec = result["median_sec"]
+        base_sec = base["median_sec"]
+        ratio = current_sec / base_sec if base_sec > 0 else float("inf")
+        regressed = ratio > tolerance and current_sec - base_sec > NOISE_FLOOR_SEC
+        regressions += regressed
+
+        mark = "❌" if regressed else "✅"
+        print(f"  {mark} {name:<50} {ratio:>6.2f}배 ({base_sec * 1000:.2f} → {current_sec * 1000:.2f} ms)")
+
+    return regressions
+
+
+def main() -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Voicecom AI 오프라인 벤치마크")
+    parser.add_argument("--segments", default="100,1000,10000", help="세그먼트 수 목록 (쉼표 구분)")
+    parser.add_argument("--audio-seconds", default="60,600", help="합성 오디오 길이 목록 (초)")
+    parser.add_argument("--search-calls", default="1000", help="검색 인덱스 통화 수 목록 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 최대 반복 횟수")
+    parser.add_argument("--budget", type=float, default=10.0, help="항목별 시간 예산 (초)")
+    parser.add_argument(
+        "--only",
+        choices=["startup", "audio", "segments", "pipeline", "search"],
+        action="append",
+        help="일부 그룹만 실행 (여러 번 지정 가능)",
+    )
+    parser.add_argument("--save", type=Path, help="결과를 기준값 JSON으로 저장")
+    parser.add_argument("--compare", type=Path, nargs="?", const=DEFAULT_BASELINE, help="기준값과 비교")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="회귀 판정 배율")
+    args = parser.parse_args()
+
+    groups = set(args.only or ["startup", "audio", "segments", "pipeline", "search"])
+    audio_seconds = parse_int_list(args.audio_seconds)
+
+    with tempfile.TemporaryDirectory(prefix="voicecom-bench-") as temp_dir:
+        work_dir = Path(temp_dir)
+        prepare_environment(work_dir)
+
+        runner = BenchmarkRunner(work_dir, args.repeat, args.budget)
+        print(f"🏁 벤치마크 시작 (작업 디렉토리: {work_dir})")
+
+        if "startup" in groups:
+            runner.bench_api_startup()
+        if "audio" in groups:
+            runner.bench_audio_utils(audio_seconds)
+        if "segments" in groups:
+            runner.bench_segments(parse_int_list(args.segments))
+        if "pipeline" in groups:
+            runner.bench_pipeline(audio_seconds)
+        if "search" in groups:
+            runner.bench_search(parse_int_list(args.search_calls))
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(
+            json.dumps(
+                {
+                    "meta": {
+                        "created_at": datetime.now().isoformat(timespec="seconds"),
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "processor": platform.processor() or platform.machine(),
+                    },
+                    "results": runner.results,
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        print(f"\n💾 기준값 저장: {args.save}")
+
+    if runner.failures:
+        print()
+        for failure in runner.failures:
+            print(f"❌ {failure}")
+        return 1
+
+    if args.compare:
+        regressions = compare(runner.results, args.compare, args.tolerance)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {regressions}건")
+            return 1
+        print("\n✅ 성능 회귀 없음")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+합성 오디오/세그먼트 생성
+화자 교대(턴) 구조를 가진 음성 유사 신호와 STT/화자 분리 결과 형식의 세그먼트를 만듭니다.
+"""
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import soundfile as sf
+
+from app.utils.segments import SegmentList
+
+
+# 화자별 기본 주파수 (Hz)
+SPEAKER_F0 = (120.0, 210.0, 165.0)
+
+# 합성 STT 텍스트 (순환 사용)
+SAMPLE_PHRASES = (
+    "안녕하세요 상담원입니다",
+    "예약 변경 문의드립니다",
+    "확인해 보겠습니다 잠시만 기다려 주세요",
+    "휠체어 탑승 가능한 차량으로 부탁드립니다",
+    "내일 오전 열 시로 변경되었습니다",
+    "감사합니다 좋은 하루 되세요",
+)
+
+# 파일 쓰기 블록 길이 (초): 긴 파일도 메모리에 전부 올리지 않음
+WRITE_BLOCK_SEC = 10.0
+
+
+def build_turns(
+    duration_sec: float,
+    turn_sec: float = 4.0,
+    gap_sec: float = 0.5,
+    num_speakers: int = 2,
+    seed: int = 0,
+) -> List[Tuple[float, float, int]]:
+    """
+    화자 교대 구조 생성
+
+    Args:
+        duration_sec: 전체 길이 (초)
+        turn_sec: 평균 발화 길이 (초, ±50% 변동)
+        gap_sec: 발화 사이 무음 길이 (초)
+        num_speakers: 화자 수
+        seed: 난수 시드
+
+    Returns:
+        [(시작(초), 종료(초), 화자 번호), ...]
+    """
+    rng = np.random.default_rng(seed)
+    turns = []
+    cursor = 0.0
+    speaker = 0
+
+    while cursor < duration_sec:
+        length = turn_sec * rng.uniform(0.5, 1.5)
+        end = min(cursor + length, duration_sec)
+        turns.append((cursor, end, speaker))
+        cursor = end + gap_sec
+        speaker = (speaker + 1) % num_speakers
+
+    return turns
+
+
+def write_synthetic_wav(
+    path: Path,
+    duration_sec: float,
+    channels: int = 1,
+    sample_rate: int = 16000,
+    turn_sec: float = 4.0,
+    gap_sec: float = 0.5,
+    seed: int = 0,
+) -> List[Tuple[float, float, int]]:
+    """
+    음성 유사 합성 WAV 생성 (PCM 16bit)
+
+    화자별 기본 주파수의 배음 + 4Hz 음절 진폭 변조 + 약한 잡음으로 구성되며,
+    Stereo는 화자 0을 왼쪽, 화자 1을 오른쪽 채널에 기록합니다 (상담 녹취 구조).
+
+    Args:
+        path: 저장 경로
+        duration_sec: 길이 (초)
+        channels: 채널 수 (1 또는 2)
+        sample_rate: 샘플레이트
+        turn_sec: 평균 발화 길이 (초)
+        gap_sec: 발화 사이 무음 길이 (초)
+        seed: 난수 시드
+
+    Returns:
+        생성에 사용한 턴 구조 [(시작, 종료, 화자), ...]
+    """
+    turns = build_turns(duration_sec, turn_sec, gap_sec, seed=seed)
+    turn_starts = np.array([start for start, _, _ in turns])
+    turn_ends = np.array([end for _, end, _ in turns])
+    turn_speakers = np.array([speaker for _, _, speaker in turns])
+
+    rng = np.random.default_rng(seed + 1)
+    total_samples = int(duration_sec * sample_rate)
+    block_samples = int(WRITE_BLOCK_SEC * sample_rate)
+
+    with sf.SoundFile(
+        path, "w", samplerate=sample_rate, channels=channels, subtype="PCM_16"
+    ) as f:
+        for block_start in range(0, total_samples, block_samples):
+            n = min(block_samples, total_samples - block_start)
+            t = (block_start + np.arange(n)) / sample_rate
+
+            # 각 샘플이 속한 턴 (없으면 무음)
+            index = np.searchsorted(turn_starts, t, side="right") - 1
+            active = (index >= 0) & (t < turn_ends[np.clip(index, 0, None)])
+            speaker = np.where(active, turn_speakers[np.clip(index, 0, None)], -1)
+
+            f0 = np.array(SPEAKER_F0)[np.clip(speaker, 0, None) % len(SPEAKER_F0)]
+            phase = 2 * np.pi * f0 * t
+            voice = np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.25 * np.sin(3 * phase)
+            envelope = 0.5 * (1 + np.sin(2 * np.pi * 4.0 * t))
+            voice = 0.2 * voice * envelope * active
+
+            noise = rng.normal(0.0, 0.003, size=(n, channels))
+
+            if channels == 1:
+                block = voice[:, None] + noise
+            else:
+                block = noise
+                block[:, 0] += voice * (speaker == 0)
+                block[:, 1] += voice * (speaker != 0)
+
+            f.write(block.astype(np.float32))
+
+    return turns
+
+
+def synthetic_whisper_segments(
+    count: int, segment_sec: float = 2.5, offset_sec: float = 0.0
+) -> SegmentList:
+    """
+    Whisper 결과 형식 세그먼트 생성
+
+    Args:
+        count: 세그먼트 수
+        segment_sec: 세그먼트 길이 (초)
+        offset_sec: 시작 오프셋 (초)
+
+    Returns:
+        세그먼트 목록
+    """
+    starts = offset_sec + np.arange(count) * segment_sec
+    return SegmentList(
+        starts,
+        starts + segment_sec - 0.1,
+        [SAMPLE_PHRASES[i % len(SAMPLE_PHRASES)] for i in range(count)],
+    )
+
+
+def synthetic_diarization_segments(
+    duration_sec: float, turn_sec: float = 4.0, seed: int = 0
+) -> List[Tuple[float, float, str]]:
+    """
+    화자 분리 결과 형식 세그먼트 생성
+
+    Args:
+        duration_sec: 전체 길이 (초)
+        turn_sec: 평균 발화 길이 (초)
+        seed: 난수 시드
+
+    Returns:
+        [(시작(초), 종료(초), 화자ID), ...]
+    """
+    return [
+        (start, end, f"SPEAKER_{speaker:02d}")
+        for start, end, speaker in build_turns(duration_sec, turn_sec, seed=seed)
+    ]
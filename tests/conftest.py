@@ -0,0 +1,46 @@
+"""
+테스트 공통 설정
+
+설정은 app import 시점에 한 번 읽히므로 경로를 임시 디렉토리로 격리한 뒤 app 모듈을 import합니다.
+"""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+_WORK_DIR = Path(tempfile.mkdtemp(prefix="aicc-tests-"))
+_DATA_DIR = _WORK_DIR / "data"
+
+shutil.copytree(Path(__file__).resolve().parent.parent / "config", _WORK_DIR / "config")
+
+os.environ.update({
+    "INPUT_DIR": str(_DATA_DIR / "input"),
+    "OUTPUT_DIR": str(_DATA_DIR / "output"),
+    "PROCESSED_DIR": str(_DATA_DIR / "processed"),
+    "ERROR_DIR": str(_DATA_DIR / "error"),
+    "LOG_DIR": str(_WORK_DIR / "logs"),
+    "CONFIG_DIR": str(_WORK_DIR / "config"),
+    "TASK_DB_PATH": str(_DATA_DIR / "tasks.db"),
+    "AUDIO_CACHE_DIR": str(_DATA_DIR / "cache" / "audio"),
+    "WORKER_METRICS_PORT": "0",
+    "PROFILE_EVERY_N_TASKS": "0",
+    "PROFILE_TASK_ID": "",
+})
+
+from app.core.config import ensure_directories  # noqa: E402
+
+ensure_directories()
+
+
+@pytest.fixture(scope="session")
+def work_dir() -> Path:
+    """테스트 세션 작업 디렉토리 (app 설정 경로의 루트)"""
+    return _WORK_DIR
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """임시 작업 디렉토리 정리"""
+    shutil.rmtree(_WORK_DIR, ignore_errors=True)
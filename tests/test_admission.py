@@ -0,0 +1,122 @@
+"""업로드 수락 제어 테스트"""
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.api.admission import expected_body_bytes
+from app.api.schemas import BacklogResponse
+from app.main import app
+from app.services import admission_service as admission_module
+from app.services.admission_service import AdmissionRejectedError, admission_service
+
+
+def test_rejection_has_cors_headers(monkeypatch):
+    """수락 제어의 429/503 응답도 CORS 미들웨어를 거쳐 브라우저에서 읽을 수 있음"""
+    async def reject(client_id, incoming_bytes=0):
+        raise AdmissionRejectedError(503, "queue_depth", "처리 대기 작업이 너무 많습니다.", 30)
+
+    monkeypatch.setattr(admission_service, "admit", reject)
+
+    response = TestClient(app).post(
+        "/api/v1/upload",
+        files={"file": ("call.wav", b"RIFF", "audio/wav")},
+        headers={"Origin": "https://crm.example.com"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
+    assert response.headers["access-control-allow-origin"] in ("*", "https://crm.example.com")
+
+
+@pytest.mark.asyncio
+async def test_disk_check_failure_is_allowed(monkeypatch):
+    """디스크 여유 공간을 확인할 수 없으면 (OSError) 500이 아니라 허용"""
+    def fail(path):
+        raise FileNotFoundError(path)
+
+    async def no_backlog():
+        raise RuntimeError("집계 실패")
+
+    monkeypatch.setattr(admission_module.shutil, "disk_usage", fail)
+    monkeypatch.setattr(admission_service, "backlog", no_backlog)
+
+    await admission_service.check_capacity(incoming_bytes=1024)
+
+
+@pytest.mark.asyncio
+async def test_low_disk_is_rejected(monkeypatch):
+    """여유 공간에서 요청 크기를 뺀 값이 ADMISSION_MIN_FREE_DISK_MB보다 작으면 503"""
+    usage = shutil.disk_usage(".")
+    monkeypatch.setattr(
+        admission_module.shutil, "disk_usage", lambda path: usage._replace(free=100 * 1024 * 1024)
+    )
+    monkeypatch.setattr(admission_module.settings, "admission_min_free_disk_mb", 90)
+
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        await admission_service.check_capacity(incoming_bytes=20 * 1024 * 1024)
+
+    assert (rejected.value.status_code, rejected.value.reason) == (503, "disk")
+
+
+@pytest.mark.parametrize("headers, expected_mb", [
+    ({"content-length": str(3 * 1024 * 1024)}, 3),
+    ({}, 500),
+    ({"content-length": "abc"}, 500),
+    ({"content-length": "-1"}, 500),
+])
+def test_expected_body_bytes(monkeypatch, headers, expected_mb):
+    """Content-Length가 없거나 잘못되면 UPLOAD_MAX_SIZE_MB로 추정"""
+    monkeypatch.setattr(admission_module.settings, "upload_max_size_mb", 500)
+    request = Request({
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/upload",
+        "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+    })
+
+    assert expected_body_bytes(request) == expected_mb * 1024 * 1024
+
+
+def test_chunked_upload_does_not_bypass_disk_check(monkeypatch):
+    """Content-Length 없는 chunked 업로드도 최대 크기 기준으로 디스크 여유 공간 확인"""
+    usage = shutil.disk_usage(".")
+    monkeypatch.setattr(
+        admission_module.shutil, "disk_usage", lambda path: usage._replace(free=600 * 1024 * 1024)
+    )
+    monkeypatch.setattr(admission_module.settings, "admission_min_free_disk_mb", 200)
+    monkeypatch.setattr(admission_module.settings, "upload_max_size_mb", 500)
+
+    async def allow(client_id):
+        return None
+
+    monkeypatch.setattr(admission_service, "_check_rate_limit", allow)
+
+    response = TestClient(app).post(
+        "/api/v1/upload",
+        content=iter([b"RIFF"]),
+        headers={"content-type": "multipart/form-data; boundary=x"},
+    )
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "disk"
+
+
+@pytest.mark.asyncio
+async def test_backlog_survives_disk_check_failure(monkeypatch):
+    """디스크 여유 공간을 확인할 수 없어도 /backlog 집계는 실패하지 않음 (free_disk_mb=None)"""
+    def fail(path):
+        raise PermissionError(path)
+
+    async def get_backlog(completed_since, bytes_per_audio_sec):
+        return 2, 120.0, 60.0
+
+    monkeypatch.setattr(admission_module.shutil, "disk_usage", fail)
+    monkeypatch.setattr(admission_module.task_index_repository, "get_backlog", get_backlog)
+
+    backlog = await admission_service._measure_backlog()
+
+    assert backlog.free_disk_mb is None
+    assert backlog.queued_tasks == 2
+    assert BacklogResponse(**backlog.to_dict(), accepting=True).free_disk_mb is None
@@ -0,0 +1,83 @@
+"""정규화 오디오 캐시 (업로드 해시 사용, LRU 정리, 손상된 항목 복구) 테스트"""
+import hashlib
+import os
+
+import numpy as np
+import pytest
+
+from app.services.audio_cache_service import AudioCacheService
+from benchmarks.synthetic_audio import write_synthetic_wav
+
+
+@pytest.fixture
+def audio_path(tmp_path):
+    """2초 합성 Stereo 통화 파일"""
+    path = tmp_path / "call.wav"
+    write_synthetic_wav(path, 2.0, channels=2)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """64MB 캐시"""
+    return AudioCacheService(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+
+
+def entry(cache: AudioCacheService, key: str):
+    """캐시 항목 경로"""
+    return cache.cache_dir / f"{key}.npy"
+
+
+def test_load_uses_given_content_hash(cache, audio_path, monkeypatch):
+    """작업 인덱스의 SHA-256을 받으면 파일을 다시 해시하지 않고 그 값을 키로 사용"""
+    def rehash(path):
+        raise AssertionError("전달받은 해시가 있으면 다시 계산하지 않음")
+
+    monkeypatch.setattr(cache, "content_hash", rehash)
+    key = hashlib.sha256(audio_path.read_bytes()).hexdigest()
+
+    first = cache.load(audio_path, key)
+    second = cache.load(audio_path, key)
+
+    assert entry(cache, key).exists()
+    assert isinstance(second, np.memmap)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_fallback_hash_matches_upload_hash(cache, audio_path):
+    """해시가 없을 때(직접 넣은 파일) 계산하는 키도 업로드 시 기록하는 SHA-256과 같음"""
+    cache.load(audio_path)
+
+    assert entry(cache, hashlib.sha256(audio_path.read_bytes()).hexdigest()).exists()
+
+
+def test_evict_removes_least_recently_used(cache):
+    """최대 크기를 넘으면 mtime(마지막 사용)이 오래된 항목부터 삭제, 조회한 항목은 최근 사용으로 갱신"""
+    data = np.zeros((16000, 2), dtype=np.float32)
+    for index, key in enumerate(("a", "b", "c")):
+        cache.put(key, data)
+        os.utime(entry(cache, key), (1_000_000 + index, 1_000_000 + index))
+
+    assert cache.get("a") is not None  # a가 가장 최근 사용
+    cache.max_bytes = 2 * entry(cache, "a").stat().st_size
+    cache.evict()
+
+    assert not entry(cache, "b").exists()
+    assert entry(cache, "a").exists()
+    assert entry(cache, "c").exists()
+
+
+def test_corrupt_entry_is_replaced(cache, audio_path):
+    """읽을 수 없는 캐시 파일은 삭제 후 다시 정규화해 저장"""
+    key = "corrupt"
+    cache.cache_dir.mkdir(parents=True, exist_ok=True)
+    entry(cache, key).write_bytes(b"not a numpy file")
+
+    assert cache.get(key) is None
+    assert not entry(cache, key).exists()
+
+    entry(cache, key).write_bytes(b"\x93NUMPY truncated")
+    loaded = cache.load(audio_path, key)
+
+    np.testing.assert_array_equal(loaded, AudioCacheService.normalize(audio_path))
+    np.testing.assert_array_equal(np.load(entry(cache, key)), loaded)
@@ -0,0 +1,135 @@
+"""배치 업로드 (POST /api/v1/upload/batch) 테스트"""
+import io
+import shutil
+import wave
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.utils.upload_utils import UploadTooLargeError, _copy_wav_member, extract_wav_archive
+
+
+def make_wav(frames: int = 160) -> bytes:
+    """16kHz 모노 16bit 무음 WAV"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(b"\x00\x00" * frames)
+    return buffer.getvalue()
+
+
+def make_zip(members: dict) -> bytes:
+    """{멤버 이름: 내용} → zip 바이트"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class RecordingGroup:
+    """celery.group 대체: 큐에 추가된 서명만 기록"""
+
+    def __init__(self):
+        self.signatures = []
+
+    def __call__(self, signatures):
+        self.signatures = list(signatures)
+        return self
+
+    def apply_async(self, task_id=None):
+        self.task_id = task_id
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Celery 전송을 기록하는 API 클라이언트 (입력 디렉토리는 테스트마다 비움)"""
+    import celery
+
+    recorder = RecordingGroup()
+    monkeypatch.setattr(celery, "group", recorder)
+
+    shutil.rmtree(settings.input_dir, ignore_errors=True)
+    settings.input_dir.mkdir(parents=True, exist_ok=True)
+
+    with TestClient(app) as test_client:
+        test_client.recorder = recorder
+        yield test_client
+
+
+def test_batch_accepts_more_than_starlette_default_files(client, monkeypatch):
+    """Starlette 기본 max_files(1000)보다 많은 파트도 BATCH_MAX_FILES까지 수락"""
+    monkeypatch.setattr(settings, "batch_max_files", 1200)
+    wav = make_wav()
+    files = [("files", (f"call_{i:04d}.wav", wav, "audio/wav")) for i in range(1001)]
+
+    response = client.post("/api/v1/upload/batch", files=files)
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["total"] == 1001
+    assert body["rejected"] == []
+    assert len(client.recorder.signatures) == 1001
+    assert client.recorder.task_id == body["batch_id"]
+
+
+def test_batch_rejects_parts_beyond_batch_max_files(client, monkeypatch):
+    """BATCH_MAX_FILES를 넘는 파트는 form 파싱 단계에서 거부"""
+    monkeypatch.setattr(settings, "batch_max_files", 3)
+    wav = make_wav()
+    files = [("files", (f"call_{i}.wav", wav, "audio/wav")) for i in range(4)]
+
+    response = client.post("/api/v1/upload/batch", files=files)
+
+    assert response.status_code == 400
+    assert client.recorder.signatures == []
+
+
+def test_archive_member_cannot_overwrite_loose_file(client):
+    """아카이브 멤버와 개별 파일의 파일명이 같으면 나중 것을 거부"""
+    loose = make_wav(160)
+    archive = make_zip({"nested/call.wav": make_wav(320), "other.wav": make_wav(160)})
+    files = [
+        ("files", ("call.wav", loose, "audio/wav")),
+        ("files", ("calls.zip", archive, "application/zip")),
+    ]
+
+    response = client.post("/api/v1/upload/batch", files=files)
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert sorted(task["filename"] for task in body["tasks"]) == ["call.wav", "other.wav"]
+    assert [item["filename"] for item in body["rejected"]] == ["calls.zip:nested/call.wav"]
+    assert (settings.input_dir / "call.wav").read_bytes() == loose
+
+
+def test_copy_wav_member_stops_at_max_bytes(tmp_path):
+    """압축 해제 크기가 제한을 넘으면 복사를 중단하고 임시 파일을 남기지 않음"""
+    data = make_wav(16000)
+    destination = tmp_path / "big.wav"
+
+    with pytest.raises(UploadTooLargeError):
+        _copy_wav_member(io.BytesIO(data), destination, chunk_size=1024, max_bytes=4096)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extract_wav_archive_rejects_oversized_member(tmp_path):
+    """압축률이 높은 멤버도 실제 압축 해제 크기로 검사"""
+    archive_path = tmp_path / "bomb.zip"
+    archive_path.write_bytes(make_zip({"bomb.wav": make_wav(1024 * 1024), "ok.wav": make_wav(160)}))
+    output_dir = tmp_path / "input"
+    output_dir.mkdir()
+
+    accepted, rejected = extract_wav_archive(
+        archive_path, output_dir, max_files=10, chunk_size=64 * 1024, max_bytes=1024 * 1024
+    )
+
+    assert [path.name for path, _, _ in accepted] == ["ok.wav"]
+    assert [name for name, _ in rejected] == ["bomb.wav"]
+    assert not (output_dir / "bomb.wav").exists()
@@ -0,0 +1,40 @@
+"""설정 검증 테스트"""
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+
+def test_pipeline_queue_size_must_be_positive(monkeypatch):
+    """WORKER_PIPELINE_QUEUE_SIZE=0은 무제한 큐가 되므로 거부"""
+    monkeypatch.setenv("WORKER_PIPELINE_QUEUE_SIZE", "0")
+
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+def test_rate_limit_overrides_parsed(monkeypatch):
+    """클라이언트별 한도는 공백/빈 항목을 무시하고 파싱"""
+    monkeypatch.setenv("RATE_LIMIT_OVERRIDES", " crm=600, nightly-import = 60 ,")
+
+    assert Settings().get_rate_limit_overrides() == {"crm": 600, "nightly-import": 60}
+
+
+@pytest.mark.parametrize("value", ["crm=abc", "crm", "=60", "crm=600,nightly"])
+def test_rate_limit_overrides_validated_at_startup(monkeypatch, value):
+    """잘못된 RATE_LIMIT_OVERRIDES는 업로드 요청이 아닌 설정 로드 시 오류"""
+    monkeypatch.setenv("RATE_LIMIT_OVERRIDES", value)
+
+    with pytest.raises(ValidationError, match="RATE_LIMIT_OVERRIDES"):
+        Settings()
+
+
+def test_rate_limit_overrides_reparsed_when_changed():
+    """값이 바뀌면 다시 파싱 (같은 값이면 캐시 사용)"""
+    config = Settings(RATE_LIMIT_OVERRIDES="crm=600")
+    first = config.get_rate_limit_overrides()
+
+    assert config.get_rate_limit_overrides() is first
+
+    config.rate_limit_overrides = "crm=10"
+    assert config.get_rate_limit_overrides() == {"crm": 10}
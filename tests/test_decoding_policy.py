@@ -0,0 +1,112 @@
+"""DecodingPolicy (부하 적응형 품질 단계) 테스트"""
+import socket
+
+import pytest
+
+from app.core.config import settings
+from app.services.decoding_policy import TIER_BALANCED, TIER_FAST, TIER_FULL, DecodingPolicy
+
+
+@pytest.fixture
+def policy(monkeypatch) -> DecodingPolicy:
+    """부하를 직접 지정하는 정책 (queue_depth가 돌려준 값 / 100 = 부하)"""
+    monkeypatch.setattr(settings, "decoding_policy_enabled", True)
+    monkeypatch.setattr(settings, "decoding_tier_pressure", "0.5,1.0")
+
+    def queue_depth():
+        depth = policy.depths.pop(0)
+        return None if depth is None else {"audio_processing": depth}
+
+    policy = DecodingPolicy()
+    policy.depths = []
+    monkeypatch.setattr(policy, "queue_depth", queue_depth)
+    monkeypatch.setattr(policy, "pressure", lambda depths: depths["audio_processing"] / 100)
+    return policy
+
+
+def select_sequence(policy: DecodingPolicy, depths: list) -> list:
+    """대기 작업 수를 차례로 적용했을 때 선택된 단계 이름"""
+    policy.depths = list(depths)
+    return [policy.select().name for _ in depths]
+
+
+def test_steps_down_at_thresholds(policy):
+    """부하가 임계값 이상이면 즉시 낮은 단계로"""
+    assert select_sequence(policy, [0, 49, 50, 99, 100, 300]) == [
+        TIER_FULL, TIER_FULL, TIER_BALANCED, TIER_BALANCED, TIER_FAST, TIER_FAST,
+    ]
+
+
+def test_steps_up_only_below_hysteresis(policy):
+    """부하가 줄 때는 임계값 × TIER_HYSTERESIS 아래로 내려가야 단계를 올림"""
+    assert select_sequence(policy, [60, 45, 40, 39]) == [TIER_BALANCED, TIER_BALANCED, TIER_BALANCED, TIER_FULL]
+    assert select_sequence(policy, [100, 85, 80, 79, 45, 39]) == [
+        TIER_FAST, TIER_FAST, TIER_FAST, TIER_BALANCED, TIER_BALANCED, TIER_FULL,
+    ]
+
+
+def test_can_skip_tiers_when_load_drops_sharply(policy):
+    """부하가 크게 줄면 중간 단계를 거치지 않고 바로 올림"""
+    assert select_sequence(policy, [150, 10]) == [TIER_FAST, TIER_FULL]
+
+
+def test_unknown_depth_keeps_current_tier(policy):
+    """큐 길이를 알 수 없으면 (Redis 장애) 현재 단계 유지"""
+    assert select_sequence(policy, [70, None, None, 0]) == [TIER_BALANCED, TIER_BALANCED, TIER_BALANCED, TIER_FULL]
+
+
+def test_requested_tier_does_not_change_level(policy):
+    """지정 단계(재처리 요청)는 부하 판단 상태를 바꾸지 않음"""
+    assert select_sequence(policy, [70]) == [TIER_BALANCED]
+
+    assert policy.select(TIER_FAST).name == TIER_FAST
+    assert select_sequence(policy, [45]) == [TIER_BALANCED]
+
+    with pytest.raises(ValueError):
+        policy.select("ultra")
+
+
+def test_disabled_policy_always_full(policy, monkeypatch):
+    """DECODING_POLICY_ENABLED=false면 부하와 무관하게 full"""
+    monkeypatch.setattr(settings, "decoding_policy_enabled", False)
+
+    assert select_sequence(policy, [500]) == [TIER_FULL]
+
+
+def worker(hostname: str, queue: str, concurrency: int) -> dict:
+    """GPU Worker 하트비트 내용"""
+    return {"hostname": hostname, "queue": queue, "concurrency": concurrency}
+
+
+def test_pressure_divides_by_effective_concurrency(monkeypatch):
+    """부하는 큐별 대기 작업 수를 그 큐를 소비하는 동시 실행 수로 나눠 계산"""
+    monkeypatch.setattr(settings, "decoding_sla_sec", 100.0)
+    monkeypatch.setattr(settings, "worker_device_index", 0)
+
+    policy = DecodingPolicy()
+    policy.pool_size = 2
+    policy.record_task(10.0)
+    policy._workers = [
+        worker(socket.gethostname(), "gpu.0", 2),  # 이 Worker (풀 크기로 계산, 중복 제외)
+        worker(socket.gethostname(), "gpu.1", 3),  # 기본 큐만 공유
+        worker("node-b", "gpu.0", 1),  # 다른 노드의 같은 번호 GPU: 장치 큐와 기본 큐 공유
+    ]
+
+    assert policy.consumers("gpu.0") == 3
+    assert policy.consumers("audio_processing") == 6
+    # (6 / 3 + 12 / 6) × 10초 / 100초
+    assert policy.pressure({"gpu.0": 6, "audio_processing": 12}) == pytest.approx(0.4)
+
+
+def test_pressure_without_other_workers_uses_pool_size(monkeypatch):
+    """등록된 다른 Worker가 없으면 이 Worker의 풀 크기로만 나눔"""
+    monkeypatch.setattr(settings, "decoding_sla_sec", 100.0)
+    monkeypatch.setattr(settings, "worker_device_index", -1)
+
+    policy = DecodingPolicy()
+    policy.pool_size = 4
+    assert policy.pressure({"audio_processing": 40}) == 0.0  # 처리 이력 없음
+
+    policy.record_task(10.0)
+    policy.record_task(20.0)  # EWMA: 10 + 0.2 × (20 - 10) = 12
+    assert policy.pressure({"audio_processing": 40}) == pytest.approx(40 / 4 * 12 / 100)
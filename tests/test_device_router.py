@@ -0,0 +1,62 @@
+"""DeviceRouter (장치별 큐 선택) 테스트"""
+from collections import Counter
+
+import pytest
+
+from app.core.config import settings
+from app.services.device_service import DeviceRouter
+
+DEVICES = [
+    {"queue": "gpu.0", "memory_free_mb": 20000},
+    {"queue": "gpu.1", "memory_free_mb": 18000},
+]
+
+
+@pytest.fixture
+def router(monkeypatch):
+    """작업당 예상 메모리 1GB 기준 라우터"""
+    monkeypatch.setattr(settings, "device_task_memory_mb", 1024)
+    return DeviceRouter()
+
+
+@pytest.mark.parametrize("routing", ["queue", "memory"])
+def test_selections_against_one_snapshot_spread_across_devices(router, monkeypatch, routing):
+    """배치 업로드처럼 같은 스냅샷으로 여러 번 선택해도 한 장치에 몰리지 않음"""
+    monkeypatch.setattr(settings, "device_routing", routing)
+
+    counts = Counter(router.select_queue(DEVICES, {}, snapshot_version=1) for _ in range(20))
+
+    assert set(counts) == {"gpu.0", "gpu.1"}
+    assert abs(counts["gpu.0"] - counts["gpu.1"]) <= 4
+
+
+def test_memory_routing_prefers_free_memory_until_estimate_catches_up(router, monkeypatch):
+    """memory 기준: 여유 메모리 차이(약 2GB)만큼은 큰 장치로 보낸 뒤 번갈아 분산"""
+    monkeypatch.setattr(settings, "device_routing", "memory")
+
+    picks = [router.select_queue(DEVICES, {}, snapshot_version=1) for _ in range(4)]
+
+    assert picks[:2] == ["gpu.0", "gpu.0"]
+    assert set(picks[2:]) == {"gpu.0", "gpu.1"}
+
+
+def test_memory_routing_counts_queued_tasks(router, monkeypatch):
+    """memory 기준: 스냅샷의 대기 작업도 예상 사용량에 포함"""
+    monkeypatch.setattr(settings, "device_routing", "memory")
+
+    assert router.select_queue(DEVICES, {"gpu.0": 5}, snapshot_version=1) == "gpu.1"
+
+
+def test_new_snapshot_version_resets_dispatch_counts(router, monkeypatch):
+    """같은 목록 객체라도 스냅샷 번호가 바뀌면 전송 수를 초기화"""
+    monkeypatch.setattr(settings, "device_routing", "queue")
+    devices = [dict(device, memory_free_mb=0) for device in DEVICES]
+
+    assert router.select_queue(devices, {}, snapshot_version=1) == "gpu.0"
+    assert router.select_queue(devices, {}, snapshot_version=1) == "gpu.1"
+    assert router.select_queue(devices, {}, snapshot_version=2) == "gpu.0"
+
+
+def test_no_devices_uses_default_queue(router):
+    """등록된 장치가 없으면 기본 큐"""
+    assert router.select_queue([], {}, snapshot_version=1) is None
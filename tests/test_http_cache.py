@@ -0,0 +1,165 @@
+"""HTTP 응답 캐시 (Range 파싱, 조건부 요청, 압축, If-Range) 테스트"""
+import gzip
+from email.utils import formatdate
+
+import pytest
+from starlette.requests import Request
+
+from app.utils.http_cache import ResponseBodyCache, build_cached_response, parse_range
+
+BODY = ("1\n00:00:00,000 --> 00:00:02,500\n상담 내용입니다.\n\n" * 200).encode("utf-8")
+LAST_MODIFIED = 1_700_000_000.0
+
+
+def make_request(**headers: str) -> Request:
+    """헤더만 지정한 GET 요청 (키의 _는 -로 변환)"""
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.fixture
+def cache():
+    """1MB 응답 본문 캐시"""
+    return ResponseBodyCache(1024 * 1024)
+
+
+def respond(cache: ResponseBodyCache, request: Request, allow_range: bool = True):
+    """BODY를 캐시에 넣고 응답 생성"""
+    cached = cache.get("key", 1) or cache.put("key", 1, BODY)
+    return build_cached_response(
+        request,
+        cache,
+        "key",
+        cached,
+        media_type="text/plain; charset=utf-8",
+        last_modified=LAST_MODIFIED,
+        compress_min_bytes=1024,
+        allow_range=allow_range,
+    )
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=10-", (10, 99)),
+    ("bytes=-20", (80, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=90-500", (90, 99)),
+    ("BYTES = 5-5", (5, 5)),
+    ("bytes=100-", None),
+    ("bytes=20-10", None),
+    ("bytes=-0", None),
+])
+def test_parse_range(header, expected):
+    """단일 범위, 접미 범위, 끝 초과 범위 보정, 만족할 수 없는 범위"""
+    assert parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["items=0-9", "bytes=0-9,20-29", "bytes=a-b", "bytes=-"])
+def test_parse_range_rejects_unsupported_forms(header):
+    """다른 단위, 다중 범위, 숫자가 아닌 범위는 ValueError"""
+    with pytest.raises(ValueError):
+        parse_range(header, 100)
+
+
+def test_parse_range_suffix_on_empty_body():
+    """빈 본문의 접미 범위는 만족할 수 없음"""
+    assert parse_range("bytes=-10", 0) is None
+
+
+def test_if_none_match_returns_304(cache):
+    """같은 ETag로 조건부 요청하면 본문 없이 304"""
+    etag = respond(cache, make_request()).headers["etag"]
+
+    response = respond(cache, make_request(if_none_match=f'W/{etag}, "other"'))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+def test_if_modified_since_returns_304(cache):
+    """If-None-Match가 없으면 Last-Modified 기준으로 판정"""
+    not_modified = respond(cache, make_request(if_modified_since=formatdate(LAST_MODIFIED, usegmt=True)))
+    modified = respond(cache, make_request(if_modified_since=formatdate(LAST_MODIFIED - 60, usegmt=True)))
+
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+
+
+def test_compressed_body_has_its_own_etag(cache):
+    """gzip 응답은 원본과 다른 ETag를 사용하고, 원본 ETag로는 304가 되지 않음"""
+    identity = respond(cache, make_request())
+    gzipped = respond(cache, make_request(accept_encoding="gzip"))
+
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(gzipped.body) == BODY
+    assert gzipped.headers["etag"] != identity.headers["etag"]
+    assert gzipped.headers["vary"] == "Accept-Encoding"
+
+    stale = respond(cache, make_request(accept_encoding="gzip", if_none_match=identity.headers["etag"]))
+    fresh = respond(cache, make_request(accept_encoding="gzip", if_none_match=gzipped.headers["etag"]))
+    assert stale.status_code == 200
+    assert fresh.status_code == 304
+
+
+def test_small_or_refused_bodies_are_not_compressed(cache):
+    """q=0으로 거부한 인코딩은 사용하지 않음"""
+    response = respond(cache, make_request(accept_encoding="gzip;q=0"))
+
+    assert "content-encoding" not in response.headers
+    assert response.body == BODY
+
+
+def test_range_is_served_uncompressed(cache):
+    """Range 응답은 압축하지 않은 원본 기준 206"""
+    response = respond(cache, make_request(range="bytes=0-99", accept_encoding="gzip"))
+
+    assert response.status_code == 206
+    assert response.body == BODY[:100]
+    assert response.headers["content-range"] == f"bytes 0-99/{len(BODY)}"
+    assert "content-encoding" not in response.headers
+
+
+def test_unsatisfiable_range_returns_416(cache):
+    """본문 밖의 범위는 416"""
+    response = respond(cache, make_request(range=f"bytes={len(BODY)}-"))
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(BODY)}"
+
+
+def test_if_range_applies_range_only_for_current_representation(cache):
+    """If-Range가 현재 ETag/Last-Modified와 같을 때만 206, 다르면 전체 200"""
+    etag = respond(cache, make_request()).headers["etag"]
+    date = formatdate(LAST_MODIFIED, usegmt=True)
+
+    assert respond(cache, make_request(range="bytes=0-9", if_range=etag)).status_code == 206
+    assert respond(cache, make_request(range="bytes=0-9", if_range=date)).status_code == 206
+
+    for stale in ('"stale"', f"W/{etag}", formatdate(LAST_MODIFIED - 60, usegmt=True)):
+        response = respond(cache, make_request(range="bytes=0-9", if_range=stale))
+        assert response.status_code == 200
+        assert response.body == BODY
+
+
+def test_range_ignored_when_not_allowed(cache):
+    """Range를 허용하지 않는 응답은 전체 본문"""
+    response = respond(cache, make_request(range="bytes=0-9"), allow_range=False)
+
+    assert response.status_code == 200
+    assert "accept-ranges" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_file_rereads_changed_file(cache, tmp_path):
+    """파일 크기/mtime이 바뀌면 다시 읽음"""
+    path = tmp_path / "call.srt"
+    path.write_bytes(b"first")
+    first, _ = await cache.get_file(path)
+
+    path.write_bytes(b"second version")
+    second, _ = await cache.get_file(path)
+
+    assert first.body == b"first"
+    assert second.body == b"second version"
+    assert first.etag != second.etag
@@ -0,0 +1,32 @@
+"""작업 프로파일러 메모리 할당 수집 구간 테스트"""
+from app.core.config import settings
+from app.core.profiling import profile_task
+from app.core.tracing import task_trace, trace_span
+from app.services.audio_cache_service import AudioCacheService
+from app.tasks.audio_task import timed_stage, trim_before_models
+from benchmarks.synthetic_audio import write_synthetic_wav
+
+
+def test_profiled_run_records_decode_stage_allocations(tmp_path, monkeypatch):
+    """프로파일링된 작업은 디코딩이 일어나는 normalize/trim 구간의 할당을 기록"""
+    monkeypatch.setattr(settings, "profile_task_id", "profiled-task")
+    monkeypatch.setattr(settings, "log_dir", tmp_path / "logs")
+    audio_path = tmp_path / "call.wav"
+    write_synthetic_wav(audio_path, 5.0)
+    cache = AudioCacheService(tmp_path / "cache", max_bytes=0)
+    stage_timings = {}
+
+    with profile_task("profiled-task") as session, task_trace("profiled-task", audio_path.name):
+        with timed_stage(stage_timings, "normalize"):
+            normalized = cache.load(audio_path)
+        with timed_stage(stage_timings, "trim"):
+            trim_before_models(normalized)
+        with trace_span("summarize"):
+            bytearray(1024 * 1024)
+
+    labels = [report.splitlines()[0] for report in session.allocation_reports]
+    assert labels == ["== normalize ==", "== trim =="]
+    assert "peak: 0.0 KiB" not in session.allocation_reports[0]
+
+    report = (tmp_path / "logs" / "profiles" / "profiled-task_alloc.txt").read_text(encoding="utf-8")
+    assert "== normalize ==" in report
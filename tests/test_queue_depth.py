@@ -0,0 +1,93 @@
+"""브로커 큐 길이 (kombu 우선순위 하위 목록 합산) 테스트"""
+from types import SimpleNamespace
+
+import pytest
+from kombu.transport.redis import PRIORITY_STEPS, Channel
+
+from app.core.celery_client import broker_queue_keys
+from app.core.config import settings
+from app.services.decoding_policy import DecodingPolicy
+from app.services.health_service import HealthService
+
+
+# Redis 목록 길이 (키: 길이), "audio_processing"에 우선순위 0/9 작업, 장치 큐에 우선순위 3 작업
+LENGTHS = {
+    "audio_processing": 2,
+    "audio_processing\x06\x169": 5,
+    "gpu.0": 1,
+    "gpu.0\x06\x163": 4,
+}
+
+
+class FakePipeline:
+    """LLEN만 지원하는 Redis 파이프라인 (동기/비동기 겸용)"""
+
+    def __init__(self):
+        self.keys = []
+
+    def llen(self, key):
+        self.keys.append(key)
+
+    def execute(self):
+        return [LENGTHS.get(key, 0) for key in self.keys]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        return FakePipeline.execute(self)
+
+
+def test_broker_queue_keys_match_kombu_priority_lists():
+    """모든 우선순위(0~9)의 kombu 목록 키가 포함됨"""
+    channel = SimpleNamespace(sep=Channel.sep, priority_steps=PRIORITY_STEPS)
+    channel.priority = lambda n: Channel.priority(channel, n)
+
+    kombu_keys = {Channel._q_for_pri(channel, "audio_processing", priority) for priority in range(10)}
+
+    assert broker_queue_keys("audio_processing")[0] == "audio_processing"
+    assert set(broker_queue_keys("audio_processing")) == kombu_keys
+
+
+def test_decoding_policy_counts_priority_lists(monkeypatch):
+    """Worker의 대기 작업 수는 장치 큐 + 기본 큐의 모든 우선순위 목록 합계"""
+    policy = DecodingPolicy()
+    policy._client = SimpleNamespace(
+        pipeline=lambda transaction=False: FakePipeline(),
+        scan_iter=lambda match: iter([]),
+    )
+    monkeypatch.setattr(policy, "consumed_queues", lambda: ["gpu.0", "audio_processing"])
+
+    assert policy.queue_depth() == {"gpu.0": 5, "audio_processing": 7}
+
+
+@pytest.mark.asyncio
+async def test_health_check_counts_priority_lists(monkeypatch):
+    """헬스 체크 큐 길이는 큐별로 우선순위 목록을 합산"""
+    monkeypatch.setattr(settings, "monitored_queues", "audio_processing")
+
+    async def ping():
+        return True
+
+    async def list_devices():
+        return [{"queue": "gpu.0", "device_index": 0, "hostname": "worker-0"}]
+
+    service = HealthService()
+    service._broker = SimpleNamespace(ping=ping, pipeline=lambda transaction=False: FakeAsyncPipeline())
+    monkeypatch.setattr(service, "_list_devices", list_devices)
+
+    connected, queue_depth, _ = await service._check_broker()
+
+    assert connected
+    assert queue_depth == {"audio_processing": 7, "gpu.0": 5}
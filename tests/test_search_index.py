@@ -0,0 +1,182 @@
+"""전문 검색 인덱스 (bigram 토큰, FTS5 항목 교체, 검색 API) 테스트"""
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+
+from app.db.database import close_task_db, get_sync_session_factory, init_task_db, init_task_db_sync
+from app.db.models import SearchSegment
+from app.db.search_index import (
+    KIND_SUMMARY,
+    KIND_TRANSCRIPT,
+    MIN_QUERY_CHARS,
+    SearchIndexRepository,
+    build_match_query,
+    ngram_tokens,
+    replace_entries,
+    summary_entry,
+)
+from app.main import app
+
+
+def transcript_entry(content: str, start: float = 0.0) -> dict:
+    """전사 검색 항목"""
+    return {"kind": KIND_TRANSCRIPT, "start_sec": start, "end_sec": start + 2.0, "speaker": "SPEAKER_00", "text": content}
+
+
+def index(source: str, entries: list, task_id: str = None, kind: str = None):
+    """동기 세션으로 source의 항목 교체 후 커밋"""
+    init_task_db_sync()
+    with get_sync_session_factory()() as session:
+        replace_entries(session, source, task_id, entries, kind)
+        session.commit()
+
+
+def matching_sources(query: str) -> list:
+    """FTS5에서 검색어와 일치하는 항목의 (source, text)"""
+    with get_sync_session_factory()() as session:
+        rows = session.execute(
+            text(
+                "SELECT s.source, s.text FROM transcript_fts f JOIN search_segments s ON s.id = f.rowid "
+                "WHERE f.tokens MATCH :match ORDER BY f.rowid"
+            ),
+            {"match": build_match_query(query)},
+        ).all()
+    return [tuple(row) for row in rows]
+
+
+@pytest.fixture
+def source():
+    """테스트마다 다른 결과 파일 이름"""
+    return f"call_{uuid.uuid4().hex}"
+
+
+@pytest_asyncio.fixture
+async def repository():
+    """스키마가 준비된 검색 저장소 (테스트마다 엔진을 현재 이벤트 루프에서 새로 생성)"""
+    await init_task_db()
+    yield SearchIndexRepository()
+    await close_task_db()
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("당일콜", ["당일", "일콜"]),
+    ("양동 고려의원", ["양동", "동고", "고려", "려의", "의원"]),
+    ("ＡＢ-1", ["ab", "b1"]),
+    ("콜", ["콜"]),
+    ("?!", []),
+    ("", []),
+])
+def test_ngram_tokens(content, expected):
+    """NFKC 정규화 + 소문자, 공백/문장 부호 제거 후 bigram (한 글자는 그대로)"""
+    assert ngram_tokens(content) == expected
+
+
+def test_ngram_tokens_ignore_spacing():
+    """STT 띄어쓰기가 달라도 같은 토큰"""
+    assert ngram_tokens("양동 고려의원") == ngram_tokens("양동고려의원")
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("당일콜", '"당일 일콜"'),
+    ("당일 콜!", '"당일 일콜"'),
+    ("AB", '"ab"'),
+    ("콜", None),
+    ("a.", None),
+    ("  ", None),
+    ("", None),
+])
+def test_build_match_query(query, expected):
+    """bigram phrase 식, 문자/숫자가 MIN_QUERY_CHARS 미만이면 None"""
+    assert MIN_QUERY_CHARS == 2
+    assert build_match_query(query) == expected
+
+
+def test_insert_and_substring_search(source):
+    """색인한 세그먼트는 부분 문자열(bigram phrase)로 검색됨"""
+    index(source, [transcript_entry("내일 당일콜 예약 부탁드립니다"), transcript_entry("감사합니다", 2.0)])
+
+    assert (source, "내일 당일콜 예약 부탁드립니다") in matching_sources("당일콜")
+    assert (source, "내일 당일콜 예약 부탁드립니다") in matching_sources("일콜 예")
+    assert not any(src == source for src, _ in matching_sources("당일 택시"))
+
+
+def test_replace_removes_old_tokens_from_fts(source):
+    """교체 시 이전 항목을 FTS5 'delete'(저장된 원문에서 다시 만든 토큰)로 지워 더 이상 검색되지 않음"""
+    index(source, [transcript_entry("양동고려의원 가는 차량")])
+    index(source, [transcript_entry("서구보건소 가는 차량")])
+
+    assert not any(src == source for src, _ in matching_sources("고려의원"))
+    assert (source, "서구보건소 가는 차량") in matching_sources("서구보건소")
+
+    with get_sync_session_factory()() as session:
+        texts = session.scalars(select(SearchSegment.text).where(SearchSegment.source == source)).all()
+    assert texts == ["서구보건소 가는 차량"]
+
+
+def test_replace_single_kind_keeps_other_entries(source):
+    """kind를 지정하면 그 종류만 교체 (재요약 시 전사 항목 유지)"""
+    index(source, [transcript_entry("휠체어 차량 배차"), summary_entry("이전 요약 내용")])
+    index(source, [summary_entry("새 요약 내용")], kind=KIND_SUMMARY)
+
+    assert (source, "휠체어 차량 배차") in matching_sources("휠체어")
+    assert (source, "새 요약 내용") in matching_sources("새 요약")
+    assert not any(src == source for src, _ in matching_sources("이전 요약"))
+
+
+def test_replace_with_no_entries_deletes_source(source):
+    """빈 항목으로 교체하면 해당 결과 파일의 항목이 모두 삭제됨"""
+    index(source, [transcript_entry("삭제될 상담 내용")])
+    index(source, [])
+
+    assert not any(src == source for src, _ in matching_sources("삭제될"))
+
+
+@pytest.mark.asyncio
+async def test_repository_search_pages_and_filters(repository, source):
+    """최근 색인 순 커서 페이지네이션 + kind 필터"""
+    index(source, [transcript_entry(f"당일콜 문의 {i}", float(i)) for i in range(3)] + [summary_entry("당일콜 요약")])
+
+    first, cursor = await repository.search("당일콜", limit=2)
+    second, _ = await repository.search("당일콜", cursor=cursor, limit=2)
+    summaries, _ = await repository.search("당일콜", kind=KIND_SUMMARY, limit=50)
+
+    assert [row["text"] for row in first] == ["당일콜 요약", "당일콜 문의 2"]
+    assert second[0]["text"] == "당일콜 문의 1"
+    assert [row["text"] for row in summaries if row["source"] == source] == ["당일콜 요약"]
+
+
+@pytest.mark.asyncio
+async def test_repository_rejects_short_query(repository):
+    """문자/숫자가 MIN_QUERY_CHARS 미만인 검색어는 ValueError"""
+    with pytest.raises(ValueError):
+        await repository.search("콜")
+
+
+def test_search_endpoint(source):
+    """GET /search: 부분 문자열 검색, 한 글자/잘못된 kind는 400"""
+    index(source, [transcript_entry("오늘 당일콜로 병원 예약했어요", 12.5)], task_id=None)
+
+    with TestClient(app) as client:
+        response = client.get("/api/v1/search", params={"q": "당일콜"})
+        single_char = client.get("/api/v1/search", params={"q": "콜"})
+        punctuation_only = client.get("/api/v1/search", params={"q": "!!"})
+        bad_kind = client.get("/api/v1/search", params={"q": "당일콜", "kind": "audio"})
+
+    assert response.status_code == 200, response.text
+    hits = [hit for hit in response.json()["items"] if hit["source"] == source]
+    assert hits == [{
+        "task_id": None,
+        "filename": None,
+        "source": source,
+        "kind": KIND_TRANSCRIPT,
+        "start": 12.5,
+        "end": 14.5,
+        "speaker": "SPEAKER_00",
+        "text": "오늘 당일콜로 병원 예약했어요",
+    }]
+    assert single_char.status_code == 400
+    assert punctuation_only.status_code == 400
+    assert bad_kind.status_code == 400
@@ -0,0 +1,163 @@
+"""SegmentList 테스트 (기존 문자열 튜플 기반 구현과 출력 비교)"""
+import random
+from datetime import timedelta
+
+import pytest
+
+from app.utils.audio_utils import merge_transcripts_with_speaker_labels
+from app.utils.segments import SegmentList
+
+
+# --- 기존 구현 (WhisperService._format_timestamp, DiarizationService.merge_with_transcript 등) ---
+
+def legacy_format_timestamp(seconds: float) -> str:
+    td = timedelta(seconds=seconds)
+    hours, remainder = divmod(td.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    milliseconds = int(td.microseconds / 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def legacy_timestamp_to_seconds(timestamp: str) -> float:
+    time_part, ms_part = timestamp.split(",")
+    hours, minutes, seconds = map(int, time_part.split(":"))
+    return hours * 3600 + minutes * 60 + seconds + int(ms_part) / 1000
+
+
+def legacy_transcribe(segments):
+    return [
+        (legacy_format_timestamp(start), legacy_format_timestamp(end), text)
+        for start, end, text in segments
+    ]
+
+
+def legacy_transcribe_to_srt(segments) -> str:
+    lines = []
+    for idx, (start, end, text) in enumerate(legacy_transcribe(segments), start=1):
+        lines.extend([f"{idx}", f"{start} --> {end}", text, ""])
+    return "\n".join(lines)
+
+
+def legacy_find_speaker_at_time(diarization_segments, time_sec: float) -> str:
+    for start, end, speaker in diarization_segments:
+        if start <= time_sec <= end:
+            return speaker
+    return "UNKNOWN"
+
+
+def legacy_merge_to_srt(diarization_segments, segments) -> str:
+    lines = []
+    for idx, (start, end, text) in enumerate(legacy_transcribe(segments), start=1):
+        mid = (legacy_timestamp_to_seconds(start) + legacy_timestamp_to_seconds(end)) / 2
+        speaker = legacy_find_speaker_at_time(diarization_segments, mid)
+        lines.extend([f"{idx}", f"{start} --> {end}", f"[{speaker}] {text}", ""])
+    return "\n".join(lines)
+
+
+def legacy_merge_channels_to_srt(left, right) -> str:
+    merged = [(start, end, "[화자1] " + text) for start, end, text in legacy_transcribe(left)]
+    merged += [(start, end, "[화자2] " + text) for start, end, text in legacy_transcribe(right)]
+    merged.sort(key=lambda segment: legacy_timestamp_to_seconds(segment[0]))
+
+    lines = []
+    for idx, (start, end, text) in enumerate(merged, start=1):
+        lines.extend([f"{idx}", f"{start} --> {end}", text, ""])
+    return "\n".join(lines)
+
+
+# --- 입력 생성 ---
+
+def random_segments(rng: random.Random, count: int):
+    """밀리초 단위 시각의 STT 세그먼트 [(시작, 종료, 텍스트), ...] (시작 시각 순)"""
+    segments = []
+    cursor_ms = 0
+    for i in range(count):
+        cursor_ms += rng.randint(0, 4000)
+        duration_ms = rng.randint(1, 6000)
+        segments.append((cursor_ms / 1000, (cursor_ms + duration_ms) / 1000, f"문장 {i}"))
+    return segments
+
+
+def random_turns(rng: random.Random, count: int):
+    """겹침/빈 구간이 있는 화자 구간 [(시작, 종료, 화자), ...] (시작 시각 순)"""
+    turns = []
+    cursor_ms = 0
+    for _ in range(count):
+        cursor_ms += rng.randint(0, 5000)
+        duration_ms = rng.randint(200, 8000)
+        speaker = rng.choice(["SPEAKER_00", "SPEAKER_01", "SPEAKER_02"])
+        turns.append((cursor_ms / 1000, (cursor_ms + duration_ms) / 1000, speaker))
+    return turns
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_mono_srt_matches_legacy(seed):
+    """화자 없는 SRT는 기존 transcribe_to_srt와 바이트 단위로 같음 (밀리초 버림 포함)"""
+    rng = random.Random(seed)
+    segments = [(start + rng.random() / 1000, end, text) for start, end, text in random_segments(rng, 200)]
+
+    assert SegmentList.from_tuples(segments).to_srt() == legacy_transcribe_to_srt(segments)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_assign_speakers_matches_legacy(seed):
+    """중간 지점 기준 화자 지정 결과가 기존 선형 탐색과 같음 (겹치는 구간은 먼저 시작한 구간, 없으면 UNKNOWN)"""
+    rng = random.Random(seed)
+    segments = random_segments(rng, 300)
+    turns = random_turns(rng, 80)
+
+    merged = SegmentList.from_tuples(segments).assign_speakers(
+        [start for start, _, _ in turns],
+        [end for _, end, _ in turns],
+        [speaker for _, _, speaker in turns],
+    )
+
+    assert merged.to_srt() == legacy_merge_to_srt(turns, segments)
+
+
+def test_assign_speakers_boundaries():
+    """구간 경계(시작/종료와 같은 중간 지점)는 포함, 구간이 없으면 UNKNOWN"""
+    segments = [(0.0, 2.0, "a"), (2.0, 4.0, "b"), (9.0, 11.0, "c"), (20.0, 22.0, "d")]
+    turns = [(1.0, 3.0, "SPEAKER_01"), (3.0, 5.0, "SPEAKER_00"), (10.0, 30.0, "SPEAKER_01")]
+
+    merged = SegmentList.from_tuples(segments).assign_speakers(*zip(*turns))
+
+    assert merged.to_srt() == legacy_merge_to_srt(turns, segments)
+    assert [item["speaker"] for item in merged.to_json()] == ["SPEAKER_01", "SPEAKER_01", "SPEAKER_01", "SPEAKER_01"]
+
+    unknown = SegmentList.from_tuples([(50.0, 51.0, "e")]).assign_speakers(*zip(*turns))
+    assert unknown.to_json()[0]["speaker"] == "UNKNOWN"
+
+
+def test_assign_speakers_without_turns():
+    """화자 구간이 없으면 모두 UNKNOWN"""
+    segments = [(0.0, 1.0, "a"), (1.0, 2.0, "b")]
+
+    merged = SegmentList.from_tuples(segments).assign_speakers([], [], [])
+
+    assert merged.to_srt() == legacy_merge_to_srt([], segments)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_channel_merge_matches_legacy(seed):
+    """좌우 채널 병합은 기존 안정 정렬(같은 시각이면 왼쪽 먼저)과 같은 SRT"""
+    rng = random.Random(seed)
+    left = random_segments(rng, 120)
+    right = random_segments(rng, 120)
+    right[:5] = left[:5]  # 같은 시작 시각
+
+    merged = merge_transcripts_with_speaker_labels(
+        SegmentList.from_tuples(left), SegmentList.from_tuples(right)
+    )
+
+    assert merged.to_srt() == legacy_merge_channels_to_srt(left, right)
+
+
+def test_from_srt_round_trip():
+    """저장된 SRT를 다시 읽어도 같은 SRT로 출력"""
+    rng = random.Random(7)
+    segments = random_segments(rng, 50)
+    turns = random_turns(rng, 10)
+    srt = SegmentList.from_tuples(segments).assign_speakers(*zip(*turns)).to_srt()
+
+    assert SegmentList.from_srt(srt).to_srt() == srt
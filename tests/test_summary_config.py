@@ -0,0 +1,109 @@
+"""SummaryConfigStore (버전별 요약 설정) 테스트"""
+import json
+import os
+
+import pytest
+
+from app.core.config import settings
+from app.services.summary_config_service import (
+    DICTIONARY_FILENAME,
+    PROMPT_FILENAME,
+    SummaryConfigStore,
+)
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """프롬프트/용어 사전만 있는 설정 디렉토리 (매 get()마다 최신 버전 확인)"""
+    (tmp_path / PROMPT_FILENAME).write_text("프롬프트 {transcript}", encoding="utf-8")
+    (tmp_path / DICTIONARY_FILENAME).write_text("AICC=상담", encoding="utf-8")
+    monkeypatch.setattr(settings, "config_dir", tmp_path)
+    monkeypatch.setattr(settings, "summary_config_check_sec", 0.0)
+    return tmp_path
+
+
+def make_store(monkeypatch) -> SummaryConfigStore:
+    """Redis 구독/발행 없는 저장소 (발행한 버전은 published에 기록)"""
+    store = SummaryConfigStore()
+    store.published = []
+    monkeypatch.setattr(store, "_ensure_listener", lambda: None)
+    monkeypatch.setattr(store, "_publish", store.published.append)
+    return store
+
+
+def hand_edit(path, content: str):
+    """설정 파일 직접 수정 (스냅샷보다 확실히 새 수정 시간)"""
+    path.write_text(content, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_first_load_registers_files_as_v1(config_dir, monkeypatch):
+    """스냅샷이 없으면 현재 설정 파일을 v1으로 등록"""
+    config = make_store(monkeypatch).get()
+
+    assert (config.version, config.changed) == (1, "file")
+    assert config.prompt_template == "프롬프트 {transcript}"
+    assert config.dictionary_content == "AICC=상담"
+    assert [path.name for path in (config_dir / "versions").glob("*.json")] == ["000001.json"]
+
+
+def test_update_bumps_version_and_rewrites_files(config_dir, monkeypatch):
+    """변경할 때마다 버전이 1씩 오르고, 바꾸지 않은 항목은 이전 버전 값을 유지"""
+    store = make_store(monkeypatch)
+    store.get()
+
+    prompt_update = store.update(prompt_template="새 프롬프트 {transcript}")
+    dictionary_update = store.update(dictionary_content="VOC=고객의 소리")
+
+    assert (prompt_update.version, prompt_update.changed) == (2, "prompt")
+    assert (dictionary_update.version, dictionary_update.changed) == (3, "dictionary")
+    assert dictionary_update.prompt_template == "새 프롬프트 {transcript}"
+    assert store.published == [2, 3]
+    assert (config_dir / PROMPT_FILENAME).read_text(encoding="utf-8") == "새 프롬프트 {transcript}"
+    assert (config_dir / DICTIONARY_FILENAME).read_text(encoding="utf-8") == "VOC=고객의 소리"
+
+    # 이전 스냅샷은 바뀌지 않음
+    v2 = json.loads((config_dir / "versions" / "000002.json").read_text(encoding="utf-8"))
+    assert v2["dictionary_content"] == "AICC=상담"
+    assert store.get().version == 3
+
+
+def test_hand_edited_file_becomes_new_version(config_dir, monkeypatch):
+    """최신 스냅샷보다 새롭고 내용이 다른 설정 파일은 다음 로드 시 새 버전으로 등록"""
+    store = make_store(monkeypatch)
+    store.update(prompt_template="API 프롬프트 {transcript}")
+
+    hand_edit(config_dir / DICTIONARY_FILENAME, "직접 수정한 사전")
+    config = store.get()
+
+    assert (config.version, config.changed) == (3, "file")
+    assert config.prompt_template == "API 프롬프트 {transcript}"
+    assert config.dictionary_content == "직접 수정한 사전"
+    assert store.get().version == 3
+
+
+def test_touched_file_with_same_content_is_not_a_new_version(config_dir, monkeypatch):
+    """수정 시간만 바뀌고 내용이 같으면 버전을 만들지 않음"""
+    store = make_store(monkeypatch)
+    store.get()
+
+    hand_edit(config_dir / PROMPT_FILENAME, "프롬프트 {transcript}")
+
+    assert store.get().version == 1
+    assert len(list((config_dir / "versions").glob("*.json"))) == 1
+
+
+def test_other_process_sees_new_version(config_dir, monkeypatch):
+    """다른 저장소 인스턴스(프로세스)의 변경은 변경 알림 또는 확인 주기에 반영"""
+    writer = make_store(monkeypatch)
+    reader = make_store(monkeypatch)
+    monkeypatch.setattr(settings, "summary_config_check_sec", 3600.0)
+
+    assert reader.get().version == 1
+    writer.update(prompt_template="변경 {transcript}")
+    assert reader.get().version == 1
+
+    # 변경 알림 수신
+    reader._stale.set()
+    assert reader.get().prompt_template == "변경 {transcript}"
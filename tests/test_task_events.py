@@ -0,0 +1,152 @@
+"""작업 진행 이벤트 구독 (TaskEventService.subscribe) 테스트 (Redis pub/sub은 메모리 대체)"""
+import asyncio
+import json
+
+import pytest
+
+from app.services.task_event_service import TaskEventService, task_event_channel
+
+TIMEOUT_SEC = 5
+
+
+class FakePubSub:
+    """redis.asyncio PubSub 대체: 발행 시점과 수신 시점에 모두 구독 중인 채널의 메시지만 get_message()로 전달"""
+
+    def __init__(self):
+        self.channels = set()
+        self.unsubscribed = []
+        self.closed = False
+        self._messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+        self.unsubscribed.extend(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        while True:
+            try:
+                message = await asyncio.wait_for(self._messages.get(), timeout)
+            except asyncio.TimeoutError:
+                return None
+            if message["channel"] in self.channels:
+                return message
+
+    async def aclose(self):
+        self.closed = True
+
+    def publish(self, task_id: str, event: str, **data):
+        """Worker 발행 대체 (구독하지 않은 채널은 유실)"""
+        channel = task_event_channel(task_id)
+        if channel in self.channels:
+            payload = {"task_id": task_id, "event": event, **data}
+            self._messages.put_nowait({"type": "message", "channel": channel, "data": json.dumps(payload)})
+
+
+@pytest.fixture
+def pubsub():
+    """메모리 pub/sub"""
+    return FakePubSub()
+
+
+@pytest.fixture
+def service(pubsub, monkeypatch):
+    """메모리 pub/sub을 사용하는 이벤트 서비스"""
+    service = TaskEventService()
+    monkeypatch.setattr(service, "_get_async_client", lambda: type("Client", (), {"pubsub": lambda self: pubsub})())
+    return service
+
+
+async def collect(stream, limit: int = 20) -> list:
+    """구독이 끝날 때까지 (keepalive 포함) 이벤트 수집"""
+    async def run():
+        items = []
+        async for item in stream:
+            items.append(item)
+            if len(items) >= limit:
+                break
+        return items
+
+    return await asyncio.wait_for(run(), TIMEOUT_SEC)
+
+
+def names(items: list) -> list:
+    """이벤트 이름 목록 (keepalive는 None)"""
+    return [item["event"] if item is not None else None for item in items]
+
+
+@pytest.mark.asyncio
+async def test_event_published_during_snapshot_is_not_lost(service, pubsub):
+    """구독 후 스냅샷을 읽으므로, 스냅샷 조회 중에 끝난 작업의 completed도 받음"""
+    subscribed_before_snapshot = []
+
+    async def snapshot():
+        subscribed_before_snapshot.append(task_event_channel("a") in pubsub.channels)
+        pubsub.publish("a", "completed", status="completed")  # 스냅샷 조회 직후 Worker가 완료
+        return [{"task_id": "a", "event": "snapshot", "status": "in_progress"}]
+
+    items = await collect(service.subscribe(["a"], keepalive_sec=1.0, snapshot=snapshot))
+
+    assert subscribed_before_snapshot == [True]
+    assert names(items) == ["snapshot", "completed"]
+    assert pubsub.closed
+
+
+@pytest.mark.asyncio
+async def test_task_already_finished_in_snapshot_ends_without_waiting(service, pubsub):
+    """스냅샷에서 이미 끝난 작업은 바로 구독 해제, 모두 끝났으면 메시지를 기다리지 않고 종료"""
+    async def snapshot():
+        return [
+            {"task_id": "a", "event": "completed", "status": "completed"},
+            {"task_id": "b", "event": "failed", "status": "failed"},
+        ]
+
+    items = await collect(service.subscribe(["a", "b"], keepalive_sec=1.0, snapshot=snapshot))
+
+    assert names(items) == ["completed", "failed"]
+    assert sorted(pubsub.unsubscribed) == [task_event_channel("a"), task_event_channel("b")]
+    assert pubsub.closed
+
+
+@pytest.mark.asyncio
+async def test_terminal_event_unsubscribes_only_that_task(service, pubsub):
+    """종료 이벤트를 받은 작업만 구독 해제, 미리보기 완료는 종료가 아님, 모두 끝나면 스트림 종료"""
+    async def snapshot():
+        # 구독 후 스냅샷 시점에 이미 발행 대기 중인 이벤트
+        pubsub.publish("b", "stage")
+        pubsub.publish("a", "completed")
+        pubsub.publish("a", "stage")  # 해제한 채널은 더 이상 수신하지 않음
+        pubsub.publish("b", "preview_completed")
+        pubsub.publish("b", "refine_failed")
+        pubsub.publish("b", "stage")  # 모든 작업이 끝난 뒤에는 읽지 않음
+        return []
+
+    items = await collect(service.subscribe(["a", "b"], keepalive_sec=1.0, snapshot=snapshot))
+
+    assert [(item["task_id"], item["event"]) for item in items] == [
+        ("b", "stage"),
+        ("a", "completed"),
+        ("b", "preview_completed"),
+        ("b", "refine_failed"),
+    ]
+    assert pubsub.unsubscribed == [task_event_channel("a"), task_event_channel("b")]
+    assert pubsub.closed
+
+
+@pytest.mark.asyncio
+async def test_keepalive_while_idle(service, pubsub):
+    """이벤트가 없으면 keepalive 주기마다 None, 잘못된 메시지는 건너뜀"""
+    stream = service.subscribe(["a"], keepalive_sec=0.05)
+
+    first = await asyncio.wait_for(stream.__anext__(), TIMEOUT_SEC)
+    second = await asyncio.wait_for(stream.__anext__(), TIMEOUT_SEC)
+
+    pubsub._messages.put_nowait({"type": "message", "channel": task_event_channel("a"), "data": "not json"})
+    pubsub.publish("a", "completed")
+    rest = await collect(stream)
+
+    assert (first, second) == (None, None)
+    assert names(rest) == ["completed"]
+    assert pubsub.closed
@@ -0,0 +1,122 @@
+"""작업 인덱스 (키셋 페이지네이션) 테스트"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+
+from app.db.database import close_task_db, get_async_session_factory, init_task_db
+from app.db.models import TaskRecord
+from app.db.task_index import TaskIndexRepository, TaskIndexWriter, decode_cursor, encode_cursor
+
+
+@pytest_asyncio.fixture
+async def repository():
+    """스키마가 준비된 저장소 (테스트마다 엔진을 현재 이벤트 루프에서 새로 생성)"""
+    await init_task_db()
+    yield TaskIndexRepository()
+    await close_task_db()
+
+
+async def create_batch(repository: TaskIndexRepository, count: int) -> str:
+    """같은 created_at을 가진 배치 작업 등록 (커서의 task_id 비교 경로 사용)"""
+    batch_id = str(uuid.uuid4())
+    await repository.create_tasks_bulk(
+        batch_id,
+        [{"task_id": str(uuid.uuid4()), "filename": f"call_{i}.wav"} for i in range(count)],
+    )
+    return batch_id
+
+
+async def collect_pages(repository: TaskIndexRepository, limit: int, **filters) -> list:
+    """next_cursor를 따라 전체 페이지 조회"""
+    pages = []
+    cursor = None
+    while True:
+        records, cursor = await repository.list_tasks(cursor=cursor, limit=limit, **filters)
+        pages.append([record.task_id for record in records])
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    """커서는 (created_at, task_id)를 그대로 복원"""
+    created_at = datetime(2025, 1, 2, 3, 4, 5, 678901)
+
+    assert decode_cursor(encode_cursor(created_at, "task|with|pipes")) == (created_at, "task|with|pipes")
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "bm90LWEtZGF0ZXx0YXNr"])
+def test_decode_cursor_rejects_malformed(cursor):
+    """base64가 아니거나 구분자/시각 형식이 잘못된 커서는 ValueError"""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_pages_cover_all_rows_without_duplicates(repository):
+    """같은 created_at이 페이지 경계에 걸려도 모든 행을 정확히 한 번씩 최신순으로 반환"""
+    batch_id = await create_batch(repository, 7)
+
+    pages = await collect_pages(repository, limit=3, batch_id=batch_id)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    task_ids = [task_id for page in pages for task_id in page]
+    assert task_ids == sorted(task_ids, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_pages_order_by_created_at_then_task_id(repository):
+    """created_at 내림차순, 같은 시각이면 task_id 내림차순"""
+    batch_id = await create_batch(repository, 4)
+    records, _ = await repository.list_tasks(batch_id=batch_id, limit=10)
+
+    # 가장 작은 task_id를 가장 최근으로 옮김
+    oldest_id = records[-1].task_id
+    async with get_async_session_factory()() as session:
+        await session.execute(
+            update(TaskRecord)
+            .where(TaskRecord.task_id == oldest_id)
+            .values(created_at=records[0].created_at + timedelta(seconds=1))
+        )
+        await session.commit()
+
+    pages = await collect_pages(repository, limit=2, batch_id=batch_id)
+
+    assert pages[0][0] == oldest_id
+    assert [task_id for page in pages for task_id in page][1:] == [record.task_id for record in records[:-1]]
+
+
+@pytest.mark.asyncio
+async def test_exact_page_size_has_no_next_cursor(repository):
+    """남은 행이 limit과 같으면 빈 다음 페이지를 만들지 않음"""
+    batch_id = await create_batch(repository, 4)
+
+    pages = await collect_pages(repository, limit=2, batch_id=batch_id)
+
+    assert [len(page) for page in pages] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_rejects_malformed_cursor(repository):
+    """잘못된 커서는 쿼리 전에 ValueError (API는 400으로 변환)"""
+    with pytest.raises(ValueError):
+        await repository.list_tasks(cursor="garbage")
+
+
+def test_writer_runs_operation_without_task_id():
+    """작업 ID가 None인 쓰기 요청도 실행되고, 기록 완료 대기 요청으로 오인되지 않음"""
+    writer = TaskIndexWriter()
+    executed = []
+
+    writer.submit(None, lambda session: executed.append(session))
+    writer.flush()
+
+    assert len(executed) == 1
+    assert writer._thread.is_alive()
+
+    writer.submit("task-1", lambda session: executed.append(session))
+    writer.flush()
+
+    assert len(executed) == 2
@@ -0,0 +1,136 @@
+"""단계 파이프라인 (StagePipeline) 동작 테스트 (단계 함수는 이벤트로 동기화하는 대체 함수)"""
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.tasks.task_pipeline import StagePipeline
+
+TIMEOUT_SEC = 5
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """단계 큐 크기 1로 활성화한 파이프라인 (테스트마다 새 단계 스레드)"""
+    monkeypatch.setattr(settings, "worker_pipeline_enabled", True)
+    monkeypatch.setattr(settings, "worker_pipeline_queue_size", 1)
+    return StagePipeline()
+
+
+def submit(pipeline: StagePipeline, steps, results: dict, key: str) -> threading.Thread:
+    """threads 풀 작업 스레드처럼 별도 스레드에서 run() 호출 (결과 또는 예외를 results에 기록)"""
+    def run():
+        try:
+            results[key] = pipeline.run(steps)
+        except Exception as e:
+            results[key] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def join_all(threads):
+    """모든 작업 스레드 종료 대기"""
+    for thread in threads:
+        thread.join(TIMEOUT_SEC)
+        assert not thread.is_alive(), "파이프라인이 멈춤"
+
+
+def test_stages_overlap_across_files(pipeline):
+    """파일 A를 추론하는 동안 파일 B를 디코딩 (순차 실행이면 A의 infer가 시간 초과)"""
+    b_decoded = threading.Event()
+    overlapped = []
+    results = {}
+
+    a_steps = [lambda: None, lambda: overlapped.append(b_decoded.wait(TIMEOUT_SEC)), lambda: None]
+    b_steps = [b_decoded.set, lambda: None, lambda: None]
+
+    threads = [submit(pipeline, a_steps, results, "a")]
+    time.sleep(0.05)  # A가 먼저 decode 단계에 들어가도록
+    threads.append(submit(pipeline, b_steps, results, "b"))
+    join_all(threads)
+
+    assert overlapped == [True]
+    assert len(results["a"]) == len(results["b"]) == 3
+
+
+def test_bounded_queues_cap_files_in_flight(pipeline):
+    """마지막 단계가 막히면 단계 스레드 + 단계 큐 분량까지만 디코딩하고 나머지 제출은 대기"""
+    gate = threading.Event()
+    decoded = []
+    lock = threading.Lock()
+    results = {}
+
+    def decode(index):
+        with lock:
+            decoded.append(index)
+
+    threads = [
+        submit(pipeline, [lambda i=i: decode(i), lambda: None, lambda: gate.wait(TIMEOUT_SEC)], results, str(i))
+        for i in range(12)
+    ]
+
+    # 역압이 자리 잡을 때까지 대기 후 디코딩된 파일 수 확인
+    deadline = time.monotonic() + TIMEOUT_SEC
+    previous = -1
+    while time.monotonic() < deadline:
+        time.sleep(0.2)
+        with lock:
+            current = len(decoded)
+        if current == previous:
+            break
+        previous = current
+
+    # post 스레드 1 + post 큐 1 + infer 스레드 1 + infer 큐 1 + decode 스레드 1 (decode 큐의 1건은 아직 디코딩 전)
+    assert len(decoded) == len(pipeline.stages) * (1 + settings.worker_pipeline_queue_size) - 1
+    assert len(decoded) < pipeline.capacity()
+    assert sum(thread.is_alive() for thread in threads) == 12
+
+    gate.set()
+    join_all(threads)
+    assert sorted(decoded) == list(range(12))
+    assert all(len(results[str(i)]) == 3 for i in range(12))
+
+
+def test_stage_failure_reported_to_its_job_only(pipeline):
+    """한 파일의 단계 예외는 그 파일의 run()에서만 발생하고, 이후 단계 생략, 다른 파일은 계속 처리"""
+    ran = []
+    results = {}
+
+    def steps(name, fail_at=None):
+        def step(stage):
+            if stage == fail_at:
+                raise RuntimeError(f"{name} {stage} 실패")
+            ran.append((name, stage))
+        return [lambda stage=stage: step(stage) for stage in pipeline.stages]
+
+    threads = []
+    for name, fail_at in (("a", None), ("b", "infer"), ("c", None)):
+        threads.append(submit(pipeline, steps(name, fail_at), results, name))
+        time.sleep(0.02)
+    join_all(threads)
+
+    assert isinstance(results["b"], RuntimeError)
+    assert str(results["b"]) == "b infer 실패"
+    assert ("b", "post") not in ran
+    assert len(results["a"]) == len(results["c"]) == 3
+    assert [stage for name, stage in ran if name == "c"] == list(pipeline.stages)
+
+
+def test_disabled_pipeline_runs_inline(monkeypatch):
+    """비활성화 시 호출한 스레드에서 순서대로 실행"""
+    monkeypatch.setattr(settings, "worker_pipeline_enabled", False)
+    callers = []
+
+    stage_seconds = StagePipeline().run([lambda: callers.append(threading.get_ident())] * 3)
+
+    assert callers == [threading.get_ident()] * 3
+    assert len(stage_seconds) == 3
+
+
+def test_step_count_must_match_stages(pipeline):
+    """단계 함수 수가 다르면 ValueError"""
+    with pytest.raises(ValueError):
+        pipeline.run([lambda: None])
@@ -0,0 +1,75 @@
+"""TrimmedAudio (무음 제거 후 시각 복원) 테스트"""
+import numpy as np
+import pytest
+
+from app.utils.audio_utils import TrimmedAudio, trim_silence
+from app.utils.segments import SegmentList
+
+
+SAMPLE_RATE = 100
+
+
+@pytest.fixture
+def trimmed() -> TrimmedAudio:
+    """원본 60초 중 1~3초, 10~12초, 50~51초만 남긴 오디오 (잘라낸 기준 0~2, 2~4, 4~5초)"""
+    regions = np.array([[100, 300], [1000, 1200], [5000, 5100]], dtype=np.int64)
+    data = np.zeros((500, 1), dtype=np.float32)
+    return TrimmedAudio(data, SAMPLE_RATE, regions, total_frames=6000)
+
+
+def test_to_original_maps_each_region(trimmed):
+    """구간 안의 시각은 해당 구간의 원본 시작 + 구간 내 오프셋"""
+    restored = trimmed.to_original(np.array([0.0, 0.5, 1.99, 2.5, 3.25, 4.0, 4.5]))
+
+    np.testing.assert_allclose(restored, [1.0, 1.5, 2.99, 10.5, 11.25, 50.0, 50.5])
+
+
+def test_to_original_boundary_side(trimmed):
+    """구간 경계는 시작 시각이면 다음 구간 시작, 종료 시각이면 이전 구간 끝"""
+    np.testing.assert_allclose(trimmed.to_original(np.array([2.0, 4.0]), side="right"), [10.0, 50.0])
+    np.testing.assert_allclose(trimmed.to_original(np.array([2.0, 4.0]), side="left"), [3.0, 12.0])
+
+
+def test_to_original_clamps_outside_range(trimmed):
+    """잘라낸 길이를 넘는 시각은 마지막 구간 기준으로 연장"""
+    np.testing.assert_allclose(trimmed.to_original(np.array([5.0, 5.5])), [51.0, 51.5])
+
+
+def test_restore_segments(trimmed):
+    """세그먼트 시작은 right, 종료는 left 기준으로 복원 (구간을 넘는 세그먼트는 원본 구간 끝에서 끝남)"""
+    segments = SegmentList([0.5, 2.0], [2.0, 4.0], ["a", "b"])
+
+    restored = trimmed.restore_segments(segments)
+
+    np.testing.assert_allclose(restored.starts, [1.5, 10.0])
+    np.testing.assert_allclose(restored.ends, [3.0, 12.0])
+    assert restored.texts == ["a", "b"]
+
+
+def test_untrimmed_and_no_speech_are_identity():
+    """자르지 않은 오디오와 음성이 없는 오디오는 시각을 그대로 반환"""
+    seconds = np.array([0.0, 1.25, 7.5])
+    data = np.zeros((1000, 1), dtype=np.float32)
+
+    np.testing.assert_allclose(TrimmedAudio.untrimmed(data, SAMPLE_RATE).to_original(seconds), seconds)
+
+    empty = TrimmedAudio(data[:0], SAMPLE_RATE, np.empty((0, 2), dtype=np.int64), len(data))
+    assert not empty.has_speech
+    np.testing.assert_allclose(empty.to_original(seconds), seconds)
+
+
+def test_trim_silence_offsets_point_to_original_samples():
+    """trim_silence 결과의 각 샘플은 to_original이 가리키는 원본 샘플과 같음"""
+    sample_rate = 16000
+    t = np.arange(sample_rate * 2) / sample_rate
+    tone = (0.3 * np.sin(2 * np.pi * 220 * t) * np.sin(2 * np.pi * 3 * t)).astype(np.float32)
+    silence = np.zeros(sample_rate * 8, dtype=np.float32)
+    data = np.concatenate([silence, tone, silence, tone * 0.5, silence])[:, np.newaxis]
+
+    result = trim_silence(data, sample_rate)
+
+    assert result.has_speech
+    assert result.removed_sec > 10
+    positions = np.arange(0, len(result.data), 97)
+    original = np.rint(result.to_original(positions / sample_rate) * sample_rate).astype(np.int64)
+    np.testing.assert_array_equal(result.data[positions, 0], data[original, 0])
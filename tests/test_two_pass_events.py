@@ -0,0 +1,79 @@
+"""2단계 처리 진행 이벤트 순서 테스트 (모델/LLM은 benchmarks.fakes로 대체)"""
+import uuid
+
+import pytest
+
+import app.services.diarization_service as diarization_module
+import app.services.whisper_service as whisper_module
+from app.core.config import settings
+from app.db.task_index import task_index_writer
+from app.services.ollama_service import ollama_service
+from app.services.task_event_service import TERMINAL_EVENTS
+from app.tasks import audio_task
+from benchmarks.fakes import FakeDiarizationService, FakeWhisperService, make_fake_summarize
+from benchmarks.synthetic_audio import write_synthetic_wav
+
+
+@pytest.fixture
+def timeline(monkeypatch):
+    """발행된 이벤트와 최종 작업 등록을 한 목록에 순서대로 기록"""
+    records = []
+    monkeypatch.setattr(whisper_module, "whisper_service", FakeWhisperService())
+    monkeypatch.setattr(diarization_module, "diarization_service", FakeDiarizationService())
+    monkeypatch.setattr(ollama_service, "summarize_sync", make_fake_summarize())
+    monkeypatch.setattr(settings, "worker_pipeline_enabled", False)
+    monkeypatch.setattr(
+        audio_task.task_event_service, "publish",
+        lambda task_id, event, **data: records.append(event),
+    )
+    monkeypatch.setattr(
+        audio_task, "enqueue_refine",
+        lambda queue, audio_path, task_id, content_hash=None: records.append("enqueue_refine"),
+    )
+    yield records
+    task_index_writer.flush()
+
+
+def run_pass(result_pass: str) -> str:
+    """합성 통화 파일 하나를 지정한 단계로 처리하고 작업 ID 반환"""
+    task_id = str(uuid.uuid4())
+    audio_path = settings.input_dir / f"{task_id}.wav"
+    if not audio_path.exists():
+        write_synthetic_wav(audio_path, 6.0, channels=2)
+    audio_task.process_audio_file.apply(
+        args=[str(audio_path), task_id],
+        kwargs={"result_pass": result_pass},
+        task_id=task_id,
+        throw=True,
+    )
+    return task_id
+
+
+def test_preview_reports_non_terminal_completion_before_enqueueing_refine(timeline):
+    """미리보기: preview_completed 보고 후 최종 작업 등록, 종료 이벤트는 발행하지 않음"""
+    run_pass(audio_task.PASS_PREVIEW)
+
+    assert timeline[0] == "started"
+    assert timeline[-2:] == ["preview_completed", "enqueue_refine"]
+    assert not TERMINAL_EVENTS.intersection(timeline)
+
+
+def test_final_pass_ends_with_terminal_completed(timeline):
+    """최종 처리: 마지막 이벤트가 종료 이벤트 completed"""
+    run_pass(audio_task.PASS_FINAL)
+
+    assert timeline[-1] == "completed"
+    assert "preview_completed" not in timeline
+    assert "enqueue_refine" not in timeline
+
+
+def test_refine_enqueue_failure_is_terminal(timeline, monkeypatch):
+    """최종 작업 등록 실패 시 미리보기 결과는 유지하고 종료 이벤트 refine_failed 발행"""
+    def fail_enqueue(queue, audio_path, task_id, content_hash=None):
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(audio_task, "enqueue_refine", fail_enqueue)
+
+    run_pass(audio_task.PASS_PREVIEW)
+
+    assert timeline[-2:] == ["preview_completed", "refine_failed"]
@@ -0,0 +1,140 @@
+"""단일 업로드 스트리밍 파싱 (receive_wav_upload, POST /api/v1/upload) 테스트"""
+import hashlib
+import shutil
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.celery_client import celery_client
+from app.core.config import settings
+from app.main import app
+from app.utils.upload_utils import (
+    InvalidWavError,
+    MalformedUploadError,
+    UploadTooLargeError,
+    receive_wav_upload,
+)
+from tests.test_batch_upload import make_wav
+
+BOUNDARY = "test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart_body(*parts: tuple) -> bytes:
+    """[(필드 이름, 파일명 또는 None, 내용), ...] → multipart 본문"""
+    body = b""
+    for name, filename, data in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode() + data + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+class RecordingStream:
+    """chunk_size 단위로 본문을 내보내며 소비된 청크 수를 기록하는 요청 스트림"""
+
+    def __init__(self, body: bytes, chunk_size: int = 1024):
+        self.chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.consumed = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_saves_file_field_and_ignores_other_fields(tmp_path):
+    """file 필드만 저장하고 다른 필드는 버림, 임시 파일은 남지 않음"""
+    wav = make_wav(frames=8000)
+    stream = RecordingStream(multipart_body(("note", None, b"hello"), ("file", "call.wav", wav)))
+
+    path, size, content_hash = await receive_wav_upload(stream, CONTENT_TYPE, tmp_path, max_bytes=1024 * 1024)
+
+    assert path == tmp_path / "call.wav"
+    assert path.read_bytes() == wav
+    assert size == len(wav)
+    assert len(content_hash) == 64
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["call.wav"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_wav_aborts_before_body_is_consumed(tmp_path):
+    """잘못된 헤더는 첫 청크에서 거부하고 나머지 본문은 읽지 않음"""
+    stream = RecordingStream(multipart_body(("file", "fake.wav", b"NOPE" * 100_000)))
+
+    with pytest.raises(InvalidWavError):
+        await receive_wav_upload(stream, CONTENT_TYPE, tmp_path, max_bytes=10 * 1024 * 1024)
+
+    assert stream.consumed == 1
+    assert len(stream.chunks) > 100
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_aborts_at_limit(tmp_path):
+    """최대 크기를 넘는 순간 중단"""
+    wav = make_wav(frames=100_000)
+    stream = RecordingStream(multipart_body(("file", "big.wav", wav)))
+
+    with pytest.raises(UploadTooLargeError):
+        await receive_wav_upload(stream, CONTENT_TYPE, tmp_path, max_bytes=64 * 1024)
+
+    assert stream.consumed < len(stream.chunks)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parts, content_type", [
+    ((("note", None, b"hello"),), CONTENT_TYPE),
+    ((("file", "call.mp3", b"ID3"),), CONTENT_TYPE),
+    ((("file", "a.wav", make_wav()), ("file", "b.wav", make_wav())), CONTENT_TYPE),
+    ((("file", "call.wav", make_wav()),), "application/octet-stream"),
+])
+async def test_rejects_malformed_uploads(tmp_path, parts, content_type):
+    """파일 필드 누락, WAV가 아닌 파일명, 파일 중복, multipart가 아닌 요청은 거부"""
+    stream = RecordingStream(multipart_body(*parts))
+
+    with pytest.raises(MalformedUploadError):
+        await receive_wav_upload(stream, content_type, tmp_path, max_bytes=1024 * 1024)
+
+    assert not any(p.name.endswith(".part") for p in tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_truncated_body_leaves_no_file(tmp_path):
+    """본문이 파트 중간에서 끊기면 저장하지 않음"""
+    body = multipart_body(("file", "call.wav", make_wav(frames=8000)))
+    stream = RecordingStream(body[: len(body) // 2])
+
+    with pytest.raises(MalformedUploadError):
+        await receive_wav_upload(stream, CONTENT_TYPE, tmp_path, max_bytes=1024 * 1024)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_upload_endpoint_streams_to_input_dir(monkeypatch):
+    """POST /upload는 본문을 input/에 저장하고 업로드 시 계산한 SHA-256과 함께 작업을 큐에 추가"""
+    sent = []
+    monkeypatch.setattr(
+        celery_client, "send_task",
+        lambda name, args, kwargs, task_id, queue: sent.append((args, kwargs)) or SimpleNamespace(id=task_id),
+    )
+    shutil.rmtree(settings.input_dir, ignore_errors=True)
+    settings.input_dir.mkdir(parents=True, exist_ok=True)
+    wav = make_wav()
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/upload", files={"file": ("call.wav", wav, "audio/wav")})
+        rejected = client.post("/api/v1/upload", files={"file": ("fake.wav", b"NOPE" * 100, "audio/wav")})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["filename"] == "call.wav"
+    assert (settings.input_dir / "call.wav").read_bytes() == wav
+    assert len(sent) == 1
+    args, kwargs = sent[0]
+    assert args == [str(settings.input_dir / "call.wav"), response.json()["task_id"]]
+    assert kwargs["content_hash"] == hashlib.sha256(wav).hexdigest()
+    assert rejected.status_code == 400
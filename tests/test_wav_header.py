@@ -0,0 +1,119 @@
+"""WavHeaderValidator (스트리밍 WAV 헤더 검증) 테스트"""
+import struct
+
+import pytest
+
+from app.utils.upload_utils import WAV_HEADER_SCAN_LIMIT, InvalidWavError, WavHeaderValidator
+
+
+def riff_chunk(chunk_id: bytes, data: bytes) -> bytes:
+    """RIFF 서브 청크 (홀수 크기는 1바이트 패딩)"""
+    return chunk_id + struct.pack("<I", len(data)) + data + (b"\x00" if len(data) & 1 else b"")
+
+
+def fmt_chunk(audio_format: int = 1, channels: int = 1, sample_rate: int = 16000) -> bytes:
+    """fmt 청크 (16bit)"""
+    block_align = channels * 2
+    byte_rate = sample_rate * block_align
+    return riff_chunk(
+        b"fmt ", struct.pack("<HHIIHH", audio_format, channels, sample_rate, byte_rate, block_align, 16)
+    )
+
+
+def wav_bytes(*chunks: bytes, riff: bytes = b"RIFF", wave: bytes = b"WAVE") -> bytes:
+    """RIFF 헤더 + 서브 청크"""
+    body = wave + b"".join(chunks)
+    return riff + struct.pack("<I", len(body)) + body
+
+
+def feed_in_chunks(data: bytes, chunk_size: int) -> WavHeaderValidator:
+    """chunk_size 단위로 나눠 전달 후 finish()"""
+    validator = WavHeaderValidator()
+    for offset in range(0, len(data), chunk_size):
+        validator.feed(data[offset:offset + chunk_size])
+    validator.finish()
+    return validator
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 44, 1024])
+def test_accepts_pcm_regardless_of_chunk_boundaries(chunk_size):
+    """헤더가 여러 청크에 걸쳐 들어와도 fmt 청크를 읽는 즉시 판정"""
+    data = wav_bytes(fmt_chunk(channels=2, sample_rate=8000), riff_chunk(b"data", b"\x00" * 400))
+
+    validator = feed_in_chunks(data, chunk_size)
+
+    assert validator.validated
+    assert (validator.channels, validator.sample_rate) == (2, 8000)
+
+
+@pytest.mark.parametrize("audio_format", [0x0001, 0x0003, 0xFFFE])
+def test_accepts_supported_formats(audio_format):
+    """PCM, IEEE float, WAVE_FORMAT_EXTENSIBLE"""
+    validator = feed_in_chunks(wav_bytes(fmt_chunk(audio_format=audio_format)), 1024)
+
+    assert validator.validated
+
+
+def test_skips_chunks_before_fmt_with_padding():
+    """fmt 앞의 LIST 등 다른 청크(홀수 크기 패딩 포함)는 건너뜀"""
+    data = wav_bytes(riff_chunk(b"LIST", b"INFOabc"), riff_chunk(b"JUNK", b"\x00" * 28), fmt_chunk())
+
+    validator = feed_in_chunks(data, 5)
+
+    assert validator.channels == 1
+
+
+def test_accepts_rf64():
+    """RF64 (4GB 초과 WAV) 헤더"""
+    validator = feed_in_chunks(wav_bytes(fmt_chunk(), riff=b"RF64"), 1024)
+
+    assert validator.validated
+
+
+def test_ignores_data_after_validation():
+    """판정 후에는 오디오 데이터를 버퍼에 쌓지 않음"""
+    validator = WavHeaderValidator()
+    validator.feed(wav_bytes(fmt_chunk()))
+    validator.feed(b"\xff" * (WAV_HEADER_SCAN_LIMIT * 2))
+
+    assert validator.validated
+    assert len(validator._buffer) == 0
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"ID3\x03" + b"\x00" * 60, "RIFF/WAVE"),
+        (wav_bytes(fmt_chunk(), wave=b"AVI "), "RIFF/WAVE"),
+        (wav_bytes(fmt_chunk(audio_format=0x0055)), "0x0055"),
+        (wav_bytes(fmt_chunk(channels=6)), "채널 수"),
+        (wav_bytes(fmt_chunk(sample_rate=0)), "샘플레이트"),
+        (wav_bytes(riff_chunk(b"data", b"\x00" * 16), fmt_chunk()), "data 청크"),
+    ],
+)
+def test_rejects_invalid_headers(data, message):
+    """형식이 잘못된 헤더는 fmt 청크까지 읽는 시점에 거부"""
+    validator = WavHeaderValidator()
+
+    with pytest.raises(InvalidWavError, match=message):
+        validator.feed(data)
+
+
+def test_rejects_truncated_header_on_finish():
+    """fmt 청크가 끝나기 전에 업로드가 끝나면 finish()에서 거부"""
+    validator = WavHeaderValidator()
+    validator.feed(wav_bytes(fmt_chunk())[:30])
+
+    assert not validator.validated
+    with pytest.raises(InvalidWavError, match="불완전"):
+        validator.finish()
+
+
+def test_rejects_missing_fmt_within_scan_limit():
+    """스캔 한도 안에 fmt 청크가 없으면 나머지를 받기 전에 거부"""
+    data = wav_bytes(riff_chunk(b"JUNK", b"\x00" * WAV_HEADER_SCAN_LIMIT), fmt_chunk())
+    validator = WavHeaderValidator()
+
+    with pytest.raises(InvalidWavError, match="fmt 청크"):
+        for offset in range(0, len(data), 4096):
+            validator.feed(data[offset:offset + 4096])
@@ -0,0 +1,74 @@
+"""Worker 모델 상주 (미리 로드 실패 처리, billiard 메모리 한도) 테스트"""
+import os
+
+import billiard
+
+import app.services.diarization_service as diarization_module
+import app.services.whisper_service as whisper_module
+from app.core.config import Settings, settings
+from app.tasks.worker_lifecycle import ModelResidency, set_child_memory_limit
+from benchmarks.fakes import FakeWhisperService
+
+
+class UnloadableDiarization:
+    """HF_TOKEN 없는 화자 분리 서비스 대체 (로드 시 ValueError)"""
+
+    def load_pipeline(self):
+        raise ValueError("Hugging Face 토큰이 필요합니다.")
+
+    def warmup(self):
+        raise AssertionError("로드 실패한 모델은 워밍업하지 않음")
+
+
+def limit_memory_to_one_kib():
+    """풀 initializer: 자식 프로세스가 작업 하나 후 교체되도록 한도를 1KiB로 지정"""
+    assert set_child_memory_limit(1)
+
+
+def test_preload_defaults_keep_per_task_loading(monkeypatch):
+    """기본값은 미리 로드 없음 + 작업 50개마다 재시작 (기존 배포 동작 유지)"""
+    monkeypatch.delenv("MODEL_PRELOAD", raising=False)
+    monkeypatch.delenv("WORKER_MAX_TASKS_PER_CHILD", raising=False)
+
+    defaults = Settings(_env_file=None)
+
+    assert defaults.get_preload_models() == []
+    assert defaults.worker_max_tasks_per_child == 50
+
+
+def test_diarization_preload_failure_is_soft(monkeypatch):
+    """화자 분리를 로드할 수 없어도 Whisper만 상주시키고 계속 진행"""
+    monkeypatch.setattr(settings, "model_preload", "whisper,diarization")
+    monkeypatch.setattr(settings, "model_warmup_enabled", False)
+    monkeypatch.setattr(whisper_module, "whisper_service", FakeWhisperService())
+    monkeypatch.setattr(diarization_module, "diarization_service", UnloadableDiarization())
+    residency = ModelResidency()
+
+    timings = residency.preload()
+
+    assert residency.resident == {"whisper"}
+    assert residency.is_resident("whisper")
+    assert not residency.is_resident("diarization")
+    assert set(timings) == {"whisper_load"}
+
+
+def test_set_child_memory_limit_outside_pool_is_logged_noop():
+    """prefork 자식이 아닌 프로세스(메인/solo)에서는 설정하지 않고 False"""
+    assert set_child_memory_limit(1024) is False
+
+
+def test_billiard_recycles_child_over_memory_limit():
+    """
+    billiard 내부 동작 고정: initializer에서 current_process()._target.max_memory_per_child를
+    바꾸면 작업 루프가 그 값을 읽어 한도를 넘은 자식 프로세스를 작업 후 교체
+    """
+    pool = billiard.Pool(1, initializer=limit_memory_to_one_kib)
+    try:
+        first = pool.apply_async(os.getpid).get(timeout=30)
+        second = pool.apply_async(os.getpid).get(timeout=30)
+    finally:
+        pool.terminate()
+        pool.join()
+
+    assert first != second
+